@@ -4,6 +4,8 @@ import os
 import sys
 from pathlib import Path
 
+from run_store import index_run
+
 REQUIRED_FIELDS = [
     "run_id",
     "timestamp",
@@ -69,6 +71,7 @@ def main() -> None:
     with target_file.open("a", encoding="utf-8") as handle:
         handle.write(json.dumps(payload, ensure_ascii=True))
         handle.write("\n")
+    index_run(target_file)
 
 
 if __name__ == "__main__":
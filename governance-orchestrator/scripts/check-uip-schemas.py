@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
-import json
-import subprocess
+import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
-import importlib.util
-from typing import Union
+from typing import Optional, Union
+
+from schema_registry import SchemaError, default_registry
+from uip_discovery import ChangeSet, DiscoveryError, add_change_arguments, changes_from_args, discovery_for
 
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 # Explicit allowlist for suppressing schema checks (repo-relative paths only).
 ALLOWLIST_PATHS = {
@@ -63,16 +63,16 @@ def is_iso8601(value: object) -> bool:
 
 def load_intent_validator():
     module_path = ROOT / "skills/ui-intent-emit/impl/run.py"
-    spec = importlib.util.spec_from_file_location("ui_intent_run", module_path)
-    if spec is None or spec.loader is None:
+    try:
+        # Imported once per process and content hash, shared by every checker.
+        module = default_registry().python_validator(module_path, "ui_intent_run")
+    except (OSError, SchemaError):
         fail(
             "UIP-STRUCTURAL-VIOLATION",
             module_path,
             "intent.validator",
             "Ensure the UI intent validator is present and importable.",
         )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
     if not hasattr(module, "validate_intent"):
         fail(
             "UIP-STRUCTURAL-VIOLATION",
@@ -90,40 +90,13 @@ def load_intent_validator():
     return module
 
 
-def run_discovery() -> list[dict[str, str]]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        if message:
-            print(message, file=sys.stderr)
-        raise SystemExit(result.returncode)
-
-    artifacts: list[dict[str, str]] = []
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifact = json.loads(line)
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits JSON lines with path/type.",
-            )
-        if "path" not in artifact or "type" not in artifact:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits path/type for every artifact.",
-            )
-        artifacts.append(artifact)
-    return artifacts
+def run_discovery(changes: Optional[ChangeSet] = None) -> list[dict[str, str]]:
+    incremental = changes is not None and not changes.full
+    try:
+        return discovery_for().artifacts(changes.paths if incremental else None)
+    except DiscoveryError as exc:
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
 
 
 def validate_intent(path: Path, data: dict, intent_module) -> None:
@@ -252,9 +225,14 @@ def validate_event(path: Path, data: dict) -> None:
         )
 
 
-def main() -> None:
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Validate UIP intent/event artifacts against their schemas.")
+    add_change_arguments(parser)
+    args = parser.parse_args(argv)
+    changes = changes_from_args(args)
+
     intent_module = load_intent_validator()
-    artifacts = run_discovery()
+    artifacts = run_discovery(changes)
     for artifact in artifacts:
         artifact_path = Path(artifact["path"])
         try:
@@ -264,16 +242,7 @@ def main() -> None:
         if relative in ALLOWLIST_PATHS:
             continue
 
-        try:
-            payload = json.loads(artifact_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                artifact_path,
-                "valid-json",
-                "Fix JSON syntax so the artifact can be parsed.",
-            )
-
+        payload = discovery_for().payload(artifact_path)
         if not isinstance(payload, dict):
             fail(
                 "UIP-SCHEMA-VIOLATION",
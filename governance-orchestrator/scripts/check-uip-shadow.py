@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
-import json
-import subprocess
-import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+from uip_discovery import ChangeSet, DiscoveryError, add_change_arguments, changes_from_args, discovery_for
 
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 INTENT_SCHEMA_VERSION = "0.2.0"
 EVENT_SCHEMA_VERSION = "0.2.0"
@@ -50,31 +49,15 @@ def is_iso8601(value: object) -> bool:
         return False
 
 
-def run_discovery() -> list[dict[str, str]]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
+def run_discovery(changes: Optional[ChangeSet] = None) -> list[dict[str, str]]:
+    incremental = changes is not None and not changes.full
+    try:
+        return discovery_for().artifacts(changes.paths if incremental else None)
+    except DiscoveryError as exc:
         print("UIP-0.2 Shadow Validation Results")
-        if message:
-            print(f"Shadow validation skipped: {message}")
-        else:
-            print("Shadow validation skipped: discovery failed.")
+        print(f"Shadow validation skipped: {exc}")
         return []
 
-    artifacts: list[dict[str, str]] = []
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifacts.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return artifacts
-
 
 def validate_intent(data: dict[str, Any]) -> list[str]:
     errors: list[str] = []
@@ -118,19 +101,21 @@ def validate_event(data: dict[str, Any]) -> list[str]:
     return errors
 
 
-def main() -> None:
-    artifacts = run_discovery()
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Report UIP artifacts that would fail UIP-0.2 validation.")
+    add_change_arguments(parser)
+    args = parser.parse_args(argv)
+    changes = changes_from_args(args)
+    incremental = changes is not None and not changes.full
+
+    artifacts = run_discovery(changes)
     failures: list[tuple[Path, list[str]]] = []
 
     for artifact in artifacts:
         path = Path(artifact.get("path", ""))
         if not path.exists():
             continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            failures.append((path, ["invalid JSON"]))
-            continue
+        payload = discovery_for().payload(path)
         if not isinstance(payload, dict):
             failures.append((path, ["artifact must be a JSON object"]))
             continue
@@ -145,7 +130,7 @@ def main() -> None:
 
     print("UIP-0.2 Shadow Validation Results")
     if not artifacts:
-        print("No artifacts discovered.")
+        print("No changed artifacts." if incremental else "No artifacts discovered.")
         return
     if not failures:
         print("All artifacts pass UIP-0.2 shadow validation.")
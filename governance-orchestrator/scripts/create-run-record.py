@@ -4,6 +4,9 @@ import os
 import sys
 from pathlib import Path
 
+from jsonl_append import append_line
+from run_store import index_run
+
 REQUIRED_FIELDS = [
     "run_id",
     "timestamp",
@@ -66,9 +69,8 @@ def main() -> None:
     target_dir.mkdir(parents=True, exist_ok=True)
 
     target_file = target_dir / f"{run_id}.jsonl"
-    with target_file.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=True))
-        handle.write("\n")
+    append_line(target_file, json.dumps(payload, ensure_ascii=True))
+    index_run(target_file)
 
 
 if __name__ == "__main__":
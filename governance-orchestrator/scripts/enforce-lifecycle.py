@@ -9,16 +9,17 @@ Enforces:
 - optional logging via hub scripts/log_event.py
 """
 import argparse
+import importlib.util
 import json
-import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, List
 
+from todo_tasks import load_tasks, shared_classifier
+
 MAX_TODO_LINE_LENGTH = 240
-EXECUTE_PROMPT_PATTERN = re.compile(r"Execute prompt:\s*([^\s]+)")
-FROM_PROMPT_PATTERN = re.compile(r"From prompt\s+([^\s:]+)(?:\s*:\s*(.+))?")
+PROMPT_CLASSIFICATION_CACHE = Path(".cache") / "lifecycle" / "prompt-classifications.json"
 
 SPEC_ID_MISSING_MESSAGE = (
     "Planning blocked: spec_id not allocated. Run allocate-spec-id.py after elicitation readiness."
@@ -29,22 +30,45 @@ SPEC_ID_MULTIPLE_MESSAGE = "Planning blocked: multiple spec_id values detected i
 
 
 def has_unchecked_tasks(todo_path: Path) -> bool:
-    if not todo_path.exists():
-        return False
-    return any(line.strip().startswith("- [ ]") for line in todo_path.read_text().splitlines())
+    table = load_tasks(todo_path)
+    return table is not None and table.has_unchecked()
 
 
 def check_ceres_todo(todo_path: Path) -> bool:
-    lines = todo_path.read_text().splitlines() if todo_path.exists() else []
-    return bool(lines and "CERES" in lines[0])
+    table = load_tasks(todo_path)
+    return bool(table and table.lines and "CERES" in table.lines[0])
+
+
+_LOG_HELPERS: Dict[Path, object] = {}
+
+
+def load_log_helper(log_helper: Path):
+    """Import the hub log helper so events can be written without a new interpreter."""
+    key = log_helper.resolve()
+    if key not in _LOG_HELPERS:
+        spec = importlib.util.spec_from_file_location("ceres_log_event", key)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _LOG_HELPERS[key] = module
+    return _LOG_HELPERS[key]
 
 
-def log_event(log_helper: Path, status: str, message: str, context: Dict) -> None:
+def log_event(log_helper: Path, status: str, message: str, context: Dict, log_out: Path | None = None) -> None:
     if not log_helper:
         return
     if not log_helper.exists():
         sys.stderr.write(f"Log helper not found at {log_helper}\n")
         return
+    try:
+        helper = load_log_helper(log_helper)
+    except Exception:
+        helper = None
+    if helper is not None and hasattr(helper, "build_event") and hasattr(helper, "append_event"):
+        out = log_out or Path.cwd() / "logs" / "events.jsonl"
+        helper.append_event(out, helper.build_event("gate", status, message, context=context))
+        return
     cmd = [
         sys.executable,
         str(log_helper),
@@ -57,6 +81,8 @@ def log_event(log_helper: Path, status: str, message: str, context: Dict) -> Non
         "--context",
         json.dumps(context),
     ]
+    if log_out:
+        cmd.extend(["--out", str(log_out)])
     subprocess.run(cmd, check=False)
 
 
@@ -75,19 +101,6 @@ def is_prompt_path(value: str) -> bool:
     return value.startswith("prompts/prompt-") and value.endswith(".md")
 
 
-def read_prompt_classification(path: Path) -> str | None:
-    classification = None
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.startswith("Classification:"):
-            classification = line.split(":", 1)[1].strip().lower()
-            break
-    if classification in {"atomic", "decomposable"}:
-        return classification
-    return None
-
-
-
-
 def validate_spec_id(objective_path: Path) -> List[str]:
     failures: List[str] = []
     if not objective_path.exists():
@@ -121,81 +134,33 @@ def validate_spec_id(objective_path: Path) -> List[str]:
 
     return failures
 
-def outcome_from_next_line(lines: List[str], index: int) -> bool:
-    if index + 1 >= len(lines):
-        return False
-    next_line = lines[index + 1].strip()
-    if not next_line.lower().startswith("outcome:"):
-        return False
-    return bool(next_line.split(":", 1)[1].strip())
-
-
 def validate_prompt_artifacts(todo_path: Path) -> List[str]:
     failures: List[str] = []
-    if not todo_path.exists():
+    table = load_tasks(todo_path)
+    if table is None:
         return failures
 
-    lines = todo_path.read_text(encoding="utf-8").splitlines()
-    for idx, line in enumerate(lines, start=1):
-        if len(line) > MAX_TODO_LINE_LENGTH:
-            failures.append(
-                f"todo.md line {idx} exceeds {MAX_TODO_LINE_LENGTH} chars; long prompts must be externalized"
-            )
-
-    references: List[dict] = []
-    for idx, line in enumerate(lines, start=1):
-        stripped = line.strip()
-        if not stripped.startswith("- ["):
-            continue
-
-        if "Execute prompt:" in stripped:
-            match = EXECUTE_PROMPT_PATTERN.search(stripped)
-            if not match:
-                failures.append(f"todo.md line {idx} has Execute prompt without a path")
-            else:
-                path_value = match.group(1)
-                if not is_prompt_path(path_value):
-                    failures.append(f"todo.md line {idx} must reference prompts/prompt-*.md")
-                tail = stripped[match.end():].strip()
-                references.append(
-                    {
-                        "line": idx,
-                        "path": path_value,
-                        "outcome": bool(tail) or outcome_from_next_line(lines, idx - 1),
-                    }
-                )
-
-        if "From prompt" in stripped:
-            match = FROM_PROMPT_PATTERN.search(stripped)
-            if not match:
-                failures.append(f"todo.md line {idx} has From prompt without a path")
-            else:
-                path_value = match.group(1)
-                if not is_prompt_path(path_value):
-                    failures.append(f"todo.md line {idx} must reference prompts/prompt-*.md")
-                outcome_inline = bool(match.group(2) and match.group(2).strip())
-                references.append(
-                    {
-                        "line": idx,
-                        "path": path_value,
-                        "outcome": outcome_inline or outcome_from_next_line(lines, idx - 1),
-                    }
-                )
+    for idx in table.long_lines(MAX_TODO_LINE_LENGTH):
+        failures.append(
+            f"todo.md line {idx} exceeds {MAX_TODO_LINE_LENGTH} chars; long prompts must be externalized"
+        )
 
     grouped: dict[str, list[dict]] = {}
-    for ref in references:
-        path_value = ref.get("path")
-        if not path_value:
+    for task, ref in table.prompt_refs():
+        if ref.path is None:
+            failures.append(f"todo.md line {task.line} has {ref.marker} without a path")
             continue
-        grouped.setdefault(path_value, []).append(ref)
+        if not is_prompt_path(ref.path):
+            failures.append(f"todo.md line {task.line} must reference prompts/prompt-*.md")
+        grouped.setdefault(ref.path, []).append({"line": task.line, "outcome": ref.outcome})
 
     hub_root = todo_path.resolve().parent
+    classifier = shared_classifier(hub_root / PROMPT_CLASSIFICATION_CACHE)
     for path_value, refs in grouped.items():
-        prompt_path = (hub_root / path_value).resolve()
-        if not prompt_path.exists():
+        exists, classification = classifier.classify(hub_root / path_value)
+        if not exists:
             failures.append(f"Prompt file not found: {path_value}")
             continue
-        classification = read_prompt_classification(prompt_path)
         if not classification:
             failures.append(f"Prompt file missing Classification (atomic|decomposable): {path_value}")
             continue
@@ -209,11 +174,12 @@ def validate_prompt_artifacts(todo_path: Path) -> List[str]:
                     failures.append(
                         f"Prompt {path_value} is decomposable; todo line {ref['line']} must include an outcome"
                     )
+    classifier.save()
 
     return failures
 
 
-def main() -> None:
+def main(argv: List[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="CERES lifecycle gate")
     parser.add_argument("--todo", type=Path, default=Path("todo.md"), help="Path to todo.md")
     parser.add_argument("--gap-ledger", type=Path, help="Optional path to gap ledger file")
@@ -224,7 +190,8 @@ def main() -> None:
     parser.add_argument("--require-todo-structure", action="store_true", help="Fail if todo.md missing required CERES sections")
     parser.add_argument("--task-id", help="Optional task identifier for logging context")
     parser.add_argument("--log-helper", type=Path, help="Optional path to umbrella scripts/log_event.py to log gate outcome")
-    args = parser.parse_args()
+    parser.add_argument("--log-out", type=Path, help="Events file for --log-helper (default: ./logs/events.jsonl)")
+    args = parser.parse_args(argv)
 
     failures = []
     warnings = []
@@ -270,7 +237,8 @@ def main() -> None:
 
     if args.require_todo_structure:
         required_sections = ["## Bugs", "## Workflow Governance", "## Current Focus", "## Next Features & Updates", "## Backlog"]
-        contents = args.todo.read_text().splitlines() if args.todo.exists() else []
+        table = load_tasks(args.todo)
+        contents = table.lines if table is not None else []
         for section in required_sections:
             if not any(line.strip() == section for line in contents):
                 failures.append(f"todo.md missing required section: {section}")
@@ -279,14 +247,14 @@ def main() -> None:
 
     if failures:
         sys.stderr.write("Lifecycle gate failed:\n" + "\n".join(f"- {f}" for f in failures) + "\n")
-        log_event(args.log_helper, "fail", "lifecycle gate failed", {**context, "failures": failures})
+        log_event(args.log_helper, "fail", "lifecycle gate failed", {**context, "failures": failures}, args.log_out)
         sys.exit(1)
 
     if warnings:
         sys.stderr.write("Lifecycle gate warnings:\n" + "\n".join(warnings) + "\n")
 
     sys.stdout.write("Lifecycle gate passed\n")
-    log_event(args.log_helper, "pass", "lifecycle gate passed", context)
+    log_event(args.log_helper, "pass", "lifecycle gate passed", context, args.log_out)
 
 
 if __name__ == "__main__":
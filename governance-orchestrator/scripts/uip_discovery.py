@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Shared UIP artifact discovery for the check-uip-* scripts.
+
+A single os.walk over the component root (pruning EXCLUDED_DIRS) finds intent/event
+artifacts and synchronization manifests together. Parsed payloads stay in memory, so
+every checker running in the same process reads each file once. Parses are also
+persisted to `.cache/uip-discovery.json`, keyed by (mtime_ns, size), so the next run
+only re-reads files that changed. The manifest is derived: deleting it never changes
+results. Set UIP_DISCOVERY_CACHE=0 to skip it.
+
+Checkers also accept --changed/--diff-range/--staged (see add_change_arguments) to
+validate only what a set of changed files affects; edits matching FULL_RUN_PATTERNS
+(schemas, validators, these scripts) fall back to a full run.
+
+Identical copies live in governance-orchestrator/scripts and ui-pattern-registry/scripts.
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from yaml_loader import YamlError, load_yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = ROOT / ".cache" / "uip-discovery.json"
+MANIFEST_VERSION = 1
+
+# Directory names pruned wherever they appear in the tree.
+EXCLUDED_DIRS = frozenset({".git", "node_modules", "runs"})
+
+KNOWN_DIRS = {
+    "ui-artifacts": "auto",
+    "ui-contracts/examples": "event",
+    "synchronizations/examples": "event",
+    "skills/ui-intent-emit/examples": "intent",
+    "concepts/ui-intent-protocol/handlers/reference": "intent",
+}
+SYNC_DIRS = (
+    "synchronizations",
+    "synchronizations/templates",
+    "synchronizations/examples",
+)
+
+# Changes to these component-relative paths alter how every artifact is judged, so
+# incremental runs fall back to checking everything.
+FULL_RUN_PATTERNS = (
+    "schemas/*",
+    "ui-contracts/*.schema.ts",
+    "ui-contracts/renderers.yaml",
+    "skills/ui-intent-emit/impl/*",
+    "skills/ui-intent-emit/schemas/*",
+    "skills/ui-intent-emit/src/schema.ts",
+    "scripts/uip_*.py",
+    "scripts/yaml_loader.py",
+    "scripts/check-uip-*.py",
+    "scripts/check-renderer-certification.py",
+)
+
+
+class DiscoveryError(Exception):
+    def __init__(self, path: Path, rule: str, suggestion: str, root: Path = ROOT) -> None:
+        self.path = path
+        self.rule = rule
+        self.suggestion = suggestion
+        super().__init__(
+            "UIP-STRUCTURAL-VIOLATION"
+            f" | file: {display_path(path, root)}"
+            f" | rule: {rule}"
+            f" | suggestion: {suggestion}"
+        )
+
+
+def display_path(path: Path, root: Path = ROOT) -> Path:
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
+def artifact_kind(name: str) -> Optional[str]:
+    if name.endswith(".intent.json"):
+        return "intent"
+    if name.endswith(".event.json"):
+        return "event"
+    return None
+
+
+def _load_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get("UIP_DISCOVERY_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class Discovery:
+    def __init__(
+        self,
+        root: Path = ROOT,
+        excluded: frozenset = EXCLUDED_DIRS,
+        manifest_path: Optional[Path] = MANIFEST_PATH,
+    ) -> None:
+        self.root = Path(root)
+        self.excluded = frozenset(excluded)
+        self.manifest_path = manifest_path
+        self._kinds: Optional[Dict[str, str]] = None
+        self._syncs: List[Path] = []
+        self._parsed: Dict[str, Any] = {}
+        self._known = {self.root / rel: kind for rel, kind in KNOWN_DIRS.items()}
+        self._sync_dirs = {self.root / rel for rel in SYNC_DIRS}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._manifest_loaded = False
+        self._dirty = False
+
+    def _kind(self, directory: Path, name: str) -> Optional[str]:
+        dir_kind = self._known.get(directory)
+        if dir_kind not in (None, "auto") and name.endswith(".json"):
+            return dir_kind
+        return artifact_kind(name)
+
+    def _is_sync(self, directory: Path, name: str) -> bool:
+        return name.endswith(".sync.yaml") or (
+            directory in self._sync_dirs and name.endswith((".yaml", ".yml"))
+        )
+
+    def _walk(self) -> None:
+        kinds: Dict[str, str] = {}
+        syncs: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if name not in self.excluded]
+            directory = Path(dirpath)
+            for name in filenames:
+                kind = self._kind(directory, name)
+                if kind is not None:
+                    kinds[str(directory / name)] = kind
+                if self._is_sync(directory, name):
+                    syncs.append(directory / name)
+        self._kinds = kinds
+        self._syncs = sorted(syncs)
+        self._load_manifest(set(kinds) | {str(path) for path in syncs})
+
+    def _ensure_walked(self) -> None:
+        if self._kinds is None:
+            self._walk()
+
+    def _load_manifest(self, present: Optional[set] = None) -> None:
+        self._manifest_loaded = True
+        if self.manifest_path is None or not _cache_enabled():
+            return
+        try:
+            data = json.loads(Path(self.manifest_path).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            self._dirty = True
+            return
+        entries = data.get("files") or {}
+        # Parses made before the tree walk (see classify) are newer than the manifest.
+        entries.update(self._entries)
+        if present is not None:
+            kept = {rel: entry for rel, entry in entries.items() if str(self.root / rel) in present}
+            self._dirty = self._dirty or len(kept) != len(entries)
+            entries = kept
+        self._entries = entries
+
+    def classify(self, path: Path) -> Tuple[Optional[str], bool]:
+        """(artifact kind or None, is sync manifest) for one path, without walking the tree."""
+        path = Path(path)
+        try:
+            parts = path.relative_to(self.root).parts
+        except ValueError:
+            return None, False
+        if any(part in self.excluded for part in parts[:-1]):
+            return None, False
+        return self._kind(path.parent, path.name), self._is_sync(path.parent, path.name)
+
+    def save(self) -> None:
+        if self.manifest_path is None or not _cache_enabled() or not self._dirty:
+            return
+        payload = {"version": MANIFEST_VERSION, "files": self._entries}
+        path = Path(self.manifest_path)
+        try:
+            text = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            # Parses still serve this run when the tree is read-only.
+            return
+        self._dirty = False
+
+    def _parse(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        key = str(path)
+        if key in self._parsed:
+            return self._parsed[key]
+        if not self._manifest_loaded:
+            self._load_manifest()
+        rel = path.relative_to(self.root).as_posix()
+        try:
+            stat = path.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature = None
+        entry = self._entries.get(rel)
+        if signature is not None and entry is not None and entry.get("signature") == signature:
+            data = entry.get("data")
+        else:
+            data = loader(path)
+            if signature is not None:
+                self._entries[rel] = {"signature": signature, "data": data}
+                self._dirty = True
+        self._parsed[key] = data
+        return data
+
+    def artifacts(self, paths: Optional[Iterable[Path]] = None) -> List[Dict[str, str]]:
+        """Intent/event artifacts as {"path", "type"}, sorted by path.
+
+        With `paths`, only those files are classified (no tree walk); missing files and
+        non-artifacts are skipped. Every returned artifact is parsed here; the first
+        one that is not valid JSON raises DiscoveryError.
+        """
+        if paths is None:
+            self._ensure_walked()
+            kinds = self._kinds
+        else:
+            kinds = {}
+            for path in paths:
+                kind, _ = self.classify(Path(path))
+                if kind is not None and Path(path).is_file():
+                    kinds[str(path)] = kind
+        results: List[Dict[str, str]] = []
+        try:
+            for path_str, kind in sorted(kinds.items()):
+                path = Path(path_str)
+                try:
+                    self._parse(path, _load_json)
+                except json.JSONDecodeError:
+                    raise DiscoveryError(
+                        path,
+                        "valid-json",
+                        "Fix JSON syntax so the artifact can be parsed.",
+                        self.root,
+                    ) from None
+                results.append({"path": path_str, "type": kind})
+        finally:
+            self.save()
+        return results
+
+    def payload(self, path: Path) -> Any:
+        """Parsed JSON for a discovered artifact (raises JSONDecodeError if invalid)."""
+        return self._parse(Path(path), _load_json)
+
+    def sync_manifests(self) -> List[Path]:
+        self._ensure_walked()
+        return list(self._syncs)
+
+    def load_syncs(self) -> List[Tuple[Path, Any, Optional[YamlError]]]:
+        """(path, manifest, error) for every synchronization manifest, sorted by path."""
+        results: List[Tuple[Path, Any, Optional[YamlError]]] = []
+        try:
+            for path in self.sync_manifests():
+                try:
+                    results.append((path, self._parse(path, load_yaml), None))
+                except YamlError as exc:
+                    results.append((path, None, exc))
+        finally:
+            self.save()
+        return results
+
+
+class ChangeSet:
+    """Files changed under the component root, used to narrow incremental checks."""
+
+    def __init__(self, paths: Iterable[Path], root: Path = ROOT) -> None:
+        self.root = Path(root)
+        self.paths = sorted({Path(path) for path in paths})
+        self._members = set(self.paths)
+        self.full_reason: Optional[str] = None
+        for path in self.paths:
+            try:
+                rel = path.relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            if any(fnmatch.fnmatchcase(rel, pattern) for pattern in FULL_RUN_PATTERNS):
+                self.full_reason = f"{rel} changed"
+                break
+
+    @property
+    def full(self) -> bool:
+        return self.full_reason is not None
+
+    def __contains__(self, path: object) -> bool:
+        return Path(path) in self._members  # type: ignore[arg-type]
+
+
+def git_changed_paths(root: Path = ROOT, diff_range: Optional[str] = None, staged: bool = False) -> List[Path]:
+    cmd = ["git", "diff", "--name-only", "--relative", "--no-renames"]
+    if staged:
+        cmd.append("--cached")
+    if diff_range:
+        cmd.append(diff_range)
+    result = subprocess.run(cmd, cwd=root, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"git diff failed: {(result.stderr or result.stdout).strip()}")
+    return [root / line for line in result.stdout.splitlines() if line.strip()]
+
+
+def add_change_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("incremental mode")
+    group.add_argument("--changed", nargs="+", default=[], metavar="PATH", help="Only check what these files affect")
+    group.add_argument("--diff-range", metavar="RANGE", help="Only check what `git diff RANGE` touches (e.g. origin/main...HEAD)")
+    group.add_argument("--staged", action="store_true", help="Only check what the staged changes touch")
+
+
+def changes_from_args(args: argparse.Namespace, root: Path = ROOT) -> Optional[ChangeSet]:
+    """ChangeSet for the incremental flags, or None when none were given (full run)."""
+    if not (args.changed or args.diff_range or args.staged):
+        return None
+    paths = [Path(path).resolve() for path in args.changed]
+    if args.diff_range or args.staged:
+        paths.extend(git_changed_paths(root, args.diff_range, args.staged))
+    return ChangeSet(paths, root)
+
+
+_DISCOVERIES: Dict[Path, Discovery] = {}
+
+
+def discovery_for(root: Path = ROOT) -> Discovery:
+    key = Path(root)
+    discovery = _DISCOVERIES.get(key)
+    if discovery is None:
+        manifest_path = MANIFEST_PATH if key == ROOT else key / ".cache" / "uip-discovery.json"
+        discovery = _DISCOVERIES[key] = Discovery(key, manifest_path=manifest_path)
+    return discovery
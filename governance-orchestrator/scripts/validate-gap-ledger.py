@@ -6,10 +6,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-try:
-    import yaml  # type: ignore
-except ImportError:  # pragma: no cover
-    yaml = None
+from yaml_loader import YamlError, load_yaml
 
 REQUIRED = {"gap_id", "type", "blocking", "answerable_by_system", "resolution_method", "status"}
 
@@ -17,11 +14,12 @@ class ValidationError(Exception):
     pass
 
 def load(path: Path) -> Dict[str, Any]:
-    text = path.read_text()
     if path.suffix.lower() in {".yaml", ".yml"}:
-        if not yaml:
-            raise ValidationError("PyYAML not installed; cannot parse YAML")
-        return yaml.safe_load(text)
+        try:
+            return load_yaml(path)
+        except YamlError as exc:
+            raise ValidationError(f"Invalid YAML: {exc}")
+    text = path.read_text()
     try:
         return json.loads(text)
     except json.JSONDecodeError as exc:
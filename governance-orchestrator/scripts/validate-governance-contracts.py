@@ -5,7 +5,16 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
-from uip_yaml import YamlError, load_yaml
+from schema_registry import RecordChecker, SchemaError, default_registry
+from yaml_loader import YamlError, load_yaml
+
+HUB_ROOT = Path(__file__).resolve().parents[2]
+if str(HUB_ROOT) not in sys.path:
+    sys.path.append(str(HUB_ROOT))
+try:
+    from observability.event_store import EventStore, verification_key
+except ImportError:
+    EventStore = None
 
 
 PHASE_SIDE_EFFECTS = {"allowed", "forbidden"}
@@ -192,59 +201,72 @@ def validate_synchronizations(sync_dir: Path) -> None:
                 fail(f"message_contract.transport in {path} must be internal, mcp, or external")
 
 
-def validate_record_types(record: dict, properties: dict, required: list[str], label: str) -> None:
-    for key in required:
-        if key not in record:
-            fail(f"{label} missing required field: {key}")
-    for key, value in record.items():
-        if key not in properties:
-            fail(f"{label} has unknown field: {key}")
-        spec = properties[key]
-        expected = spec.get("type")
-        if expected == "string" and not isinstance(value, str):
-            fail(f"{label} field {key} must be string")
-        if expected == "integer" and not isinstance(value, int):
-            fail(f"{label} field {key} must be integer")
-        if expected == "object" and not isinstance(value, dict):
-            fail(f"{label} field {key} must be object")
-        if expected == "array" and not isinstance(value, list):
-            fail(f"{label} field {key} must be array")
-        if "enum" in spec and value not in spec.get("enum", []):
-            fail(f"{label} field {key} must be one of {spec.get('enum')}")
+def load_record_checker(path: Path, label: str) -> RecordChecker:
+    if not path.exists():
+        fail(f"{label} not found: {path}")
+    try:
+        # Compiled once per schema content hash; plans persist across runs.
+        return default_registry().record_checker(path)
+    except SchemaError as exc:
+        fail(f"{label} JSON error: {exc.__cause__ or exc}")
+    raise AssertionError("unreachable")
+
+
+def validate_record_types(record: dict, checker: RecordChecker, label: str) -> None:
+    error = checker.first_error(record, label)
+    if error is not None:
+        fail(error)
 
 
 def validate_memory_records(memory_dir: Path, schema_path: Path) -> None:
     if not memory_dir.exists():
         return
-    schema = load_json_file(schema_path, "Memory record schema")
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
+    checker = load_record_checker(schema_path, "Memory record schema")
 
     for path in sorted(memory_dir.glob("*.json")):
         record = load_json_file(path, f"Memory record {path}")
         record = require_dict(record, f"Memory record {path}")
-        validate_record_types(record, properties, required, f"Memory record {path}")
-
+        validate_record_types(record, checker, f"Memory record {path}")
 
-def validate_observability_events(events_path: Path, schema_path: Path) -> None:
-    if not events_path.exists():
-        return
-    schema = load_json_file(schema_path, "Observability event schema")
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
 
-    for line_no, raw in enumerate(events_path.read_text(encoding="utf-8").splitlines(), start=1):
+def validate_event_lines(path: Path, checker: RecordChecker, where: str) -> None:
+    for line_no, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
         if not raw.strip():
             continue
         try:
             event = json.loads(raw)
         except json.JSONDecodeError as exc:
-            fail(f"Observability event JSON error at line {line_no}: {exc}")
-        event = require_dict(event, f"Observability event line {line_no}")
-        validate_record_types(event, properties, required, f"Observability event line {line_no}")
+            fail(f"Observability event JSON error{where} at line {line_no}: {exc}")
+        event = require_dict(event, f"Observability event{where} line {line_no}")
+        validate_record_types(event, checker, f"Observability event{where} line {line_no}")
+
+
+def validate_observability_events(events_path: Path, schema_path: Path) -> None:
+    store = EventStore(events_path) if EventStore is not None else None
+    if not events_path.exists() and (store is None or not store.segment_paths()):
+        return
+    checker = load_record_checker(schema_path, "Observability event schema")
+
+    if store is None:
+        validate_event_lines(events_path, checker, "")
+        return
+    # Sealed segments are immutable; each is validated once per schema revision.
+    key = verification_key(schema_path, Path(__file__))
+    for path in store.segment_paths():
+        if path == events_path:
+            validate_event_lines(path, checker, "")
+            continue
+        if store.is_verified(path, key):
+            continue
+        validate_event_lines(path, checker, f" in segment {path.name}")
+        store.mark_verified(path, key)
 
 
 def find_reflection_event(events_path: Path, task_id: str) -> bool:
+    if EventStore is not None:
+        # The index also matches context values; type and phase must be top-level here.
+        events = EventStore(events_path).iter_query(type="critique", phase="reflection", task_id=task_id)
+        return any(event.get("type") == "critique" and event.get("phase") == "reflection" for event in events)
     if not events_path.exists():
         return False
     for raw in events_path.read_text(encoding="utf-8").splitlines():
@@ -268,7 +290,7 @@ def find_reflection_event(events_path: Path, task_id: str) -> bool:
     return False
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Validate CERES governance contracts")
     parser.add_argument("--hub-root", type=Path, help="Path to CERES hub root")
     parser.add_argument("--phase", help="Active phase name")
@@ -277,7 +299,7 @@ def main() -> None:
     parser.add_argument("--task-class", help="Task class (e.g., codegen, migration, security)")
     parser.add_argument("--task-id", help="Task identifier for reflection checks")
     parser.add_argument("--events", type=Path, help="Observability events file")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     hub_root = args.hub_root
     if hub_root is None:
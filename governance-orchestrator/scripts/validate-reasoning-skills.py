@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from yaml_loader import YamlError, load_yaml
+
 
 class ValidationError(Exception):
     pass
@@ -26,124 +28,11 @@ def _find_repo_root(start: Path) -> Path:
     raise ValidationError(f"Could not locate repo root from: {start}")
 
 
-def _strip_yaml_comment(line: str) -> str:
-    in_single = False
-    in_double = False
-    out = []
-    for ch in line:
-        if ch == "'" and not in_double:
-            in_single = not in_single
-        elif ch == '"' and not in_single:
-            in_double = not in_double
-        if ch == "#" and not in_single and not in_double:
-            break
-        out.append(ch)
-    return "".join(out)
-
-
-def _parse_scalar(text: str) -> Any:
-    lowered = text.lower()
-    if lowered in {"null", "~"}:
-        return None
-    if lowered == "true":
-        return True
-    if lowered == "false":
-        return False
-    if text in {"[]", "{}"}:
-        return [] if text == "[]" else {}
-    if text.startswith("[") or text.startswith("{"):
-        raise ValidationError(f"Unsupported flow value (must be JSON): {text}")
-    if text.startswith('"') and text.endswith('"'):
-        return text[1:-1]
-    if text.startswith("'") and text.endswith("'") and len(text) >= 2:
-        return text[1:-1].replace("''", "'")
-    if text.isdigit() or (text.startswith("-") and text[1:].isdigit()):
-        try:
-            return int(text, 10)
-        except Exception:
-            pass
-    return text
-
-
-def _preprocess_yaml(text: str) -> list[tuple[int, str]]:
-    out: list[tuple[int, str]] = []
-    for raw in text.splitlines():
-        if "\t" in raw:
-            raise ValidationError("Tabs are not allowed (use spaces).")
-        line = _strip_yaml_comment(raw).rstrip()
-        if not line.strip():
-            continue
-        indent = len(line) - len(line.lstrip(" "))
-        out.append((indent, line.lstrip(" ")))
-    return out
-
-
-def _parse_block(lines: list[tuple[int, str]], index: int, indent: int) -> tuple[Any, int]:
-    if index >= len(lines):
-        return {}, index
-    current_indent, current_text = lines[index]
-    if current_indent != indent:
-        raise ValidationError(f"Unexpected indentation at line: {current_text}")
-
-    if current_text.startswith("- "):
-        items: list[Any] = []
-        i = index
-        while i < len(lines):
-            i_indent, i_text = lines[i]
-            if i_indent != indent or not i_text.startswith("- "):
-                break
-            rest = i_text[2:].strip()
-            i += 1
-            if rest == "":
-                if i >= len(lines) or lines[i][0] <= indent:
-                    items.append(None)
-                else:
-                    child_indent = lines[i][0]
-                    child, i = _parse_block(lines, i, child_indent)
-                    items.append(child)
-            else:
-                items.append(_parse_scalar(rest))
-        return items, i
-
-    mapping: dict[str, Any] = {}
-    i = index
-    while i < len(lines):
-        i_indent, i_text = lines[i]
-        if i_indent != indent or i_text.startswith("- "):
-            break
-        if ":" not in i_text:
-            raise ValidationError(f"Invalid mapping entry (missing ':'): {i_text}")
-        key, rest = i_text.split(":", 1)
-        key = key.strip()
-        if not key:
-            raise ValidationError(f"Empty key in mapping entry: {i_text}")
-        rest = rest.lstrip()
-        i += 1
-        if rest == "":
-            if i >= len(lines) or lines[i][0] <= indent:
-                mapping[key] = {}
-            else:
-                child_indent = lines[i][0]
-                child, i = _parse_block(lines, i, child_indent)
-                mapping[key] = child
-        else:
-            mapping[key] = _parse_scalar(rest)
-    return mapping, i
-
-
 def _load_yaml(path: Path) -> Any:
-    raw = path.read_text(encoding="utf-8")
-    lines = _preprocess_yaml(raw)
-    if not lines:
-        raise ValidationError(f"Empty YAML file: {path}")
-    top_indent = lines[0][0]
-    if top_indent != 0:
-        raise ValidationError(f"Top-level YAML must start at indent 0: {path}")
-    parsed, next_index = _parse_block(lines, 0, 0)
-    if next_index != len(lines):
-        leftover = ", ".join(line for _, line in lines[next_index:next_index + 3])
-        raise ValidationError(f"Trailing YAML content in {path}: {leftover}")
-    return parsed
+    try:
+        return load_yaml(path)
+    except YamlError as exc:
+        raise ValidationError(str(exc)) from exc
 
 
 def _validate_list_field(data: dict[str, Any], field: str, errors: list[str]) -> None:
@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+Shared YAML loading for CERES scripts.
+
+`load_yaml(path)` first tries a pure-Python parser for the block-style subset our
+config files use: mappings, sequences (including mappings inside list items),
+single-line flow collections, quoted and plain scalars, and literal/folded block
+scalars. Documents outside the subset (anchors, aliases, tags, multi-line flow or
+quoted scalars) go to libyaml (PyYAML's CSafeLoader), then to PyYAML's pure-Python
+SafeLoader. On our configs the subset parser is about twice as fast as CSafeLoader
+(which still builds objects in Python), and PyYAML is only imported when a document
+needs it. CERES_YAML_BACKEND=libyaml tries CSafeLoader first; CERES_YAML_BACKEND=subset
+disables PyYAML entirely.
+
+All paths resolve scalars the same way (YAML 1.1 core types as in yaml.safe_load),
+except that timestamps stay strings so parsed documents remain JSON-serialisable.
+
+Parsed documents are cached per process by (path, mtime_ns, size, inode), so scripts
+and in-process preflight stages that read the same config share one parse. Cached
+documents are shared: treat them as read-only.
+
+Benchmark: `python scripts/yaml_loader.py --benchmark [PATH ...]`.
+
+Identical copies live in each component's scripts/ directory; keep them in sync.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+
+
+def _without_timestamps(base: Any) -> Any:
+    class Loader(base):  # type: ignore[misc, valid-type]
+        pass
+
+    Loader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag != _TIMESTAMP_TAG]
+        for first, resolvers in base.yaml_implicit_resolvers.items()
+    }
+    return Loader
+
+
+class YamlError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Scalars (same implicit types as PyYAML's SafeLoader, minus timestamps)
+
+_NULLS = {"", "~", "null", "Null", "NULL"}
+_BOOLS = {
+    "yes": True, "Yes": True, "YES": True, "true": True, "True": True, "TRUE": True,
+    "on": True, "On": True, "ON": True,
+    "no": False, "No": False, "NO": False, "false": False, "False": False, "FALSE": False,
+    "off": False, "Off": False, "OFF": False,
+}
+_INT = re.compile(
+    r"[-+]?0b[0-1_]+|[-+]?0[0-7_]+|[-+]?(?:0|[1-9][0-9_]*)|[-+]?0x[0-9a-fA-F_]+|[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+"
+)
+_FLOAT = re.compile(
+    r"[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?|\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?"
+    r"|[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN)"
+)
+_BLOCK_INDICATOR = re.compile(r"[|>](?:[1-9][+-]?|[+-][1-9]?)?")
+_UNSUPPORTED_START = ("&", "*", "!", "%", "@", "`")
+
+
+def _plain_start_ok(text: str, flow: bool) -> bool:
+    """False when a plain scalar starts with a YAML indicator the subset would misread.
+
+    Such scalars are either errors or special nodes (like the "=" value tag) under
+    libyaml, so the subset raises and leaves the decision to the fallback.
+    """
+    if text == "=" or text[0] in ",[]{}#|>" or text.startswith(_UNSUPPORTED_START):
+        return False
+    if text[0] in "?:" and flow:
+        return False
+    return not (text[0] in "-?:" and text[1:2] in ("", " "))
+
+
+def _sexagesimal(text: str, convert: Callable[[str], Any]) -> Any:
+    value = 0
+    for part in text.split(":"):
+        value = value * 60 + convert(part)
+    return value
+
+
+def _to_int(text: str) -> int:
+    text = text.replace("_", "")
+    sign = -1 if text[0] == "-" else 1
+    if text[0] in "+-":
+        text = text[1:]
+    if text == "0":
+        return 0
+    if text.startswith("0b"):
+        return sign * int(text[2:], 2)
+    if text.startswith("0x"):
+        return sign * int(text[2:], 16)
+    if text[0] == "0":
+        return sign * int(text, 8)
+    if ":" in text:
+        return sign * _sexagesimal(text, int)
+    return sign * int(text)
+
+
+def _to_float(text: str) -> float:
+    text = text.replace("_", "").lower()
+    sign = -1.0 if text[0] == "-" else 1.0
+    if text[0] in "+-":
+        text = text[1:]
+    if text == ".inf":
+        return sign * math.inf
+    if text == ".nan":
+        return math.nan
+    if ":" in text:
+        return sign * _sexagesimal(text, float)
+    return sign * float(text)
+
+
+def resolve_scalar(text: str) -> Any:
+    """Type a plain (unquoted) scalar the way yaml.safe_load does, minus timestamps."""
+    if text in _NULLS:
+        return None
+    if text in _BOOLS:
+        return _BOOLS[text]
+    if text[0] in "+-.0123456789":
+        if _INT.fullmatch(text):
+            return _to_int(text)
+        if _FLOAT.fullmatch(text):
+            return _to_float(text)
+    return text
+
+
+def _is_quote_start(line: str, index: int) -> bool:
+    return index == 0 or line[index - 1] in " \t[{,"
+
+
+def strip_comment(line: str) -> str:
+    """Drop a trailing `# comment` that is outside quotes and preceded by whitespace."""
+    if "#" not in line:
+        return line
+    quote = ""
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if quote:
+            if char == "\\" and quote == '"':
+                index += 1
+            elif char == quote:
+                if quote == "'" and line[index + 1:index + 2] == "'":
+                    index += 1
+                else:
+                    quote = ""
+        elif char in "'\"" and _is_quote_start(line, index):
+            quote = char
+        elif char == "#" and (index == 0 or line[index - 1] in " \t"):
+            return line[:index]
+        index += 1
+    return line
+
+
+def _quoted(text: str, start: int) -> Tuple[str, int]:
+    """Parse a quoted scalar starting at text[start]; returns (value, index after it)."""
+    quote = text[start]
+    index = start + 1
+    if quote == "'":
+        out: List[str] = []
+        while index < len(text):
+            char = text[index]
+            if char == "'":
+                if text[index + 1:index + 2] == "'":
+                    out.append("'")
+                    index += 2
+                    continue
+                return "".join(out), index + 1
+            out.append(char)
+            index += 1
+        raise YamlError(f"Unterminated single-quoted string: {text}")
+    while index < len(text):
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == '"':
+            raw = text[start:index + 1]
+            try:
+                return json.loads(raw), index + 1
+            except ValueError:
+                raise YamlError(f"Unsupported escape in double-quoted string: {raw}") from None
+        index += 1
+    raise YamlError(f"Unterminated double-quoted string: {text}")
+
+
+def _split_key(text: str) -> Optional[Tuple[str, str]]:
+    """(key, rest) for a `key: value` entry, or None if the line is not a mapping entry."""
+    if text[0] in "'\"":
+        try:
+            key, end = _quoted(text, 0)
+        except YamlError:
+            return None
+        rest = text[end:].lstrip(" ")
+        if rest == ":" or rest.startswith(": "):
+            return key, rest[1:].strip()
+        return None
+    if text[0] in "[{":
+        return None
+    index = text.find(":")
+    while index != -1:
+        if index + 1 == len(text) or text[index + 1] == " ":
+            key = text[:index].rstrip()
+            return (key, text[index + 1:].strip()) if key else None
+        index = text.find(":", index + 1)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Flow collections ([a, b], {k: v}) on a single line
+
+
+class _Flow:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.index = 0
+
+    def _skip(self) -> None:
+        while self.index < len(self.text) and self.text[self.index] == " ":
+            self.index += 1
+
+    def _peek(self) -> str:
+        self._skip()
+        return self.text[self.index] if self.index < len(self.text) else ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise YamlError(f"Expected '{char}' in flow collection: {self.text}")
+        self.index += 1
+
+    def parse(self) -> Any:
+        value = self.node()
+        if self._peek():
+            raise YamlError(f"Unexpected content after flow collection: {self.text}")
+        return value
+
+    def node(self, stops: str = ",]}") -> Any:
+        char = self._peek()
+        if char == "[":
+            return self.sequence()
+        if char == "{":
+            return self.mapping()
+        if char in ("'", '"'):
+            value, self.index = _quoted(self.text, self.index)
+            return value
+        if char in _UNSUPPORTED_START:
+            raise YamlError(f"Unsupported YAML feature in flow collection: {self.text}")
+        start = self.index
+        while self.index < len(self.text):
+            char = self.text[self.index]
+            if char in stops:
+                break
+            if char == ":" and self.text[self.index + 1:self.index + 2] in ("", " ", ",", "]", "}"):
+                break
+            self.index += 1
+        text = self.text[start:self.index].strip()
+        if text and not _plain_start_ok(text, flow=True):
+            raise YamlError(f"Unsupported plain scalar in flow collection: {self.text}")
+        return resolve_scalar(text)
+
+    def sequence(self) -> List[Any]:
+        self._expect("[")
+        items: List[Any] = []
+        while self._peek() != "]":
+            if not self._peek():
+                raise YamlError(f"Unterminated flow sequence: {self.text}")
+            items.append(self.node())
+            if self._peek() == ":":
+                raise YamlError(f"Unsupported mapping inside flow sequence: {self.text}")
+            if self._peek() == ",":
+                self.index += 1
+            elif self._peek() != "]":
+                raise YamlError(f"Expected ',' or ']' in flow sequence: {self.text}")
+        self.index += 1
+        return items
+
+    def mapping(self) -> Dict[Any, Any]:
+        self._expect("{")
+        mapping: Dict[Any, Any] = {}
+        while self._peek() != "}":
+            if not self._peek():
+                raise YamlError(f"Unterminated flow mapping: {self.text}")
+            key = self.node(",}")
+            value = None
+            if self._peek() == ":":
+                self.index += 1
+                value = self.node(",}")
+            mapping[key] = value
+            if self._peek() == ",":
+                self.index += 1
+            elif self._peek() != "}":
+                raise YamlError(f"Expected ',' or '}}' in flow mapping: {self.text}")
+        self.index += 1
+        return mapping
+
+
+# ---------------------------------------------------------------------------
+# Block structure
+
+_Line = Tuple[int, str]  # (indent, text without indentation or comment)
+
+
+def _block_indicator(text: str) -> Optional[str]:
+    head, _, token = text.rpartition(" ")
+    if not _BLOCK_INDICATOR.fullmatch(token):
+        return None
+    head = head.rstrip()
+    if text == token or head.endswith(":") or head == "-" or head.endswith(" -"):
+        return token
+    return None
+
+
+def _node_indent(indent: int, text: str) -> int:
+    """Indentation of the node owning a block scalar that starts on this line."""
+    column = indent
+    while text.startswith("- "):
+        stripped = text[2:].lstrip(" ")
+        column += len(text) - len(stripped)
+        text = stripped
+    if _split_key(text) is not None:
+        return column
+    return column - 2 if column > indent else indent
+
+
+def _fold(lines: List[str]) -> str:
+    out: List[str] = []
+    empties = 0
+    previous_more = False
+    for line in lines:
+        if line == "":
+            empties += 1
+            continue
+        more = line.startswith((" ", "\t"))
+        if out:
+            if previous_more or more:
+                out.append("\n" * (empties + 1))
+            else:
+                out.append("\n" * empties if empties else " ")
+        elif empties:
+            out.append("\n" * empties)
+        out.append(line)
+        empties = 0
+        previous_more = more
+    return "".join(out)
+
+
+def _block_scalar(indicator: str, body: List[str], parent: int) -> str:
+    explicit = next((int(char) for char in indicator if char.isdigit()), None)
+    chomp = "+" if "+" in indicator else "-" if "-" in indicator else ""
+    content = [line for line in body if line.strip()]
+    indent = parent + explicit if explicit else (min(len(line) - len(line.lstrip(" ")) for line in content) if content else 0)
+    lines = []
+    for line in body:
+        if line.strip() and len(line) - len(line.lstrip(" ")) < indent:
+            raise YamlError(f"Block scalar line is less indented than its first line: {line.strip()}")
+        lines.append(line[indent:] if line.strip() else "")
+    trailing = 0
+    while lines and lines[-1] == "":
+        lines.pop()
+        trailing += 1
+    text = _fold(lines) if indicator[0] == ">" else "\n".join(lines)
+    if not lines:
+        return "\n" * trailing if chomp == "+" else ""
+    if chomp == "-":
+        return text
+    if chomp == "+":
+        return text + "\n" * (trailing + 1)
+    return text + "\n"
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.lines: List[_Line] = []
+        self.blocks: Dict[int, str] = {}
+        raw_lines = text.splitlines()
+        index = 0
+        while index < len(raw_lines):
+            raw = raw_lines[index]
+            index += 1
+            line = strip_comment(raw).rstrip()
+            if not line.strip():
+                continue
+            body = line.lstrip(" ")
+            if body.startswith("\t"):
+                raise YamlError("Tabs are not allowed in YAML indentation (use spaces).")
+            indent = len(line) - len(body)
+            if indent == 0 and body in ("---", "..."):
+                if body == "..." or self.lines:
+                    raise YamlError("Multiple YAML documents are not supported.")
+                continue
+            indicator = _block_indicator(body)
+            if indicator is not None:
+                parent = _node_indent(indent, body)
+                block: List[str] = []
+                while index < len(raw_lines):
+                    candidate = raw_lines[index]
+                    if candidate.strip() and len(candidate) - len(candidate.lstrip(" ")) <= parent:
+                        break
+                    block.append(candidate.rstrip("\r"))
+                    index += 1
+                self.blocks[len(self.lines)] = _block_scalar(indicator, block, parent)
+            self.lines.append((indent, body))
+
+    def document(self) -> Any:
+        if not self.lines:
+            return None
+        if self.lines[0][0] != 0:
+            raise YamlError("Top-level YAML must start at indent 0.")
+        value, index = self.node(0, 0)
+        if index != len(self.lines):
+            leftover = ", ".join(text for _, text in self.lines[index:index + 3])
+            raise YamlError(f"Trailing YAML content: {leftover}")
+        return value
+
+    def node(self, index: int, indent: int) -> Tuple[Any, int]:
+        text = self.lines[index][1]
+        if text == "-" or text.startswith("- "):
+            return self.sequence(index, indent)
+        if _split_key(text) is not None:
+            return self.mapping(index, indent)
+        return self.value(text, index), index + 1
+
+    def child(self, index: int, indent: int, allow_sequence: bool) -> Tuple[Any, int]:
+        """The value of an entry whose inline part was empty: nested block or null."""
+        if index < len(self.lines):
+            next_indent, next_text = self.lines[index]
+            if next_indent > indent:
+                return self.node(index, next_indent)
+            if allow_sequence and next_indent == indent and (next_text == "-" or next_text.startswith("- ")):
+                return self.sequence(index, indent)
+        return None, index
+
+    def sequence(self, index: int, indent: int) -> Tuple[List[Any], int]:
+        items: List[Any] = []
+        while index < len(self.lines):
+            line_indent, text = self.lines[index]
+            if line_indent != indent or not (text == "-" or text.startswith("- ")):
+                break
+            rest = text[1:].lstrip(" ")
+            if rest == "":
+                item, index = self.child(index + 1, indent, False)
+            elif rest == "-" or rest.startswith("- ") or _split_key(rest) is not None:
+                # Inline node ("- key: value" or "- - item"): re-read it at its own column.
+                column = indent + len(text) - len(rest)
+                self.lines[index] = (column, rest)
+                item, index = self.node(index, column)
+            else:
+                item, index = self.value(rest, index), index + 1
+            items.append(item)
+        if index < len(self.lines) and self.lines[index][0] > indent:
+            raise YamlError(f"Unexpected indentation at line: {self.lines[index][1]}")
+        return items, index
+
+    def mapping(self, index: int, indent: int) -> Tuple[Dict[Any, Any], int]:
+        mapping: Dict[Any, Any] = {}
+        while index < len(self.lines):
+            line_indent, text = self.lines[index]
+            if line_indent != indent or text == "-" or text.startswith("- "):
+                break
+            entry = _split_key(text)
+            if entry is None:
+                raise YamlError(f"Invalid mapping entry (missing ':'): {text}")
+            raw_key, rest = entry
+            key = raw_key if text[0] in "'\"" else self.value(raw_key, None)
+            if rest == "":
+                value, index = self.child(index + 1, indent, True)
+            else:
+                value, index = self.value(rest, index), index + 1
+            mapping[key] = value
+        if index < len(self.lines) and self.lines[index][0] > indent:
+            raise YamlError(f"Unexpected indentation at line: {self.lines[index][1]}")
+        return mapping, index
+
+    def value(self, text: str, index: Optional[int]) -> Any:
+        if index is not None and index in self.blocks and _BLOCK_INDICATOR.fullmatch(text):
+            return self.blocks[index]
+        char = text[0]
+        if char in "[{":
+            return _Flow(text).parse()
+        if char in "'\"":
+            value, end = _quoted(text, 0)
+            if text[end:].strip():
+                raise YamlError(f"Unexpected content after quoted scalar: {text}")
+            return value
+        if char in _UNSUPPORTED_START or text.startswith("<<"):
+            raise YamlError(f"Unsupported YAML feature (anchors, aliases, tags): {text}")
+        if ": " in text:
+            raise YamlError(f"Mapping values are not allowed here: {text}")
+        if not _plain_start_ok(text, flow=False):
+            raise YamlError(f"Plain scalar starts with a YAML indicator: {text}")
+        return resolve_scalar(text)
+
+
+def parse_subset(text: str) -> Any:
+    """Parse YAML text with the pure-Python subset parser (raises YamlError)."""
+    return _Parser(text).document()
+
+
+# ---------------------------------------------------------------------------
+# Backends and cache
+
+
+_LOADERS: Optional[Dict[str, Any]] = None
+
+
+def pyyaml_loaders() -> Dict[str, Any]:
+    """{"libyaml": CSafeLoader, "pyyaml": SafeLoader} variants available here (imported lazily)."""
+    global _LOADERS
+    if _LOADERS is None:
+        _LOADERS = {}
+        try:
+            import yaml  # type: ignore
+        except Exception:
+            return _LOADERS
+        if hasattr(yaml, "CSafeLoader"):
+            _LOADERS["libyaml"] = _without_timestamps(yaml.CSafeLoader)
+        _LOADERS["pyyaml"] = _without_timestamps(yaml.SafeLoader)
+    return _LOADERS
+
+
+def backend() -> str:
+    """CERES_YAML_BACKEND: "auto" (default), "libyaml" or "subset"."""
+    value = os.environ.get("CERES_YAML_BACKEND", "").strip().lower()
+    return value if value in {"libyaml", "subset"} else "auto"
+
+
+def _pyyaml_parse(text: str, loader: Any) -> Any:
+    import yaml  # type: ignore
+
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as exc:
+        raise YamlError(str(exc).replace("\n", " ")) from exc
+
+
+def parse(text: str) -> Any:
+    """Parse YAML text (no caching). Raises YamlError."""
+    mode = backend()
+    if mode == "libyaml" and "libyaml" in pyyaml_loaders():
+        return _pyyaml_parse(text, pyyaml_loaders()["libyaml"])
+    try:
+        return parse_subset(text)
+    except YamlError:
+        loaders = {} if mode == "subset" else pyyaml_loaders()
+        fallback = loaders.get("libyaml") or loaders.get("pyyaml")
+        if fallback is None:
+            raise
+        return _pyyaml_parse(text, fallback)
+
+
+_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def _cached(path: Path, loader: Callable[[str], Any]) -> Any:
+    stat = path.stat()
+    key = (loader.__name__, str(path.resolve()))
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    data = loader(path.read_text(encoding="utf-8"))
+    _CACHE[key] = (signature, data)
+    return data
+
+
+def load_yaml(path: Path) -> Any:
+    """Parsed YAML document at `path` (cached by mtime/size). Raises YamlError."""
+    path = Path(path)
+    try:
+        data = _cached(path, parse)
+    except YamlError as exc:
+        raise YamlError(f"{exc} ({path})") from exc
+    if data is None:
+        raise YamlError(f"Empty YAML file: {path}")
+    return data
+
+
+def _parse_yaml_or_json(text: str) -> Any:
+    try:
+        data = parse(text)
+    except YamlError:
+        data = None
+    if data is None:
+        data = json.loads(text)
+    return data
+
+
+def read_yaml_or_json(path: Path) -> Any:
+    """YAML document at `path`, else JSON (cached by mtime/size). Raises ValueError."""
+    return _cached(Path(path), _parse_yaml_or_json)
+
+
+def load_yaml_or_json(path: Path, label: str, expect_object: bool = True) -> Any:
+    """read_yaml_or_json for CLI scripts: exits with a labelled message on bad input."""
+    try:
+        data = read_yaml_or_json(path)
+    except ValueError as exc:
+        raise SystemExit(f"Failed to parse {label}: {exc}")
+    if expect_object and not isinstance(data, dict):
+        raise SystemExit(f"{label} must be an object.")
+    return data
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+
+
+def _default_benchmark_paths(root: Path) -> List[Path]:
+    paths = [root / "ceres.policy.yaml", root / "ceres.workflow.yaml"]
+    paths.extend(sorted(root.glob("*/skills/*/skill.yaml")))
+    paths.extend(sorted(root.glob("skills/*/skill.yaml")))
+    paths.extend(sorted(root.glob("synchronizations/*.yaml")))
+    paths.extend(sorted(root.glob("*/synchronizations/**/*.yaml")))
+    return [path for path in paths if path.is_file()]
+
+
+def benchmark(paths: List[Path], repeat: int) -> List[Dict[str, Any]]:
+    texts = [(path, path.read_text(encoding="utf-8")) for path in paths]
+    candidates: List[Tuple[str, Callable[[str], Any]]] = [("subset", parse_subset)]
+    for name, loader in pyyaml_loaders().items():
+        candidates.append((name, lambda text, loader=loader: _pyyaml_parse(text, loader)))
+    rows: List[Dict[str, Any]] = []
+    for name, loader in candidates:
+        supported = []
+        for path, text in texts:
+            try:
+                loader(text)
+                supported.append(text)
+            except YamlError:
+                pass
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for text in supported:
+                loader(text)
+        elapsed = time.perf_counter() - started
+        rows.append({"backend": name, "files": len(supported), "seconds": elapsed})
+    clear_cache()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for path, _ in texts:
+            try:
+                load_yaml(path)
+            except YamlError:
+                pass
+    rows.append({"backend": f"load_yaml ({backend()}, cached)", "files": len(texts), "seconds": time.perf_counter() - started})
+    for row in rows:
+        parses = max(row["files"] * repeat, 1)
+        row["us_per_file"] = round(row["seconds"] / parses * 1e6, 1)
+        row["seconds"] = round(row["seconds"], 4)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="CERES YAML loader")
+    parser.add_argument("--benchmark", action="store_true", help="Time each parser on PATHs (default: repo configs)")
+    parser.add_argument("--repeat", type=int, default=200, help="Parses per file for --benchmark")
+    parser.add_argument("--root", type=Path, default=Path(__file__).resolve().parent.parent)
+    parser.add_argument("paths", nargs="*", type=Path)
+    args = parser.parse_args(argv)
+    if not args.benchmark:
+        for path in args.paths:
+            try:
+                sys.stdout.write(json.dumps(load_yaml(path), indent=2, sort_keys=True, default=str) + "\n")
+            except YamlError as exc:
+                sys.stderr.write(f"ERROR: {exc}\n")
+                return 1
+        return 0
+    paths = args.paths or _default_benchmark_paths(args.root)
+    if not paths:
+        sys.stderr.write("No YAML files to benchmark.\n")
+        return 2
+    sys.stdout.write(f"{len(paths)} files x {args.repeat} parses\n")
+    for row in benchmark(paths, args.repeat):
+        sys.stdout.write(f"{row['backend']:<32} {row['files']:>4} files {row['seconds']:>9.4f}s {row['us_per_file']:>9.1f} us/file\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
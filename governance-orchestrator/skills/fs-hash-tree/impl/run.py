@@ -5,10 +5,24 @@ from __future__ import annotations
 import fnmatch
 import hashlib
 import json
+import mmap
 import os
+import re
+import stat
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+CACHE_VERSION = 1
+MAX_WORKERS = 64
+# Files at least this large are hashed from an mmap in one update() call; hashlib
+# releases the GIL for the whole buffer, so pool threads hash them concurrently.
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# Files modified this recently may change again within the same mtime tick, so their
+# digests are not trusted on the next run (git's "racily clean" rule).
+RACY_WINDOW_NS = 2_000_000_000
 
 
 def eprint_json(event: str, payload: dict[str, Any]) -> None:
@@ -18,6 +32,11 @@ def eprint_json(event: str, payload: dict[str, Any]) -> None:
 def sha_file(path: Path, algorithm: str) -> str:
     hasher = hashlib.new(algorithm)
     with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+            return hasher.hexdigest()
         while True:
             chunk = f.read(1024 * 1024)
             if not chunk:
@@ -26,11 +45,133 @@ def sha_file(path: Path, algorithm: str) -> str:
     return hasher.hexdigest()
 
 
-def matches_any(path_posix: str, patterns: list[str]) -> bool:
-    for pattern in patterns:
-        if fnmatch.fnmatch(path_posix, pattern):
-            return True
-    return False
+def compile_excludes(patterns: list[str]) -> Optional[re.Pattern[str]]:
+    """One regex equivalent to fnmatch.fnmatch against any of `patterns`."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns))
+
+
+def is_excluded(path_posix: str, exclude_re: Optional[re.Pattern[str]]) -> bool:
+    return exclude_re is not None and exclude_re.match(os.path.normcase(path_posix)) is not None
+
+
+def is_cache_file(file_path: Path, cache_path: Optional[Path]) -> bool:
+    """True for the digest cache itself and its in-flight `<name>.<pid>.tmp` siblings."""
+    if cache_path is None or file_path.parent != cache_path.parent:
+        return False
+    name = file_path.name
+    return name == cache_path.name or (name.startswith(f"{cache_path.name}.") and name.endswith(".tmp"))
+
+
+class DigestCache:
+    """Per-file digests keyed by (size, mtime_ns, inode), persisted as JSON at `path`.
+
+    The cache only decides whether a file is re-read; a digest is reused solely when all
+    three stat fields match, so output is identical with or without it. A cache file under
+    the hashed root is skipped by the walk for the same reason.
+    """
+
+    def __init__(self, path: Path, algorithm: str, root: Path) -> None:
+        self.path = path
+        self.algorithm = algorithm
+        self.prefix = str(root) + os.sep
+        self.hits = 0
+        self.misses = 0
+        self.data: dict[str, Any] = {"version": CACHE_VERSION, "files": {}}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("files"), dict):
+            self.data = data
+        stale = self.data["files"].get(algorithm)
+        self.previous: dict[str, list[Any]] = stale if isinstance(stale, dict) else {}
+        self.current: dict[str, list[Any]] = {}
+
+    def lookup(self, file_path: Path, st: os.stat_result) -> Optional[str]:
+        entry = self.previous.get(str(file_path))
+        if isinstance(entry, list) and entry[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+        return None
+
+    def store(self, file_path: Path, st: os.stat_result, digest: str) -> None:
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            self.current[str(file_path)] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+
+    def save(self) -> None:
+        # Entries under other roots are kept; entries under this root are replaced so
+        # deleted or excluded files drop out.
+        merged = {k: v for k, v in self.previous.items() if not k.startswith(self.prefix)}
+        merged.update(self.current)
+        self.data["files"][self.algorithm] = merged
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self.data, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            eprint_json("cache_write_failed", {"path": str(self.path), "message": str(e)})
+
+
+def hash_files(
+    entries: list[tuple[Path, os.stat_result]], algorithm: str, workers: int, cache: Optional[DigestCache]
+) -> list[str]:
+    """Digests for `entries`, in order. Cache lookups and stores stay on this thread."""
+    digests: list[Optional[str]] = [cache.lookup(path, st) if cache else None for path, st in entries]
+    pending = [i for i, digest in enumerate(digests) if digest is None]
+
+    def work(index: int) -> str:
+        return sha_file(entries[index][0], algorithm)
+
+    if workers > 1 and len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            computed = list(pool.map(work, pending))
+    else:
+        computed = [work(i) for i in pending]
+    for index, digest in zip(pending, computed):
+        digests[index] = digest
+        if cache:
+            cache.store(entries[index][0], entries[index][1], digest)
+    return digests  # type: ignore[return-value]
+
+
+def merkle_directories(files: list[dict[str, Any]], algorithm: str) -> list[dict[str, Any]]:
+    """Per-directory digests over (kind, name, digest) of each child, sorted by name.
+
+    Only directories that contain files (at any depth) appear; the root is ".". Two
+    trees differ below a directory exactly when that directory's digests differ.
+    """
+    children: dict[str, list[tuple[str, str, str]]] = {".": []}
+    counts: dict[str, int] = {".": 0}
+    for entry in files:
+        parts = entry["path"].split("/")
+        for depth in range(len(parts) - 1):
+            directory = "/".join(parts[: depth + 1])
+            if directory not in children:
+                children[directory] = []
+                counts[directory] = 0
+                parent = "/".join(parts[:depth]) or "."
+                children[parent].append(("d", parts[depth], directory))
+        parent = "/".join(parts[:-1]) or "."
+        children[parent].append(("f", parts[-1], entry["digest"]))
+        counts["."] += 1
+        for depth in range(len(parts) - 1):
+            counts["/".join(parts[: depth + 1])] += 1
+
+    digests: dict[str, str] = {}
+    for directory in sorted(children, key=lambda d: (d.count("/") if d != "." else -1), reverse=True):
+        hasher = hashlib.new(algorithm)
+        for kind, name, ref in sorted(children[directory], key=lambda c: c[1]):
+            digest = digests[ref] if kind == "d" else ref
+            hasher.update(f"{kind}\0{name}\0{digest}\0".encode("utf-8"))
+        digests[directory] = hasher.hexdigest()
+    return [
+        {"path": directory, "digest": digests[directory], "fileCount": counts[directory]}
+        for directory in sorted(digests)
+    ]
 
 
 def main() -> int:
@@ -52,11 +193,27 @@ def main() -> int:
         if not isinstance(exclude, list) or any(not isinstance(p, str) or not p for p in exclude):
             raise ValueError("exclude must be an array of non-empty strings")
 
+        cache_raw = input_obj.get("cachePath")
+        if cache_raw is not None and (not isinstance(cache_raw, str) or not cache_raw):
+            raise ValueError("cachePath must be a non-empty string")
+
         root_path = Path(root_raw).resolve()
         if not root_path.exists() or not root_path.is_dir():
             raise ValueError("root must be an existing directory")
 
-        files: list[dict[str, Any]] = []
+        workers = input_obj.get("workers", 1)
+        if not isinstance(workers, int) or isinstance(workers, bool) or not 1 <= workers <= MAX_WORKERS:
+            raise ValueError(f"workers must be an integer between 1 and {MAX_WORKERS}")
+
+        merkle = input_obj.get("merkle", False)
+        if not isinstance(merkle, bool):
+            raise ValueError("merkle must be a boolean")
+
+        exclude_re = compile_excludes(exclude)
+        cache_path = Path(cache_raw).resolve() if cache_raw else None
+        cache = DigestCache(cache_path, algorithm, root_path) if cache_path else None
+
+        found: list[tuple[str, Path, os.stat_result]] = []
         for dirpath, dirnames, filenames in os.walk(root_path, topdown=True, followlinks=False):
             dir_path = Path(dirpath)
             rel_dir = dir_path.relative_to(root_path).as_posix()
@@ -69,21 +226,35 @@ def main() -> int:
             pruned_dirnames = []
             for d in dirnames:
                 rel = f"{rel_dir}/{d}" if rel_dir else d
-                if matches_any(rel, exclude):
+                if is_excluded(rel, exclude_re):
                     continue
                 pruned_dirnames.append(d)
             dirnames[:] = pruned_dirnames
 
             for filename in filenames:
+                rel = f"{rel_dir}/{filename}" if rel_dir else filename
+                if is_excluded(rel, exclude_re):
+                    continue
                 file_path = dir_path / filename
-                if file_path.is_symlink() or not file_path.is_file():
+                if is_cache_file(file_path, cache_path):
                     continue
-                rel = f"{rel_dir}/{filename}" if rel_dir else filename
-                if matches_any(rel, exclude):
+                try:
+                    st = os.lstat(file_path)
+                except FileNotFoundError:
                     continue
-                digest = sha_file(file_path, algorithm)
-                size = file_path.stat().st_size
-                files.append({"path": rel, "digest": digest, "size": size})
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                found.append((rel, file_path, st))
+
+        digests = hash_files([(path, st) for _, path, st in found], algorithm, workers, cache)
+        files: list[dict[str, Any]] = [
+            {"path": rel, "digest": digest, "size": st.st_size}
+            for (rel, _, st), digest in zip(found, digests)
+        ]
+
+        if cache:
+            cache.save()
+            eprint_json("cache", {"hits": cache.hits, "misses": cache.misses, "path": str(cache.path)})
 
         files.sort(key=lambda x: x["path"])
         tree_hasher = hashlib.new(algorithm)
@@ -100,6 +271,8 @@ def main() -> int:
             "fileCount": len(files),
             "files": files,
         }
+        if merkle:
+            output["directories"] = merkle_directories(files, algorithm)
         sys.stdout.write(json.dumps(output, separators=(",", ":"), sort_keys=True) + "\n")
         return 0
     except Exception as e:
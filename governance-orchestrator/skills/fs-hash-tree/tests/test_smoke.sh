@@ -4,7 +4,8 @@ set -euo pipefail
 skill_dir="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
 
 tmp_out="$(mktemp)"
-trap 'rm -f "$tmp_out"' EXIT
+tmp_cache_dir="$(mktemp -d)"
+trap 'rm -f "$tmp_out"; rm -rf "$tmp_cache_dir"' EXIT
 
 (cd "$skill_dir" && python3 "impl/run.py" < "fixtures/input.json" > "$tmp_out")
 
@@ -30,3 +31,40 @@ if expected != actual:
     print("actual:", actual, file=sys.stderr)
     raise SystemExit(1)
 PY
+
+# A warm digest cache must not change the output.
+cache_input="{\"root\":\"fixtures/tree\",\"algorithm\":\"sha256\",\"exclude\":[],\"cachePath\":\"${tmp_cache_dir}/digests.json\"}"
+for _ in 1 2; do
+  (cd "$skill_dir" && printf '%s' "$cache_input" | python3 "impl/run.py" 2>/dev/null | cmp -s - "$tmp_out") || {
+    echo "Mismatch: output differs with cachePath" >&2
+    exit 1
+  }
+done
+
+# A cache file inside the hashed root is not part of the tree.
+cp -R "$skill_dir/fixtures/tree" "$tmp_cache_dir/tree"
+inner_input="{\"root\":\"${tmp_cache_dir}/tree\",\"cachePath\":\"${tmp_cache_dir}/tree/.cache.json\"}"
+for _ in 1 2; do
+  printf '%s' "$inner_input" | python3 "$skill_dir/impl/run.py" 2>/dev/null | python3 -c '
+import json, sys
+flat = json.load(open(sys.argv[1], encoding="utf-8"))
+inner = json.load(sys.stdin)
+flat.pop("root")
+inner.pop("root")
+if inner != flat:
+    print("Mismatch: cachePath under root changed the output", inner, file=sys.stderr)
+    raise SystemExit(1)
+' "$tmp_out"
+done
+test -f "$tmp_cache_dir/tree/.cache.json"
+
+# Threaded Merkle mode keeps the flat fields and adds per-directory digests.
+(cd "$skill_dir" && printf '%s' '{"root":"fixtures/tree","workers":4,"merkle":true}' | python3 "impl/run.py") | python3 -c '
+import json, sys
+flat = json.load(open(sys.argv[1], encoding="utf-8"))
+merkle = json.load(sys.stdin)
+dirs = {d["path"]: d["fileCount"] for d in merkle.pop("directories")}
+if merkle != flat or dirs != {".": 2, "subdir": 1}:
+    print("Mismatch: merkle output", merkle, dirs, file=sys.stderr)
+    raise SystemExit(1)
+' "$tmp_out"
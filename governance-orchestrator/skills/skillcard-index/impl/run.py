@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
+import bisect
 import os
 import re
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Iterator, Literal, Optional
+
+CACHE_VERSION = 1
+# Directory names never descended into unless `pruneDirs` overrides them.
+DEFAULT_PRUNE_DIRS = frozenset({".git", ".hg", ".svn", "node_modules", "__pycache__"})
+# Entries modified this recently may change again within the same mtime tick, so they
+# are not cached (git's "racily clean" rule).
+RACY_WINDOW_NS = 2_000_000_000
 
 
 def eprint_json(event: str, payload: dict[str, Any]) -> None:
@@ -129,44 +138,198 @@ def _validate_frontmatter(frontmatter: dict[str, str], profile: Profile) -> tupl
     return errors, warnings
 
 
-def _index_skillcards(root: Path, profile: Profile, max_results: int | None) -> dict[str, Any]:
-    results: list[dict[str, Any]] = []
-    for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
-        dirnames.sort()
-        filenames.sort()
-        if "SKILL.md" not in filenames:
+class IndexCache:
+    """Directory listings and parsed frontmatter per root, persisted as JSON at `path`.
+
+    A directory's listing (has SKILL.md, child directories) is reused while its
+    (mtime_ns, inode) match, so a warm run stats directories instead of listing them.
+    A SKILL.md parse is reused while its (size, mtime_ns, inode) match; profile
+    validation always reruns. Output is identical with or without the cache.
+    """
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root_key = str(root)
+        self.dir_hits = 0
+        self.dir_misses = 0
+        self.card_hits = 0
+        self.card_misses = 0
+        self.data: dict[str, Any] = {"version": CACHE_VERSION, "roots": {}}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("roots"), dict):
+            self.data = data
+        previous = self.data["roots"].get(self.root_key)
+        previous = previous if isinstance(previous, dict) else {}
+        self.previous_dirs: dict[str, list[Any]] = previous.get("dirs") or {}
+        self.previous_cards: dict[str, dict[str, Any]] = previous.get("cards") or {}
+        self.dirs: dict[str, list[Any]] = {}
+        self.cards: dict[str, dict[str, Any]] = {}
+
+    def listing(self, rel_dir: str, st: os.stat_result) -> Optional[tuple[bool, list[str]]]:
+        entry = self.previous_dirs.get(rel_dir)
+        if isinstance(entry, list) and entry[:2] == [st.st_mtime_ns, st.st_ino]:
+            self.dir_hits += 1
+            self.dirs[rel_dir] = entry
+            return entry[2], entry[3]
+        self.dir_misses += 1
+        return None
+
+    def store_listing(self, rel_dir: str, st: os.stat_result, has_card: bool, subdirs: list[str]) -> None:
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            self.dirs[rel_dir] = [st.st_mtime_ns, st.st_ino, has_card, subdirs]
+
+    def parsed(self, rel_path: str, st: os.stat_result) -> Optional[dict[str, Any]]:
+        entry = self.previous_cards.get(rel_path)
+        if isinstance(entry, dict) and entry.get("signature") == [st.st_size, st.st_mtime_ns, st.st_ino]:
+            self.card_hits += 1
+            self.cards[rel_path] = entry
+            return entry
+        self.card_misses += 1
+        return None
+
+    def store_parsed(self, rel_path: str, st: os.stat_result, parsed: dict[str, Any]) -> None:
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            self.cards[rel_path] = {"signature": [st.st_size, st.st_mtime_ns, st.st_ino], **parsed}
+
+    def save(self, complete: bool) -> None:
+        # A complete walk replaces this root's entries so deleted skill cards and
+        # directories drop out; a walk cut short by maxResults only adds to them.
+        dirs, cards = self.dirs, self.cards
+        if not complete:
+            dirs = {**self.previous_dirs, **self.dirs}
+            cards = {**self.previous_cards, **self.cards}
+        if dirs == self.previous_dirs and cards == self.previous_cards:
+            return
+        self.data["roots"][self.root_key] = {"dirs": dirs, "cards": cards}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self.data, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            eprint_json("cache_write_failed", {"path": str(self.path), "message": str(e)})
+
+
+def _list_dir(dir_path: str) -> tuple[bool, list[str]]:
+    """Whether `dir_path` holds a SKILL.md, and its sorted child directories (symlinks excluded)."""
+    has_card = False
+    subdirs: list[str] = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry.name)
+            elif entry.name == "SKILL.md":
+                has_card = True
+    subdirs.sort()
+    return has_card, subdirs
+
+
+def _walk_skillcards(root: Path, prune: frozenset[str], cache: Optional[IndexCache]) -> Iterator[str]:
+    """Relative SKILL.md paths in `os.walk` top-down order with sorted names.
+
+    Directories named in `prune` are not entered. Unreadable directories are skipped.
+    """
+    root_str = str(root)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        dir_path = os.path.join(root_str, rel_dir) if rel_dir else root_str
+        try:
+            if cache is None:
+                listing = _list_dir(dir_path)
+            else:
+                st = os.stat(dir_path)
+                listing = cache.listing(rel_dir, st)
+                if listing is None:
+                    listing = _list_dir(dir_path)
+                    cache.store_listing(rel_dir, st, *listing)
+        except OSError:
             continue
+        has_card, subdirs = listing
+        if has_card:
+            yield f"{rel_dir}/SKILL.md" if rel_dir else "SKILL.md"
+        for name in reversed(subdirs):
+            if name not in prune:
+                stack.append(f"{rel_dir}/{name}" if rel_dir else name)
+
+
+def _parse_skillcard(skill_path: Path) -> dict[str, Any]:
+    """Profile-independent parse of one SKILL.md: frontmatter plus split/parse issues."""
+    markdown = skill_path.read_text(encoding="utf-8")
+    frontmatter_text, split_errors = _split_frontmatter(markdown)
+    frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
+    return {
+        "frontmatter": frontmatter,
+        "errors": [e.to_json() for e in split_errors + parse_errors],
+        "warnings": [w.to_json() for w in parse_warnings],
+    }
 
-        skill_path = Path(dirpath) / "SKILL.md"
-        rel_path = skill_path.relative_to(root).as_posix()
 
-        errors: list[Issue] = []
-        warnings: list[Issue] = []
+def _index_skillcards(
+    root: Path,
+    profile: Profile,
+    max_results: int | None,
+    prune: frozenset[str] = DEFAULT_PRUNE_DIRS,
+    cache: Optional[IndexCache] = None,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    complete = True
+    for rel_path in _walk_skillcards(root, prune, cache):
+        skill_path = root / rel_path
+        errors: list[dict[str, Any]] = []
+        warnings: list[dict[str, Any]] = []
         frontmatter: dict[str, str] = {}
 
         try:
-            markdown = skill_path.read_text(encoding="utf-8")
-            frontmatter_text, split_errors = _split_frontmatter(markdown)
-            frontmatter, parse_errors, parse_warnings = _parse_frontmatter_scalars(frontmatter_text)
+            st = os.stat(skill_path)
+            parsed = cache.parsed(rel_path, st) if cache else None
+            if parsed is None:
+                parsed = _parse_skillcard(skill_path)
+                if cache:
+                    cache.store_parsed(rel_path, st, parsed)
+            frontmatter = parsed["frontmatter"]
             val_errors, val_warnings = _validate_frontmatter(frontmatter, profile)
-            errors = split_errors + parse_errors + val_errors
-            warnings = parse_warnings + val_warnings
+            errors = parsed["errors"] + [e.to_json() for e in val_errors]
+            warnings = parsed["warnings"] + [w.to_json() for w in val_warnings]
         except Exception as e:
-            errors = [Issue(code="read_error", message=str(e))]
+            frontmatter = {}
+            errors = [Issue(code="read_error", message=str(e)).to_json()]
 
         results.append(
             {
                 "path": rel_path,
                 "ok": len(errors) == 0,
                 "frontmatter": dict(sorted(frontmatter.items())),
-                "errors": [e.to_json() for e in errors],
-                "warnings": [w.to_json() for w in warnings],
+                "errors": errors,
+                "warnings": warnings,
             }
         )
 
         if max_results is not None and len(results) >= max_results:
+            complete = False
             break
 
+    if cache:
+        cache.save(complete)
+        eprint_json(
+            "cache",
+            {
+                "cardHits": cache.card_hits,
+                "cardMisses": cache.card_misses,
+                "dirHits": cache.dir_hits,
+                "dirMisses": cache.dir_misses,
+                "path": str(cache.path),
+            },
+        )
+
     valid = sum(1 for r in results if r["ok"])
     invalid = len(results) - valid
     return {
@@ -179,6 +342,141 @@ def _index_skillcards(root: Path, profile: Profile, max_results: int | None) ->
     }
 
 
+def _allowed_tools(value: str) -> list[str]:
+    """`allowed-tools` as a list: comma-separated when it has commas, else whitespace-separated."""
+    parts = value.split(",") if "," in value else value.split()
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SkillIndex:
+    """In-memory inverted index over skillcard entries (as emitted in `skillcards`).
+
+    Exact names map to entries, a sorted name list answers prefix queries, description
+    trigrams narrow substring queries before a final case-insensitive check, and
+    validity and `allowed-tools` are posting sets. Results keep index (path) order.
+    """
+
+    def __init__(self, skillcards: list[dict[str, Any]]) -> None:
+        self.skillcards = skillcards
+        self._by_name: dict[str, set[int]] = {}
+        self._names: list[tuple[str, int]] = []
+        self._descriptions: list[str] = []
+        self._by_trigram: dict[str, set[int]] = {}
+        self._by_validity: dict[bool, set[int]] = {True: set(), False: set()}
+        self._by_tool: dict[str, set[int]] = {}
+        for i, card in enumerate(skillcards):
+            frontmatter = card.get("frontmatter", {})
+            name = frontmatter.get("name", "")
+            description = frontmatter.get("description", "").lower()
+            self._by_name.setdefault(name, set()).add(i)
+            self._names.append((name, i))
+            self._descriptions.append(description)
+            for gram in _trigrams(description):
+                self._by_trigram.setdefault(gram, set()).add(i)
+            self._by_validity[bool(card.get("ok"))].add(i)
+            for tool in _allowed_tools(frontmatter.get("allowed-tools", "")):
+                self._by_tool.setdefault(tool, set()).add(i)
+        self._names.sort()
+
+    @classmethod
+    def from_index(cls, index: dict[str, Any]) -> "SkillIndex":
+        return cls(index["skillcards"])
+
+    def _with_prefix(self, prefix: str) -> set[int]:
+        start = bisect.bisect_left(self._names, (prefix, -1))
+        matches: set[int] = set()
+        for name, i in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.add(i)
+        return matches
+
+    def _containing(self, text: str, candidates: Optional[set[int]]) -> set[int]:
+        needle = text.lower()
+        if len(needle) >= 3:
+            for gram in _trigrams(needle):
+                posting = self._by_trigram.get(gram, set())
+                candidates = posting if candidates is None else candidates & posting
+                if not candidates:
+                    return set()
+        pool: Iterable[int] = range(len(self.skillcards)) if candidates is None else candidates
+        return {i for i in pool if needle in self._descriptions[i]}
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        description: Optional[str] = None,
+        valid: Optional[bool] = None,
+        allowed_tools: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Entries matching every given filter; `allowed_tools` requires all listed tools."""
+        filters: list[set[int]] = []
+        if name is not None:
+            filters.append(self._by_name.get(name, set()))
+        if name_prefix is not None:
+            filters.append(self._with_prefix(name_prefix))
+        if valid is not None:
+            filters.append(self._by_validity[valid])
+        for tool in allowed_tools or []:
+            filters.append(self._by_tool.get(tool, set()))
+
+        candidates: Optional[set[int]] = None
+        for posting in sorted(filters, key=len):
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return []
+        if description is not None:
+            candidates = self._containing(description, candidates)
+        ids = sorted(candidates) if candidates is not None else list(range(len(self.skillcards)))
+        return [self.skillcards[i] for i in ids[:limit]]
+
+
+def load_skill_index(
+    root: Path,
+    profile: Profile = "compat",
+    cache_path: Optional[Path] = None,
+    prune: frozenset[str] = DEFAULT_PRUNE_DIRS,
+) -> SkillIndex:
+    """Index `root` (through the index cache when `cache_path` is given) and build a SkillIndex."""
+    cache = IndexCache(Path(cache_path), root) if cache_path else None
+    return SkillIndex.from_index(_index_skillcards(root, profile, None, prune, cache))
+
+
+def _parse_query(raw: Any) -> dict[str, Any]:
+    """Validate the `query` input object and map it to SkillIndex.search keyword arguments."""
+    if not isinstance(raw, dict):
+        raise ValueError("query must be an object")
+    fields = {
+        "name": "name",
+        "namePrefix": "name_prefix",
+        "description": "description",
+        "valid": "valid",
+        "allowedTools": "allowed_tools",
+        "limit": "limit",
+    }
+    unknown = sorted(set(raw) - set(fields))
+    if unknown:
+        raise ValueError(f"query has unknown field: {unknown[0]}")
+    for key in ("name", "namePrefix", "description"):
+        if key in raw and (not isinstance(raw[key], str) or not raw[key]):
+            raise ValueError(f"query.{key} must be a non-empty string")
+    if "valid" in raw and not isinstance(raw["valid"], bool):
+        raise ValueError("query.valid must be a boolean")
+    tools = raw.get("allowedTools")
+    if tools is not None and (not isinstance(tools, list) or any(not isinstance(t, str) or not t for t in tools)):
+        raise ValueError("query.allowedTools must be an array of non-empty strings")
+    limit = raw.get("limit")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+        raise ValueError("query.limit must be a positive integer")
+    return {fields[key]: value for key, value in raw.items()}
+
+
 def main() -> int:
     try:
         input_obj = json.load(sys.stdin)
@@ -199,11 +497,32 @@ def main() -> int:
             if not isinstance(max_results, int) or max_results < 1:
                 raise ValueError("maxResults must be a positive integer")
 
+        prune_raw = input_obj.get("pruneDirs")
+        if prune_raw is None:
+            prune = DEFAULT_PRUNE_DIRS
+        elif isinstance(prune_raw, list) and all(isinstance(d, str) and d and "/" not in d for d in prune_raw):
+            prune = frozenset(prune_raw)
+        else:
+            raise ValueError("pruneDirs must be an array of directory names")
+
+        cache_raw = input_obj.get("cachePath")
+        if cache_raw is not None and (not isinstance(cache_raw, str) or not cache_raw):
+            raise ValueError("cachePath must be a non-empty string")
+
+        query = _parse_query(input_obj["query"]) if input_obj.get("query") is not None else None
+
         root = Path(root_raw).resolve()
         if not root.exists() or not root.is_dir():
             raise ValueError("root must be an existing directory")
 
-        output = _index_skillcards(root, profile, max_results)
+        cache = IndexCache(Path(cache_raw), root) if cache_raw else None
+        if query is not None and max_results is not None:
+            # Filter the whole tree first: maxResults caps the matches, not the walk.
+            query["limit"] = min(query.get("limit") or max_results, max_results)
+        output = _index_skillcards(root, profile, max_results if query is None else None, prune, cache)
+        if query is not None:
+            output["skillcards"] = SkillIndex.from_index(output).search(**query)
+            output["matched"] = len(output["skillcards"])
         sys.stdout.write(json.dumps(output, separators=(",", ":"), sort_keys=True) + "\n")
         return 0
     except Exception as e:
@@ -4,7 +4,8 @@ set -euo pipefail
 skill_dir="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
 
 tmp_out="$(mktemp)"
-trap 'rm -f "$tmp_out"' EXIT
+tmp_dir="$(mktemp -d)"
+trap 'rm -f "$tmp_out"; rm -rf "$tmp_dir"' EXIT
 
 (cd "$skill_dir" && python3 "impl/run.py" < "fixtures/input.json" > "$tmp_out")
 
@@ -29,3 +30,149 @@ if expected != actual:
     print("actual:", actual, file=sys.stderr)
     raise SystemExit(1)
 PY
+
+# Default pruning, maxResults, and a warm index cache that follows edits, additions,
+# and deletions must match a cold run.
+python3 - "$skill_dir/impl/run.py" "$tmp_dir" <<'PY'
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+run_py, tmp_dir = sys.argv[1], Path(sys.argv[2])
+repo = tmp_dir / "repo"
+cache_path = tmp_dir / "index.json"
+
+
+def run(payload):
+    proc = subprocess.run([sys.executable, run_py], input=json.dumps(payload), capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def card(rel, body, age=10):
+    path = repo / rel / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    past = path.stat().st_mtime - age
+    for target in (path, path.parent, repo):
+        os.utime(target, (past, past))
+
+
+def check(label):
+    cold = run({"root": str(repo)})
+    for _ in range(2):
+        warm = run({"root": str(repo), "cachePath": str(cache_path)})
+        if warm != cold:
+            print(f"Mismatch ({label}):", cold, warm, file=sys.stderr)
+            raise SystemExit(1)
+    return cold
+
+
+card("a", "---\nname: a\ndescription: first\n---\n")
+card("b", "---\nname: b\ndescription: second\n---\n")
+card("node_modules/pkg", "---\nname: vendored\ndescription: skip me\n---\n")
+out = check("initial")
+if [c["path"] for c in out["skillcards"]] != ["a/SKILL.md", "b/SKILL.md"]:
+    print("Mismatch: pruning", out, file=sys.stderr)
+    raise SystemExit(1)
+if run({"root": str(repo), "pruneDirs": []})["total"] != 3 or run({"root": str(repo), "maxResults": 1})["total"] != 1:
+    print("Mismatch: pruneDirs/maxResults", file=sys.stderr)
+    raise SystemExit(1)
+
+card("a", "---\nname: A\ndescription: edited\n---\n", age=5)
+card("c", "---\nname: c\n---\n")
+shutil.rmtree(repo / "b")
+out = check("changed")
+if [c["ok"] for c in out["skillcards"]] != [False, False] or out["skillcards"][1]["path"] != "c/SKILL.md":
+    print("Mismatch: refresh", out, file=sys.stderr)
+    raise SystemExit(1)
+PY
+
+# Query mode (skill input) and the SkillIndex library agree with a plain scan.
+python3 - "$skill_dir/impl/run.py" "$tmp_dir" <<'PY'
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+run_py, repo = sys.argv[1], Path(sys.argv[2]) / "query-repo"
+tools = ["Bash", "Read", "Write"]
+for i in range(60):
+    allowed = ", ".join(t for j, t in enumerate(tools) if i % (j + 2) == 0)
+    name = f"skill-{i:02d}" if i % 7 else f"Bad_{i}"
+    path = repo / f"s{i:02d}" / "SKILL.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        f"---\nname: {name}\ndescription: Handles {'PDF forms' if i % 3 else 'spreadsheets'} #{i}\n"
+        + (f"allowed-tools: {allowed}\n" if allowed else "")
+        + "---\n",
+        encoding="utf-8",
+    )
+
+spec = importlib.util.spec_from_file_location("skillcard_index_run", run_py)
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+index = module.load_skill_index(repo.resolve())
+cards = index.skillcards
+
+
+def scan(name=None, name_prefix=None, description=None, valid=None, allowed_tools=None, limit=None):
+    out = []
+    for card in cards:
+        fm = card["frontmatter"]
+        have = module._allowed_tools(fm.get("allowed-tools", ""))
+        if name is not None and fm.get("name") != name:
+            continue
+        if name_prefix is not None and not fm.get("name", "").startswith(name_prefix):
+            continue
+        if description is not None and description.lower() not in fm.get("description", "").lower():
+            continue
+        if valid is not None and card["ok"] != valid:
+            continue
+        if any(tool not in have for tool in allowed_tools or []):
+            continue
+        out.append(card)
+    return out[:limit]
+
+
+queries = [
+    {"name": "skill-05"},
+    {"name_prefix": "skill-1"},
+    {"name_prefix": "Bad"},
+    {"description": "pdf"},
+    {"description": "SPREADSHEETS #2"},
+    {"description": "#1"},
+    {"description": "zz-missing"},
+    {"valid": False},
+    {"allowed_tools": ["Bash", "Read"]},
+    {"allowed_tools": ["Write"], "valid": True, "description": "forms", "limit": 2},
+]
+for query in queries:
+    if index.search(**query) != scan(**query):
+        print("Mismatch: SkillIndex.search", query, file=sys.stderr)
+        raise SystemExit(1)
+
+payload = {"root": str(repo), "query": {"namePrefix": "skill-", "allowedTools": ["Read"], "limit": 3}}
+out = json.loads(subprocess.run([sys.executable, run_py], input=json.dumps(payload), capture_output=True, text=True, check=True).stdout)
+expected = scan(name_prefix="skill-", allowed_tools=["Read"], limit=3)
+if out["skillcards"] != expected or out["matched"] != 3 or out["total"] != 60:
+    print("Mismatch: query input", out, file=sys.stderr)
+    raise SystemExit(1)
+
+# maxResults caps the matches of a query rather than cutting the walk short.
+capped = repo.parent / "capped-repo"
+for name in ("alpha", "beta", "gamma"):
+    path = capped / name / "SKILL.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(f"---\nname: {name}\ndescription: {name} skill\n---\n", encoding="utf-8")
+for query, names in (({"name": "gamma"}, ["gamma"]), ({"description": "skill"}, ["alpha"])):
+    payload = {"root": str(capped), "maxResults": 1, "query": query}
+    out = json.loads(subprocess.run([sys.executable, run_py], input=json.dumps(payload), capture_output=True, text=True, check=True).stdout)
+    if [c["frontmatter"]["name"] for c in out["skillcards"]] != names or out["matched"] != 1:
+        print("Mismatch: maxResults with query", query, out, file=sys.stderr)
+        raise SystemExit(1)
+PY
@@ -156,8 +156,7 @@ def _build_result(
     }
 
 
-def main() -> int:
-    input_obj = json.load(sys.stdin)
+def parse(input_obj: Any) -> dict[str, Any]:
     if not isinstance(input_obj, dict):
         raise ValueError("input must be a JSON object")
 
@@ -212,7 +211,30 @@ def main() -> int:
             mode="text",
             path=None,
         )
+    return result
+
 
+def serve_worker() -> int:
+    """Line-delimited JSON request loop used by `skillctl serve` (runtime.worker)."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = {"id": request_id, "output": parse(request.get("input"))}
+        except Exception as e:
+            response = {"id": request_id, "error": str(e)}
+        sys.stdout.write(json.dumps(response, separators=(",", ":"), sort_keys=True) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def main() -> int:
+    if sys.argv[1:] == ["--worker"]:
+        return serve_worker()
+    result = parse(json.load(sys.stdin))
     sys.stdout.write(json.dumps(result, separators=(",", ":"), sort_keys=True) + "\n")
     return 0
 
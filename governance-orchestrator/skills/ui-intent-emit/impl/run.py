@@ -120,29 +120,49 @@ def validate_intent(intent: Any) -> List[Dict[str, str]]:
     return errors
 
 
-def main() -> None:
-    try:
-        payload = json.load(sys.stdin)
-    except json.JSONDecodeError as exc:
-        output = {"ok": False, "errors": [error("", f"Invalid JSON input: {exc}")]}
-        json.dump(output, sys.stdout)
-        sys.exit(0)
-
+def emit(payload: Any) -> Dict[str, Any]:
     intent = payload.get("intent") if isinstance(payload, dict) else None
     errors = validate_intent(intent)
 
     if errors:
-        output = {"ok": False, "errors": errors}
-        json.dump(output, sys.stdout)
-        return
+        return {"ok": False, "errors": errors}
 
-    output = {
+    return {
         "ok": True,
         "errors": [],
         "schemaVersion": intent.get("schemaVersion"),
         "intent": intent,
     }
-    json.dump(output, sys.stdout)
+
+
+def serve_worker() -> None:
+    """Line-delimited JSON request loop used by `skillctl serve` (runtime.worker)."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = {"id": request_id, "output": emit(request.get("input"))}
+        except Exception as exc:
+            response = {"id": request_id, "error": str(exc)}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--worker"]:
+        serve_worker()
+        return
+    try:
+        payload = json.load(sys.stdin)
+    except json.JSONDecodeError as exc:
+        output = {"ok": False, "errors": [error("", f"Invalid JSON input: {exc}")]}
+        json.dump(output, sys.stdout)
+        sys.exit(0)
+
+    json.dump(emit(payload), sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Segmented, indexed store over an append-only events.jsonl file.
+
+The active file keeps its usual path so existing appenders are unaffected. Sealed
+segments live next to it in `<stem>.segments/NNNNNN.jsonl`, and a derived index in
+`<stem>.segments/.event-index/` maps indexed field values to byte offsets so that
+queries only open the segments (and lines) that can match. The index is a cache:
+deleting it is always safe and it is rebuilt on the next query.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from observability.jsonl_append import append_line
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+INDEX_VERSION = 1
+INDEXED_FIELDS = ("type", "event", "task_id", "spec_id", "phase")
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+INDEX_DIRNAME = ".event-index"
+ACTIVE = "active"
+READ_CHUNK = 1024 * 1024
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (str, int, float, bool))
+
+
+def _key(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def field_values(event: Dict[str, Any], field: str) -> List[Any]:
+    """Values of an indexed field, read from the event and from its context object."""
+    values: List[Any] = []
+    value = event.get(field)
+    if _is_scalar(value):
+        values.append(value)
+    context = event.get("context")
+    if isinstance(context, dict):
+        nested = context.get(field)
+        if _is_scalar(nested) and nested not in values:
+            values.append(nested)
+    return values
+
+
+def _timestamp_of(event: Dict[str, Any]) -> Optional[str]:
+    value = event.get("timestamp")
+    return value if isinstance(value, str) and value else None
+
+
+def matches(
+    event: Dict[str, Any],
+    filters: Dict[str, Any],
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> bool:
+    for field, expected in filters.items():
+        if expected not in field_values(event, field):
+            return False
+    if since is not None or until is not None:
+        stamp = _timestamp_of(event)
+        if stamp is None:
+            return False
+        if since is not None and stamp < since:
+            return False
+        if until is not None and stamp > until:
+            return False
+    return True
+
+
+def _empty_segment(name: str) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "bytes": 0,
+        "offset": 0,
+        "inode": None,
+        "lines": 0,
+        "first_ts": None,
+        "last_ts": None,
+        "invalid": [],
+        "postings": {field: {} for field in INDEXED_FIELDS},
+    }
+
+
+def _summary(segment: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {key: segment[key] for key in ("bytes", "offset", "inode", "lines", "first_ts", "last_ts")}
+    summary["values"] = {field: sorted(segment["postings"][field]) for field in INDEXED_FIELDS}
+    return summary
+
+
+class EventStore:
+    def __init__(
+        self,
+        path: Path,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        daily: bool = False,
+    ) -> None:
+        if max_segment_bytes <= 0:
+            raise ValueError("max_segment_bytes must be positive")
+        self.path = Path(path)
+        self.segments_dir = self.path.with_name(f"{self.path.stem}.segments")
+        self.index_dir = self.segments_dir / INDEX_DIRNAME
+        self.max_segment_bytes = max_segment_bytes
+        self.daily = daily
+        self._manifest: Dict[str, Any] = {"version": INDEX_VERSION, "segments": {}, "verified": {}}
+        self._manifest_mtime: Optional[int] = None
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+        self._persist = True
+
+    # -- persistence -----------------------------------------------------
+
+    def _index_file(self, name: str) -> Path:
+        return self.index_dir / f"{Path(name).stem}.json"
+
+    def _write_json(self, path: Path, payload: Dict[str, Any]) -> None:
+        if not self._persist:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # Read-only checkouts still answer queries from the in-memory index.
+            self._persist = False
+
+    def _read_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        return data
+
+    def _load_manifest(self) -> None:
+        manifest_path = self.index_dir / "index.json"
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._manifest_mtime:
+            return
+        data = self._read_json(manifest_path)
+        if data is not None:
+            data.setdefault("verified", {})
+            self._manifest = data
+            self._loaded.clear()
+        self._manifest_mtime = mtime
+
+    def _save_manifest(self) -> None:
+        manifest_path = self.index_dir / "index.json"
+        self._write_json(manifest_path, self._manifest)
+        try:
+            self._manifest_mtime = manifest_path.stat().st_mtime_ns
+        except OSError:
+            self._manifest_mtime = None
+
+    def _save_segment(self, segment: Dict[str, Any]) -> None:
+        self._loaded[segment["name"]] = segment
+        self._manifest["segments"][segment["name"]] = _summary(segment)
+        payload = dict(segment, version=INDEX_VERSION)
+        self._write_json(self._index_file(segment["name"]), payload)
+
+    def _segment(self, name: str) -> Optional[Dict[str, Any]]:
+        summary = self._manifest["segments"].get(name)
+        if summary is None:
+            return None
+        segment = self._loaded.get(name)
+        if segment is not None and segment["bytes"] == summary["bytes"]:
+            return segment
+        data = self._read_json(self._index_file(name))
+        if data is None or data.get("bytes") != summary["bytes"]:
+            return None
+        data.pop("version", None)
+        self._loaded[name] = data
+        return data
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            handle = (self.index_dir / "lock").open("a")
+        except OSError:
+            yield
+            return
+        with handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # -- indexing --------------------------------------------------------
+
+    def _index_from(self, path: Path, segment: Dict[str, Any]) -> None:
+        offset = segment["offset"]
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            pending = b""
+            while True:
+                chunk = handle.read(READ_CHUNK)
+                if not chunk:
+                    break
+                pending += chunk
+                start = 0
+                while True:
+                    end = pending.find(b"\n", start)
+                    if end < 0:
+                        break
+                    self._index_line(segment, offset, pending[start:end])
+                    offset += end + 1 - start
+                    start = end + 1
+                pending = pending[start:]
+        segment["offset"] = offset
+
+    def _index_line(self, segment: Dict[str, Any], offset: int, raw: bytes) -> None:
+        if not raw.strip():
+            return
+        segment["lines"] += 1
+        try:
+            event = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            segment["invalid"].append(offset)
+            return
+        if not isinstance(event, dict):
+            segment["invalid"].append(offset)
+            return
+        for field in INDEXED_FIELDS:
+            for value in field_values(event, field):
+                segment["postings"][field].setdefault(_key(value), []).append(offset)
+        stamp = _timestamp_of(event)
+        if stamp is not None:
+            if segment["first_ts"] is None or stamp < segment["first_ts"]:
+                segment["first_ts"] = stamp
+            if segment["last_ts"] is None or stamp > segment["last_ts"]:
+                segment["last_ts"] = stamp
+
+    def _sealed_paths(self) -> List[Path]:
+        if not self.segments_dir.is_dir():
+            return []
+        return sorted(p for p in self.segments_dir.glob("*.jsonl") if p.is_file())
+
+    def refresh(self) -> None:
+        """Bring the index up to date with sealed segments and the active file."""
+        self._load_manifest()
+        changed = False
+        sealed = self._sealed_paths()
+        names = {p.name for p in sealed}
+        for name in list(self._manifest["segments"]):
+            if name != ACTIVE and name not in names:
+                del self._manifest["segments"][name]
+                self._manifest["verified"].pop(name, None)
+                changed = True
+        for path in sealed:
+            size = path.stat().st_size
+            if self._segment(path.name) is not None and self._manifest["segments"][path.name]["bytes"] == size:
+                continue
+            segment = _empty_segment(path.name)
+            self._index_from(path, segment)
+            segment["bytes"] = size
+            self._manifest["verified"].pop(path.name, None)
+            self._save_segment(segment)
+            changed = True
+
+        try:
+            stat = self.path.stat()
+        except OSError:
+            stat = None
+        segment = self._segment(ACTIVE)
+        if stat is None:
+            if segment is not None:
+                del self._manifest["segments"][ACTIVE]
+                self._loaded.pop(ACTIVE, None)
+                changed = True
+        else:
+            if segment is None or segment["inode"] != stat.st_ino or stat.st_size < segment["offset"]:
+                segment = _empty_segment(ACTIVE)
+                segment["inode"] = stat.st_ino
+            if stat.st_size != segment["bytes"] or ACTIVE not in self._manifest["segments"]:
+                self._index_from(self.path, segment)
+                segment["bytes"] = stat.st_size
+                self._save_segment(segment)
+                changed = True
+        if changed:
+            self._save_manifest()
+
+    # -- segments and rotation -------------------------------------------
+
+    def segment_paths(self) -> List[Path]:
+        """Sealed segments in order, followed by the active file if present."""
+        paths = self._sealed_paths()
+        if self.path.exists():
+            paths.append(self.path)
+        return paths
+
+    def _path_of(self, name: str) -> Path:
+        return self.path if name == ACTIVE else self.segments_dir / name
+
+    def _first_timestamp(self) -> Optional[str]:
+        try:
+            with self.path.open("rb") as handle:
+                for raw in handle:
+                    if raw.strip():
+                        try:
+                            event = json.loads(raw)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            return None
+                        return _timestamp_of(event) if isinstance(event, dict) else None
+        except OSError:
+            return None
+        return None
+
+    def should_rotate(self, now: Optional[datetime] = None) -> bool:
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return False
+        if size == 0:
+            return False
+        if size >= self.max_segment_bytes:
+            return True
+        if self.daily:
+            first = self._first_timestamp()
+            today = (now or datetime.now(timezone.utc)).date().isoformat()
+            return first is not None and first[:10] < today
+        return False
+
+    def rotate(self) -> Optional[Path]:
+        """Seal the active file as the next numbered segment."""
+        with self._locked():
+            self.refresh()
+            if not self.path.exists() or self.path.stat().st_size == 0:
+                return None
+            self.segments_dir.mkdir(parents=True, exist_ok=True)
+            sealed = self._sealed_paths()
+            number = int(sealed[-1].stem) + 1 if sealed else 1
+            target = self.segments_dir / f"{number:06d}.jsonl"
+            os.replace(self.path, target)
+            segment = self._segment(ACTIVE) or _empty_segment(ACTIVE)
+            del self._manifest["segments"][ACTIVE]
+            self._loaded.pop(ACTIVE, None)
+            try:
+                self._index_file(ACTIVE).unlink()
+            except OSError:
+                pass
+            segment["name"] = target.name
+            segment["inode"] = None
+            self._save_segment(segment)
+            self._save_manifest()
+            # Bytes appended between refresh and rename are picked up by size mismatch.
+            self.refresh()
+            return target
+
+    def maybe_rotate(self, now: Optional[datetime] = None) -> Optional[Path]:
+        if self.should_rotate(now):
+            return self.rotate()
+        return None
+
+    def append(self, event: Dict[str, Any]) -> None:
+        append_line(self.path, json.dumps(event))
+        self.maybe_rotate()
+
+    # -- queries ---------------------------------------------------------
+
+    def _candidates(self, name: str, filters: Dict[str, Any]) -> Optional[List[int]]:
+        """Offsets that may match, or None when the segment must be scanned."""
+        if not filters:
+            return None
+        segment = self._segment(name)
+        if segment is None:
+            return None
+        offsets: Optional[set] = None
+        for field, value in filters.items():
+            hits = set(segment["postings"][field].get(_key(value), ()))
+            offsets = hits if offsets is None else offsets & hits
+            if not offsets:
+                return []
+        return sorted(offsets or ())
+
+    def _prunable(self, name: str, filters: Dict[str, Any], since: Optional[str], until: Optional[str]) -> bool:
+        summary = self._manifest["segments"].get(name)
+        if summary is None:
+            return False
+        for field, value in filters.items():
+            if _key(value) not in summary["values"][field]:
+                return True
+        if since is not None and summary["last_ts"] is not None and summary["last_ts"] < since:
+            return True
+        if until is not None and summary["first_ts"] is not None and summary["first_ts"] > until:
+            return True
+        return False
+
+    def iter_query(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Unindexed query fields: {sorted(unknown)}")
+        filters = {field: value for field, value in filters.items() if value is not None}
+        self.refresh()
+        names = [p.name for p in self._sealed_paths()]
+        if self.path.exists():
+            names.append(ACTIVE)
+        for name in names:
+            if self._prunable(name, filters, since, until):
+                continue
+            path = self._path_of(name)
+            offsets = self._candidates(name, filters)
+            limit = self._manifest["segments"].get(name, {}).get("offset")
+            try:
+                handle = path.open("rb")
+            except OSError:
+                continue
+            with handle:
+                for raw in self._lines(handle, offsets, limit):
+                    try:
+                        event = json.loads(raw)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if isinstance(event, dict) and matches(event, filters, since, until):
+                        yield event
+
+    @staticmethod
+    def _lines(handle, offsets: Optional[List[int]], limit: Optional[int]) -> Iterator[bytes]:
+        if offsets is None:
+            consumed = 0
+            for raw in handle:
+                consumed += len(raw)
+                if limit is not None and consumed > limit:
+                    break
+                if raw.strip():
+                    yield raw
+            return
+        for offset in offsets:
+            handle.seek(offset)
+            yield handle.readline()
+
+    def query(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for event in self.iter_query(since=since, until=until, **filters):
+            results.append(event)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def exists(self, **filters: Any) -> bool:
+        return bool(self.query(limit=1, **filters))
+
+    # -- validation memo -------------------------------------------------
+
+    def is_verified(self, path: Path, key: str) -> bool:
+        """True when a sealed segment was already validated under `key`."""
+        if path == self.path:
+            return False
+        self.refresh()
+        return self._manifest["verified"].get(path.name) == key
+
+    def mark_verified(self, path: Path, key: str) -> None:
+        if path == self.path:
+            return
+        self._manifest["verified"][path.name] = key
+        self._save_manifest()
+
+
+def verification_key(*parts: Path) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        try:
+            digest.update(part.read_bytes())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def query(path: Path, **kwargs: Any) -> List[Dict[str, Any]]:
+    return EventStore(path).query(**kwargs)
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query and rotate an events.jsonl store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    q = sub.add_parser("query", help="Print matching events as JSONL")
+    q.add_argument("path", type=Path)
+    for field in INDEXED_FIELDS:
+        q.add_argument(f"--{field.replace('_', '-')}", dest=field)
+    q.add_argument("--since", help="Inclusive ISO timestamp lower bound")
+    q.add_argument("--until", help="Inclusive ISO timestamp upper bound")
+    q.add_argument("--limit", type=int)
+
+    r = sub.add_parser("rotate", help="Seal the active file when it exceeds its bounds")
+    r.add_argument("path", type=Path)
+    r.add_argument("--max-bytes", type=int, default=DEFAULT_SEGMENT_BYTES)
+    r.add_argument("--daily", action="store_true", help="Also rotate when the active file spans days")
+    r.add_argument("--force", action="store_true", help="Rotate regardless of size or date")
+
+    x = sub.add_parser("reindex", help="Drop and rebuild the index")
+    x.add_argument("path", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.command == "query":
+        filters = {field: getattr(args, field) for field in INDEXED_FIELDS}
+        store = EventStore(args.path)
+        for event in store.query(since=args.since, until=args.until, limit=args.limit, **filters):
+            print(json.dumps(event))
+        return 0
+    if args.command == "rotate":
+        store = EventStore(args.path, max_segment_bytes=args.max_bytes, daily=args.daily)
+        target = store.rotate() if args.force else store.maybe_rotate()
+        print(f"Rotated to {target}" if target else "No rotation needed")
+        return 0
+    store = EventStore(args.path)
+    if store.index_dir.is_dir():
+        for entry in store.index_dir.glob("*.json"):
+            entry.unlink()
+    store.refresh()
+    segments: Dict[str, Any] = store._manifest["segments"]
+    print(f"Indexed {sum(s['lines'] for s in segments.values())} events in {len(segments)} segment(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
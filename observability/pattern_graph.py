@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+In-memory relation graph over Pattern Recall logs.
+
+Nodes are record IDs. Edges come from `relations.ndjson` (`from_id` -> `to_id`, labelled
+with `relation_type`) and from `attempts.ndjson` (`problem_id` -> attempt `id`, labelled
+`attempt`). Each log is consumed incrementally from its last offset, so repeated
+traversals in one session only read newly appended lines. Informational only: the
+graph is derived from the logs and carries no ranking or ordering semantics beyond
+traversal depth.
+"""
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from observability.pattern_index import LogCursor
+
+ATTEMPT_EDGE = "attempt"
+DIRECTIONS = {"out", "in", "both"}
+STRATEGIES = {"bfs", "dfs"}
+
+Edge = Tuple[str, str]  # (neighbour id, relation type)
+
+
+class RelationGraph:
+    def __init__(self, logs_dir: Path) -> None:
+        self.logs_dir = Path(logs_dir)
+        self._cursors = {
+            name: LogCursor(self.logs_dir / f"{name}.ndjson") for name in ("problems", "attempts", "relations")
+        }
+        self._kinds: Dict[str, Dict[str, str]] = {name: {} for name in self._cursors}
+        self._edges: Dict[str, List[Tuple[str, str, str]]] = {name: [] for name in ("attempts", "relations")}
+        self._out: Dict[str, List[Edge]] = {}
+        self._in: Dict[str, List[Edge]] = {}
+
+    def _add_edge(self, source: str, target: str, relation: str) -> None:
+        self._out.setdefault(source, []).append((target, relation))
+        self._in.setdefault(target, []).append((source, relation))
+
+    def refresh(self) -> None:
+        rebuild = False
+        for name, cursor in self._cursors.items():
+            reset, records = cursor.poll()
+            if reset:
+                self._kinds[name] = {}
+                if name in self._edges:
+                    self._edges[name] = []
+                    rebuild = True
+            for _, record in records:
+                if name == "problems":
+                    if isinstance(record.get("id"), str):
+                        self._kinds[name][record["id"]] = "problem"
+                    continue
+                if name == "attempts":
+                    attempt_id, problem_id = record.get("id"), record.get("problem_id")
+                    if isinstance(attempt_id, str):
+                        self._kinds[name][attempt_id] = "attempt"
+                        if isinstance(problem_id, str):
+                            edge = (problem_id, attempt_id, ATTEMPT_EDGE)
+                            self._edges[name].append(edge)
+                            if not rebuild:
+                                self._add_edge(*edge)
+                    continue
+                source, target = record.get("from_id"), record.get("to_id")
+                if isinstance(source, str) and isinstance(target, str):
+                    edge = (source, target, str(record.get("relation_type") or ""))
+                    self._edges[name].append(edge)
+                    if not rebuild:
+                        self._add_edge(*edge)
+        if rebuild:
+            self._out, self._in = {}, {}
+            for edges in self._edges.values():
+                for edge in edges:
+                    self._add_edge(*edge)
+
+    def kind(self, node: str) -> Optional[str]:
+        if node in self._kinds["attempts"]:
+            return "attempt"
+        if node in self._kinds["problems"]:
+            return "problem"
+        return None
+
+    def neighbours(
+        self, node: str, direction: str = "out", relation_types: Optional[Set[str]] = None
+    ) -> List[Edge]:
+        edges: List[Edge] = []
+        if direction in ("out", "both"):
+            edges.extend(self._out.get(node, ()))
+        if direction in ("in", "both"):
+            edges.extend(self._in.get(node, ()))
+        if relation_types is not None:
+            edges = [edge for edge in edges if edge[1] in relation_types]
+        return edges
+
+    def traverse(
+        self,
+        start_ids: Iterable[str],
+        max_depth: int,
+        *,
+        strategy: str = "bfs",
+        direction: str = "out",
+        relation_types: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Nodes reachable from `start_ids` within `max_depth` hops (start nodes excluded).
+
+        Each result carries its depth, kind (problem/attempt/None), the relation that reached
+        it and the path from its start node. Each node is reported once. DFS expands a node
+        again when a shorter path reaches it, so its result carries the shallowest depth found
+        and every node within `max_depth` is reported, as with BFS.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {sorted(STRATEGIES)}")
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {sorted(DIRECTIONS)}")
+        if max_depth < 0:
+            raise ValueError("max_depth must be >= 0")
+        self.refresh()
+        allowed = set(relation_types) if relation_types is not None else None
+        wanted = set(kinds) if kinds is not None else None
+        starts = list(dict.fromkeys(start_ids))
+        depths: Dict[str, int] = {node: 0 for node in starts}
+        reported: Dict[str, Dict[str, Any]] = {}
+        frontier = deque((node, 0, [node]) for node in starts)
+        if strategy == "dfs":
+            frontier.reverse()
+        results: List[Dict[str, Any]] = []
+        while frontier:
+            node, depth, path = frontier.popleft() if strategy == "bfs" else frontier.pop()
+            if depth >= max_depth:
+                continue
+            children = []
+            for neighbour, relation in self.neighbours(node, direction, allowed):
+                seen = depths.get(neighbour)
+                if seen is not None and seen <= depth + 1:
+                    continue
+                depths[neighbour] = depth + 1
+                if neighbour in reported:
+                    reported[neighbour].update(depth=depth + 1, relation_type=relation, path=path + [neighbour])
+                elif seen is None:
+                    kind = self.kind(neighbour)
+                    if wanted is None or kind in wanted:
+                        reported[neighbour] = {
+                            "id": neighbour,
+                            "kind": kind,
+                            "depth": depth + 1,
+                            "relation_type": relation,
+                            "path": path + [neighbour],
+                        }
+                        results.append(reported[neighbour])
+                        if limit is not None and len(results) >= limit:
+                            return results
+                children.append((neighbour, depth + 1, path + [neighbour]))
+            frontier.extend(children if strategy == "bfs" else reversed(children))
+        return results
+
+
+_GRAPHS: Dict[Path, RelationGraph] = {}
+
+
+def graph_for(logs_dir: Path) -> RelationGraph:
+    key = Path(logs_dir).resolve()
+    graph = _GRAPHS.get(key)
+    if graph is None:
+        graph = _GRAPHS[key] = RelationGraph(key)
+    return graph
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+ID -> byte-offset index for Pattern Recall NDJSON logs.
+
+Derived and regenerable: each log gets `logs/.index/<file>.json` mapping every ID field
+value to the offsets of the lines that carry it. The index is caught up from its last
+offset after each append and before each lookup, and rebuilt from scratch if the log
+was replaced, truncated or rewritten. Deleting `.index/` never changes lookup results.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+ID_FIELDS = ("id", "problem_id", "attempt_id", "ref_id", "from_id", "to_id")
+INDEX_VERSION = 2
+HEAD_BYTES = 4096
+
+
+def _key(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, bool)):
+        return json.dumps(value)
+    return None
+
+
+def _head_digest(path: Path, length: int) -> str:
+    with path.open("rb") as fh:
+        return hashlib.sha256(fh.read(min(length, HEAD_BYTES))).hexdigest()
+
+
+class LogCursor:
+    """Tracks how far an append-only NDJSON log has been consumed.
+
+    `poll()` returns records appended since the last call, or every record again (with
+    `reset=True`) when the log was replaced, truncated or rewritten in place.
+    """
+
+    def __init__(self, log_path: Path, state: Optional[Dict[str, Any]] = None) -> None:
+        self.log_path = Path(log_path)
+        self.state: Dict[str, Any] = state or {"inode": None, "offset": 0, "head": None}
+
+    def _is_current(self, stat: os.stat_result) -> bool:
+        offset = self.state.get("offset", 0)
+        if self.state.get("inode") != stat.st_ino or stat.st_size < offset:
+            return False
+        return offset == 0 or self.state.get("head") == _head_digest(self.log_path, offset)
+
+    def poll(self) -> Tuple[bool, List[Tuple[int, Dict[str, Any]]]]:
+        try:
+            stat = self.log_path.stat()
+        except OSError:
+            reset = self.state.get("inode") is not None
+            self.state = {"inode": None, "offset": 0, "head": None}
+            return reset, []
+        reset = False
+        if not self._is_current(stat):
+            reset = self.state.get("inode") is not None or self.state.get("offset", 0) > 0
+            self.state = {"inode": stat.st_ino, "offset": 0, "head": None}
+        if stat.st_size == self.state["offset"]:
+            return reset, []
+        records: List[Tuple[int, Dict[str, Any]]] = []
+        offset = self.state["offset"]
+        with self.log_path.open("rb") as fh:
+            fh.seek(offset)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break  # partial line from an in-flight append; read it next time
+                line_offset = offset
+                offset += len(raw)
+                try:
+                    record = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if isinstance(record, dict):
+                    records.append((line_offset, record))
+        self.state["offset"] = offset
+        self.state["head"] = _head_digest(self.log_path, offset)
+        return reset, records
+
+
+class RecordIndex:
+    def __init__(self, log_path: Path) -> None:
+        self.log_path = Path(log_path)
+        self.index_path = self.log_path.parent / ".index" / f"{self.log_path.name}.json"
+        self._cursor: Optional[LogCursor] = None
+        self._ids: Dict[str, List[int]] = {}
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            self._cursor = LogCursor(self.log_path, data["cursor"])
+            self._ids = data["ids"]
+        else:
+            self._cursor = LogCursor(self.log_path)
+            self._ids = {}
+
+    def _save(self) -> None:
+        payload = {"version": INDEX_VERSION, "cursor": self._cursor.state, "ids": self._ids}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            # The in-memory index still serves lookups when logs/ is read-only.
+            pass
+
+    def refresh(self) -> None:
+        if self._cursor is None:
+            self._load()
+        reset, records = self._cursor.poll()
+        if reset:
+            self._ids = {}
+        for offset, record in records:
+            seen = set()
+            for field in ID_FIELDS:
+                key = _key(record.get(field))
+                if key is not None and key not in seen:
+                    seen.add(key)
+                    self._ids.setdefault(key, []).append(offset)
+        if (reset or records) and self._cursor.state["inode"] is not None:
+            self._save()
+
+    def offsets(self, ids: Iterable[Any]) -> List[int]:
+        """Offsets of lines carrying any of `ids` in an ID field, in file order."""
+        self.refresh()
+        found = set()
+        for value in ids:
+            key = _key(value)
+            if key is not None:
+                found.update(self._ids.get(key, ()))
+        return sorted(found)
+
+    def read(self, ids: Iterable[Any]) -> List[Dict[str, Any]]:
+        offsets = self.offsets(ids)
+        records: List[Dict[str, Any]] = []
+        if not offsets:
+            return records
+        with self.log_path.open("rb") as fh:
+            for offset in offsets:
+                fh.seek(offset)
+                try:
+                    record = json.loads(fh.readline())
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+        return records
+
+
+_INDEXES: Dict[Path, RecordIndex] = {}
+
+
+def index_for(log_path: Path) -> RecordIndex:
+    key = Path(log_path).resolve()
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = RecordIndex(key)
+    return index
@@ -13,6 +13,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from observability.jsonl_append import append_line
+from observability.pattern_graph import graph_for
+from observability.pattern_index import ID_FIELDS, index_for
+
 PATTERN_RECALL_ENABLED_ENV = "PATTERN_RECALL_ENABLED"
 PATTERN_RECALL_ROOT_ENV = "PATTERN_RECALL_ROOT"
 
@@ -77,8 +81,11 @@ def _append_record(filename: str, record: Dict[str, Any], env: Optional[Dict[str
     path = log_path / filename
     record = dict(record)
     record["recorded_at"] = record.get("recorded_at") or _timestamp()
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record, sort_keys=True) + "\n")
+    append_line(path, json.dumps(record, sort_keys=True))
+    try:
+        index_for(path).refresh()
+    except OSError:
+        pass  # the index is derived; lookups rebuild it if this update was missed
     return path
 
 
@@ -256,25 +263,58 @@ def read_records(
     if not path.exists():
         return []
 
-    matched: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if _matches_ids(record, ids_set):
-                matched.append(record)
-    return matched
+    return [record for record in index_for(path).read(ids_set) if _matches_ids(record, ids_set)]
+
+
+def traverse_relations(
+    start_ids: Iterable[str],
+    *,
+    explicit_reference: bool,
+    phase: str,
+    max_depth: int,
+    strategy: str = "bfs",
+    direction: str = "out",
+    relation_types: Optional[Iterable[str]] = None,
+    kinds: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Bounded BFS/DFS over relations (and problem -> attempt links) from explicit IDs.
+
+    Example: all attempts reachable from problem X within depth k is
+    `traverse_relations(["X"], ..., max_depth=k, kinds=["attempt"])`.
+    Guards match read_records.
+    """
+    env = env or os.environ
+    if not is_enabled(env):
+        return []
+    if not explicit_reference:
+        raise ValueError("Explicit reference required to read pattern recall records.")
+    ok, normalized_phase = _guard_phase(phase)
+    if not ok:
+        return []
+    starts = list(start_ids or [])
+    if not starts:
+        raise ValueError("At least one ID must be provided for lookup.")
+
+    logs_dir = _root(env) / "logs"
+    if not logs_dir.is_dir():
+        return []
+    return graph_for(logs_dir).traverse(
+        starts,
+        max_depth,
+        strategy=strategy,
+        direction=direction,
+        relation_types=relation_types,
+        kinds=kinds,
+        limit=limit,
+    )
 
 
 def _matches_ids(record: Dict[str, Any], ids: Iterable[str]) -> bool:
-    ids_set = set(ids)
-    for key in ("id", "problem_id", "attempt_id", "ref_id", "from_id", "to_id"):
+    ids_set = ids if isinstance(ids, (set, frozenset)) else set(ids)
+    for key in ID_FIELDS:
         value = record.get(key)
-        if value in ids_set:
+        if isinstance(value, (str, int, float, bool)) and value in ids_set:
             return True
     return False
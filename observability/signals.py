@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, TextIO
 
+from observability.jsonl_append import append_lines
+
 ALLOWED_SEVERITY = {"info", "warning", "critical"}
 FORBIDDEN_FIELDS = {"action", "recommendation", "rank", "score", "priority", "auto_fix", "auto_migrate"}
 
@@ -145,10 +147,9 @@ def emit_signals(
         _normalize_signal(sig, now=now) for sig in raw_signals
     ]
 
-    # Append-only log
-    with events_path.open("a", encoding="utf-8") as fh:
-        for sig in normalized_signals:
-            fh.write(json.dumps(sig, sort_keys=True) + "\n")
+    # Append-only log; one write so concurrent emitters never interleave a batch
+    events_path.touch(exist_ok=True)
+    append_lines(events_path, [json.dumps(sig, sort_keys=True) for sig in normalized_signals])
 
     # CLI notices
     for sig in normalized_signals:
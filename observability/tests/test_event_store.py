@@ -0,0 +1,121 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+
+from observability import event_store
+from observability.event_store import EventStore
+
+
+def write_events(path: Path, events: list) -> None:
+    with path.open("a", encoding="utf-8") as fh:
+        for event in events:
+            fh.write(json.dumps(event) + "\n")
+
+
+class EventStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "events.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _event(self, n: int, **extra) -> dict:
+        event = {"timestamp": f"2026-01-{n:02d}T00:00:00Z", "type": "gate", "status": "pass", "message": f"m{n}"}
+        event.update(extra)
+        return event
+
+    def test_query_filters_by_indexed_fields(self) -> None:
+        write_events(
+            self.path,
+            [
+                self._event(1, task_id="T-1"),
+                self._event(2, type="critique", phase="reflection", context={"task_id": "T-2"}),
+                self._event(3, type="critique", phase="reflection", task_id="T-1"),
+            ],
+        )
+        store = EventStore(self.path)
+        self.assertEqual([e["message"] for e in store.query(task_id="T-1")], ["m1", "m3"])
+        self.assertEqual([e["message"] for e in store.query(type="critique", task_id="T-2")], ["m2"])
+        self.assertEqual(store.query(type="critique", task_id="T-9"), [])
+        self.assertEqual([e["message"] for e in store.query(since="2026-01-02T00:00:00Z", limit=1)], ["m2"])
+        with self.assertRaises(ValueError):
+            store.query(message="m1")
+
+    def test_incremental_refresh_sees_appends_and_ignores_partial_lines(self) -> None:
+        write_events(self.path, [self._event(1, task_id="T-1")])
+        store = EventStore(self.path)
+        self.assertEqual(len(store.query(task_id="T-1")), 1)
+
+        write_events(self.path, [self._event(2, task_id="T-1")])
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write('{"type": "gate", "task_id": "T-1"')
+        self.assertEqual(len(store.query(task_id="T-1")), 2)
+        self.assertEqual(len(EventStore(self.path).query(task_id="T-1")), 2)
+
+    def test_rewritten_file_is_reindexed(self) -> None:
+        write_events(self.path, [self._event(1, task_id="T-1"), self._event(2, task_id="T-1")])
+        store = EventStore(self.path)
+        self.assertEqual(len(store.query(task_id="T-1")), 2)
+        self.path.unlink()
+        write_events(self.path, [self._event(3, task_id="T-2")])
+        self.assertEqual(store.query(task_id="T-1"), [])
+        self.assertEqual(len(store.query(task_id="T-2")), 1)
+
+    def test_rotation_seals_segments_and_prunes_on_query(self) -> None:
+        store = EventStore(self.path, max_segment_bytes=200)
+        for n in range(1, 7):
+            store.append(self._event(n, task_id=f"T-{n}"))
+        sealed = sorted(store.segments_dir.glob("*.jsonl"))
+        self.assertGreaterEqual(len(sealed), 2)
+        self.assertEqual([e["message"] for e in store.query(type="gate")], [f"m{n}" for n in range(1, 7)])
+        self.assertEqual([e["message"] for e in store.query(task_id="T-1")], ["m1"])
+
+        opened = []
+        original = Path.open
+
+        def tracking_open(path, *args, **kwargs):
+            if path.suffix == ".jsonl":
+                opened.append(path.name)
+            return original(path, *args, **kwargs)
+
+        Path.open = tracking_open
+        try:
+            EventStore(self.path).query(task_id="T-1")
+        finally:
+            Path.open = original
+        self.assertEqual(opened, [sealed[0].name])
+
+    def test_daily_rotation(self) -> None:
+        write_events(self.path, [self._event(1)])
+        store = EventStore(self.path, daily=True)
+        self.assertIsNone(store.maybe_rotate(now=datetime(2026, 1, 1, 12, tzinfo=timezone.utc)))
+        target = store.maybe_rotate(now=datetime(2026, 1, 2, tzinfo=timezone.utc))
+        self.assertEqual(target.name, "000001.jsonl")
+        self.assertFalse(self.path.exists())
+        self.assertEqual(len(store.query(type="gate")), 1)
+
+    def test_verification_memo_resets_when_segment_changes(self) -> None:
+        write_events(self.path, [self._event(1)])
+        store = EventStore(self.path)
+        segment = store.rotate()
+        store.mark_verified(segment, "k1")
+        self.assertTrue(EventStore(self.path).is_verified(segment, "k1"))
+        self.assertFalse(store.is_verified(segment, "k2"))
+        write_events(segment, [self._event(2)])
+        self.assertFalse(store.is_verified(segment, "k1"))
+
+    def test_cli_query(self) -> None:
+        write_events(self.path, [self._event(1, spec_id="s-1"), self._event(2)])
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(event_store.main(["query", str(self.path), "--spec-id", "s-1"]), 0)
+        self.assertEqual([json.loads(line)["message"] for line in out.getvalue().splitlines()], ["m1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
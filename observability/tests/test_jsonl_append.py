@@ -0,0 +1,54 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from observability import jsonl_append
+
+COMPONENTS = ("governance-orchestrator", "readme-spec-engine", "spec-compiler", "ui-constitution", "ui-pattern-registry")
+
+
+class JsonlAppendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "nested" / "ledger.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_append_lines_terminates_each_record(self) -> None:
+        jsonl_append.append_line(self.path, '{"a": 1}')
+        jsonl_append.append_lines(self.path, ['{"b": 2}\n', '{"c": 3}'])
+        jsonl_append.append_lines(self.path, [])
+        self.assertEqual(self.path.read_text(encoding="utf-8"), '{"a": 1}\n{"b": 2}\n{"c": 3}\n')
+
+    def test_large_records_round_trip(self) -> None:
+        record = {"pad": "x" * (jsonl_append.ATOMIC_APPEND_BYTES * 3)}
+        jsonl_append.append_line(self.path, json.dumps(record))
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), record)
+
+    def test_parallel_writers_produce_no_torn_lines(self) -> None:
+        result = jsonl_append.stress(self.path, writers=4, records=50, large_every=5)
+        self.assertEqual(result["corrupted"], 0)
+        self.assertTrue(result["complete"])
+        self.assertEqual(result["records"], 200)
+
+    def test_stress_refuses_existing_ledger(self) -> None:
+        jsonl_append.append_line(self.path, '{"keep": true}')
+        with self.assertRaises(FileExistsError):
+            jsonl_append.stress(self.path, writers=1, records=1)
+        with self.assertRaises(SystemExit) as exit_info:
+            jsonl_append.main(["--out", str(self.path), "--writers", "1", "--records", "1"])
+        self.assertEqual(exit_info.exception.code, 2)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), '{"keep": true}\n')
+
+    def test_component_copies_match_hub(self) -> None:
+        root = Path(__file__).resolve().parents[2]
+        hub = (root / "observability" / "jsonl_append.py").read_text(encoding="utf-8")
+        for component in COMPONENTS:
+            copy = root / component / "scripts" / "jsonl_append.py"
+            self.assertEqual(copy.read_text(encoding="utf-8"), hub, component)
+
+
+if __name__ == "__main__":
+    unittest.main()
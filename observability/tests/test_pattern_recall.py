@@ -1,4 +1,5 @@
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -126,6 +127,101 @@ class PatternRecallTests(unittest.TestCase):
                 extra={"rank": 0.9},
             )
 
+    def _record_attempts(self, count: int) -> None:
+        os.environ["PATTERN_RECALL_ENABLED"] = "true"
+        for n in range(count):
+            pattern_recall.record_attempt(
+                attempt_id=f"a{n}",
+                problem_id=f"p{n % 3}",
+                phase="reflect",
+                summary=f"attempt {n}",
+            )
+
+    def _read_attempts(self, ids: list) -> list:
+        return pattern_recall.read_records("attempt", ids=ids, explicit_reference=True, phase="reflect")
+
+    def test_index_lookup_matches_any_id_field(self) -> None:
+        self._record_attempts(9)
+        index_file = Path(self.tmpdir.name) / "logs" / ".index" / "attempts.ndjson.json"
+        self.assertTrue(index_file.exists())
+        self.assertEqual([r["id"] for r in self._read_attempts(["p1"])], ["a1", "a4", "a7"])
+        self.assertEqual([r["id"] for r in self._read_attempts(["a5", "p2"])], ["a2", "a5", "a8"])
+        self.assertEqual(self._read_attempts(["missing"]), [])
+
+    def test_index_catches_up_and_rebuilds_when_stale(self) -> None:
+        self._record_attempts(3)
+        log_file = Path(self.tmpdir.name) / "logs" / "attempts.ndjson"
+        with log_file.open("a", encoding="utf-8") as fh:
+            fh.write('{"id": "external", "problem_id": "p0"}\n{"id": "partial"')
+        self.assertEqual([r["id"] for r in self._read_attempts(["p0"])], ["a0", "external"])
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()[:3]
+        log_file.write_text("\n".join(reversed(lines)) + "\n", encoding="utf-8")
+        self.assertEqual([r["id"] for r in self._read_attempts(["a0", "a2"])], ["a2", "a0"])
+
+        shutil.rmtree(Path(self.tmpdir.name) / "logs" / ".index")
+        self.assertEqual([r["id"] for r in self._read_attempts(["a1"])], ["a1"])
+
+    def test_index_does_not_bypass_phase_guard(self) -> None:
+        self._record_attempts(1)
+        self.assertEqual(
+            pattern_recall.read_records("attempt", ids=["a0"], explicit_reference=True, phase="execute"),
+            [],
+        )
+
+    def _build_history(self) -> None:
+        os.environ["PATTERN_RECALL_ENABLED"] = "true"
+        for problem_id in ("p1", "p2", "p3"):
+            pattern_recall.record_problem(
+                problem_id=problem_id, title=problem_id, source="test", phase="observe", provenance={}
+            )
+        for attempt_id, problem_id in (("a1", "p1"), ("a2", "p2"), ("a3", "p3")):
+            pattern_recall.record_attempt(attempt_id=attempt_id, problem_id=problem_id, phase="reflect", summary="s")
+        pattern_recall.record_relation("p1", "p2", "similar_problem", "same failure", phase="reflect")
+        pattern_recall.record_relation("p2", "p3", "similar_problem", "same failure", phase="reflect")
+
+    def _traverse(self, start: list, depth: int, **kwargs) -> list:
+        return pattern_recall.traverse_relations(start, explicit_reference=True, phase="reflect", max_depth=depth, **kwargs)
+
+    def test_traversal_is_bounded_by_depth(self) -> None:
+        self._build_history()
+        self.assertEqual([r["id"] for r in self._traverse(["p1"], 2, kinds=["attempt"])], ["a1", "a2"])
+        self.assertEqual([r["id"] for r in self._traverse(["p1"], 3, kinds=["attempt"])], ["a1", "a2", "a3"])
+        reached = {r["id"]: r for r in self._traverse(["p1"], 3)}
+        self.assertEqual(reached["a3"]["path"], ["p1", "p2", "p3", "a3"])
+        self.assertEqual(reached["p2"]["relation_type"], "similar_problem")
+        self.assertEqual([r["id"] for r in self._traverse(["a3"], 2, direction="in")], ["p3", "p2"])
+        dfs = [r["id"] for r in self._traverse(["p1"], 3, strategy="dfs", relation_types=["similar_problem"])]
+        self.assertEqual(dfs, ["p2", "p3"])
+        self.assertEqual(len(self._traverse(["p1"], 5, limit=2)), 2)
+
+    def test_dfs_reexpands_nodes_reached_by_shorter_paths(self) -> None:
+        os.environ["PATTERN_RECALL_ENABLED"] = "true"
+        for source, target in (("S", "A"), ("S", "B"), ("A", "C"), ("C", "D"), ("B", "D"), ("D", "E")):
+            pattern_recall.record_relation(source, target, "similar_problem", "edge", phase="reflect")
+        bfs = {r["id"]: r["depth"] for r in self._traverse(["S"], 3)}
+        dfs = {r["id"]: r for r in self._traverse(["S"], 3, strategy="dfs")}
+        self.assertEqual(bfs, {"A": 1, "B": 1, "C": 2, "D": 2, "E": 3})
+        self.assertEqual({node: r["depth"] for node, r in dfs.items()}, bfs)
+        self.assertEqual(dfs["D"]["path"], ["S", "B", "D"])
+        self.assertEqual(dfs["E"]["path"], ["S", "B", "D", "E"])
+
+    def test_traversal_sees_appends_incrementally(self) -> None:
+        self._build_history()
+        self.assertEqual(self._traverse(["p3"], 1, kinds=["problem"]), [])
+        pattern_recall.record_relation("p3", "p1", "similar_problem", "cycle", phase="reflect")
+        self.assertEqual([r["id"] for r in self._traverse(["p3"], 5, kinds=["problem"])], ["p1", "p2"])
+
+    def test_traversal_respects_guards(self) -> None:
+        self._build_history()
+        with self.assertRaises(ValueError):
+            pattern_recall.traverse_relations(["p1"], explicit_reference=False, phase="reflect", max_depth=1)
+        self.assertEqual(
+            pattern_recall.traverse_relations(["p1"], explicit_reference=True, phase="plan", max_depth=1), []
+        )
+        os.environ["PATTERN_RECALL_ENABLED"] = "false"
+        self.assertEqual(self._traverse(["p1"], 1), [])
+
     def test_missing_storage_is_safe(self) -> None:
         os.environ["PATTERN_RECALL_ENABLED"] = "true"
         # Remove backing directory to simulate layer removal.
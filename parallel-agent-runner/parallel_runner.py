@@ -1,27 +1,176 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import os
+import signal
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Callable, Dict, List, Optional
 
+KILL_GRACE_SECONDS = 5.0
+WATCH_INTERVAL_SECONDS = 0.1
+OUTPUT_LOCK = threading.Lock()
 
-def run_cmd(cmd: str) -> dict:
-    start = datetime.utcnow().isoformat() + 'Z'
-    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    stdout, stderr = proc.communicate()
-    end = datetime.utcnow().isoformat() + 'Z'
+
+def timestamp() -> str:
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+class OutputSink:
+    """Collects one stream of a command: in memory, or spilled to a file, optionally teed live."""
+
+    def __init__(self, label: str, name: str, tee: Optional[IO[str]], spill_path: Optional[Path]) -> None:
+        self.label = label
+        self.name = name
+        self.tee = tee
+        self.spill_path = spill_path
+        self.chunks: List[str] = []
+        self.handle = spill_path.open("w", encoding="utf-8") if spill_path else None
+
+    def write_line(self, line: str) -> None:
+        if self.handle:
+            self.handle.write(line)
+        else:
+            self.chunks.append(line)
+        if self.tee is not None:
+            text = line if line.endswith("\n") else line + "\n"
+            with OUTPUT_LOCK:
+                self.tee.write(f"[{self.label}] {text}")
+                self.tee.flush()
+
+    def pump(self, pipe: IO[bytes]) -> None:
+        with pipe:
+            for raw in iter(pipe.readline, b""):
+                self.write_line(raw.decode("utf-8", errors="replace"))
+        if self.handle:
+            self.handle.close()
+
+    def record(self, entry: dict) -> None:
+        if self.spill_path:
+            entry[f"{self.name}_path"] = str(self.spill_path)
+        else:
+            entry[self.name] = "".join(self.chunks)
+
+
+def kill_group(proc: subprocess.Popen, sig: int) -> None:
+    try:
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def wait_with_usage(proc: subprocess.Popen) -> Optional[dict]:
+    """Reap the child with wait4 so its (and its reaped descendants') rusage is exact."""
+    if not hasattr(os, "wait4"):
+        proc.wait()
+        return None
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    max_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
     return {
+        "cpu_user_seconds": round(usage.ru_utime, 3),
+        "cpu_system_seconds": round(usage.ru_stime, 3),
+        "max_rss_kb": max_rss_kb,
+    }
+
+
+def run_cmd(
+    cmd: str,
+    label: str = "",
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    stream: bool = False,
+    spill_dir: Optional[Path] = None,
+    kill_grace: float = KILL_GRACE_SECONDS,
+    cancel: Optional[threading.Event] = None,
+) -> dict:
+    """Run one shell command in its own process group.
+
+    `timeout` bounds this command; `deadline` is an absolute time.monotonic() bound shared by
+    the whole run. Whichever comes first, or `cancel` being set, kills the process group
+    (SIGTERM, then SIGKILL).
+    """
+    start = timestamp()
+    started = time.monotonic()
+    limits = [bound for bound in (started + timeout if timeout else None, deadline) if bound is not None]
+    stop_at = min(limits) if limits else None
+    if stop_at is not None and stop_at <= started:
+        return {"cmd": cmd, "returncode": None, "timed_out": True, "skipped": True, "start": start, "end": start}
+    if cancel is not None and cancel.is_set():
+        return {"cmd": cmd, "returncode": None, "cancelled": True, "skipped": True, "start": start, "end": start}
+
+    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True)
+    sinks = [
+        OutputSink(label, name, tee if stream else None, spill_dir / f"{label}.{name}.log" if spill_dir else None)
+        for name, tee in (("stdout", sys.stdout), ("stderr", sys.stderr))
+    ]
+    pumps = [
+        threading.Thread(target=sink.pump, args=(pipe,), daemon=True)
+        for sink, pipe in zip(sinks, (proc.stdout, proc.stderr))
+    ]
+    for pump in pumps:
+        pump.start()
+
+    state = {"finished": False, "killed": None}
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def kill(reason: str, sig: int) -> None:
+        with lock:
+            if state["finished"]:
+                return
+            state["killed"] = state["killed"] or reason
+            kill_group(proc, sig)
+
+    def watch() -> None:
+        while not done.wait(WATCH_INTERVAL_SECONDS):
+            if cancel is not None and cancel.is_set():
+                reason = "cancelled"
+            elif stop_at is not None and time.monotonic() >= stop_at:
+                reason = "timed_out"
+            else:
+                continue
+            kill(reason, signal.SIGTERM)
+            if not done.wait(kill_grace):
+                kill(reason, signal.SIGKILL)
+            return
+
+    watchdog = None
+    if stop_at is not None or cancel is not None:
+        watchdog = threading.Thread(target=watch, daemon=True)
+        watchdog.start()
+
+    usage = wait_with_usage(proc)
+    with lock:
+        state["finished"] = True
+    done.set()
+    if state["killed"]:
+        # Descendants that outlived the shell still hold the pipes open.
+        kill_group(proc, signal.SIGKILL)
+    for pump in pumps:
+        pump.join()
+
+    entry = {
         "cmd": cmd,
         "returncode": proc.returncode,
-        "stdout": stdout,
-        "stderr": stderr,
+        "timed_out": state["killed"] == "timed_out",
         "start": start,
-        "end": end,
+        "end": timestamp(),
+        "wall_seconds": round(time.monotonic() - started, 3),
     }
+    if state["killed"] == "cancelled":
+        entry["cancelled"] = True
+    if usage:
+        entry.update(usage)
+    for sink in sinks:
+        sink.record(entry)
+    return entry
 
 
 def log_entry(entry: dict, log_file: Optional[Path]) -> None:
@@ -30,27 +179,226 @@ def log_entry(entry: dict, log_file: Optional[Path]) -> None:
             f.write(json.dumps(entry) + "\n")
 
 
+def report(res: dict, stream: bool) -> None:
+    if stream:
+        status = "timed out" if res.get("timed_out") else f"exit {res['returncode']}"
+        sys.stdout.write(f"=== DONE ({status}, {res.get('wall_seconds', 0)}s): {res['cmd']}\n")
+        return
+    sys.stdout.write(f"\n=== CMD: {res['cmd']}\n")
+    if "stdout_path" in res:
+        sys.stdout.write(f"(stdout: {res['stdout_path']}, stderr: {res['stderr_path']})\n")
+    else:
+        sys.stdout.write(res.get("stdout", ""))
+        if res.get("stderr"):
+            sys.stderr.write(res["stderr"])
+    if res.get("timed_out"):
+        sys.stderr.write(f"Timed out: {res['cmd']}\n")
+
+
+def load_graph(path: Path, capacity: int) -> List[dict]:
+    """Load a task graph (schemas/task_graph.schema.json) whose tasks carry a `command`.
+
+    Dependencies are the union of each task's `depends_on` and the `edges` (from -> to means
+    `to` waits for `from`). Returns tasks in a topological order that keeps file order among
+    independent tasks.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise SystemExit(f"Failed to read task graph {path}: {exc}")
+    if not isinstance(data, dict) or not isinstance(data.get("tasks"), list) or not isinstance(data.get("edges"), list):
+        raise SystemExit("Task graph must be an object with tasks and edges arrays.")
+
+    tasks: Dict[str, dict] = {}
+    for index, raw in enumerate(data["tasks"]):
+        task_id = raw.get("task_id") if isinstance(raw, dict) else None
+        if not isinstance(task_id, str) or not task_id:
+            raise SystemExit(f"tasks[{index}] missing task_id.")
+        if task_id in tasks:
+            raise SystemExit(f"Duplicate task_id '{task_id}'.")
+        command = raw.get("command")
+        if not isinstance(command, str) or not command.strip():
+            raise SystemExit(f"Task '{task_id}' has no command.")
+        weight = raw.get("weight", 1)
+        if not isinstance(weight, int) or isinstance(weight, bool) or weight < 1:
+            raise SystemExit(f"Task '{task_id}' weight must be a positive integer.")
+        if weight > capacity:
+            raise SystemExit(f"Task '{task_id}' weight {weight} exceeds capacity {capacity}.")
+        tasks[task_id] = {
+            "task_id": task_id,
+            "cmd": command,
+            "weight": weight,
+            "deps": list(dict.fromkeys(raw.get("depends_on") or [])),
+        }
+    for index, edge in enumerate(data["edges"]):
+        if not isinstance(edge, dict) or "from" not in edge or "to" not in edge:
+            raise SystemExit(f"edges[{index}] must include from/to.")
+        if edge["to"] in tasks and edge["from"] not in tasks[edge["to"]]["deps"]:
+            tasks[edge["to"]]["deps"].append(edge["from"])
+        for end in ("from", "to"):
+            if edge[end] not in tasks:
+                raise SystemExit(f"Edge references unknown task '{edge[end]}'.")
+    for task in tasks.values():
+        for dep in task["deps"]:
+            if dep not in tasks:
+                raise SystemExit(f"Task '{task['task_id']}' depends_on unknown task '{dep}'.")
+
+    ordered: List[dict] = []
+    placed: set = set()
+    remaining = list(tasks.values())
+    while remaining:
+        ready = [task for task in remaining if all(dep in placed for dep in task["deps"])]
+        if not ready:
+            cycle = ", ".join(task["task_id"] for task in remaining)
+            raise SystemExit(f"Task graph has a cycle among: {cycle}")
+        for task in ready:
+            ordered.append(task)
+            placed.add(task["task_id"])
+        remaining = [task for task in remaining if task["task_id"] not in placed]
+    return ordered
+
+
+def schedule(
+    tasks: List[dict],
+    capacity: int,
+    run: Callable[[dict, threading.Event], dict],
+    on_result: Callable[[dict], None],
+    fail_fast: bool = False,
+) -> bool:
+    """Run tasks as their dependencies succeed, keeping the summed weight within `capacity`.
+
+    Tasks downstream of a failure are skipped. With `fail_fast`, the first failure also
+    cancels running tasks and stops new ones from starting. Returns True if anything failed.
+    """
+    pending = list(tasks)
+    succeeded: set = set()
+    failed: set = set()
+    cancel = threading.Event()
+    running: Dict[object, dict] = {}
+    in_use = 0
+
+    def settle(task: dict, entry: dict) -> None:
+        entry = {"task_id": task["task_id"], "weight": task["weight"], **entry}
+        if entry.get("returncode") == 0 and not entry.get("skipped"):
+            succeeded.add(task["task_id"])
+        else:
+            failed.add(task["task_id"])
+            if fail_fast:
+                cancel.set()
+        on_result(entry)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(capacity, len(tasks)))) as executor:
+        while pending or running:
+            for task in list(pending):
+                blocked = [dep for dep in task["deps"] if dep in failed]
+                if blocked or cancel.is_set():
+                    pending.remove(task)
+                    reason = f"upstream failed: {', '.join(blocked)}" if blocked else "cancelled by fail-fast"
+                    settle(task, {"cmd": task["cmd"], "returncode": None, "skipped": True, "reason": reason})
+                    continue
+                if all(dep in succeeded for dep in task["deps"]) and in_use + task["weight"] <= capacity:
+                    pending.remove(task)
+                    in_use += task["weight"]
+                    running[executor.submit(run, task, cancel)] = task
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                in_use -= task["weight"]
+                settle(task, future.result())
+    return bool(failed)
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be > 0")
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be > 0")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="CERES parallel agent runner")
-    parser.add_argument("--cmd", action="append", required=True, help="Command to run (repeatable)")
-    parser.add_argument("--concurrency", type=int, default=2, help="Max parallel commands")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--cmd", action="append", help="Command to run (repeatable)")
+    source.add_argument("--graph", type=Path, help="Task graph JSON; each task needs a command")
+    parser.add_argument("--concurrency", type=positive_int, default=2, help="Max parallel commands")
+    parser.add_argument(
+        "--capacity", type=positive_int, help="Total task weight allowed at once with --graph (default: --concurrency)"
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="With --graph, cancel everything on first failure")
     parser.add_argument("--log-file", type=Path, help="Optional JSONL log file")
+    parser.add_argument("--stream", action="store_true", help="Tee output live, prefixed with the command index")
+    parser.add_argument("--spill-dir", type=Path, help="Write each command's output to files instead of memory")
+    parser.add_argument("--timeout", type=positive_float, help="Per-command timeout in seconds")
+    parser.add_argument("--global-timeout", type=positive_float, help="Timeout for the whole run in seconds")
+    parser.add_argument(
+        "--kill-grace", type=positive_float, default=KILL_GRACE_SECONDS, help="Seconds between SIGTERM and SIGKILL"
+    )
     args = parser.parse_args()
 
+    deadline = time.monotonic() + args.global_timeout if args.global_timeout else None
+    if args.spill_dir:
+        args.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.graph:
+        capacity = args.capacity or args.concurrency
+        tasks = load_graph(args.graph, capacity)
+
+        def run_task(task: dict, cancel: threading.Event) -> dict:
+            return run_cmd(
+                task["cmd"],
+                label=task["task_id"],
+                timeout=args.timeout,
+                deadline=deadline,
+                stream=args.stream,
+                spill_dir=args.spill_dir,
+                kill_grace=args.kill_grace,
+                cancel=cancel,
+            )
+
+        def on_result(res: dict) -> None:
+            log_entry(res, args.log_file)
+            with OUTPUT_LOCK:
+                if res.get("reason"):
+                    sys.stderr.write(f"Skipped {res['task_id']} ({res['reason']})\n")
+                else:
+                    report(res, args.stream)
+
+        failed = schedule(tasks, capacity, run_task, on_result, fail_fast=args.fail_fast)
+        sys.exit(1 if failed else 0)
+
     cmds: List[str] = args.cmd
     results = []
     failed = False
 
     with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-        future_to_cmd = {executor.submit(run_cmd, cmd): cmd for cmd in cmds}
+        future_to_cmd = {
+            executor.submit(
+                run_cmd,
+                cmd,
+                label=str(index),
+                timeout=args.timeout,
+                deadline=deadline,
+                stream=args.stream,
+                spill_dir=args.spill_dir,
+                kill_grace=args.kill_grace,
+            ): cmd
+            for index, cmd in enumerate(cmds, start=1)
+        }
         for future in as_completed(future_to_cmd):
             res = future.result()
             results.append(res)
             log_entry(res, args.log_file)
-            sys.stdout.write(f"\n=== CMD: {res['cmd']}\n")
-            sys.stdout.write(res["stdout"])
-            if res["stderr"]:
-                sys.stderr.write(res["stderr"])
+            with OUTPUT_LOCK:
+                report(res, args.stream)
             if res["returncode"] != 0:
                 failed = True
 
@@ -0,0 +1,194 @@
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+RUNNER = Path(__file__).resolve().parents[1] / "parallel_runner.py"
+_spec = importlib.util.spec_from_file_location("parallel_runner", RUNNER)
+parallel_runner = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parallel_runner)
+
+
+def run_runner(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(RUNNER), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=60,
+    )
+
+
+class ParallelRunnerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.log = self.root / "runs.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _entries(self) -> dict:
+        entries = [json.loads(line) for line in self.log.read_text(encoding="utf-8").splitlines()]
+        return {entry["cmd"]: entry for entry in entries}
+
+    def test_buffered_mode_records_output_and_usage(self) -> None:
+        result = run_runner("--cmd", "echo out; echo err >&2", "--cmd", "exit 3", "--log-file", str(self.log))
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("=== CMD: echo out; echo err >&2\nout\n", result.stdout)
+        entry = self._entries()["echo out; echo err >&2"]
+        self.assertEqual((entry["stdout"], entry["stderr"], entry["timed_out"]), ("out\n", "err\n", False))
+        for key in ("wall_seconds", "cpu_user_seconds", "cpu_system_seconds", "max_rss_kb"):
+            self.assertIn(key, entry)
+        self.assertEqual(self._entries()["exit 3"]["returncode"], 3)
+
+    def test_stream_prefixes_lines_and_spills_to_files(self) -> None:
+        spill = self.root / "spill"
+        result = run_runner(
+            "--stream", "--spill-dir", str(spill), "--log-file", str(self.log), "--cmd", "echo one; echo two"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("[1] one\n[1] two\n", result.stdout)
+        entry = self._entries()["echo one; echo two"]
+        self.assertNotIn("stdout", entry)
+        self.assertEqual(Path(entry["stdout_path"]).read_text(encoding="utf-8"), "one\ntwo\n")
+
+    def test_timeout_kills_whole_process_group(self) -> None:
+        started = time.monotonic()
+        result = run_runner(
+            "--timeout", "0.5", "--kill-grace", "0.5", "--log-file", str(self.log), "--cmd", "sleep 30 & sleep 30"
+        )
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Timed out: sleep 30 & sleep 30", result.stderr)
+        self.assertTrue(self._entries()["sleep 30 & sleep 30"]["timed_out"])
+
+    def test_global_timeout_skips_commands_not_yet_started(self) -> None:
+        result = run_runner(
+            "--concurrency",
+            "1",
+            "--global-timeout",
+            "0.5",
+            "--kill-grace",
+            "0.5",
+            "--log-file",
+            str(self.log),
+            "--cmd",
+            "sleep 30",
+            "--cmd",
+            "echo late",
+        )
+        self.assertEqual(result.returncode, 1)
+        late = self._entries()["echo late"]
+        self.assertTrue(late["skipped"])
+        self.assertIsNone(late["returncode"])
+
+
+
+def write_graph(path: Path, tasks: list, edges: list | None = None) -> Path:
+    for task in tasks:
+        task.setdefault("description", task["task_id"])
+        task.setdefault("command", f"echo {task['task_id']}")
+    path.write_text(json.dumps({"tasks": tasks, "edges": edges or []}), encoding="utf-8")
+    return path
+
+
+class TaskGraphTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.graph = Path(self.tmp.name) / "task_graph.json"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_graph_is_ordered_topologically_from_depends_on_and_edges(self) -> None:
+        write_graph(
+            self.graph,
+            [{"task_id": "c", "depends_on": ["b"]}, {"task_id": "b"}, {"task_id": "a"}],
+            [{"from": "a", "to": "b"}],
+        )
+        tasks = parallel_runner.load_graph(self.graph, capacity=2)
+        self.assertEqual([task["task_id"] for task in tasks], ["a", "b", "c"])
+        self.assertEqual(tasks[1]["deps"], ["a"])
+
+    def test_invalid_graphs_are_rejected(self) -> None:
+        cases = [
+            ([{"task_id": "a", "depends_on": ["b"]}, {"task_id": "b", "depends_on": ["a"]}], "cycle"),
+            ([{"task_id": "a", "depends_on": ["missing"]}], "unknown task"),
+            ([{"task_id": "a", "weight": 3}], "exceeds capacity"),
+            ([{"task_id": "a", "command": ""}], "has no command"),
+        ]
+        for tasks, message in cases:
+            write_graph(self.graph, tasks)
+            with self.assertRaises(SystemExit) as ctx:
+                parallel_runner.load_graph(self.graph, capacity=2)
+            self.assertIn(message, str(ctx.exception.code))
+
+    def _schedule(self, tasks: list, capacity: int, fail: set = frozenset(), fail_fast: bool = False) -> tuple:
+        lock = threading.Lock()
+        active = {"weight": 0, "peak": 0}
+        results = {}
+
+        def run(task: dict, cancel: threading.Event) -> dict:
+            with lock:
+                active["weight"] += task["weight"]
+                active["peak"] = max(active["peak"], active["weight"])
+            time.sleep(0.05)
+            with lock:
+                active["weight"] -= task["weight"]
+            return {"cmd": task["cmd"], "returncode": 1 if task["task_id"] in fail else 0}
+
+        def on_result(entry: dict) -> None:
+            results[entry["task_id"]] = entry
+
+        write_graph(self.graph, tasks)
+        failed = parallel_runner.schedule(
+            parallel_runner.load_graph(self.graph, capacity), capacity, run, on_result, fail_fast=fail_fast
+        )
+        return failed, results, active["peak"]
+
+    def test_weights_bound_parallelism(self) -> None:
+        tasks = [{"task_id": f"t{n}", "weight": 2 if n % 2 else 1} for n in range(6)]
+        failed, results, peak = self._schedule(tasks, capacity=3)
+        self.assertFalse(failed)
+        self.assertEqual(len(results), 6)
+        self.assertLessEqual(peak, 3)
+        self.assertGreater(peak, 1)
+
+    def test_failure_skips_downstream_but_not_independent_branches(self) -> None:
+        tasks = [
+            {"task_id": "a"},
+            {"task_id": "b", "depends_on": ["a"]},
+            {"task_id": "c", "depends_on": ["b"]},
+            {"task_id": "x"},
+        ]
+        failed, results, _ = self._schedule(tasks, capacity=2, fail={"a"})
+        self.assertTrue(failed)
+        self.assertEqual(results["b"]["reason"], "upstream failed: a")
+        self.assertEqual(results["c"]["reason"], "upstream failed: b")
+        self.assertEqual(results["x"]["returncode"], 0)
+
+    def test_fail_fast_cancels_remaining_work(self) -> None:
+        _, results, _ = self._schedule([{"task_id": "a"}, {"task_id": "z"}], capacity=1, fail={"a"})
+        self.assertEqual(results["z"]["returncode"], 0)
+        _, results, _ = self._schedule([{"task_id": "a"}, {"task_id": "z"}], capacity=1, fail={"a"}, fail_fast=True)
+        self.assertEqual(results["z"]["reason"], "cancelled by fail-fast")
+
+    def test_cli_fail_fast_kills_running_tasks(self) -> None:
+        write_graph(
+            self.graph,
+            [{"task_id": "slow", "command": "sleep 30"}, {"task_id": "bad", "command": "sleep 0.2; exit 4"}],
+        )
+        started = time.monotonic()
+        result = run_runner("--graph", str(self.graph), "--fail-fast", "--kill-grace", "0.5")
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(result.returncode, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,24 +34,12 @@ def load_prompt(args: argparse.Namespace) -> str:
     raise SystemExit("No prompt provided. Pass --prompt-file or pipe input.")
 
 
-def emit(report: Dict[str, Any]) -> None:
-    if yaml:
-        sys.stdout.write(yaml.safe_dump(report, sort_keys=False))
-    else:
-        sys.stdout.write(json.dumps(report, indent=2))
-
-
-def main() -> None:
-    parser = argparse.ArgumentParser(description="CERES Prompt Debugger")
-    parser.add_argument("--prompt-file", help="Path to prompt text (optional)")
-    args = parser.parse_args()
-
-    prompt = load_prompt(args)
+def build_report(prompt: str) -> Dict[str, Any]:
     classification = classify(prompt)
     issues = validate(prompt)
     risk_level = assess(prompt, issues, classification["destructive"])
     status, suggested = decide(issues, classification["destructive"])
-    report = build(
+    return build(
         prompt=prompt,
         detected_intent=classification["detected_intent"],
         repos=classification["repos"],
@@ -60,7 +48,25 @@ def main() -> None:
         status=status,
         suggested=suggested,
     )
-    emit(report)
+
+
+def render(report: Dict[str, Any]) -> str:
+    if yaml:
+        return yaml.safe_dump(report, sort_keys=False)
+    return json.dumps(report, indent=2)
+
+
+def emit(report: Dict[str, Any]) -> None:
+    sys.stdout.write(render(report))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CERES Prompt Debugger")
+    parser.add_argument("--prompt-file", help="Path to prompt text (optional)")
+    args = parser.parse_args()
+
+    prompt = load_prompt(args)
+    emit(build_report(prompt))
 
 
 if __name__ == "__main__":
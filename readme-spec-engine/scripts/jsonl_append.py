@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Whole-record appends for JSONL ledgers shared by concurrent writers.
+
+Records up to ATOMIC_APPEND_BYTES go out as a single O_APPEND write, which the kernel
+places at end-of-file without interleaving. Larger records (or batches) hold an
+exclusive flock for the write loop; small writers take a shared lock so they still
+run concurrently with each other but never land inside a large record.
+
+Identical copies live in each component's scripts/ directory; keep them in sync.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+ATOMIC_APPEND_BYTES = 4096
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def append_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is None:
+            _write_all(fd, data)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_SH if len(data) <= ATOMIC_APPEND_BYTES else fcntl.LOCK_EX)
+            try:
+                _write_all(fd, data)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append_lines(path: Path, lines: Iterable[str], fsync: bool = False) -> None:
+    """Append lines as one unit; a trailing newline is added to each line that lacks one."""
+    text = "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+    if text:
+        append_bytes(path, text.encode("utf-8"), fsync)
+
+
+def append_line(path: Path, line: str) -> None:
+    append_lines(path, [line])
+
+
+def _stress_writer(path: str, writer: int, records: int, large_every: int) -> None:
+    for n in range(records):
+        pad = "x" * (3 * ATOMIC_APPEND_BYTES if large_every and n % large_every == 0 else 64)
+        append_line(Path(path), json.dumps({"writer": writer, "n": n, "pad": pad}))
+
+
+def stress(path: Path, writers: int, records: int, large_every: int = 10) -> dict:
+    """Run `writers` processes appending `records` each into a new file; verify every line is intact."""
+    path = Path(path)
+    if path.exists():
+        # Never stress (and so overwrite or verify against) an existing ledger.
+        raise FileExistsError(f"stress output already exists: {path}")
+    start = time.perf_counter()
+    procs = [
+        multiprocessing.Process(target=_stress_writer, args=(str(path), writer, records, large_every))
+        for writer in range(writers)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+
+    corrupted = 0
+    seen: List[List[int]] = [[] for _ in range(writers)]
+    for raw in path.read_bytes().splitlines():
+        try:
+            record = json.loads(raw)
+            seen[record["writer"]].append(record["n"])
+        except (ValueError, KeyError, IndexError, TypeError):
+            corrupted += 1
+    complete = all(sorted(values) == list(range(records)) for values in seen)
+    total = writers * records
+    return {
+        "writers": writers,
+        "records": total,
+        "corrupted": corrupted,
+        "complete": complete,
+        "seconds": round(elapsed, 3),
+        "records_per_second": round(total / elapsed) if elapsed else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stress-test concurrent JSONL appends")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--large-every", type=int, default=10, help="Every Nth record exceeds the atomic size")
+    parser.add_argument("--out", type=Path, help="New ledger path; must not exist (default: temporary file)")
+    args = parser.parse_args(argv)
+    if args.out is not None and args.out.exists():
+        parser.error(f"--out {args.out} already exists; stress only writes to a new file")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = args.out or Path(tmp) / "stress.jsonl"
+        result = stress(out, args.writers, args.records, args.large_every)
+    print(json.dumps(result, sort_keys=True))
+    return 0 if result["corrupted"] == 0 and result["complete"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Compiled, memoised schema validators shared by the governance checks.
+
+Schemas are looked up by file name across SCHEMA_DIRS (component `schemas/`, the hub
+`schemas/`, `skills/_schema/`) or by explicit path. Each file is read once per
+(mtime_ns, size) and every compiled form is memoised by the SHA-256 of its content, so
+renamed or duplicated schemas share one validator. Two compiled forms are offered:
+
+- `validator(name)`: a jsonschema validator (schema checked once), for callers that
+  already depend on jsonschema (skillctl).
+- `record_checker(name)`: a stdlib-only flat-record checker (required fields, unknown
+  fields, property type and enum) for hub contracts.
+
+Record checker plans and the path -> content hash map are persisted to
+`.cache/schema-registry.json`, so a warm start skips re-reading and re-compiling
+unchanged schemas. The cache is derived; deleting it never changes results. Set
+SCHEMA_REGISTRY_CACHE=0 to skip it.
+
+Identical copies live in each component's scripts/ directory that runs skillctl.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import jsonschema  # type: ignore
+except Exception:  # pragma: no cover
+    jsonschema = None  # type: ignore
+
+ROOT = Path(__file__).resolve().parent.parent
+HUB_ROOT = ROOT.parent
+SCHEMA_DIRS = (ROOT / "schemas", HUB_ROOT / "schemas", ROOT / "skills" / "_schema")
+CACHE_PATH = ROOT / ".cache" / "schema-registry.json"
+CACHE_VERSION = 1
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+}
+
+
+class SchemaError(Exception):
+    pass
+
+
+class RecordChecker:
+    """Flat-record check compiled from a schema's top-level required/properties."""
+
+    def __init__(self, plan: Dict[str, Any]) -> None:
+        self.plan = plan
+        self.required: List[str] = plan["required"]
+        self.fields: Dict[str, Tuple[Optional[Callable[[Any], bool]], Optional[str], Optional[list]]] = {
+            key: (_TYPE_CHECKS.get(expected) if expected else None, expected, enum)
+            for key, (expected, enum) in plan["fields"].items()
+        }
+
+    @staticmethod
+    def plan_for(schema: Dict[str, Any]) -> Dict[str, Any]:
+        properties = schema.get("properties", {})
+        return {
+            "required": list(schema.get("required", [])),
+            "fields": {
+                key: [spec.get("type") if isinstance(spec.get("type"), str) else None, spec.get("enum")]
+                for key, spec in properties.items()
+                if isinstance(spec, dict)
+            },
+        }
+
+    def first_error(self, record: Dict[str, Any], label: str) -> Optional[str]:
+        """The first violation as a message, in the order the hub checks always used."""
+        for key in self.required:
+            if key not in record:
+                return f"{label} missing required field: {key}"
+        for key, value in record.items():
+            field = self.fields.get(key)
+            if field is None:
+                return f"{label} has unknown field: {key}"
+            check, expected, enum = field
+            if check is not None and not check(value):
+                return f"{label} field {key} must be {expected}"
+            if enum is not None and value not in enum:
+                return f"{label} field {key} must be one of {enum}"
+        return None
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get("SCHEMA_REGISTRY_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class SchemaRegistry:
+    def __init__(self, search_dirs: Iterable[Path] = SCHEMA_DIRS, cache_path: Optional[Path] = CACHE_PATH) -> None:
+        self.search_dirs = [Path(path) for path in search_dirs]
+        self.cache_path = cache_path if _cache_enabled() else None
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._plans: Dict[str, Dict[str, Any]] = {}
+        self._schemas: Dict[str, Any] = {}
+        self._validators: Dict[str, Any] = {}
+        self._checkers: Dict[str, RecordChecker] = {}
+        self._modules: Dict[Tuple[str, str], ModuleType] = {}
+        self._dirty = False
+        self._load_cache()
+
+    def _load_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            data = json.loads(Path(self.cache_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._files = data.get("files") or {}
+            self._plans = data.get("plans") or {}
+
+    def save(self) -> None:
+        if self.cache_path is None or not self._dirty:
+            return
+        path = Path(self.cache_path)
+        # Forget deleted schemas and plans no remaining schema hashes to.
+        self._files = {key: entry for key, entry in self._files.items() if os.path.isfile(key)}
+        live = {entry.get("sha256") for entry in self._files.values()}
+        self._plans = {digest: plan for digest, plan in self._plans.items() if digest in live}
+        payload = {"version": CACHE_VERSION, "files": self._files, "plans": self._plans}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            return
+        self._dirty = False
+
+    def resolve(self, name: Union[str, Path]) -> Path:
+        candidate = Path(name)
+        if candidate.is_absolute() or len(candidate.parts) > 1:
+            if candidate.is_file():
+                return candidate.resolve()
+            raise SchemaError(f"Schema not found: {candidate}")
+        for directory in self.search_dirs:
+            path = directory / candidate
+            if path.is_file():
+                return path.resolve()
+        raise SchemaError(f"Schema {name} not found in: {', '.join(str(d) for d in self.search_dirs)}")
+
+    def _signature(self, path: Path) -> List[int]:
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def digest(self, name: Union[str, Path]) -> str:
+        """SHA-256 of the schema file content (cached by mtime and size)."""
+        path = self.resolve(name)
+        key = str(path)
+        signature = self._signature(path)
+        entry = self._files.get(key)
+        if entry is not None and entry.get("signature") == signature:
+            return entry["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._files[key] = {"signature": signature, "sha256": digest}
+        self._dirty = True
+        return digest
+
+    def schema(self, name: Union[str, Path]) -> Any:
+        digest = self.digest(name)
+        if digest not in self._schemas:
+            path = self.resolve(name)
+            try:
+                self._schemas[digest] = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise SchemaError(f"Invalid JSON at {path}: {exc}") from exc
+        return self._schemas[digest]
+
+    def validator(self, name: Union[str, Path]) -> Any:
+        digest = self.digest(name)
+        if digest not in self._validators:
+            self._validators[digest] = compile_validator(self.schema(name))
+        return self._validators[digest]
+
+    def record_checker(self, name: Union[str, Path]) -> RecordChecker:
+        digest = self.digest(name)
+        checker = self._checkers.get(digest)
+        if checker is None:
+            plan = self._plans.get(digest)
+            if plan is None:
+                schema = self.schema(name)
+                if not isinstance(schema, dict):
+                    raise SchemaError(f"Schema {name} must be a JSON object")
+                plan = self._plans[digest] = RecordChecker.plan_for(schema)
+                self._dirty = True
+            checker = self._checkers[digest] = RecordChecker(plan)
+        self.save()
+        return checker
+
+    def python_validator(self, path: Path, module_name: str) -> ModuleType:
+        """Import a validator module once per process, keyed by its content hash."""
+        path = Path(path)
+        key = (str(path.resolve()), hashlib.sha256(path.read_bytes()).hexdigest())
+        module = self._modules.get(key)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                raise SchemaError(f"Cannot import validator module: {path}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._modules[key] = module
+        return module
+
+
+def compile_validator(schema: Any) -> Any:
+    """A jsonschema validator for `schema`, checked once (requires jsonschema)."""
+    if jsonschema is None:
+        raise SchemaError("jsonschema is required for full JSON Schema validation")
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+_DEFAULT: Optional[SchemaRegistry] = None
+
+
+def default_registry() -> SchemaRegistry:
+    """Process-wide registry over SCHEMA_DIRS (explicit paths resolve anywhere)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = SchemaRegistry()
+    return _DEFAULT
@@ -13,6 +13,16 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+try:
+    from observability.event_store import EventStore
+except ImportError:
+    EventStore = None
+try:
+    from observability.jsonl_append import append_line
+except ImportError:
+    append_line = None
 
 PLACEHOLDER_VALUES = {"<spec-id>", "<spec_id>"}
 
@@ -159,6 +169,9 @@ def update_objective(path: Path, spec_id: str) -> bool:
 
 
 def event_exists(events_path: Path, spec_id: str) -> bool:
+    if EventStore is not None:
+        events = EventStore(events_path).iter_query(event="spec_allocated", spec_id=spec_id)
+        return any(data.get("event") == "spec_allocated" and data.get("spec_id") == spec_id for data in events)
     if not events_path.is_file():
         return False
     with events_path.open("r", encoding="utf-8") as handle:
@@ -207,8 +220,12 @@ def emit_event(events_path: Path, spec_id: str, artifacts_updated: list[str]) ->
     if git_head:
         event["git_head"] = git_head
 
+    line = json.dumps(event, separators=(",", ":"))
+    if append_line is not None:
+        append_line(events_path, line)
+        return
     with events_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, separators=(",", ":")) + "\n")
+        handle.write(line + "\n")
 
 
 def main() -> None:
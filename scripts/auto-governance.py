@@ -3,12 +3,21 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts import workspace_snapshot
+from scripts.workspace_snapshot import ArtifactError
+from scripts.yaml_loader import read_yaml_or_json
+
 STATE_PATH = ROOT / "modes_settings_profiles.json"
 
 
@@ -21,90 +30,38 @@ def write_json(path: Path, data: Dict[str, Any]) -> None:
 
 
 def workspace_root() -> Path:
-    env = os.environ.get("CERES_WORKSPACE")
-    if env:
-        return Path(env)
-    candidate = ROOT / ".ceres" / "workspace"
-    if candidate.exists():
-        return candidate
-    return ROOT
-
-
-def parse_front_matter(text: str) -> Dict[str, Any]:
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}
-    data: Dict[str, Any] = {}
-    current_key = None
-    for line in lines[1:]:
-        if line.strip() == "---":
-            break
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if ":" in stripped and not stripped.startswith("-"):
-            key, value = stripped.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            current_key = None
-            if value == "":
-                data[key] = []
-                current_key = key
-            elif value.lower() in {"true", "false"}:
-                data[key] = value.lower() == "true"
-            else:
-                data[key] = value.strip("\"'")
-        elif stripped.startswith("-") and current_key:
-            item = stripped.lstrip("-").strip()
-            if item:
-                data.setdefault(current_key, [])
-                if isinstance(data[current_key], list):
-                    data[current_key].append(item)
-    return data
+    return workspace_snapshot.resolve_workspace(ROOT)
 
 
 def detect_issues(workspace: Path) -> List[str]:
     issues: List[str] = []
-
-    objective = workspace / "objective-contract.json"
-    if not objective.exists():
-        issues.append("objective_contract_missing")
-    else:
-        try:
-            data = load_json(objective)
-            if data.get("status") != "committed":
-                issues.append("objective_contract_not_committed")
-        except Exception:
-            issues.append("objective_contract_parse_error")
-
-    gap = workspace / "gap-ledger.json"
-    if not gap.exists():
-        issues.append("gap_ledger_missing")
-    else:
-        try:
-            data = load_json(gap)
-            gaps = data.get("gaps", [])
-            for entry in gaps:
-                if isinstance(entry, dict) and entry.get("blocking") is True and entry.get("status") != "resolved":
-                    issues.append("blocking_gap_unresolved")
-                    break
-        except Exception:
-            issues.append("gap_ledger_parse_error")
-
-    elicitation_dir = workspace / "specs" / "elicitation"
-    if not elicitation_dir.exists():
+    snapshot = workspace_snapshot.shared(workspace, ROOT)
+
+    try:
+        if snapshot.objective() is None:
+            issues.append("objective_contract_missing")
+        elif snapshot.objective_status() != "committed":
+            issues.append("objective_contract_not_committed")
+    except ArtifactError:
+        issues.append("objective_contract_parse_error")
+
+    try:
+        if snapshot.gap_ledger() is None:
+            issues.append("gap_ledger_missing")
+        elif snapshot.blocking_gaps():
+            issues.append("blocking_gap_unresolved")
+    except ArtifactError:
+        issues.append("gap_ledger_parse_error")
+
+    elicitation = snapshot.elicitation()
+    if elicitation is None:
         issues.append("elicitation_missing")
     else:
-        files = sorted(p for p in elicitation_dir.glob("*.md") if p.is_file())
-        if not files:
-            issues.append("elicitation_missing")
-        else:
-            data = parse_front_matter(files[0].read_text(encoding="utf-8"))
-            if data.get("ready_for_planning") is not True:
-                issues.append("elicitation_not_ready")
-            blocking = data.get("blocking_unknowns")
-            if isinstance(blocking, list) and blocking:
-                issues.append("elicitation_blocking_unknowns")
+        if elicitation.get("ready_for_planning") is not True:
+            issues.append("elicitation_not_ready")
+        blocking = elicitation.get("blocking_unknowns")
+        if isinstance(blocking, list) and blocking:
+            issues.append("elicitation_blocking_unknowns")
 
     report_candidates = [
         workspace / "logs" / "prompt-debug-report.yaml",
@@ -113,11 +70,7 @@ def detect_issues(workspace: Path) -> List[str]:
     for report in report_candidates:
         if report.exists():
             try:
-                import yaml  # type: ignore
-            except Exception:
-                break
-            try:
-                data = yaml.safe_load(report.read_text(encoding="utf-8")) or {}
+                data = read_yaml_or_json(report) or {}
                 if data.get("status") and data.get("status") != "approved":
                     issues.append("prompt_debugger_not_approved")
             except Exception:
@@ -157,8 +110,13 @@ def emit_event(status: str, issues: List[str]) -> None:
     helper = ROOT / "scripts" / "log_event.py"
     if not helper.exists():
         return
-    payload = json.dumps({"issues": issues})
-    os.system(f"{helper} --type auto_governance --status {status} --message \"auto governance\" --context '{payload}'")
+    try:
+        from scripts import log_event
+
+        event = log_event.build_event("auto_governance", status, "auto governance", context={"issues": issues})
+        log_event.append_event(Path.cwd() / "logs" / "events.jsonl", event)
+    except Exception:
+        return
 
 
 def run_harness_detection(workspace: Path) -> Dict[str, Any]:
@@ -181,7 +139,8 @@ def main() -> int:
     run_harness_detection(workspace)
     issues = detect_issues(workspace)
     strict = bool(issues)
-    state = load_json(STATE_PATH)
+    # The snapshot's copy is shared; apply_overrides mutates the state it is given.
+    state = copy.deepcopy(workspace_snapshot.shared(workspace, ROOT).mode_settings())
     state = apply_overrides(state, strict)
     write_json(STATE_PATH, state)
     emit_event("warn" if strict else "info", issues)
@@ -3,7 +3,8 @@
 CERES doctor (read-only, non-authoritative).
 
 Checks:
-- Workspace detection (.ceres/workspace or legacy root)
+- Workspace detection (.ceres/workspace or legacy root), with a summary of its
+  artifacts from the shared WorkspaceSnapshot
 - core.lock integrity vs core submodule (if present)
 - Wrapper parity (wrappers executable + underlying scripts present)
 - Feature flags (read-only; e.g., pattern recall)
@@ -27,11 +28,26 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
 try:
     from observability import signals as signals_module
 except Exception:
     signals_module = None
 
+# Optional like signals: doctor must keep working from a stripped-down core.
+try:
+    from scripts import workspace_snapshot
+except Exception:
+    workspace_snapshot = None
+
+try:
+    from scripts import session_daemon
+except Exception:
+    session_daemon = None
+
 
 DEFAULT_WRAPPERS = ("preflight", "start-session", "export-handover")
 DEFAULT_ROOT = Path(".")
@@ -79,11 +95,14 @@ def resolve_workspace(env: Optional[Dict[str, str]] = None) -> Tuple[Path, bool]
 def check_workspace(env: Optional[Dict[str, str]] = None) -> Finding:
     path, exists = resolve_workspace(env)
     if exists:
+        evidence: Dict[str, Any] = {"workspace": str(path)}
+        if workspace_snapshot is not None:
+            evidence["artifacts"] = workspace_snapshot.shared(path).summary()
         return Finding(
             id="workspace_detected",
             status="ok",
             message=f"Workspace detected at {path}",
-            evidence={"workspace": str(path)},
+            evidence=evidence,
         )
     return Finding(
         id="workspace_missing",
@@ -265,4 +284,5 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    forwarded = session_daemon.forward("doctor", sys.argv[1:]) if session_daemon is not None else None
+    sys.exit(forwarded if forwarded is not None else main())
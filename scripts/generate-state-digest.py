@@ -8,105 +8,59 @@ the task demands deeper context.
 
 from __future__ import annotations
 
-import hashlib
-import json
-import os
-import re
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict
 
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
 
-def resolve_workspace() -> Path:
-    env = os.environ.get("CERES_WORKSPACE")
-    if env:
-        return Path(env)
-    root = Path(__file__).resolve().parent.parent
-    candidate = root / ".ceres" / "workspace"
-    if candidate.is_dir():
-        return candidate
-    return root
+from scripts import workspace_snapshot
+from scripts.workspace_snapshot import ArtifactError, WorkspaceSnapshot
 
 
-def file_hash(path: Path) -> str:
-    if not path.exists():
-        return "missing"
-    return hashlib.md5(path.read_bytes()).hexdigest()[:12]
+def resolve_workspace() -> Path:
+    return workspace_snapshot.resolve_workspace(ROOT)
 
 
-def load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
+def objective_or_empty(snapshot: WorkspaceSnapshot) -> Dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        return snapshot.objective() or {}
+    except ArtifactError:
         return {}
 
 
-def extract_section(text: str, heading: str) -> List[str]:
-    lines: List[str] = []
-    in_section = False
-    for line in text.splitlines():
-        if re.match(rf"^#{1,3}\s+{re.escape(heading)}", line, re.IGNORECASE):
-            in_section = True
-            continue
-        if in_section:
-            if re.match(r"^#{1,3}\s+", line):
-                break
-            stripped = line.strip()
-            if stripped and stripped != "-":
-                lines.append(stripped)
-    return lines
-
-
-def last_completed_entry(path: Path) -> Optional[str]:
-    if not path.exists():
-        return None
-    entries = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- [x] ") and "YYYY-MM-DD" not in stripped:
-            entries.append(stripped[6:])
-    return entries[-1] if entries else None
-
-
 def generate(workspace: Path) -> str:
-    obj_path = workspace / "objective-contract.json"
-    gap_path = workspace / "gap-ledger.json"
-    todo_path = workspace / "todo.md"
-    completed_path = workspace / "completed.md"
-    memory_path = workspace / "memory.md"
-    inbox_path = workspace / "todo-inbox.md"
-
-    obj = load_json(obj_path)
-    gaps = load_json(gap_path)
-
-    todo_text = todo_path.read_text(encoding="utf-8") if todo_path.exists() else ""
-    memory_text = memory_path.read_text(encoding="utf-8") if memory_path.exists() else ""
+    snapshot = workspace_snapshot.shared(workspace, ROOT)
+    obj = objective_or_empty(snapshot)
 
     spec_id = obj.get("spec_id", "(none)")
     obj_status = obj.get("status", "(none)")
     goal = obj.get("goal", "").strip() or "(not set)"
 
-    gap_list = gaps.get("gaps", [])
-    blocking = [g for g in gap_list if isinstance(g, dict) and g.get("blocking") and g.get("status") != "resolved"]
-    open_gaps = [g for g in gap_list if isinstance(g, dict) and g.get("status") != "resolved"]
+    try:
+        blocking = snapshot.blocking_gaps()
+        open_gaps = snapshot.open_gaps()
+    except ArtifactError:
+        blocking, open_gaps = [], []
 
-    current_focus = extract_section(todo_text, "Current Focus")
-    decisions = extract_section(memory_text, "Decisions")
-    risks = extract_section(memory_text, "Active Risks")
+    current_focus = snapshot.current_focus()
+    decisions = snapshot.memory_section("Decisions")
+    risks = snapshot.memory_section("Active Risks")
 
-    last_done = last_completed_entry(completed_path)
+    last_done = snapshot.last_completed()
 
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     sources = {
-        "objective-contract.json": file_hash(obj_path),
-        "gap-ledger.json": file_hash(gap_path),
-        "todo.md": file_hash(todo_path),
-        "completed.md": file_hash(completed_path),
-        "memory.md": file_hash(memory_path),
-        "todo-inbox.md": file_hash(inbox_path),
+        "objective-contract.json": snapshot.digest(snapshot.objective_path),
+        "gap-ledger.json": snapshot.digest(snapshot.gap_ledger_path),
+        "todo.md": snapshot.digest(snapshot.todo_path),
+        "completed.md": snapshot.digest(snapshot.completed_path),
+        "memory.md": snapshot.digest(snapshot.memory_path),
+        "todo-inbox.md": snapshot.digest(snapshot.inbox_path),
     }
 
     lines = [
@@ -150,13 +104,17 @@ def generate(workspace: Path) -> str:
     return "\n".join(lines)
 
 
-def main() -> None:
+def main(argv: list | None = None) -> int:
     workspace = resolve_workspace()
     digest = generate(workspace)
     out_path = workspace / "STATE.md"
     out_path.write_text(digest, encoding="utf-8")
     print(f"STATE digest written to {out_path}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    from scripts import session_daemon
+
+    forwarded = session_daemon.forward("digest", sys.argv[1:])
+    sys.exit(forwarded if forwarded is not None else main())
@@ -4,15 +4,28 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import Container, List, Optional, Set, Tuple
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts.todo_tasks import parse_tasks
+from scripts.yaml_loader import read_yaml_or_json
+
 PENDING_NOTE = "(completed locally; pending push hash)"
+DEFAULT_COMPLETED = "# Completed\n"
+INDEX_VERSION = 1
+# Bytes hashed at the start of completed.md and just before the indexed offset to
+# detect a rewrite (rather than an append) since the index was saved.
+ANCHOR_BYTES = 4096
 
 
 def run(cmd: List[str]) -> Tuple[int, str, str]:
@@ -44,22 +57,10 @@ def load_workflow_config() -> dict:
     path = resolve_workflow_path()
     if not path:
         return {}
-    text = path.read_text(encoding="utf-8")
-    data = None
     try:
-        import yaml  # type: ignore
-    except Exception:
-        yaml = None
-    if yaml is not None:
-        try:
-            data = yaml.safe_load(text)
-        except Exception:
-            data = None
-    if data is None:
-        try:
-            data = json.loads(text)
-        except Exception:
-            return {}
+        data = read_yaml_or_json(path)
+    except ValueError:
+        return {}
     return data if isinstance(data, dict) else {}
 
 
@@ -78,12 +79,11 @@ def normalize_summary(text: str) -> str:
 
 
 def extract_checked_tasks(todo_text: str, include_all: bool) -> List[str]:
-    tasks: List[str] = []
-    for line in todo_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- [x] ") and (include_all or PENDING_NOTE in stripped):
-            tasks.append(normalize_summary(stripped[len("- [x] ") :]))
-    return tasks
+    return [
+        normalize_summary(task.summary)
+        for task in parse_tasks(todo_text).checked()
+        if include_all or PENDING_NOTE in task.text
+    ]
 
 
 def extract_completed_summaries(completed_text: str) -> List[str]:
@@ -105,21 +105,228 @@ def extract_completed_summaries(completed_text: str) -> List[str]:
     return summaries
 
 
-def prune_completed_tasks(todo_text: str, completed: List[str], newly_added: List[str]) -> str:
+def prune_completed_tasks(todo_text: str, completed: Container[str], newly_added: List[str]) -> str:
+    added = set(newly_added)
+    table = parse_tasks(todo_text)
+    pruned = set()
+    for task in table.checked():
+        summary = normalize_summary(task.summary)
+        if summary in added or summary in completed:
+            pruned.add(task.line)
     remaining: List[str] = []
-    completed_set = set(completed + newly_added)
-    for line in todo_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- [x] "):
-            summary = normalize_summary(stripped[len("- [x] ") :])
-            if summary in completed_set:
-                continue
+    for idx, line in enumerate(table.lines, start=1):
+        if idx in pruned:
+            continue
         if PENDING_NOTE in line:
             line = line.replace(PENDING_NOTE, "").rstrip()
         remaining.append(line)
     return "\n".join(remaining) + ("\n" if todo_text.endswith("\n") else "")
 
 
+def summary_key(summary: str) -> str:
+    return hashlib.sha1(summary.strip().encode("utf-8")).hexdigest()[:20]
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace `path` via a temp file so readers never see a partial write."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class CompletedIndex:
+    """Hashes of the summaries already recorded in completed.md, kept up to date by tail reads.
+
+    completed.md is append-only, so the index stores the byte offset it has read up
+    to (always a line end) and only parses what was appended since. A changed inode,
+    a shrunken file, or a changed head/anchor block means the file was rewritten,
+    and the index is rebuilt from the whole file.
+
+    The summary keys live in an append-only `.keys` file next to the JSON header
+    and are searched as bytes, so a run only loads them, never re-parses or
+    rewrites them.
+    """
+
+    def __init__(self, completed_path: Path, cache_path: Optional[Path] = None) -> None:
+        self.completed_path = completed_path
+        self.cache_path = cache_path or completed_path.parent / ".cache" / "housekeeping" / f"{completed_path.name}.index.json"
+        self.keys_path = self.cache_path.with_suffix(".keys")
+        self.offset = 0
+        self.inode: Optional[int] = None
+        self.head = ""
+        self.anchor = ""
+        self.bytes_read = 0
+        self._stored = b"\n"
+        self._added: Set[str] = set()
+        # Keys of an unterminated last line: matched, but neither stored nor read past.
+        self._partial: Set[str] = set()
+        self._rewrite = True
+        self._dirty = False
+
+    def __contains__(self, summary: object) -> bool:
+        if not isinstance(summary, str):
+            return False
+        key = summary_key(summary)
+        return key in self._added or key in self._partial or f"\n{key}\n".encode("ascii") in self._stored
+
+    def __len__(self) -> int:
+        return self._stored.count(b"\n") - 1 + len(self._added)
+
+    def add(self, summaries: List[str]) -> None:
+        for summary in summaries:
+            if summary not in self:
+                self._added.add(summary_key(summary))
+
+    @staticmethod
+    def _block_hash(handle, start: int, end: int) -> str:
+        handle.seek(start)
+        return hashlib.sha1(handle.read(end - start)).hexdigest()
+
+    def _stamp(self, handle, offset: int) -> Tuple[str, str]:
+        head = self._block_hash(handle, 0, min(offset, ANCHOR_BYTES))
+        anchor = self._block_hash(handle, max(0, offset - ANCHOR_BYTES), offset)
+        return head, anchor
+
+    def load(self) -> "CompletedIndex":
+        """Restore the saved index, if any; call refresh() to catch up with the file."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            with open(self.keys_path, "rb") as handle:
+                stored = handle.read(int(data["keys_size"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return self
+        if data.get("version") != INDEX_VERSION or data.get("path") != str(self.completed_path.resolve()):
+            return self
+        if len(stored) != data["keys_size"]:
+            return self
+        self._stored = b"\n" + stored
+        self._added = set()
+        self._rewrite = False
+        self.offset = int(data.get("offset") or 0)
+        self.inode = data.get("inode")
+        self.head = data.get("head") or ""
+        self.anchor = data.get("anchor") or ""
+        return self
+
+    def _reset(self) -> None:
+        self._stored = b"\n"
+        self._added = set()
+        self._partial = set()
+        self._rewrite = True
+        self.offset = 0
+        self.head = self.anchor = ""
+        self._dirty = True
+
+    def refresh(self) -> "CompletedIndex":
+        """Index whatever was appended since the indexed offset (everything after a rewrite)."""
+        try:
+            handle = open(self.completed_path, "rb")
+        except FileNotFoundError:
+            if self.offset or len(self):
+                self._reset()
+            return self
+        self._partial = set()
+        with handle:
+            st = os.fstat(handle.fileno())
+            if self.offset and (
+                st.st_ino != self.inode or st.st_size < self.offset or self._stamp(handle, self.offset) != (self.head, self.anchor)
+            ):
+                self._reset()
+            self.inode = st.st_ino
+            if st.st_size == self.offset:
+                return self
+            handle.seek(self.offset)
+            tail = handle.read(st.st_size - self.offset)
+            end = tail.rfind(b"\n") + 1
+            if end < len(tail):
+                # The offset stays at the last line end, so the line is re-read once terminated.
+                partial = extract_completed_summaries(tail[end:].decode("utf-8"))
+                self._partial = {summary_key(summary) for summary in partial}
+            if end == 0:
+                return self
+            self.bytes_read += end
+            self.add(extract_completed_summaries(tail[:end].decode("utf-8")))
+            self.offset += end
+            self.head, self.anchor = self._stamp(handle, self.offset)
+            self._dirty = True
+        return self
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        added = "".join(f"{key}\n" for key in sorted(self._added)).encode("ascii")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._rewrite or not self.keys_path.exists():
+                # Drop the header first so a crash mid-rewrite leaves no index, not a wrong one.
+                if self.cache_path.exists():
+                    self.cache_path.unlink()
+                stored = added
+                with open(self.keys_path, "wb") as handle:
+                    handle.write(stored)
+            else:
+                stored = self._stored[1:] + added
+                with open(self.keys_path, "r+b") as handle:
+                    handle.seek(len(self._stored) - 1)
+                    handle.truncate()
+                    handle.write(added)
+            header = {
+                "version": INDEX_VERSION,
+                "path": str(self.completed_path.resolve()),
+                "inode": self.inode,
+                "offset": self.offset,
+                "head": self.head,
+                "anchor": self.anchor,
+                "keys_size": len(stored),
+            }
+            write_atomic(self.cache_path, json.dumps(header))
+        except OSError:
+            return
+        self._stored = b"\n" + stored
+        self._added = set()
+        self._rewrite = False
+        self._dirty = False
+
+
+def append_completed(completed_path: Path, entries: List[str]) -> None:
+    """Append entries as the full rewrite did: one newline between old and new content."""
+    block = "\n".join(entries) + "\n"
+    try:
+        handle = open(completed_path, "r+b")
+    except FileNotFoundError:
+        write_atomic(completed_path, DEFAULT_COMPLETED + block)
+        return
+    with handle:
+        size = handle.seek(0, os.SEEK_END)
+        start = max(0, size - ANCHOR_BYTES)
+        handle.seek(start)
+        tail = handle.read()
+        kept = tail.rstrip(b"\n")
+        if not kept.strip() and start == 0:
+            # Blank file: drop trailing newlines and add no separator line.
+            handle.seek(0)
+            handle.truncate()
+            handle.write(kept + block.encode("utf-8"))
+            return
+        if not kept:
+            # Only newlines in the last block; fall back to rewriting the file.
+            handle.seek(0)
+            text = handle.read().decode("utf-8").rstrip("\n")
+            handle.seek(0)
+            handle.truncate()
+            handle.write((text + ("\n" if text.strip() else "") + block).encode("utf-8"))
+            return
+        handle.seek(start + len(kept))
+        handle.truncate()
+        handle.write(b"\n" + block.encode("utf-8"))
+
+
 def sync_completed(
     todo_path: Path,
     completed_path: Path,
@@ -127,35 +334,35 @@ def sync_completed(
     dry_run: bool,
     include_all: bool,
     prune: bool,
+    index: Optional[CompletedIndex] = None,
 ) -> Tuple[int, List[str]]:
     todo_text = todo_path.read_text(encoding="utf-8") if todo_path.exists() else ""
-    completed_text = completed_path.read_text(encoding="utf-8") if completed_path.exists() else "# Completed\n"
+    if index is None:
+        index = CompletedIndex(completed_path).load()
+    index.refresh()
 
     checked_tasks = extract_checked_tasks(todo_text, include_all)
-    existing = extract_completed_summaries(completed_text)
 
     new_entries: List[str] = []
     recorded_summaries: List[str] = []
     date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     for task in checked_tasks:
-        if task in existing:
+        if task in index:
             continue
         recorded_summaries.append(task)
         entry = f"- [x] {date_str} — {task} (push {push_hash})"
         new_entries.append(entry)
 
-    updated_completed = completed_text.rstrip("\n") + ("\n" if completed_text.strip() else "")
-    if new_entries:
-        updated_completed += "\n".join(new_entries) + "\n"
-
-    updated_todo = prune_completed_tasks(todo_text, existing, recorded_summaries if prune else [])
+    updated_todo = prune_completed_tasks(todo_text, index, recorded_summaries if prune else [])
 
     if not dry_run:
         if new_entries:
-            completed_path.write_text(updated_completed, encoding="utf-8")
+            append_completed(completed_path, new_entries)
+            index.refresh()
+        index.save()
         if updated_todo != todo_text:
-            todo_path.write_text(updated_todo, encoding="utf-8")
+            write_atomic(todo_path, updated_todo)
 
     return len(new_entries), new_entries
 
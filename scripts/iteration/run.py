@@ -12,6 +12,12 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+try:
+    from observability.jsonl_append import append_line
+except ImportError:
+    append_line = None
 DECISION_RULE_VERSION = "1.0"
 RULE_TEXT = "highest priority where passes=false; tie-break id ascending"
 
@@ -95,6 +101,9 @@ def build_record(
 
 
 def write_progress(path: Path, record: Dict[str, Any]) -> None:
+    if append_line is not None:
+        append_line(path, json.dumps(record, sort_keys=True))
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as handle:
         handle.write(json.dumps(record, sort_keys=True))
@@ -3,15 +3,34 @@
 
 Appends a JSONL event to ./logs/events.jsonl with a timestamp.
 Use this as a lightweight hook from governance/execution stages.
+
+Stages that emit several events should import this module and use EventWriter,
+which buffers events and appends them with one locked write plus fsync.
 """
+from __future__ import annotations
+
 import argparse
 import json
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+try:
+    from observability.jsonl_append import append_lines
+except ImportError:
+    append_lines = None
+try:
+    from observability.event_store import DEFAULT_SEGMENT_BYTES, EventStore
+except ImportError:
+    DEFAULT_SEGMENT_BYTES, EventStore = 0, None
+
 PHASES = {"planning", "execution", "reflection", "correction"}
+DEFAULT_FLUSH_BYTES = 64 * 1024
 
 
 def parse_pattern_sequence(value: str) -> List[str]:
@@ -27,11 +46,152 @@ def parse_pattern_sequence(value: str) -> List[str]:
     return [part for part in parts if part]
 
 
-def main() -> None:
+def build_event(
+    event_type: str,
+    status: str,
+    message: str,
+    phase: str | None = None,
+    pattern: str | None = None,
+    agent: str | None = None,
+    task_id: str | None = None,
+    spec_id: str | None = None,
+    synchronization_id: str | None = None,
+    correction_count: int | None = None,
+    pattern_sequence: List[str] | None = None,
+    context: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Build an event payload with the same key order the CLI has always written."""
+    if phase is not None and phase not in PHASES:
+        raise ValueError(f"phase must be one of {sorted(PHASES)}")
+    if correction_count is not None and correction_count < 0:
+        raise ValueError("correction-count must be >= 0")
+
+    event: Dict[str, Any] = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "type": event_type,
+        "status": status,
+        "message": message,
+    }
+
+    if context:
+        event["context"] = context
+    if phase:
+        event["phase"] = phase
+    if pattern:
+        event["pattern"] = pattern
+    if agent:
+        event["agent"] = agent
+    if task_id:
+        event["task_id"] = task_id
+    if spec_id:
+        event["spec_id"] = spec_id
+    if synchronization_id:
+        event["synchronization_id"] = synchronization_id
+    if correction_count is not None:
+        event["correction_count"] = correction_count
+    if pattern_sequence is not None:
+        event["pattern_sequence"] = pattern_sequence
+    return event
+
+
+class EventWriter:
+    """Buffer events for one output file and append them in a single locked write.
+
+    Events are flushed when the buffer reaches `flush_bytes`, on `flush()`, and when the
+    context manager exits (including on error), so a stage's events land together and
+    parallel agents never interleave partial batches. One writer may be shared by threads.
+    After each flush the file is sealed as an event-store segment once it passes
+    `max_segment_bytes` (a stat when it has not).
+    """
+
+    def __init__(
+        self,
+        out: Path,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        fsync: bool = True,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        self.out = Path(out)
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+        self.max_segment_bytes = max_segment_bytes
+        self._lines: List[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "EventWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            self._lines.append(line)
+            self._size += len(line)
+            full = self._size >= self.flush_bytes
+        if full:
+            self.flush()
+
+    def emit(self, event_type: str, status: str, message: str, **fields: Any) -> Dict[str, Any]:
+        event = build_event(event_type, status, message, **fields)
+        self.add(event)
+        return event
+
+    def flush(self) -> int:
+        """Write buffered events; returns how many were written."""
+        with self._lock:
+            lines, self._lines, self._size = self._lines, [], 0
+            if not lines:
+                return 0
+            if append_lines is not None:
+                append_lines(self.out, lines, fsync=self.fsync)
+            else:
+                self.out.parent.mkdir(parents=True, exist_ok=True)
+                with self.out.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(lines))
+            if EventStore is not None:
+                try:
+                    EventStore(self.out, max_segment_bytes=self.max_segment_bytes).maybe_rotate()
+                except OSError:
+                    pass  # rotation is housekeeping; the events are already written
+            return len(lines)
+
+
+def append_event(out: Path, event: Dict[str, Any]) -> None:
+    with EventWriter(out) as writer:
+        writer.add(event)
+
+
+def events_from_jsonl(text: str) -> List[Dict[str, Any]]:
+    """Build events from JSONL specs: objects with type/status/message plus build_event fields."""
+    events: List[Dict[str, Any]] = []
+    for line_no, raw in enumerate(text.splitlines(), start=1):
+        if not raw.strip():
+            continue
+        try:
+            spec = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Event spec line {line_no}: {exc}") from exc
+        if not isinstance(spec, dict):
+            raise ValueError(f"Event spec line {line_no}: must be an object")
+        spec = dict(spec)
+        try:
+            event_type, status, message = spec.pop("type"), spec.pop("status"), spec.pop("message")
+            events.append(build_event(event_type, status, message, **spec))
+        except KeyError as exc:
+            raise ValueError(f"Event spec line {line_no}: missing {exc}") from exc
+        except TypeError as exc:
+            raise ValueError(f"Event spec line {line_no}: {exc}") from exc
+    return events
+
+
+def main(argv: List[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="CERES event logger")
-    parser.add_argument("--type", required=True, help="Event type (e.g., gate, stage, check)")
-    parser.add_argument("--status", required=True, help="Status (e.g., pass, fail, info)")
-    parser.add_argument("--message", required=True, help="Short message")
+    parser.add_argument("--type", help="Event type (e.g., gate, stage, check)")
+    parser.add_argument("--status", help="Status (e.g., pass, fail, info)")
+    parser.add_argument("--message", help="Short message")
     parser.add_argument("--phase", choices=sorted(PHASES), help="Active phase")
     parser.add_argument("--pattern", help="Active pattern name")
     parser.add_argument("--agent", help="Agent name")
@@ -53,12 +213,32 @@ def main() -> None:
         default=Path("logs/events.jsonl"),
         help="Output JSONL file",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Write every event spec in a JSONL file ('-' for stdin) with one append",
+    )
+    args = parser.parse_args(argv)
 
     args.out = args.out.expanduser()
     if not args.out.is_absolute():
         args.out = Path.cwd() / args.out
 
+    if args.batch:
+        text = sys.stdin.read() if args.batch == "-" else Path(args.batch).read_text(encoding="utf-8")
+        try:
+            events = events_from_jsonl(text)
+        except ValueError as exc:
+            sys.stderr.write(f"{exc}\n")
+            sys.exit(1)
+        with EventWriter(args.out) as writer:
+            for event in events:
+                writer.add(event)
+        return
+    missing = [f"--{name}" for name in ("type", "status", "message") if getattr(args, name) is None]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
     ctx: Dict[str, Any] = {}
     if args.context:
         try:
@@ -71,39 +251,27 @@ def main() -> None:
             sys.exit(1)
         ctx = parsed
 
-    event: Dict[str, Any] = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "type": args.type,
-        "status": args.status,
-        "message": args.message,
-    }
+    sequence = parse_pattern_sequence(args.pattern_sequence) if args.pattern_sequence else None
+    try:
+        event = build_event(
+            args.type,
+            args.status,
+            args.message,
+            phase=args.phase,
+            pattern=args.pattern,
+            agent=args.agent,
+            task_id=args.task_id,
+            spec_id=args.spec_id,
+            synchronization_id=args.synchronization_id,
+            correction_count=args.correction_count,
+            pattern_sequence=sequence,
+            context=ctx,
+        )
+    except ValueError as exc:
+        sys.stderr.write(f"{exc}\n")
+        sys.exit(1)
 
-    if ctx:
-        event["context"] = ctx
-    if args.phase:
-        event["phase"] = args.phase
-    if args.pattern:
-        event["pattern"] = args.pattern
-    if args.agent:
-        event["agent"] = args.agent
-    if args.task_id:
-        event["task_id"] = args.task_id
-    if args.spec_id:
-        event["spec_id"] = args.spec_id
-    if args.synchronization_id:
-        event["synchronization_id"] = args.synchronization_id
-    if args.correction_count is not None:
-        if args.correction_count < 0:
-            sys.stderr.write("correction-count must be >= 0\n")
-            sys.exit(1)
-        event["correction_count"] = args.correction_count
-    if args.pattern_sequence:
-        sequence = parse_pattern_sequence(args.pattern_sequence)
-        event["pattern_sequence"] = sequence
-
-    args.out.parent.mkdir(parents=True, exist_ok=True)
-    with args.out.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
+    append_event(args.out, event)
 
 
 if __name__ == "__main__":
@@ -5,32 +5,31 @@ Mirrors preflight.sh.
 Fallback only; shell remains authoritative.
 """
 
+import contextlib
+import hashlib
+import importlib.util
+import io
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
+
+CODE_ROOT = Path(__file__).resolve().parent.parent
+if str(CODE_ROOT) not in sys.path:
+    sys.path.append(str(CODE_ROOT))
+
+from scripts import log_event, workspace_snapshot
+from scripts.workspace_snapshot import ArtifactError, WorkspaceSnapshot
 
 def resolve_root() -> Path:
-    root = Path(__file__).resolve().parent.parent
-    env_home = os.environ.get("CERES_HOME")
-    if env_home:
-        try:
-            env_path = Path(env_home).resolve()
-            if env_path.name == ".ceres":
-                return env_path.parent
-        except Exception:
-            pass
-    if root.name == "core" and root.parent.name == ".ceres":
-        return root.parent.parent
-    if ".ceres" in root.parts:
-        try:
-            idx = root.parts.index(".ceres")
-            return Path(*root.parts[:idx])
-        except Exception:
-            pass
-    return root
+    return workspace_snapshot.project_root()
 
 
 ROOT = resolve_root()
@@ -47,6 +46,18 @@ def resolve_prompt_debugger() -> Path:
             return path
     raise SystemExit("Prompt debugger not found (expected prompt-debugger/cli.py).")
 
+def resolve_component_script(component: str, name: str) -> Path | None:
+    candidates = [ROOT / component / "scripts" / name]
+    env_home = os.environ.get("CERES_HOME")
+    if env_home:
+        candidates.append(Path(env_home) / "core" / component / "scripts" / name)
+    candidates.append(ROOT / ".ceres" / "core" / component / "scripts" / name)
+    for path in candidates:
+        if path.is_file():
+            return path
+    return None
+
+
 MODE = "execute"
 PROMPT_FILE = "todo-inbox.md"
 REPORT_FILE = str(ROOT / "logs" / "prompt-debug-report.yaml")
@@ -64,6 +75,219 @@ PROMPT_ALLOWLIST = {"plan.md", "execute.md", "README.md", "prompt-ceres-verify.m
 PROMPT_REF_RE = re.compile(r"prompts/[A-Za-z0-9._/-]+\.md")
 
 
+def in_process_enabled() -> bool:
+    return os.environ.get("CERES_PREFLIGHT_IN_PROCESS") in {"1", "true", "True"}
+
+
+# Set from --in-process or CERES_PREFLIGHT_IN_PROCESS=1; stages then run as
+# library calls in this interpreter instead of one subprocess per stage.
+IN_PROCESS = in_process_enabled()
+DEFAULT_JOBS = 4
+_MODULES: dict[Path, object] = {}
+_MODULES_LOCK = threading.RLock()
+
+
+def load_module(name: str, path: Path):
+    """Import a stage script by path (several live in hyphenated files or dirs)."""
+    key = path.resolve()
+    with _MODULES_LOCK:
+        module = _MODULES.get(key)
+        if module is None:
+            parent = str(key.parent)
+            if parent not in sys.path:
+                sys.path.insert(0, parent)
+            spec = importlib.util.spec_from_file_location(name, key)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load {path}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _MODULES[key] = module
+    return module
+
+
+_CAPTURE = threading.local()
+_CAPTURE_LOCK = threading.Lock()
+_CAPTURE_DEPTH = 0
+
+
+class _RoutedStream:
+    """sys.stdout/sys.stderr stand-in that writes to the current thread's capture buffer."""
+
+    def __init__(self, target, name: str) -> None:
+        self.target = target
+        self.name = name
+
+    def write(self, text: str) -> int:
+        buffer = getattr(_CAPTURE, self.name, None)
+        return (buffer if buffer is not None else self.target).write(text)
+
+    def flush(self) -> None:
+        buffer = getattr(_CAPTURE, self.name, None)
+        (buffer if buffer is not None else self.target).flush()
+
+    def __getattr__(self, attr: str):
+        return getattr(self.target, attr)
+
+
+@contextlib.contextmanager
+def captured_output():
+    """Capture stdout/stderr written by this thread only; other stages keep their own buffers.
+
+    contextlib.redirect_stdout swaps the process-wide stream, which interleaves
+    output once stages run on a worker pool.
+    """
+    global _CAPTURE_DEPTH
+    with _CAPTURE_LOCK:
+        if _CAPTURE_DEPTH == 0:
+            sys.stdout = _RoutedStream(sys.stdout, "stdout")
+            sys.stderr = _RoutedStream(sys.stderr, "stderr")
+        _CAPTURE_DEPTH += 1
+    previous = (getattr(_CAPTURE, "stdout", None), getattr(_CAPTURE, "stderr", None))
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    _CAPTURE.stdout, _CAPTURE.stderr = stdout, stderr
+    try:
+        yield stdout, stderr
+    finally:
+        _CAPTURE.stdout, _CAPTURE.stderr = previous
+        with _CAPTURE_LOCK:
+            _CAPTURE_DEPTH -= 1
+            if _CAPTURE_DEPTH == 0:
+                sys.stdout = sys.stdout.target
+                sys.stderr = sys.stderr.target
+
+
+def exit_code_of(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    return 1
+
+
+def call_in_process(func, argv: list) -> subprocess.CompletedProcess:
+    """Run a script entry point like a subprocess: same exit code, captured output."""
+    returncode = 0
+    with captured_output() as (stdout, stderr):
+        try:
+            result = func(argv)
+            if isinstance(result, int):
+                returncode = result
+        except SystemExit as exc:
+            returncode = exit_code_of(exc)
+            if not isinstance(exc.code, (int, type(None))):
+                sys.stderr.write(f"{exc.code}\n")
+        except Exception:
+            returncode = 1
+            traceback.print_exc()
+    return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
+
+
+def resolve_workspace() -> Path:
+    return workspace_snapshot.resolve_workspace(ROOT)
+
+
+def snapshot() -> WorkspaceSnapshot:
+    """The process-wide workspace snapshot; gate inputs are parsed once per change."""
+    return workspace_snapshot.shared(resolve_workspace(), ROOT)
+
+
+def cache_enabled(no_cache: bool) -> bool:
+    if no_cache:
+        return False
+    return os.environ.get("CERES_STRICT") != "1"
+
+
+def file_hash(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return "missing"
+    except IsADirectoryError:
+        return "directory"
+
+
+CACHE_VERSION = 1
+
+
+class StageCache:
+    """Persistent verdicts for preflight stages, keyed on the content of their inputs.
+
+    A stage key covers the validator sources, the stage arguments and every input
+    file, so any edit (or a validator upgrade) invalidates the cached verdict.
+    Only successful stage results are stored; failures always re-run.
+    """
+
+    def __init__(self, path: Path, enabled: bool) -> None:
+        self.path = path
+        self.enabled = enabled
+        self.stages: dict = {}
+        self._hashes: dict[Path, str] = {}
+        self._lock = threading.Lock()
+        if enabled and path.is_file():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                stages = data.get("stages")
+                self.stages = stages if isinstance(stages, dict) else {}
+
+    def _hash(self, path: Path) -> str:
+        if path not in self._hashes:
+            self._hashes[path] = file_hash(path)
+        return self._hashes[path]
+
+    def key(self, stage: str, scripts: list, inputs: list, args: list) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}:{stage}\n".encode("utf-8"))
+        for label, paths in (("script", scripts), ("input", inputs)):
+            for path in sorted({Path(p) for p in paths}, key=str):
+                digest.update(f"{label}:{path}:{self._hash(path)}\n".encode("utf-8"))
+        digest.update(json.dumps(args).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, stage: str, key: str) -> dict | None:
+        if not self.enabled:
+            return None
+        entry = self.stages.get(stage)
+        if isinstance(entry, dict) and entry.get("key") == key and isinstance(entry.get("result"), dict):
+            return entry["result"]
+        return None
+
+    def put(self, stage: str, key: str, result: dict) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._put(stage, key, result)
+
+    def _put(self, stage: str, key: str, result: dict) -> None:
+        self.stages[stage] = {"key": key, "result": result}
+        try:
+            payload = json.dumps({"version": CACHE_VERSION, "stages": self.stages}, indent=2, sort_keys=True)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(payload + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError) as exc:
+            self.stages.pop(stage, None)
+            sys.stderr.write(f"WARN: preflight cache not written: {exc}\n")
+
+
+def completed_from_cache(args: list, entry: dict) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args, int(entry.get("returncode", 0)), entry.get("stdout", ""), entry.get("stderr", "")
+    )
+
+
+def cache_entry(result: subprocess.CompletedProcess) -> dict:
+    return {"returncode": result.returncode, "stdout": result.stdout or "", "stderr": result.stderr or ""}
+
+
+def stage_cache_path() -> Path:
+    return resolve_workspace() / ".cache" / "preflight" / "stages.json"
+
+
 def fast_start_enabled() -> bool:
     if os.environ.get("CERES_STRICT") == "1":
         return False
@@ -90,6 +314,11 @@ Options:
   --pattern <name>            Active pattern name (default: planning for plan, tool-use for execute)
   --task-class <name>         Optional task class for reflection enforcement
   --events <path>             Observability events JSONL (default: logs/events.jsonl)
+  --in-process                Run stages as library calls in one interpreter
+                              (also CERES_PREFLIGHT_IN_PROCESS=1)
+  --no-cache                  Re-run every stage instead of reusing cached verdicts
+                              (CERES_STRICT=1 also disables the cache)
+  --jobs <n>                  Worker threads for independent stages (default: 4; 1 runs them in order)
 """
     )
 
@@ -101,75 +330,18 @@ def make_abs(value: str) -> str:
 
 
 def load_yaml_or_json(path: Path, label: str) -> dict:
-    text = path.read_text(encoding="utf-8")
-    data = None
     try:
-        import yaml  # type: ignore
-    except Exception:
-        yaml = None
-
-    if yaml is not None:
-        try:
-            data = yaml.safe_load(text)
-        except Exception:
-            data = None
-
-    if data is None:
-        try:
-            data = json.loads(text)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse {label}: {exc}")
-
+        data = snapshot().document(path)
+    except ArtifactError as exc:
+        raise SystemExit(f"Failed to parse {label}: {exc}")
     return data or {}
 
 
-def parse_front_matter(text: str) -> dict:
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
-        raise SystemExit("Spec Elicitation Record missing front matter (expected leading ---).")
-
-    front_matter_lines = []
-    end_index = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_index = i
-            break
-        front_matter_lines.append(lines[i])
-
-    if end_index is None:
-        raise SystemExit("Spec Elicitation Record front matter not terminated (missing ---).")
-
-    data: dict[str, object] = {}
-    current_key: str | None = None
-
-    for raw_line in front_matter_lines:
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if re.match(r"^[A-Za-z0-9_\-]+\s*:", line):
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-            current_key = None
-            if value == "":
-                data[key] = []
-                current_key = key
-            elif value in {"[]", "[ ]"}:
-                data[key] = []
-            elif value.lower() in {"true", "false"}:
-                data[key] = value.lower() == "true"
-            else:
-                data[key] = value.strip("\"'")
-        elif line.startswith("-") and current_key:
-            item = line.lstrip("-").strip()
-            if item:
-                items = data.setdefault(current_key, [])
-                if isinstance(items, list):
-                    items.append(item)
-        else:
-            continue
-
-    return data
+def load_front_matter(path: Path) -> dict:
+    try:
+        return snapshot().front_matter(path) or {}
+    except ArtifactError as exc:
+        raise SystemExit(f"Spec Elicitation Record {exc}.")
 
 
 def resolve_elicitation(path: Path) -> Path:
@@ -199,7 +371,7 @@ def validate_prompt_hygiene(todo_file: Path) -> None:
     if not todo_file.is_file():
         raise SystemExit(f"Todo file not found: {todo_file}")
 
-    text = todo_file.read_text(encoding="utf-8")
+    text = snapshot().text(todo_file) or ""
     refs = set(PROMPT_REF_RE.findall(text))
     completed_refs = sorted(ref for ref in refs if ref.startswith("prompts/completed/"))
     if completed_refs:
@@ -223,7 +395,7 @@ def validate_prompt_hygiene(todo_file: Path) -> None:
 
 
 def validate_elicitation(path: Path) -> str:
-    data = parse_front_matter(path.read_text(encoding="utf-8"))
+    data = load_front_matter(path)
     spec_id = data.get("spec_id")
     if not isinstance(spec_id, str) or not spec_id.strip():
         raise SystemExit("Spec Elicitation Record missing spec_id in front matter.")
@@ -241,17 +413,8 @@ def validate_elicitation(path: Path) -> str:
     return spec_id.strip()
 
 
-def run_or_exit(cmd: list, **kwargs) -> None:
-    try:
-        result = subprocess.run(cmd, **kwargs)
-    except FileNotFoundError:
-        sys.stderr.write(f"{cmd[0]}: command not found\n")
-        sys.exit(127)
-    if result.returncode != 0:
-        sys.exit(result.returncode)
-
-
 def emit_gate_event(
+    events: log_event.EventWriter,
     log_root: Path,
     phase: str,
     agent: str,
@@ -264,41 +427,28 @@ def emit_gate_event(
 ) -> None:
     if not log_root.exists():
         return
-    log_helper = ROOT / "scripts" / "log_event.py"
-    if not log_helper.exists():
-        return
-    cmd = [
-        sys.executable,
-        str(log_helper),
-        "--type",
+    events.emit(
         "gate",
-        "--status",
         status,
-        "--message",
         message,
-        "--phase",
-        phase,
-        "--agent",
-        agent,
-        "--pattern",
-        pattern,
-    ]
-    if task_id:
-        cmd.extend(["--task-id", task_id])
-    if spec_id:
-        cmd.extend(["--spec-id", spec_id])
-    if context:
-        cmd.extend(["--context", json.dumps(context)])
-    subprocess.run(cmd, cwd=str(log_root), check=False)
+        phase=phase,
+        pattern=pattern,
+        agent=agent,
+        task_id=task_id or None,
+        spec_id=spec_id or None,
+        context=context,
+    )
 
 
 def policy_guard_advisory(
+    events: log_event.EventWriter,
     log_root: Path,
     phase: str,
     agent: str,
     pattern: str,
     task_id: str | None,
     spec_id: str | None,
+    cache: StageCache | None = None,
 ) -> None:
     guard = ROOT / "scripts" / "policy_guard.py"
     policy_path = ROOT / "ceres.policy.yaml"
@@ -307,6 +457,7 @@ def policy_guard_advisory(
     if not policy_path.exists():
         sys.stderr.write("WARN: policy guard advisory skipped (missing ceres.policy.yaml).\n")
         emit_gate_event(
+            events,
             log_root,
             phase,
             agent,
@@ -319,12 +470,23 @@ def policy_guard_advisory(
         )
         return
 
-    result = subprocess.run(
-        [sys.executable, str(guard), "--current", str(policy_path), "--json"],
-        capture_output=True,
-        text=True,
-        cwd=str(ROOT),
-    )
+    guard_args = ["--current", str(policy_path), "--json"]
+    guard_scripts = [guard, ROOT / "scripts" / "yaml_loader.py"]
+    cache_key = cache.key("policy_guard", guard_scripts, [policy_path], guard_args) if cache else ""
+    cached = cache.get("policy_guard", cache_key) if cache else None
+    if cached is not None:
+        result = completed_from_cache(guard_args, cached)
+    elif IN_PROCESS:
+        result = call_in_process(load_module("ceres_policy_guard", guard).main, guard_args)
+    else:
+        result = subprocess.run(
+            [sys.executable, str(guard), *guard_args],
+            capture_output=True,
+            text=True,
+            cwd=str(ROOT),
+        )
+    if cache and cached is None and result.returncode == 0:
+        cache.put("policy_guard", cache_key, cache_entry(result))
 
     payload = {}
     stdout = (result.stdout or "").strip()
@@ -335,6 +497,7 @@ def policy_guard_advisory(
         except json.JSONDecodeError as exc:
             sys.stderr.write(f"WARN: policy guard advisory parse failed: {exc}\n")
             emit_gate_event(
+                events,
                 log_root,
                 phase,
                 agent,
@@ -375,6 +538,7 @@ def policy_guard_advisory(
         context["stderr"] = stderr
 
     emit_gate_event(
+        events,
         log_root,
         phase,
         agent,
@@ -387,318 +551,284 @@ def policy_guard_advisory(
     )
 
 
-def main() -> None:
-    mode = MODE
-    prompt_arg = PROMPT_FILE
-    report_arg = REPORT_FILE
-    todo_arg = TODO_FILE
-    gap_ledger_arg = GAP_LEDGER
-    objective_arg = OBJECTIVE
-    elicitation_arg = ELICITATION
-    task_id = TASK_ID
-    task_class = TASK_CLASS
-    events = EVENTS
-    spec_id = ""
+def run_captured(cmd: list) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(cmd, cwd=str(ROOT), capture_output=True, text=True)
+    except FileNotFoundError:
+        return subprocess.CompletedProcess(cmd, 127, "", f"{cmd[0]}: command not found\n")
 
-    phase = "planning" if mode == "plan" else "execution"
-    agent = "Planner" if mode == "plan" else "Execution"
-    pattern = "planning" if mode == "plan" else "tool-use"
-    phase_set = False
-    agent_set = False
-    pattern_set = False
 
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg == "--mode" and i + 1 < len(args):
-            mode = args[i + 1]
-            if not phase_set:
-                phase = "planning" if mode == "plan" else "execution"
-            if not agent_set:
-                agent = "Planner" if mode == "plan" else "Execution"
-            if not pattern_set:
-                pattern = "planning" if mode == "plan" else "tool-use"
-            i += 2
-        elif arg == "--prompt" and i + 1 < len(args):
-            prompt_arg = args[i + 1]
-            i += 2
-        elif arg == "--prompt-report" and i + 1 < len(args):
-            report_arg = args[i + 1]
-            i += 2
-        elif arg == "--todo" and i + 1 < len(args):
-            todo_arg = args[i + 1]
-            i += 2
-        elif arg == "--gap-ledger" and i + 1 < len(args):
-            gap_ledger_arg = args[i + 1]
-            i += 2
-        elif arg == "--objective" and i + 1 < len(args):
-            objective_arg = args[i + 1]
-            i += 2
-        elif arg == "--elicitation" and i + 1 < len(args):
-            elicitation_arg = args[i + 1]
-            i += 2
-        elif arg == "--task-id" and i + 1 < len(args):
-            task_id = args[i + 1]
-            i += 2
-        elif arg == "--phase" and i + 1 < len(args):
-            phase = args[i + 1]
-            phase_set = True
-            i += 2
-        elif arg == "--agent" and i + 1 < len(args):
-            agent = args[i + 1]
-            agent_set = True
-            i += 2
-        elif arg == "--pattern" and i + 1 < len(args):
-            pattern = args[i + 1]
-            pattern_set = True
-            i += 2
-        elif arg == "--task-class" and i + 1 < len(args):
-            task_class = args[i + 1]
-            i += 2
-        elif arg == "--events" and i + 1 < len(args):
-            events = args[i + 1]
-            i += 2
-        elif arg in {"-h", "--help"}:
-            usage()
-            sys.exit(0)
-        else:
-            sys.stderr.write(f"Unknown option: {arg}\n")
-            usage()
-            sys.exit(1)
+def contract_stage_script(contracts_script: Path | None) -> Path:
+    return (contracts_script or ROOT / "governance-orchestrator" / "scripts" / "validate-governance-contracts.py").resolve()
 
-    if mode not in {"plan", "execute"}:
-        sys.stderr.write(f"Invalid mode: {mode} (expected plan or execute)\n")
-        sys.exit(1)
 
-    prompt_file = Path(make_abs(prompt_arg))
-    report_file = Path(make_abs(report_arg))
-    todo_file = Path(make_abs(todo_arg))
-    gap_ledger = Path(make_abs(gap_ledger_arg))
-    objective = Path(make_abs(objective_arg))
-    elicitation_path = Path(make_abs(elicitation_arg))
-    events_path = Path(make_abs(events)) if events else None
-    log_root = ROOT / "governance-orchestrator"
+def contract_stage_scripts(contracts_script: Path | None) -> list:
+    script = contract_stage_script(contracts_script)
+    # In process the validator may import event_store from the hub on sys.path rather than its own root.
+    event_stores = dict.fromkeys([script.parents[2] / "observability" / "event_store.py", ROOT / "observability" / "event_store.py"])
+    return [
+        script,
+        script.parent / "yaml_loader.py",
+        script.parent / "schema_registry.py",
+        *event_stores,
+        Path(__file__).resolve(),
+    ]
+
+
+def contract_stage_inputs(contracts_script: Path | None, events_path: Path | None) -> list:
+    # The validator reads everything relative to its own hub root (CERES_HOME/core or .ceres/core when resolved there).
+    hub_root = contract_stage_script(contracts_script).parents[2]
+    inputs = [
+        hub_root / "governance" / "inference-phases.yaml",
+        hub_root / "AGENTS.md",
+        hub_root / "schemas" / "synchronization.schema.json",
+        hub_root / "schemas" / "memory-record.schema.json",
+        hub_root / "schemas" / "observability-event.schema.json",
+        events_path or hub_root / "logs" / "events.jsonl",
+    ]
+    inputs.extend(sorted((hub_root / "synchronizations").glob("*.yaml")))
+    inputs.extend(sorted((hub_root / "memory" / "records").glob("*.json")))
+    return inputs
+
+
+def lifecycle_stage_scripts(lifecycle_script: Path | None) -> list:
+    script = lifecycle_script or ROOT / "governance-orchestrator" / "scripts" / "enforce-lifecycle.py"
+    return [script, script.parent / "todo_tasks.py", ROOT / "scripts" / "log_event.py", Path(__file__).resolve()]
+
+
+def lifecycle_stage_inputs(todo_file: Path, gap_ledger: Path, report_file: Path) -> list:
+    inputs = [
+        todo_file,
+        gap_ledger,
+        gap_ledger.parent / "validate-gap-ledger.py",
+        report_file,
+        todo_file.resolve().parent / "objective-contract.json",
+    ]
+    if todo_file.is_file():
+        refs = set(PROMPT_REF_RE.findall(todo_file.read_text(encoding="utf-8")))
+        inputs.extend(todo_file.resolve().parent / ref for ref in sorted(refs))
+    return inputs
+
+
+def emit_lifecycle_pass_event(
+    events: log_event.EventWriter, todo_file: Path, gap_ledger: Path, report_file: Path, task_id: str | None
+) -> None:
+    """Log the event enforce-lifecycle.py writes on pass (same helper, same file)."""
+    context = {
+        "todo": str(todo_file),
+        "gap_ledger": str(gap_ledger),
+        "prompt_report": str(report_file),
+        "task_id": task_id or None,
+        "objective_contract": str(todo_file.resolve().parent / "objective-contract.json"),
+    }
+    events.emit("gate", "pass", "lifecycle gate passed", context=context)
+
+
+def run_prompt_debugger_in_process(
+    debugger: Path, prompt_file: Path, report_file: Path
+) -> tuple[subprocess.CompletedProcess, dict | None]:
+    """Build the Prompt Debug Report in-process and hand the parsed report to the next stage."""
+    args = [str(debugger), "--prompt-file", str(prompt_file)]
+    try:
+        cli = load_module("ceres_prompt_debugger", debugger)
+        report = cli.build_report(prompt_file.read_text())
+        report_file.write_text(cli.render(report), encoding="utf-8")
+    except Exception as exc:
+        return subprocess.CompletedProcess(args, 1, "", f"{type(exc).__name__}: {exc}"), None
+    return subprocess.CompletedProcess(args, 0, "", ""), report
+
+
+
+@dataclass
+class GateConfig:
+    mode: str
+    prompt_file: Path
+    report_file: Path
+    todo_file: Path
+    gap_ledger: Path
+    objective: Path
+    elicitation_path: Path
+    events_path: Path | None
+    log_root: Path
+    phase: str
+    agent: str
+    pattern: str
+    task_id: str
+    task_class: str
+    cache: StageCache
+    events: log_event.EventWriter
+
+
+class GateFailure(Exception):
+    """A stage verdict: the gate event context plus how the sequential gate exited.
+
+    ``error`` is the SystemExit the sequential code raised (a message or a bare
+    exit code); ``stderr`` is what it wrote before exiting. ``context`` of None
+    means no gate event was emitted for this failure.
+    """
+
+    def __init__(self, context: dict | None, error: SystemExit, stderr: str = "") -> None:
+        super().__init__(str(error))
+        self.context = context
+        self.error = error
+        self.stderr = stderr
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[GateConfig, dict], object]
+    deps: tuple = ()
+
+
+@dataclass
+class StageOutcome:
+    value: object = None
+    failure: GateFailure | None = None
+    skipped: bool = False
+    stdout: str = ""
+    stderr: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None and not self.skipped
+
+
+def stage_policy_guard(config: GateConfig, deps: dict) -> None:
+    # Advisory only: never fails the gate, and logs its event as soon as it runs.
+    with config.events:
+        policy_guard_advisory(
+            config.events,
+            config.log_root, config.phase, config.agent, config.pattern, config.task_id, "", config.cache
+        )
 
-    (ROOT / "logs").mkdir(parents=True, exist_ok=True)
-    policy_guard_advisory(log_root, phase, agent, pattern, task_id, spec_id)
 
+def stage_prompt(config: GateConfig, deps: dict) -> dict:
+    prompt_file = config.prompt_file
+    report_file = config.report_file
+    cache = config.cache
     if not prompt_file.is_file():
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "prompt", "reason": "missing", "path": str(prompt_file)},
+            SystemExit(1),
+            f"Prompt file not found: {prompt_file}\n",
         )
-        sys.stderr.write(f"Prompt file not found: {prompt_file}\n")
-        sys.exit(1)
 
-    report_file.parent.mkdir(parents=True, exist_ok=True)
-    debugger = resolve_prompt_debugger()
-    result = subprocess.run(
-        [str(debugger), "--prompt-file", str(prompt_file)],
-        stdout=report_file.open("w", encoding="utf-8"),
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+    try:
+        debugger = resolve_prompt_debugger()
+    except SystemExit as exc:
+        raise GateFailure(None, exc)
+    report = None
+    debugger_key = cache.key("prompt_debugger", list(debugger.parent.glob("*.py")), [prompt_file], [])
+    cached = cache.get("prompt_debugger", debugger_key)
+    if cached is not None and isinstance(cached.get("report"), dict):
+        report = cached["report"]
+        report_file.write_text(cached.get("stdout", ""), encoding="utf-8")
+        result = completed_from_cache([str(debugger)], cached)
+    elif IN_PROCESS:
+        result, report = run_prompt_debugger_in_process(debugger, prompt_file, report_file)
+    else:
+        with report_file.open("w", encoding="utf-8") as handle:
+            result = subprocess.run(
+                [str(debugger), "--prompt-file", str(prompt_file)],
+                stdout=handle,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
     if result.returncode != 0:
         context = {"stage": "prompt_report", "reason": "prompt_debugger_failed", "exit_code": result.returncode}
         stderr = (result.stderr or "").strip()
         if stderr:
             context["stderr"] = stderr
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            context,
-        )
-        if stderr:
-            sys.stderr.write(stderr + "\n")
-        sys.exit(result.returncode)
+        raise GateFailure(context, SystemExit(result.returncode), stderr + "\n" if stderr else "")
 
     try:
-        report = load_yaml_or_json(report_file, "Prompt Debug Report")
+        if report is None:
+            report = load_yaml_or_json(report_file, "Prompt Debug Report")
+        if cached is None:
+            entry = cache_entry(result)
+            entry["stdout"] = report_file.read_text(encoding="utf-8")
+            entry["report"] = report
+            cache.put("prompt_debugger", debugger_key, entry)
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            {"stage": "prompt_report", "reason": "parse_failed", "error": str(exc)},
-        )
-        raise
+        raise GateFailure({"stage": "prompt_report", "reason": "parse_failed", "error": str(exc)}, exc)
 
     status = report.get("status")
     if status != "approved":
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "prompt_report", "reason": "not_approved", "status": status},
+            SystemExit(f"Prompt Debug Report status is '{status}'. Resolve issues before proceeding."),
         )
-        raise SystemExit(f"Prompt Debug Report status is '{status}'. Resolve issues before proceeding.")
+    return report
+
 
+def stage_objective(config: GateConfig, deps: dict) -> dict:
+    objective = config.objective
+    mode = config.mode
     if not objective.is_file():
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "objective", "reason": "missing", "path": str(objective)},
+            SystemExit(1),
+            f"Objective Contract missing: {objective}\n",
         )
-        sys.stderr.write(f"Objective Contract missing: {objective}\n")
-        sys.exit(1)
 
     try:
         objective_data = load_yaml_or_json(objective, "Objective Contract")
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            {"stage": "objective", "reason": "parse_failed", "error": str(exc)},
-        )
-        raise
+        raise GateFailure({"stage": "objective", "reason": "parse_failed", "error": str(exc)}, exc)
 
     status = objective_data.get("status")
     if mode == "execute" and status != "committed":
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "objective", "reason": "status_invalid", "status": status},
-        )
-        raise SystemExit(
-            f"Objective Contract status must be 'committed' for execute mode (found '{status}')."
+            SystemExit(f"Objective Contract status must be 'committed' for execute mode (found '{status}')."),
         )
     if mode == "plan" and status not in {"draft", "committed"}:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "objective", "reason": "status_invalid", "status": status},
+            SystemExit(f"Objective Contract status must be draft or committed for plan mode (found '{status}')."),
         )
-        raise SystemExit(
-            f"Objective Contract status must be draft or committed for plan mode (found '{status}')."
-        )
+    return objective_data
+
 
+def stage_elicitation(config: GateConfig, deps: dict) -> str:
+    elicitation_path = config.elicitation_path
     try:
         elicitation_file = resolve_elicitation(elicitation_path)
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "elicitation", "reason": "missing", "error": str(exc), "path": str(elicitation_path)},
+            exc,
         )
-        raise
 
     try:
-        spec_id = validate_elicitation(elicitation_file)
+        return validate_elicitation(elicitation_file)
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "elicitation", "reason": "not_ready", "error": str(exc), "path": str(elicitation_file)},
+            exc,
         )
-        raise
 
+
+def stage_gap_ledger(config: GateConfig, deps: dict) -> list:
+    gap_ledger = config.gap_ledger
     if not gap_ledger.is_file():
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "gap_ledger", "reason": "missing", "path": str(gap_ledger)},
+            SystemExit(1),
+            f"Gap Ledger missing: {gap_ledger}\n",
         )
-        sys.stderr.write(f"Gap Ledger missing: {gap_ledger}\n")
-        sys.exit(1)
 
     try:
         gap_data = load_yaml_or_json(gap_ledger, "Gap Ledger")
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            {"stage": "gap_ledger", "reason": "parse_failed", "error": str(exc)},
-        )
-        raise
+        raise GateFailure({"stage": "gap_ledger", "reason": "parse_failed", "error": str(exc)}, exc)
 
     gaps = gap_data.get("gaps")
     if not isinstance(gaps, list):
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            {"stage": "gap_ledger", "reason": "invalid"},
-        )
-        raise SystemExit("Gap Ledger must contain a 'gaps' list")
+        raise GateFailure({"stage": "gap_ledger", "reason": "invalid"}, SystemExit("Gap Ledger must contain a 'gaps' list"))
 
-    if mode == "execute":
+    if config.mode == "execute":
         blocking = [
             gap
             for gap in gaps
@@ -706,74 +836,76 @@ def main() -> None:
         ]
         if blocking:
             ids = [gap.get("gap_id", "<unknown>") for gap in blocking]
-            emit_gate_event(
-                log_root,
-                phase,
-                agent,
-                pattern,
-                task_id,
-                spec_id,
-                "fail",
-                "preflight gate failed",
+            raise GateFailure(
                 {"stage": "gap_ledger", "reason": "blocking_unresolved", "gap_ids": ids},
+                SystemExit(f"Blocking gaps unresolved: {', '.join(ids)}"),
             )
-            raise SystemExit(f"Blocking gaps unresolved: {', '.join(ids)}")
+    return gaps
+
 
+def stage_prompt_hygiene(config: GateConfig, deps: dict) -> None:
     try:
-        validate_prompt_hygiene(todo_file)
+        validate_prompt_hygiene(config.todo_file)
     except SystemExit as exc:
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            {"stage": "prompt_hygiene", "reason": "invalid", "error": str(exc)},
-        )
-        raise
+        raise GateFailure({"stage": "prompt_hygiene", "reason": "invalid", "error": str(exc)}, exc)
+
 
+def stage_runtime(config: GateConfig, deps: dict) -> tuple:
     run_component = ROOT / "scripts" / "run-component.sh"
+    if IN_PROCESS:
+        contracts_script = resolve_component_script("governance-orchestrator", "validate-governance-contracts.py")
+        lifecycle_script = resolve_component_script("governance-orchestrator", "enforce-lifecycle.py")
+        if contracts_script is None or lifecycle_script is None:
+            missing_path = ROOT / "governance-orchestrator" / "scripts"
+            raise GateFailure(
+                {"stage": "runtime", "reason": "component-script-missing", "path": str(missing_path)},
+                SystemExit(1),
+                f"Missing governance-orchestrator scripts under: {missing_path}\n",
+            )
+        return contracts_script, lifecycle_script
     if not run_component.exists() or not os.access(run_component, os.X_OK):
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
+        raise GateFailure(
             {"stage": "runtime", "reason": "run-component-missing", "path": str(run_component)},
+            SystemExit(1),
+            f"Missing hub helper: {run_component}\n",
         )
-        sys.stderr.write(f"Missing hub helper: {run_component}\n")
-        sys.exit(1)
+    return None, None
 
-    contract_cmd = [
-        sys.executable,
-        "scripts/validate-governance-contracts.py",
+
+def stage_contracts(config: GateConfig, deps: dict) -> None:
+    contracts_script, _ = deps["runtime"]
+    run_component = ROOT / "scripts" / "run-component.sh"
+    cache = config.cache
+    contract_args = [
         "--phase",
-        phase,
+        config.phase,
         "--agent",
-        agent,
+        config.agent,
         "--pattern",
-        pattern,
+        config.pattern,
     ]
-    if task_class:
-        contract_cmd.extend(["--task-class", task_class])
-    if task_id:
-        contract_cmd.extend(["--task-id", task_id])
-    if events_path:
-        contract_cmd.extend(["--events", str(events_path)])
-
-    contract_result = subprocess.run(
-        [str(run_component), "governance-orchestrator", " ".join(contract_cmd)],
-        capture_output=True,
-        text=True,
-        cwd=str(ROOT),
+    if config.task_class:
+        contract_args.extend(["--task-class", config.task_class])
+    if config.task_id:
+        contract_args.extend(["--task-id", config.task_id])
+    if config.events_path:
+        contract_args.extend(["--events", str(config.events_path)])
+
+    contract_key = cache.key(
+        "contracts",
+        contract_stage_scripts(contracts_script),
+        contract_stage_inputs(contracts_script, config.events_path),
+        contract_args,
     )
+    cached = cache.get("contracts", contract_key)
+    if cached is not None:
+        contract_result = completed_from_cache(contract_args, cached)
+    elif IN_PROCESS:
+        contracts = load_module("ceres_validate_governance_contracts", contracts_script)
+        contract_result = call_in_process(contracts.main, contract_args)
+    else:
+        contract_cmd = [sys.executable, "scripts/validate-governance-contracts.py", *contract_args]
+        contract_result = run_captured([str(run_component), "governance-orchestrator", " ".join(contract_cmd)])
     if contract_result.returncode != 0:
         context = {"stage": "contracts", "reason": "validation_failed", "exit_code": contract_result.returncode}
         stderr = (contract_result.stderr or "").strip()
@@ -782,26 +914,18 @@ def main() -> None:
             context["stderr"] = stderr
         if stdout:
             context["stdout"] = stdout
-        emit_gate_event(
-            log_root,
-            phase,
-            agent,
-            pattern,
-            task_id,
-            spec_id,
-            "fail",
-            "preflight gate failed",
-            context,
-        )
-        if stderr:
-            sys.stderr.write(stderr + "\n")
-        elif stdout:
-            sys.stderr.write(stdout + "\n")
-        sys.exit(contract_result.returncode)
-
-    cmd = [
-        sys.executable,
-        "scripts/enforce-lifecycle.py",
+        shown = stderr or stdout
+        raise GateFailure(context, SystemExit(contract_result.returncode), shown + "\n" if shown else "")
+    if cached is None:
+        cache.put("contracts", contract_key, cache_entry(contract_result))
+
+
+def stage_lifecycle(config: GateConfig, deps: dict) -> None:
+    _, lifecycle_script = deps["runtime"]
+    run_component = ROOT / "scripts" / "run-component.sh"
+    cache = config.cache
+    todo_file, gap_ledger, report_file = config.todo_file, config.gap_ledger, config.report_file
+    lifecycle_args = [
         "--todo",
         str(todo_file),
         "--gap-ledger",
@@ -816,16 +940,279 @@ def main() -> None:
         str(ROOT / "scripts" / "log_event.py"),
     ]
 
-    if task_id:
-        cmd.extend(["--task-id", task_id])
+    if config.task_id:
+        lifecycle_args.extend(["--task-id", config.task_id])
+
+    lifecycle_key = cache.key(
+        "lifecycle",
+        lifecycle_stage_scripts(lifecycle_script),
+        lifecycle_stage_inputs(todo_file, gap_ledger, report_file),
+        lifecycle_args,
+    )
+    cached = cache.get("lifecycle", lifecycle_key)
+    if cached is not None:
+        # Replay the verdict, including the pass event the gate itself would log.
+        sys.stdout.write(cached.get("stdout", ""))
+        sys.stderr.write(cached.get("stderr", ""))
+        with config.events:
+            emit_lifecycle_pass_event(config.events, todo_file, gap_ledger, report_file, config.task_id)
+        return
+
+    if IN_PROCESS:
+        # The component runner executes inside governance-orchestrator/, so its
+        # relative logs/events.jsonl lands there; keep that explicit in-process.
+        lifecycle = load_module("ceres_enforce_lifecycle", lifecycle_script)
+        stage_args = [*lifecycle_args, "--log-out", str(config.log_root / "logs" / "events.jsonl")]
+        lifecycle_result = call_in_process(lifecycle.main, stage_args)
+    else:
+        cmd = [sys.executable, "scripts/enforce-lifecycle.py", *lifecycle_args]
+        lifecycle_result = run_captured([str(run_component), "governance-orchestrator", " ".join(cmd)])
+    sys.stdout.write(lifecycle_result.stdout or "")
+    sys.stderr.write(lifecycle_result.stderr or "")
+    if lifecycle_result.returncode != 0:
+        # enforce-lifecycle logs its own failure event.
+        raise GateFailure(None, SystemExit(lifecycle_result.returncode))
+    cache.put("lifecycle", lifecycle_key, cache_entry(lifecycle_result))
+
+
+def gate_stages() -> list:
+    """Preflight stages in report order, with the inputs each one waits on.
+
+    Everything except the lifecycle gate is independent; the lifecycle gate reads
+    the Prompt Debug Report and must only run (and log) once every other check
+    has passed, exactly as in the sequential gate.
+    """
+    stages = [
+        Stage("policy_guard", stage_policy_guard),
+        Stage("prompt", stage_prompt),
+        Stage("objective", stage_objective),
+        Stage("elicitation", stage_elicitation),
+        Stage("gap_ledger", stage_gap_ledger),
+        Stage("prompt_hygiene", stage_prompt_hygiene),
+        Stage("runtime", stage_runtime),
+        Stage("contracts", stage_contracts, ("runtime",)),
+    ]
+    stages.append(Stage("lifecycle", stage_lifecycle, tuple(stage.name for stage in stages)))
+    return stages
+
+
+def execute_stage(stage: Stage, config: GateConfig, outcomes: dict) -> StageOutcome:
+    outcome = StageOutcome()
+    with captured_output() as (stdout, stderr):
+        try:
+            outcome.value = stage.run(config, {dep: outcomes[dep].value for dep in stage.deps})
+        except GateFailure as failure:
+            outcome.failure = failure
+    outcome.stdout = stdout.getvalue()
+    outcome.stderr = stderr.getvalue()
+    return outcome
+
+
+def run_stage_graph(stages: list, config: GateConfig, jobs: int) -> dict:
+    """Run stages on a worker pool as soon as their dependencies have passed.
+
+    Stages whose dependencies failed are skipped. Each stage's output is captured
+    so the caller can report results in declaration order, whatever order they
+    finished in.
+    """
+    outcomes: dict[str, StageOutcome] = {}
+    pending = list(stages)
+    running: dict = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for stage in list(pending):
+                if not all(dep in outcomes for dep in stage.deps):
+                    continue
+                pending.remove(stage)
+                if all(outcomes[dep].ok for dep in stage.deps):
+                    running[pool.submit(execute_stage, stage, config, outcomes)] = stage
+                else:
+                    outcomes[stage.name] = StageOutcome(skipped=True)
+            if not running:
+                if pending:
+                    names = ", ".join(stage.name for stage in pending)
+                    raise ValueError(f"Preflight stage graph has unsatisfiable dependencies: {names}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                outcomes[stage.name] = future.result()
+    return outcomes
+
+
+def report_outcomes(stages: list, outcomes: dict, config: GateConfig) -> None:
+    """Replay stage output and fail on the first failing stage, in declaration order."""
+    spec_id = ""
+    for stage in stages:
+        outcome = outcomes[stage.name]
+        if outcome.skipped:
+            continue
+        sys.stdout.write(outcome.stdout)
+        sys.stderr.write(outcome.stderr)
+        failure = outcome.failure
+        if failure is not None:
+            if failure.context is not None:
+                emit_gate_event(
+                    config.events,
+                    config.log_root,
+                    config.phase,
+                    config.agent,
+                    config.pattern,
+                    config.task_id,
+                    spec_id,
+                    "fail",
+                    "preflight gate failed",
+                    failure.context,
+                )
+            if failure.stderr:
+                sys.stderr.write(failure.stderr)
+            raise failure.error
+        if stage.name == "elicitation":
+            spec_id = outcome.value
+
+
+def main(argv: list | None = None) -> None:
+    global IN_PROCESS
+    mode = MODE
+    prompt_arg = PROMPT_FILE
+    report_arg = REPORT_FILE
+    todo_arg = TODO_FILE
+    gap_ledger_arg = GAP_LEDGER
+    objective_arg = OBJECTIVE
+    elicitation_arg = ELICITATION
+    task_id = TASK_ID
+    task_class = TASK_CLASS
+    events = EVENTS
+    no_cache = False
+    jobs = DEFAULT_JOBS
+
+    phase = "planning" if mode == "plan" else "execution"
+    agent = "Planner" if mode == "plan" else "Execution"
+    pattern = "planning" if mode == "plan" else "tool-use"
+    phase_set = False
+    agent_set = False
+    pattern_set = False
+
+    args = sys.argv[1:] if argv is None else list(argv)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--mode" and i + 1 < len(args):
+            mode = args[i + 1]
+            if not phase_set:
+                phase = "planning" if mode == "plan" else "execution"
+            if not agent_set:
+                agent = "Planner" if mode == "plan" else "Execution"
+            if not pattern_set:
+                pattern = "planning" if mode == "plan" else "tool-use"
+            i += 2
+        elif arg == "--prompt" and i + 1 < len(args):
+            prompt_arg = args[i + 1]
+            i += 2
+        elif arg == "--prompt-report" and i + 1 < len(args):
+            report_arg = args[i + 1]
+            i += 2
+        elif arg == "--todo" and i + 1 < len(args):
+            todo_arg = args[i + 1]
+            i += 2
+        elif arg == "--gap-ledger" and i + 1 < len(args):
+            gap_ledger_arg = args[i + 1]
+            i += 2
+        elif arg == "--objective" and i + 1 < len(args):
+            objective_arg = args[i + 1]
+            i += 2
+        elif arg == "--elicitation" and i + 1 < len(args):
+            elicitation_arg = args[i + 1]
+            i += 2
+        elif arg == "--task-id" and i + 1 < len(args):
+            task_id = args[i + 1]
+            i += 2
+        elif arg == "--phase" and i + 1 < len(args):
+            phase = args[i + 1]
+            phase_set = True
+            i += 2
+        elif arg == "--agent" and i + 1 < len(args):
+            agent = args[i + 1]
+            agent_set = True
+            i += 2
+        elif arg == "--pattern" and i + 1 < len(args):
+            pattern = args[i + 1]
+            pattern_set = True
+            i += 2
+        elif arg == "--task-class" and i + 1 < len(args):
+            task_class = args[i + 1]
+            i += 2
+        elif arg == "--events" and i + 1 < len(args):
+            events = args[i + 1]
+            i += 2
+        elif arg == "--in-process":
+            IN_PROCESS = True
+            i += 1
+        elif arg == "--no-cache":
+            no_cache = True
+            i += 1
+        elif arg == "--jobs" and i + 1 < len(args):
+            try:
+                jobs = int(args[i + 1])
+            except ValueError:
+                jobs = 0
+            if jobs < 1:
+                sys.stderr.write(f"Invalid jobs: {args[i + 1]} (expected a positive integer)\n")
+                sys.exit(1)
+            i += 2
+        elif arg in {"-h", "--help"}:
+            usage()
+            sys.exit(0)
+        else:
+            sys.stderr.write(f"Unknown option: {arg}\n")
+            usage()
+            sys.exit(1)
+
+    if mode not in {"plan", "execute"}:
+        sys.stderr.write(f"Invalid mode: {mode} (expected plan or execute)\n")
+        sys.exit(1)
 
-    run_or_exit([str(run_component), "governance-orchestrator", " ".join(cmd)], cwd=str(ROOT))
+    prompt_file = Path(make_abs(prompt_arg))
+    report_file = Path(make_abs(report_arg))
+    todo_file = Path(make_abs(todo_arg))
+    gap_ledger = Path(make_abs(gap_ledger_arg))
+    objective = Path(make_abs(objective_arg))
+    elicitation_path = Path(make_abs(elicitation_arg))
+    events_path = Path(make_abs(events)) if events else None
+    log_root = ROOT / "governance-orchestrator"
+
+    config = GateConfig(
+        mode=mode,
+        prompt_file=prompt_file,
+        report_file=report_file,
+        todo_file=todo_file,
+        gap_ledger=gap_ledger,
+        objective=objective,
+        elicitation_path=elicitation_path,
+        events_path=events_path,
+        log_root=log_root,
+        phase=phase,
+        agent=agent,
+        pattern=pattern,
+        task_id=task_id,
+        task_class=task_class,
+        cache=StageCache(stage_cache_path(), cache_enabled(no_cache)),
+        events=log_event.EventWriter(log_root / "logs" / "events.jsonl"),
+    )
+
+    (ROOT / "logs").mkdir(parents=True, exist_ok=True)
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    stages = gate_stages()
+    outcomes = run_stage_graph(stages, config, jobs)
+    with config.events:
+        report_outcomes(stages, outcomes, config)
 
     print(f"Preflight checks passed ({mode} mode).")
 
-if __name__ == "__main__":
+def cli(argv: list | None = None) -> None:
+    """main() with the FAST_START override applied (the preflight.py entry point)."""
     try:
-        main()
+        main(argv)
     except SystemExit as exc:
         if fast_start_enabled():
             code = exc.code if isinstance(exc.code, int) else 1
@@ -833,3 +1220,12 @@ if __name__ == "__main__":
                 sys.stderr.write("WARN: preflight failed (FAST_START override; continuing).\n")
             sys.exit(0)
         raise
+
+
+if __name__ == "__main__":
+    from scripts import session_daemon
+
+    forwarded = session_daemon.forward("preflight", sys.argv[1:])
+    if forwarded is not None:
+        sys.exit(forwarded)
+    cli()
@@ -14,4 +14,6 @@ if [[ -n "${CERES_HOME:-}" && "$CERES_HOME" == */.ceres ]]; then
   ROOT="$(CDPATH= cd -- "${CERES_HOME%/.ceres}" && pwd)"
 fi
 
-exec python3 "$ROOT/scripts/preflight.py" "$@"
+# session_daemon.py hands the run to a warm session daemon when one is up and
+# otherwise runs preflight.py in the same interpreter.
+exec python3 "$ROOT/scripts/session_daemon.py" run preflight "$@"
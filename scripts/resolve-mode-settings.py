@@ -20,6 +20,12 @@ from pathlib import Path
 import os
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts import workspace_snapshot
+from scripts.workspace_snapshot import ArtifactError
+
 STATE_PATH = ROOT / "modes_settings_profiles.json"
 EVENTS_PATH = ROOT / "events.jsonl"
 
@@ -41,12 +47,13 @@ SCHEMA_SETTINGS_KEYS = [
 
 
 def load_state() -> dict:
-    if not STATE_PATH.exists():
-        raise SystemExit(f"Missing configuration: {STATE_PATH}")
     try:
-        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        state = workspace_snapshot.shared(root=ROOT).mode_settings()
+    except ArtifactError:
         raise SystemExit(f"Invalid JSON in {STATE_PATH}")
+    if state is None:
+        raise SystemExit(f"Missing configuration: {STATE_PATH}")
+    return state
 
 
 def select_mode_defaults(state: dict, active_mode: str) -> dict:
@@ -12,35 +12,11 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from scripts import rigor_rules, rigor_runner
+from scripts.yaml_loader import load_yaml_or_json
 
 ROOT = Path(__file__).resolve().parent.parent
 
 
-def load_yaml_or_json(path: Path, label: str) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    data = None
-    try:
-        import yaml  # type: ignore
-    except Exception:
-        yaml = None
-
-    if yaml is not None:
-        try:
-            data = yaml.safe_load(text)
-        except Exception:
-            data = None
-
-    if data is None:
-        try:
-            data = json.loads(text)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse {label}: {exc}")
-
-    if not isinstance(data, dict):
-        raise SystemExit(f"{label} must be an object.")
-    return data
-
-
 def load_list(path: Path) -> List[str]:
     text = path.read_text(encoding="utf-8").strip()
     if not text:
@@ -58,22 +34,11 @@ def emit_event(status: str, message: str, context: Dict[str, Any]) -> None:
     helper = ROOT / "scripts" / "log_event.py"
     if not helper.exists():
         return
-    cmd = [
-        sys.executable,
-        str(helper),
-        "--type",
-        "rigor",
-        "--status",
-        status,
-        "--message",
-        message,
-        "--context",
-        json.dumps(context),
-    ]
     try:
-        import subprocess
+        from scripts import log_event
 
-        subprocess.run(cmd, check=False, cwd=str(ROOT))
+        event = log_event.build_event("rigor", status, message, context=context)
+        log_event.append_event(ROOT / "logs" / "events.jsonl", event)
     except Exception:
         return
 
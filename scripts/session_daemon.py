@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""Optional warm session daemon for preflight, status, doctor and the state digest.
+
+Each of those scripts otherwise starts a fresh interpreter, re-imports its stage
+modules, rediscovers the project root and re-parses the workspace artifacts.
+`session_daemon.py start` runs one local server on a Unix socket in the workspace
+(`session.sock`) that keeps them loaded: the shared WorkspaceSnapshot, the preflight
+stage modules (with their compiled schema validators) and the event writer.
+
+The scripts stay the entry points. Their `__main__` blocks call `forward()`, which
+replays the command in the daemon with the caller's argv, cwd and environment and
+returns its exit code, or returns None when no daemon answers so the script runs
+in-process exactly as before. `session_daemon.py run <command> [args]` (used by
+preflight.sh and status.sh) is the thinnest client: it forwards before importing
+the command's module and only loads it, in the same interpreter, on fallback. Set
+CERES_SESSION_DAEMON=0 to bypass a running daemon.
+
+Requests are served one at a time. The daemon declines requests for another project
+root, exits when a source file it has loaded changes (the declined call then runs
+in-process), and exits after CERES_SESSION_DAEMON_IDLE seconds without requests.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts import workspace_snapshot
+
+# Server-side and CLI modules (argparse, importlib, runpy, subprocess) are imported
+# where they are used so that forwarding a request stays cheap.
+
+SOCKET_NAME = "session.sock"
+DEFAULT_IDLE_SECONDS = 1800
+CONNECT_TIMEOUT = 0.5
+REQUEST_READ_TIMEOUT = 10.0
+START_TIMEOUT = 5.0
+
+# command -> (script in scripts/, entry point); entry points take argv and return or
+# raise an exit code.
+COMMANDS = {
+    "preflight": ("preflight.py", "cli"),
+    "status": ("status.py", "main"),
+    "doctor": ("doctor.py", "main"),
+    "digest": ("generate-state-digest.py", "main"),
+}
+
+
+def module_name(command: str) -> str:
+    return "scripts." + Path(COMMANDS[command][0]).stem
+
+
+def enabled() -> bool:
+    return os.environ.get("CERES_SESSION_DAEMON", "1").lower() not in {"0", "false", "no", "off"}
+
+
+def socket_path() -> Path:
+    return workspace_snapshot.resolve_workspace(workspace_snapshot.project_root()) / SOCKET_NAME
+
+
+def request(payload: Dict[str, Any], path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send one request; None when no daemon is listening or the reply is lost."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = path or socket_path()
+    if not path.exists():
+        return None
+    with contextlib.closing(socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)) as sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(None)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return None
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        return None
+    return response if isinstance(response, dict) else None
+
+
+def forward(command: str, argv: List[str]) -> Optional[int]:
+    """Run `command` in the daemon and replay its output; None means run it in-process."""
+    if not enabled():
+        return None
+    response = request(
+        {
+            "command": command,
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "root": str(workspace_snapshot.project_root()),
+        }
+    )
+    if response is None or "returncode" not in response:
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return int(response["returncode"])
+
+
+def run(command: str, argv: List[str]) -> int:
+    """Forward `command`, or run its script as __main__ in this interpreter."""
+    forwarded = forward(command, argv)
+    if forwarded is not None:
+        return forwarded
+    import runpy
+
+    script = Path(__file__).resolve().parent / COMMANDS[command][0]
+    sys.argv = [str(script), *argv]
+    runpy.run_path(str(script), run_name="__main__")
+    return 0
+
+
+@contextlib.contextmanager
+def client_context(cwd: Optional[str], env: Optional[Dict[str, str]]) -> Iterator[None]:
+    """Run with the client's working directory and environment, then restore ours."""
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    try:
+        if env is not None:
+            os.environ.clear()
+            os.environ.update(env)
+        if cwd:
+            os.chdir(cwd)
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+
+class SessionDaemon:
+    """Serves COMMANDS in this interpreter over a Unix socket."""
+
+    def __init__(self, path: Path, root: Path, idle_seconds: float = DEFAULT_IDLE_SECONDS) -> None:
+        self.path = Path(path)
+        self.root = Path(root)
+        self.idle_seconds = idle_seconds
+        self.running = False
+        self.served = 0
+        self._sources: Dict[str, int] = {}
+        self._preflight: Any = None
+
+    def warm(self) -> None:
+        """Import the command modules and the preflight stages they would load cold."""
+        import importlib
+
+        self._preflight = importlib.import_module("scripts.preflight")
+        self._preflight.IN_PROCESS = True
+        for command in COMMANDS:
+            with contextlib.suppress(ImportError):
+                importlib.import_module(module_name(command))
+        self._preflight.load_module("ceres_log_event", ROOT / "scripts" / "log_event.py")
+        for name, script in (
+            ("ceres_validate_governance_contracts", "validate-governance-contracts.py"),
+            ("ceres_enforce_lifecycle", "enforce-lifecycle.py"),
+        ):
+            path = self._preflight.resolve_component_script("governance-orchestrator", script)
+            if path is not None:
+                self._preflight.load_module(name, path)
+        workspace = workspace_snapshot.resolve_workspace(self.root)
+        workspace_snapshot.shared(workspace, ROOT).summary()
+        self._sources = self.source_mtimes()
+
+    def source_mtimes(self) -> Dict[str, int]:
+        """mtime_ns of every loaded module file under ROOT (including preflight stage modules)."""
+        modules = list(sys.modules.values())
+        if self._preflight is not None:
+            modules.extend(self._preflight._MODULES.values())
+        prefix = str(ROOT) + os.sep
+        mtimes: Dict[str, int] = {}
+        for module in modules:
+            path = getattr(module, "__file__", None)
+            if not path or not path.startswith(prefix) or path in mtimes:
+                continue
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = -1
+        return mtimes
+
+    def stale(self) -> bool:
+        for path, mtime in self._sources.items():
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = -1
+            if current != mtime:
+                return True
+        return False
+
+    def dispatch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        command = payload.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "root": str(self.root), "served": self.served}
+        if command == "stop":
+            self.running = False
+            return {"ok": True}
+        if payload.get("root") != str(self.root):
+            return {"declined": "root mismatch"}
+        if self.stale():
+            self.running = False
+            return {"declined": "sources changed"}
+        entry = COMMANDS.get(command)
+        if entry is None:
+            return {"returncode": 2, "stdout": "", "stderr": f"session daemon: unknown command {command!r}\n"}
+        import importlib
+
+        try:
+            func = getattr(importlib.import_module(module_name(command)), entry[1])
+        except ImportError as exc:
+            return {"declined": f"cannot load {command}: {exc}"}
+        with client_context(payload.get("cwd"), payload.get("env")):
+            result = self._preflight.call_in_process(func, list(payload.get("argv") or []))
+        self.served += 1
+        # Stage modules loaded by this request join the staleness check.
+        for path, mtime in self.source_mtimes().items():
+            self._sources.setdefault(path, mtime)
+        return {"returncode": result.returncode, "stdout": result.stdout, "stderr": result.stderr}
+
+    def handle(self, conn: socket.socket) -> None:
+        conn.settimeout(REQUEST_READ_TIMEOUT)
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            payload = json.loads(b"".join(chunks).decode("utf-8"))
+        except ValueError as exc:
+            response: Dict[str, Any] = {"error": f"invalid request: {exc}"}
+        else:
+            response = self.dispatch(payload) if isinstance(payload, dict) else {"error": "invalid request"}
+        conn.sendall(json.dumps(response).encode("utf-8"))
+
+    def serve(self) -> None:
+        self.warm()
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o077)
+        try:
+            server.bind(str(self.path))
+        finally:
+            os.umask(previous_umask)
+        inode = self.path.stat().st_ino
+        server.listen(8)
+        server.settimeout(self.idle_seconds)
+        self.running = True
+        try:
+            while self.running:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    try:
+                        self.handle(conn)
+                    except OSError:
+                        continue
+        finally:
+            server.close()
+            # Leave a socket that a newer daemon bound in our place.
+            with contextlib.suppress(OSError):
+                if self.path.stat().st_ino == inode:
+                    self.path.unlink()
+
+
+def ping(path: Path) -> Optional[Dict[str, Any]]:
+    response = request({"command": "ping"}, path)
+    return response if response and response.get("ok") else None
+
+
+def start(path: Path) -> int:
+    import subprocess
+    import time
+
+    running = ping(path)
+    if running:
+        print(f"session daemon already running (pid {running['pid']})")
+        return 0
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        running = ping(path)
+        if running:
+            print(f"started session daemon (pid {running['pid']}) on {path}")
+            return 0
+        time.sleep(0.05)
+    sys.stderr.write(f"session daemon did not start on {path}\n")
+    return 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else list(argv)
+    if len(args) >= 2 and args[0] == "run" and args[1] in COMMANDS:
+        return run(args[1], args[2:])
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="CERES warm session daemon (optional)",
+        epilog=f"Also: run {{{','.join(COMMANDS)}}} [args...] forwards a command or runs it in-process.",
+    )
+    parser.add_argument("action", choices=["start", "stop", "status", "serve"])
+    parser.add_argument(
+        "--idle",
+        type=float,
+        default=float(os.environ.get("CERES_SESSION_DAEMON_IDLE", DEFAULT_IDLE_SECONDS)),
+        help="Exit after this many seconds without requests",
+    )
+    args = parser.parse_args(args)
+    if not hasattr(socket, "AF_UNIX"):
+        sys.stderr.write("session daemon requires Unix domain sockets\n")
+        return 1
+    path = socket_path()
+
+    if args.action == "start":
+        return start(path)
+    if args.action == "serve":
+        SessionDaemon(path, workspace_snapshot.project_root(), args.idle).serve()
+        return 0
+    running = ping(path)
+    if args.action == "status":
+        if running:
+            print(f"session daemon running (pid {running['pid']}, {running['served']} requests served) on {path}")
+        else:
+            print("session daemon not running")
+        return 0
+    if running:
+        request({"command": "stop"}, path)
+        print(f"stopped session daemon (pid {running['pid']})")
+    else:
+        print("session daemon not running")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,11 @@ elif [[ -z "${CERES_AUTObOOTSTRAP_RUNNING:-}" && -x "$ROOT/scripts/autobootstrap
   set -e
 fi
 
+# Optional warm session daemon; preflight/status/doctor/digest run in-process without it.
+if [[ "${CERES_SESSION_DAEMON:-}" == "1" ]]; then
+  python3 "$ROOT/scripts/session_daemon.py" start || true
+fi
+
 if [[ -n "${CERES_WORKSPACE:-}" && -d "$CERES_WORKSPACE" ]]; then
   LOG_DIR="$CERES_WORKSPACE/logs"
 else
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""CERES status: git state of the umbrella and component repos, plus workspace artifacts.
+
+status.sh delegates here. Component repos come from repos.yaml (`name` and
+`local_path` per entry); the workspace line is the shared WorkspaceSnapshot summary.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts import workspace_snapshot
+
+
+def parse_repos(path: Path) -> List[Tuple[str, str]]:
+    """(name, local_path) for each `- ` entry of repos.yaml; [] when the file is absent."""
+    if not path.is_file():
+        return []
+    data: List[Dict[str, str]] = []
+    current: Optional[Dict[str, str]] = None
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("- "):
+            if current:
+                data.append(current)
+            current = {}
+            line = line[2:]
+            if line and ":" in line:
+                key, value = line.split(":", 1)
+                current[key.strip()] = value.strip()
+            continue
+        if current is not None and ":" in line:
+            key, value = line.split(":", 1)
+            current[key.strip()] = value.strip()
+    if current:
+        data.append(current)
+    return [(repo.get("name") or "", repo.get("local_path") or "") for repo in data]
+
+
+def git(repo: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(["git", "-C", str(repo), *args], capture_output=True, text=True, check=False)
+    except OSError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def repo_state(repo: Path) -> Tuple[str, str, str]:
+    branch = git(repo, "rev-parse", "--abbrev-ref", "HEAD") or "n/a"
+    sha = git(repo, "rev-parse", "--short", "HEAD") or "n/a"
+    dirty = "dirty" if git(repo, "status", "--porcelain") else "clean"
+    return branch, sha, dirty
+
+
+def workspace_lines(root: Path) -> List[str]:
+    workspace = workspace_snapshot.resolve_workspace(root)
+    summary = workspace_snapshot.shared(workspace, root).summary()
+    ready = "ready" if summary["elicitation_ready"] else "not ready"
+    return [
+        f"Workspace: {workspace}",
+        f"  objective: {summary['objective_status'] or 'missing'} | "
+        f"gaps: {summary['open_gaps']} open, {summary['blocking_gaps']} blocking | elicitation: {ready}",
+    ]
+
+
+def render(root: Path = ROOT, project: Optional[Path] = None) -> str:
+    """Status of the umbrella repo at `root`; the workspace is resolved from `project` (default: root)."""
+    branch, sha, dirty = repo_state(root)
+    lines = [f"Umbrella repo: {root}", f"  branch: {branch} | sha: {sha} | {dirty}", "", "Component repos:"]
+    for name, rel_path in parse_repos(root / "repos.yaml"):
+        if not name:
+            continue
+        repo_path = root / rel_path
+        if not repo_path.is_dir():
+            lines.append(f"  {name}: MISSING at {repo_path}")
+            continue
+        branch, sha, dirty = repo_state(repo_path)
+        lines.append(f"  {name}: branch={branch} | sha={sha} | {dirty}")
+    lines.append("")
+    lines.extend(workspace_lines(project or root))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    sys.stdout.write(render(ROOT, workspace_snapshot.project_root()))
+    return 0
+
+
+if __name__ == "__main__":
+    from scripts import session_daemon
+
+    forwarded = session_daemon.forward("status", sys.argv[1:])
+    sys.exit(forwarded if forwarded is not None else main())
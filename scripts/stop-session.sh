@@ -3,6 +3,8 @@ set -euo pipefail
 
 PID_FILE="logs/handover-watch.pid"
 
+python3 "$(dirname "${BASH_SOURCE[0]}")/session_daemon.py" stop >/dev/null 2>&1 || true
+
 if [[ ! -f "$PID_FILE" ]]; then
   echo "no handover watch pid file found"
   exit 0
@@ -83,6 +83,64 @@ class HousekeepingTests(unittest.TestCase):
         self.assertNotIn("Task C", updated)
         self.assertIn("Task D", updated)
 
+    def _sync(self) -> tuple:
+        return housekeeping.sync_completed(
+            todo_path=self.todo,
+            completed_path=self.completed,
+            push_hash="deadbeef",
+            dry_run=False,
+            include_all=True,
+            prune=False,
+        )
+
+    def test_completed_index_reads_only_appended_entries(self) -> None:
+        self.todo.write_text("# Todo\n- [x] Task E\n- [x] Task F\n", encoding="utf-8")
+        self.completed.write_text("# Completed\n- [x] 2026-01-01 — Task E (push abcdef)\n", encoding="utf-8")
+        self.assertEqual(self._sync()[0], 1)
+
+        appended = "- [x] 2026-01-02 — Task G (push 1234567) [evidence.md]\n"
+        with self.completed.open("a", encoding="utf-8") as handle:
+            handle.write(appended)
+        index = housekeeping.CompletedIndex(self.completed).load().refresh()
+        self.assertEqual(index.bytes_read, len(appended.encode("utf-8")))
+        self.assertIn("Task G", index)
+        self.assertIn("Task F", index)
+
+        self.todo.write_text("# Todo\n- [x] Task F\n- [x] Task G\n- [ ] Task I\n", encoding="utf-8")
+        self.assertEqual(self._sync(), (0, []))
+        self.assertEqual(self.todo.read_text(encoding="utf-8"), "# Todo\n- [ ] Task I\n")
+        self.assertEqual(self.completed.read_text(encoding="utf-8").count("Task F"), 1)
+
+        todo_inode = self.todo.stat().st_ino
+        self.assertEqual(self._sync(), (0, []))
+        self.assertEqual(self.todo.stat().st_ino, todo_inode)
+
+    def test_unterminated_last_entry_counts_as_completed(self) -> None:
+        self.todo.write_text("# Todo\n- [x] Ship foo\n", encoding="utf-8")
+        ledger = "# Completed\n- [x] 2026-01-01 — Ship foo (push abc123)"
+        self.completed.write_text(ledger, encoding="utf-8")
+        self.assertEqual(self._sync(), (0, []))
+        self.assertEqual(self.completed.read_text(encoding="utf-8"), ledger)
+
+        index = housekeeping.CompletedIndex(self.completed).load().refresh()
+        self.assertEqual(index.offset, len("# Completed\n".encode("utf-8")))
+        with self.completed.open("a", encoding="utf-8") as handle:
+            handle.write(" [evidence.md]\n")
+        self.todo.write_text("# Todo\n- [x] Ship foo\n", encoding="utf-8")
+        self.assertEqual(self._sync(), (0, []))
+
+    def test_rewritten_completed_ledger_rebuilds_index(self) -> None:
+        self.todo.write_text("# Todo\n- [x] Task H\n", encoding="utf-8")
+        self.completed.write_text("# Completed\n", encoding="utf-8")
+        self.assertEqual(self._sync()[0], 1)
+        self.todo.write_text("# Todo\n- [x] Task H\n", encoding="utf-8")
+        self.assertEqual(self._sync()[0], 0)
+
+        self.todo.write_text("# Todo\n- [x] Task H\n", encoding="utf-8")
+        self.completed.write_text("# Completed\n- [x] 2026-01-01 — Other (push abcdef)\n", encoding="utf-8")
+        self.assertEqual(self._sync()[0], 1)
+        self.assertIn("Task H (push deadbeef)", self.completed.read_text(encoding="utf-8"))
+
 
 if __name__ == "__main__":
     unittest.main()
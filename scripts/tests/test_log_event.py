@@ -0,0 +1,131 @@
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import log_event
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class EventWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = Path(self.tmp.name) / "logs" / "events.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _read(self) -> list:
+        return [json.loads(line) for line in self.out.read_text(encoding="utf-8").splitlines()]
+
+    def test_events_are_buffered_until_exit(self) -> None:
+        with log_event.EventWriter(self.out) as writer:
+            writer.emit("gate", "pass", "first", phase="planning")
+            writer.emit("gate", "fail", "second", context={"task": "T-1"})
+            self.assertFalse(self.out.exists())
+        events = self._read()
+        self.assertEqual([e["message"] for e in events], ["first", "second"])
+        self.assertEqual(events[0]["phase"], "planning")
+        self.assertEqual(events[1]["context"], {"task": "T-1"})
+
+    def test_size_threshold_and_error_exit_flush(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with log_event.EventWriter(self.out, flush_bytes=1) as writer:
+                writer.emit("gate", "pass", "first")
+                self.assertEqual(len(self._read()), 1)
+                writer.emit("gate", "pass", "second")
+                raise RuntimeError("stage crashed")
+        self.assertEqual([e["message"] for e in self._read()], ["first", "second"])
+
+    def test_invalid_event_is_rejected_before_buffering(self) -> None:
+        writer = log_event.EventWriter(self.out)
+        with self.assertRaises(ValueError):
+            writer.emit("gate", "pass", "bad", phase="nope")
+        self.assertEqual(writer.flush(), 0)
+        self.assertFalse(self.out.exists())
+
+    def test_parallel_writers_do_not_interleave_batches(self) -> None:
+        def worker(n: int) -> None:
+            for batch in range(20):
+                with log_event.EventWriter(self.out, fsync=False) as writer:
+                    for i in range(10):
+                        writer.emit("gate", "pass", f"{n}-{batch}-{i}", context={"pad": "x" * 512})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        messages = [e["message"] for e in self._read()]
+        self.assertEqual(len(messages), 4 * 20 * 10)
+        for start in range(0, len(messages), 10):
+            prefixes = {m.rsplit("-", 1)[0] for m in messages[start : start + 10]}
+            self.assertEqual(len(prefixes), 1, messages[start : start + 10])
+
+    def test_shared_writer_flushes_through_jsonl_append(self) -> None:
+        writer = log_event.EventWriter(self.out)
+        threads = [
+            threading.Thread(target=writer.emit, args=("gate", "pass", f"stage-{n}")) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with mock.patch.object(log_event, "append_lines", wraps=log_event.append_lines) as append:
+            self.assertEqual(writer.flush(), 4)
+            self.assertEqual(writer.flush(), 0)
+        append.assert_called_once()
+        self.assertTrue(append.call_args.kwargs["fsync"])
+        self.assertEqual(sorted(e["message"] for e in self._read()), [f"stage-{n}" for n in range(4)])
+
+    @unittest.skipIf(log_event.EventStore is None, "observability not importable")
+    def test_flush_rotates_large_event_files(self) -> None:
+        with log_event.EventWriter(self.out, max_segment_bytes=200) as writer:
+            for n in range(3):
+                writer.emit("gate", "pass", f"m{n}", context={"pad": "x" * 100})
+        self.assertFalse(self.out.exists())
+        segments = sorted(self.out.with_name("events.segments").glob("*.jsonl"))
+        self.assertEqual([path.name for path in segments], ["000001.jsonl"])
+        with log_event.EventWriter(self.out, max_segment_bytes=200) as writer:
+            writer.emit("gate", "pass", "small")
+        self.assertEqual([e["message"] for e in self._read()], ["small"])
+        store = log_event.EventStore(self.out)
+        self.assertEqual([e["message"] for e in store.query(type="gate")], ["m0", "m1", "m2", "small"])
+
+    def test_cli_batch_writes_all_specs(self) -> None:
+        specs = "\n".join(
+            [
+                json.dumps({"type": "stage", "status": "pass", "message": "a", "task_id": "T-1"}),
+                json.dumps({"type": "stage", "status": "fail", "message": "b"}),
+            ]
+        )
+        result = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "log_event.py"), "--batch", "-", "--out", str(self.out)],
+            input=specs,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual([(e["message"], e.get("task_id")) for e in self._read()], [("a", "T-1"), ("b", None)])
+
+    def test_cli_batch_rejects_incomplete_spec(self) -> None:
+        result = subprocess.run(
+            [sys.executable, str(REPO_ROOT / "scripts" / "log_event.py"), "--batch", "-", "--out", str(self.out)],
+            input='{"type": "stage", "status": "pass"}\n',
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("missing 'message'", result.stderr)
+        self.assertFalse(self.out.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,299 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from scripts import preflight
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+AGENTS = textwrap.dedent(
+    """\
+    patterns:
+      - planning
+      - tool-use
+    agents:
+      - name: Planner
+        supports_patterns:
+          - planning
+        allowed_phases:
+          - planning
+          - correction
+        side_effects: forbidden
+      - name: Execution
+        supports_patterns:
+          - tool-use
+        allowed_phases:
+          - execution
+          - correction
+        side_effects: allowed
+    """
+)
+
+TODO = textwrap.dedent(
+    """\
+    # Todo (CERES template)
+
+    ## Bugs
+
+    ## Workflow Governance
+
+    ## Current Focus
+    - [ ] Do a thing
+
+    ## Next Features & Updates
+
+    ## Backlog
+    """
+)
+
+RUN_COMPONENT = textwrap.dedent(
+    """\
+    #!/usr/bin/env bash
+    set -euo pipefail
+    ROOT="$(CDPATH= cd -- "$(dirname -- "${BASH_SOURCE[0]}")/.." && pwd)"
+    cd "$ROOT/$1"
+    eval "$2"
+    """
+)
+
+
+def build_hub(repo: Path) -> None:
+    (repo / "scripts").mkdir(parents=True)
+    for name in ("preflight.py", "log_event.py", "policy_guard.py", "yaml_loader.py", "workspace_snapshot.py", "session_daemon.py"):
+        shutil.copy(REPO_ROOT / "scripts" / name, repo / "scripts" / name)
+    shutil.copytree(REPO_ROOT / "prompt-debugger", repo / "prompt-debugger")
+    (repo / "observability").mkdir()
+    for name in ("__init__.py", "jsonl_append.py"):
+        shutil.copy(REPO_ROOT / "observability" / name, repo / "observability" / name)
+    component = repo / "governance-orchestrator" / "scripts"
+    component.mkdir(parents=True)
+    for name in ("validate-governance-contracts.py", "enforce-lifecycle.py", "todo_tasks.py", "yaml_loader.py", "schema_registry.py"):
+        shutil.copy(REPO_ROOT / "governance-orchestrator" / "scripts" / name, component / name)
+    (repo / "governance-orchestrator" / "logs").mkdir()
+    (repo / "governance").mkdir()
+    shutil.copy(REPO_ROOT / "governance" / "inference-phases.yaml", repo / "governance")
+    shutil.copytree(REPO_ROOT / "schemas", repo / "schemas")
+    shutil.copy(REPO_ROOT / "ceres.policy.yaml", repo / "ceres.policy.yaml")
+
+    run_component = repo / "scripts" / "run-component.sh"
+    run_component.write_text(RUN_COMPONENT, encoding="utf-8")
+    run_component.chmod(0o755)
+
+    (repo / "AGENTS.md").write_text(AGENTS, encoding="utf-8")
+    (repo / "todo.md").write_text(TODO, encoding="utf-8")
+    (repo / "todo-inbox.md").write_text("Implement the signup form validation rules\n", encoding="utf-8")
+    (repo / "gap-ledger.json").write_text(json.dumps({"gaps": []}), encoding="utf-8")
+    (repo / "objective-contract.json").write_text(
+        json.dumps({"goal": "g", "status": "committed", "spec_id": "spec-1"}), encoding="utf-8"
+    )
+    elicitation = repo / "specs" / "elicitation"
+    elicitation.mkdir(parents=True)
+    (elicitation / "spec.md").write_text(
+        "---\nspec_id: spec-1\nready_for_planning: true\nblocking_unknowns: []\n---\n",
+        encoding="utf-8",
+    )
+
+
+def run_preflight(repo: Path, *extra: str, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env["CERES_FAST_START"] = "0"
+    for name in ("CERES_HOME", "CERES_WORKSPACE", "CERES_STRICT", "CERES_PREFLIGHT_IN_PROCESS"):
+        env.pop(name, None)
+    env.update(extra_env or {})
+    return subprocess.run(
+        [sys.executable, str(repo / "scripts" / "preflight.py"), *extra],
+        cwd=repo,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+class PreflightInProcessTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name) / "hub"
+        build_hub(self.repo)
+        self.events = self.repo / "governance-orchestrator" / "logs" / "events.jsonl"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _run(self, *extra: str, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+        return run_preflight(self.repo, *extra, extra_env=extra_env)
+
+    def _take_events(self) -> list:
+        if not self.events.exists():
+            return []
+        events = [json.loads(line) for line in self.events.read_text(encoding="utf-8").splitlines()]
+        self.events.unlink()
+        for event in events:
+            event.pop("timestamp")
+        return events
+
+    def _assert_parity(self, *extra: str) -> subprocess.CompletedProcess:
+        report = self.repo / "logs" / "prompt-debug-report.yaml"
+        legacy = self._run("--no-cache", *extra)
+        legacy_events = self._take_events()
+        legacy_report = report.read_text(encoding="utf-8") if report.exists() else None
+
+        fast = self._run("--no-cache", "--in-process", *extra)
+        self.assertEqual(fast.returncode, legacy.returncode)
+        self.assertEqual(fast.stdout, legacy.stdout)
+        self.assertEqual(fast.stderr, legacy.stderr)
+        self.assertEqual(self._take_events(), legacy_events)
+        fast_report = report.read_text(encoding="utf-8") if report.exists() else None
+        self.assertEqual(fast_report, legacy_report)
+        return fast
+
+    def test_happy_path_matches_subprocess_chain(self) -> None:
+        result = self._assert_parity()
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Preflight checks passed (execute mode).", result.stdout)
+
+    def test_contract_failure_matches_subprocess_chain(self) -> None:
+        result = self._assert_parity("--phase", "planning")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Agent Execution not allowed in phase planning", result.stderr)
+
+    def test_lifecycle_failure_matches_subprocess_chain(self) -> None:
+        (self.repo / "todo.md").write_text("# Todo (CERES template)\n", encoding="utf-8")
+        result = self._assert_parity()
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Lifecycle gate failed", result.stderr)
+
+    def test_in_process_does_not_need_run_component(self) -> None:
+        (self.repo / "scripts" / "run-component.sh").unlink()
+        result = self._run("--in-process")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+class PreflightStageCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name) / "hub"
+        build_hub(self.repo)
+        self.cache = self.repo / ".cache" / "preflight" / "stages.json"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _run(self, *extra: str, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+        return run_preflight(self.repo, *extra, extra_env=extra_env)
+
+    def _mark_cached_lifecycle(self) -> None:
+        data = json.loads(self.cache.read_text(encoding="utf-8"))
+        data["stages"]["lifecycle"]["result"]["stdout"] = "Lifecycle gate passed (cached)\n"
+        self.cache.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_unchanged_inputs_reuse_cached_verdicts(self) -> None:
+        first = self._run("--in-process")
+        self.assertEqual(first.returncode, 0, first.stderr)
+        stages = json.loads(self.cache.read_text(encoding="utf-8"))["stages"]
+        self.assertEqual(sorted(stages), ["contracts", "lifecycle", "policy_guard", "prompt_debugger"])
+
+        self._mark_cached_lifecycle()
+        second = self._run("--in-process")
+        self.assertEqual(second.returncode, 0, second.stderr)
+        self.assertIn("Lifecycle gate passed (cached)", second.stdout)
+
+    def test_changed_input_invalidates_stage(self) -> None:
+        self.assertEqual(self._run().returncode, 0)
+        (self.repo / "todo.md").write_text("# Todo (CERES template)\n", encoding="utf-8")
+        result = self._run()
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Lifecycle gate failed", result.stderr)
+
+    def test_nested_core_inputs_invalidate_contracts(self) -> None:
+        core = self.repo / ".ceres" / "core"
+        core.mkdir(parents=True)
+        shutil.move(str(self.repo / "governance-orchestrator"), str(core / "governance-orchestrator"))
+        for name in ("governance", "schemas"):
+            shutil.copytree(self.repo / name, core / name)
+        shutil.copy(self.repo / "AGENTS.md", core / "AGENTS.md")
+        first = self._run("--in-process")
+        self.assertEqual(first.returncode, 0, first.stderr)
+
+        (core / "AGENTS.md").write_text("patterns: []\nagents: []\n", encoding="utf-8")
+        result = self._run("--in-process")
+        self.assertEqual(result.returncode, 1, result.stdout)
+        self.assertIn("Agent not defined", result.stderr)
+
+    def test_no_cache_and_strict_bypass_cache(self) -> None:
+        self.assertEqual(self._run("--in-process").returncode, 0)
+        self._mark_cached_lifecycle()
+        for result in (
+            self._run("--in-process", "--no-cache"),
+            self._run("--in-process", extra_env={"CERES_STRICT": "1"}),
+        ):
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertNotIn("(cached)", result.stdout)
+
+
+class PreflightStageGraphTests(unittest.TestCase):
+    def test_independent_stages_run_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def meet(config, deps):
+            barrier.wait()
+            return threading.get_ident()
+
+        stages = [preflight.Stage(name, meet) for name in ("a", "b", "c")]
+        outcomes = preflight.run_stage_graph(stages, None, jobs=3)
+        self.assertTrue(all(outcome.ok for outcome in outcomes.values()))
+        self.assertEqual(len({outcome.value for outcome in outcomes.values()}), 3)
+
+    def test_failed_dependency_skips_downstream(self) -> None:
+        def fail(config, deps):
+            raise preflight.GateFailure(None, SystemExit(3))
+
+        stages = [
+            preflight.Stage("a", fail),
+            preflight.Stage("b", lambda config, deps: "ok"),
+            preflight.Stage("c", lambda config, deps: deps["b"], ("a", "b")),
+        ]
+        outcomes = preflight.run_stage_graph(stages, None, jobs=2)
+        self.assertFalse(outcomes["a"].ok)
+        self.assertEqual(outcomes["b"].value, "ok")
+        self.assertTrue(outcomes["c"].skipped)
+
+    def test_report_uses_declaration_order_not_completion_order(self) -> None:
+        slow_started = threading.Event()
+
+        def slow(config, deps):
+            slow_started.wait(5)
+            print("first")
+
+        def fast(config, deps):
+            print("second")
+            slow_started.set()
+            raise preflight.GateFailure(None, SystemExit(2), "fast failed\n")
+
+        stages = [preflight.Stage("slow", slow), preflight.Stage("fast", fast)]
+        outcomes = preflight.run_stage_graph(stages, None, jobs=2)
+        stdout, stderr = StringIO(), StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            with self.assertRaises(SystemExit) as ctx:
+                preflight.report_outcomes(stages, outcomes, None)
+        self.assertEqual(ctx.exception.code, 2)
+        self.assertEqual(stdout.getvalue(), "first\nsecond\n")
+        self.assertEqual(stderr.getvalue(), "fast failed\n")
+
+    def test_unsatisfiable_dependency_is_reported(self) -> None:
+        stages = [preflight.Stage("a", lambda config, deps: None, ("missing",))]
+        with self.assertRaises(ValueError):
+            preflight.run_stage_graph(stages, None, jobs=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
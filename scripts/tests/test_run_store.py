@@ -0,0 +1,187 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "governance-orchestrator" / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+import run_store  # noqa: E402
+
+
+def record(run_id: str, day: str, **fields) -> dict:
+    payload = {
+        "run_id": run_id,
+        "timestamp": f"{day}T10:00:00Z",
+        "concept_id": "concept-a",
+        "skill_id": "skill-a",
+        "spec_id": "spec-a",
+        "files_touched": [],
+        "commands_executed": [],
+        "outcome": "pass",
+        "fix_loop_count": 0,
+        "synchronizations_used": [],
+        "push_hash": "abcdef1",
+    }
+    payload.update(fields)
+    return payload
+
+
+class RunStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.runs = self.root / "runs"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _write(self, *records: dict, age: float = 60.0) -> Path:
+        first = records[0]
+        path = self.runs / first["timestamp"][:10] / f"{first['run_id']}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(json.dumps(item) + "\n" for item in records), encoding="utf-8")
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def _store(self) -> run_store.RunStore:
+        store = run_store.RunStore(self.runs)
+        self.addCleanup(store.close)
+        return store
+
+    def _script(self, name: str, payload: dict) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / name)],
+            cwd=self.root,
+            input=json.dumps(payload),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    def test_writers_update_index(self) -> None:
+        created = self._script("create-run-record.py", record("run-1", "2025-01-02", outcome="fail", fix_loop_count=1))
+        self.assertEqual(created.returncode, 0, created.stderr)
+        self.assertTrue((self.root / ".cache" / "runs" / "index.sqlite").is_file())
+        appended = self._script(
+            "append-run-outcome.py",
+            record("run-1", "2025-01-02", timestamp="2025-01-02T12:00:00Z", fix_loop_count=2),
+        )
+        self.assertEqual(appended.returncode, 0, appended.stderr)
+
+        store = self._store()
+        [run] = store.query(skill_id="skill-a")
+        self.assertEqual(
+            (run["run_id"], run["timestamp"], run["outcome"], run["fix_loop_count"], run["records"]),
+            ("run-1", "2025-01-02T10:00:00Z", "pass", 2, 2),
+        )
+
+    def test_refresh_rereads_only_changed_files_in_range(self) -> None:
+        self._write(record("run-1", "2025-01-01"))
+        self._write(record("run-2", "2025-01-02"))
+        self._write(record("run-3", "2025-01-03"))
+        removed = self._write(record("run-4", "2025-01-04"))
+        self.assertEqual(len(self._store().query()), 4)
+
+        self._write(record("run-2", "2025-01-02", outcome="fail"), age=30.0)
+        self._write(record("run-5", "2025-01-03"))
+        removed.unlink()
+        store = self._store()
+        runs = store.query(since="2025-01-02", until="2025-01-03")
+        self.assertEqual([(run["run_id"], run["outcome"]) for run in runs], [("run-2", "fail"), ("run-3", "pass"), ("run-5", "pass")])
+        self.assertEqual(store.reads, 2)
+        self.assertEqual(len(store.query(since="2025-01-03T10:00:00Z", until="2025-01-03")), 2)
+        self.assertEqual([run["run_id"] for run in store.query()], ["run-1", "run-2", "run-3", "run-5"])
+        self.assertEqual(store.reads, 2)
+
+    def test_aggregations(self) -> None:
+        self._write(record("run-1", "2025-02-01", fix_loop_count=0))
+        self._write(record("run-2", "2025-02-01", fix_loop_count=2, outcome="fail"))
+        self._write(record("run-3", "2025-02-02", fix_loop_count=2, skill_id="skill-b", concept_id="concept-b"))
+        self._write(record("run-4", "2025-02-03", fix_loop_count=4, outcome="fail"))
+
+        store = self._store()
+        self.assertEqual(
+            store.fix_loops(until="2025-02-02"),
+            [
+                {"skill_id": "skill-a", "runs": 2, "max": 2, "histogram": {"0": 1, "2": 1}, "mean": 1.0},
+                {"skill_id": "skill-b", "runs": 1, "max": 2, "histogram": {"2": 1}, "mean": 2.0},
+            ],
+        )
+        rates = {row["concept_id"]: row["failure_rate"] for row in store.failure_rate()}
+        self.assertEqual(rates, {"concept-a": round(2 / 3, 4), "concept-b": 0.0})
+        with self.assertRaises(ValueError):
+            store.failure_rate(by="files_touched")
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = run_store.main(["--runs", str(self.runs), "failure-rate", "--since", "2025-02-03"])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.getvalue(), "concept-a\truns=1\tfailed=1\trate=100.0%\n")
+
+    def test_damaged_index_is_rebuilt(self) -> None:
+        self._write(record("run-1", "2025-03-01"))
+        index = self.root / ".cache" / "runs" / "index.sqlite"
+        index.parent.mkdir(parents=True)
+        index.write_bytes(b"not a database" * 100)
+        self.assertEqual(len(self._store().query()), 1)
+
+    def test_locked_index_is_kept(self) -> None:
+        self._write(record("run-1", "2025-03-01"))
+        self.assertEqual(len(self._store().query()), 1)
+        index = self.root / ".cache" / "runs" / "index.sqlite"
+        inode = index.stat().st_ino
+        open_index = run_store.RunStore._open
+
+        def locked(target: str) -> sqlite3.Connection:
+            if target != ":memory:":
+                raise sqlite3.OperationalError("database is locked")
+            return open_index(target)
+
+        with mock.patch.object(run_store.RunStore, "_open", staticmethod(locked)):
+            self.assertEqual(len(self._store().query()), 1)
+        self.assertEqual(index.stat().st_ino, inode)
+
+    def test_concurrent_stores_create_schema_once(self) -> None:
+        self._write(record("run-1", "2025-03-01"))
+        counts: list = []
+        errors: list = []
+
+        def worker() -> None:
+            store = run_store.RunStore(self.runs)
+            try:
+                version = store._connect().execute("PRAGMA user_version").fetchone()[0]
+                counts.append((len(store.query()), version))
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+            finally:
+                store.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(counts, [(1, run_store.INDEX_VERSION)] * 8)
+
+    def test_component_copies_match(self) -> None:
+        hub = (SCRIPTS_DIR / "run_store.py").read_text(encoding="utf-8")
+        for component in ("readme-spec-engine", "spec-compiler", "ui-constitution", "ui-pattern-registry"):
+            copy = REPO_ROOT / component / "scripts" / "run_store.py"
+            self.assertEqual(copy.read_text(encoding="utf-8"), hub)
+
+
+if __name__ == "__main__":
+    unittest.main()
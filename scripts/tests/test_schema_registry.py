@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "governance-orchestrator" / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+import schema_registry  # noqa: E402
+
+RECORD_SCHEMA = {
+    "type": "object",
+    "required": ["id", "kind"],
+    "additionalProperties": False,
+    "properties": {
+        "id": {"type": "string"},
+        "kind": {"type": "string", "enum": ["a", "b"]},
+        "count": {"type": "integer"},
+        "tags": {"type": "array"},
+    },
+}
+
+
+class SchemaRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.schemas = self.root / "schemas"
+        self.schemas.mkdir()
+        self.cache = self.root / ".cache" / "schema-registry.json"
+        self.schema_path = self._write("record.schema.json", RECORD_SCHEMA)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _write(self, name: str, payload: object) -> Path:
+        path = self.schemas / name
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+    def _registry(self) -> "schema_registry.SchemaRegistry":
+        return schema_registry.SchemaRegistry([self.schemas], cache_path=self.cache)
+
+    def test_record_checker_reports_first_violation(self) -> None:
+        checker = self._registry().record_checker("record.schema.json")
+        cases = [
+            ({"id": "x", "kind": "a", "count": 2}, None),
+            ({"id": "x"}, "R missing required field: kind"),
+            ({"id": "x", "kind": "a", "extra": 1}, "R has unknown field: extra"),
+            ({"id": "x", "kind": "a", "count": "2"}, "R field count must be integer"),
+            ({"id": "x", "kind": "c"}, "R field kind must be one of ['a', 'b']"),
+        ]
+        for record, expected in cases:
+            self.assertEqual(checker.first_error(record, "R"), expected)
+
+    def test_compiled_forms_are_shared_by_content_hash(self) -> None:
+        registry = self._registry()
+        copy = self._write("copy.schema.json", RECORD_SCHEMA)
+        self.assertIs(registry.record_checker("record.schema.json"), registry.record_checker(copy))
+        self.assertEqual(registry.digest(self.schema_path), registry.digest(copy))
+        with self.assertRaises(schema_registry.SchemaError):
+            registry.resolve("missing.schema.json")
+
+    def test_persisted_plans_are_reused_until_schema_changes(self) -> None:
+        self._registry().record_checker("record.schema.json")
+        data = json.loads(self.cache.read_text(encoding="utf-8"))
+        self.assertEqual(len(data["plans"]), 1)
+
+        # Same size and mtime: the persisted digest and plan are trusted without re-reading.
+        stat = self.schema_path.stat()
+        self.schema_path.write_text("X" * stat.st_size, encoding="utf-8")
+        os.utime(self.schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        checker = self._registry().record_checker("record.schema.json")
+        self.assertEqual(checker.required, ["id", "kind"])
+
+        changed = dict(RECORD_SCHEMA, required=["id"])
+        self._write("record.schema.json", changed)
+        os.utime(self.schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(self._registry().record_checker("record.schema.json").required, ["id"])
+
+    def test_python_validator_is_imported_once(self) -> None:
+        module_path = self.root / "validator.py"
+        module_path.write_text("LOADS = []\nLOADS.append(1)\n", encoding="utf-8")
+        registry = self._registry()
+        first = registry.python_validator(module_path, "registry_test_validator")
+        self.assertIs(registry.python_validator(module_path, "registry_test_validator"), first)
+        self.assertEqual(first.LOADS, [1])
+
+    def test_component_copies_match(self) -> None:
+        hub = (SCRIPTS_DIR / "schema_registry.py").read_text(encoding="utf-8")
+        for component in ("readme-spec-engine", "ui-pattern-registry"):
+            copy = REPO_ROOT / component / "scripts" / "schema_registry.py"
+            self.assertEqual(copy.read_text(encoding="utf-8"), hub)
+
+
+if __name__ == "__main__":
+    unittest.main()
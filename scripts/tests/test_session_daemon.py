@@ -0,0 +1,91 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import session_daemon
+from scripts.tests.test_preflight import REPO_ROOT, build_hub
+
+
+@unittest.skipUnless(hasattr(session_daemon.socket, "AF_UNIX"), "Unix domain sockets unavailable")
+class SessionDaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name) / "hub"
+        build_hub(self.repo)
+        shutil.copy(REPO_ROOT / "scripts" / "preflight.sh", self.repo / "scripts" / "preflight.sh")
+        self.socket = self.repo / session_daemon.SOCKET_NAME
+        self.env = {name: value for name, value in os.environ.items() if not name.startswith("CERES_")}
+        self.env["CERES_FAST_START"] = "0"
+
+    def tearDown(self) -> None:
+        self._daemon("stop")
+        self.tmp.cleanup()
+
+    def _run(self, *cmd: str, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            list(cmd),
+            cwd=self.repo,
+            env={**self.env, **(extra_env or {})},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    def _daemon(self, action: str) -> subprocess.CompletedProcess:
+        return self._run(sys.executable, str(self.repo / "scripts" / "session_daemon.py"), action)
+
+    def _preflight(self, *extra: str, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+        return self._run(str(self.repo / "scripts" / "preflight.sh"), "--no-cache", *extra, extra_env=extra_env)
+
+    def _served(self) -> int:
+        return session_daemon.request({"command": "ping"}, self.socket)["served"]
+
+    def test_forwarded_preflight_matches_in_process_run(self) -> None:
+        expected = self._preflight("--in-process")
+        self.assertEqual(expected.returncode, 0, expected.stderr)
+
+        started = self._daemon("start")
+        self.assertEqual(started.returncode, 0, started.stderr)
+        self.assertEqual(self.socket.stat().st_mode & 0o077, 0)
+        for _ in range(2):
+            result = self._preflight()
+            self.assertEqual((result.returncode, result.stdout, result.stderr), (0, expected.stdout, expected.stderr))
+        self.assertEqual(self._served(), 2)
+
+        bypassed = self._preflight(extra_env={"CERES_SESSION_DAEMON": "0"})
+        self.assertEqual(bypassed.returncode, 0, bypassed.stderr)
+        self.assertEqual(self._served(), 2)
+
+        (self.repo / "objective-contract.json").write_text('{"goal": "g", "status": "draft"}', encoding="utf-8")
+        failed = self._preflight()
+        self.assertEqual(failed.returncode, 1)
+        self.assertIn("must be 'committed'", failed.stderr)
+
+    def test_changed_source_falls_back_and_stops_daemon(self) -> None:
+        self.assertEqual(self._daemon("start").returncode, 0)
+        script = self.repo / "scripts" / "preflight.py"
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        result = self._preflight()
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Preflight checks passed (execute mode).", result.stdout)
+        deadline = time.monotonic() + 5
+        while self.socket.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(self.socket.exists())
+
+    def test_forward_without_daemon_runs_in_process(self) -> None:
+        with mock.patch.dict(os.environ, {"CERES_WORKSPACE": str(self.repo)}):
+            self.assertIsNone(session_daemon.forward("status", []))
+        self.assertIn("not running", self._daemon("status").stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
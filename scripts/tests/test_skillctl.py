@@ -0,0 +1,388 @@
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "governance-orchestrator" / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+import skillctl  # noqa: E402
+
+MANIFEST = """apiVersion: skill/v1
+kind: Skill
+
+id: {skill_id}
+name: {skill_id}
+version: 0.1.0
+description: Test skill.
+
+governance:
+  specId: "SPEC-TEST"
+  oneSkillPerCommit: true
+
+runtime:
+  type: command
+  command:
+    - python3
+    - impl/run.py
+{worker}  cwd: "."
+  timeoutMs: 10000
+
+io:
+  inputSchema: schemas/input.schema.json
+  outputSchema: schemas/output.schema.json
+  input:
+    transport: stdin
+    encoding: json
+  output:
+    transport: stdout
+    encoding: json
+
+determinism:
+  network: forbidden
+  time: forbidden
+  randomness: forbidden
+
+security:
+  access:
+    filesystem:
+      read: []
+      write: []
+    env:
+      read: []
+    subprocess:
+      allowed: false
+    network:
+      allowed: false
+
+observability:
+  logs:
+    format: jsonl
+    destination: stderr
+  runReport:
+    enabled: true
+"""
+
+WORKER = """  worker:
+    command:
+      - python3
+      - impl/run.py
+      - --worker
+"""
+
+# `mode` drives the failure cases: fail (skill error), sleep (outlives the timeout),
+# crash (worker process exits), badout (output violates the schema).
+IMPL = """import json
+import sys
+import time
+
+
+def handle(payload):
+    mode = payload.get("mode", "ok")
+    time.sleep(payload.get("delayMs", 0) / 1000.0)
+    if mode == "fail":
+        raise ValueError(f"cannot handle {payload['value']}")
+    if mode == "sleep":
+        time.sleep(30)
+    if mode == "crash":
+        sys.exit(3)
+    if mode == "badout":
+        return {"value": payload["value"]}
+    return {"value": payload["value"], "doubled": payload["value"] * 2}
+
+
+if sys.argv[1:] == ["--worker"]:
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            response = {"id": request["id"], "output": handle(request["input"])}
+        except ValueError as e:
+            response = {"id": request["id"], "error": str(e)}
+        sys.stdout.write(json.dumps(response) + "\\n")
+        sys.stdout.flush()
+else:
+    try:
+        sys.stdout.write(json.dumps(handle(json.load(sys.stdin))))
+    except ValueError as e:
+        sys.stderr.write(f"{e}\\n")
+        sys.exit(1)
+"""
+
+INPUT_SCHEMA = {
+    "type": "object",
+    "required": ["value"],
+    "properties": {
+        "value": {"type": "integer"},
+        "mode": {"enum": ["ok", "fail", "sleep", "crash", "badout"]},
+        "delayMs": {"type": "integer", "minimum": 0},
+    },
+    "additionalProperties": False,
+}
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "required": ["value", "doubled"],
+    "properties": {"value": {"type": "integer"}, "doubled": {"type": "integer"}},
+    "additionalProperties": False,
+}
+
+
+def build_repo(root: Path) -> None:
+    """A repo with `echo` (declares runtime.worker) and `plain` (one-shot only)."""
+    (root / "AGENTS.md").write_text("# Test\n", encoding="utf-8")
+    schema_dir = root / "skills" / "_schema"
+    schema_dir.mkdir(parents=True)
+    shutil.copy(REPO_ROOT / "governance-orchestrator" / "skills" / "_schema" / "skill.schema.json", schema_dir)
+    for slug, worker in (("echo", True), ("plain", False)):
+        skill_dir = root / "skills" / slug
+        (skill_dir / "impl").mkdir(parents=True)
+        (skill_dir / "schemas").mkdir()
+        (skill_dir / "impl" / "run.py").write_text(IMPL, encoding="utf-8")
+        (skill_dir / "schemas" / "input.schema.json").write_text(json.dumps(INPUT_SCHEMA), encoding="utf-8")
+        (skill_dir / "schemas" / "output.schema.json").write_text(json.dumps(OUTPUT_SCHEMA), encoding="utf-8")
+        manifest = MANIFEST.format(
+            skill_id=f"test.{slug}",
+            worker=WORKER if worker else "",
+        )
+        (skill_dir / "skill.yaml").write_text(manifest, encoding="utf-8")
+
+
+def reports(stderr: str, event: str) -> list:
+    found = []
+    for line in stderr.splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and record.get("event") == event:
+            found.append(record)
+    return found
+
+
+class SkillRepoTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmpdir.name)
+        build_repo(self.repo)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _skillctl(self, *args: str, stdin: str = "") -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / "skillctl.py"), "--repo-root", str(self.repo), *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+
+
+
+@unittest.skipIf(skillctl.jsonschema is None, "jsonschema not installed")
+class SkillctlServeTests(SkillRepoTestCase):
+    def _serve(self, requests: list, *args: str) -> tuple:
+        lines = [item if isinstance(item, str) else json.dumps(item) for item in requests]
+        result = self._skillctl("serve", *args, stdin="\n".join(lines) + "\n")
+        return result, [json.loads(line) for line in result.stdout.splitlines()]
+
+    def _runtime(self, slug: str) -> "skillctl._SkillRuntime":
+        return skillctl._SkillRuntime(self.repo, f"skills/{slug}", False)
+
+    def test_serve_answers_each_request_in_order_on_a_warm_worker(self) -> None:
+        result, responses = self._serve(
+            [
+                {"id": 1, "skill": "test.echo", "input": {"value": 1}},
+                {"id": "two", "skill": "skills/echo", "input": {"value": 2}},
+                {"id": 3, "skill": "test.echo", "input": {"value": 3}},
+                {"id": 4, "skill": "test.plain", "input": {"value": 4}},
+            ]
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual([r["id"] for r in responses], [1, "two", 3, 4])
+        self.assertEqual([r["status"] for r in responses], ["success"] * 4)
+        self.assertEqual([r["output"]["doubled"] for r in responses], [2, 4, 6, 8])
+
+        runs = reports(result.stderr, "skill_run_report")
+        self.assertEqual([r["mode"] for r in runs], ["worker", "worker", "worker", "oneshot"])
+        # Pools are keyed by request target: `skills/echo` gets its own, `test.echo` reuses one.
+        self.assertEqual([r["worker"]["requests"] for r in runs if r["skill"]["path"] == "skills/echo"], [1, 1, 2])
+
+    def test_serve_replies_with_errors_and_keeps_going(self) -> None:
+        result, responses = self._serve(
+            [
+                "{not json",
+                {"id": 1, "input": {"value": 1}},
+                {"id": 2, "skill": "test.missing", "input": {"value": 1}},
+                {"id": 3, "skill": "test.echo", "input": {"value": "x"}},
+                {"id": 4, "skill": "test.echo", "input": {"value": 4, "mode": "fail"}},
+                {"id": 5, "skill": "test.echo", "input": {"value": 5, "mode": "badout"}},
+                {"id": 6, "skill": "test.plain", "input": {"value": 6, "mode": "fail"}},
+                {"id": 7, "skill": "test.echo", "input": {"value": 7}},
+            ]
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual([r["id"] for r in responses], [None, None, 2, 3, 4, 5, 6, 7])
+        self.assertEqual([r["status"] for r in responses], ["error"] * 7 + ["success"])
+        errors = [r.get("error", "") for r in responses]
+        self.assertIn("string 'skill'", errors[1])
+        self.assertIn("'x' is not of type 'integer'", errors[3])
+        self.assertEqual(errors[4], "Skill worker error: cannot handle 4")
+        self.assertTrue(errors[5].startswith("'doubled' is a required property"), errors[5])
+        self.assertEqual(errors[6], "Skill exited with code 1")
+        self.assertIn("cannot handle 6", result.stderr)
+        self.assertEqual(responses[7]["output"], {"value": 7, "doubled": 14})
+
+    def test_no_workers_runs_every_request_one_shot(self) -> None:
+        result, responses = self._serve([{"id": 1, "skill": "test.echo", "input": {"value": 1}}], "--no-workers")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(responses[0]["output"], {"value": 1, "doubled": 2})
+        self.assertEqual([r["mode"] for r in reports(result.stderr, "skill_run_report")], ["oneshot"])
+
+    def test_oneshot_fallback_for_skill_without_worker(self) -> None:
+        runtime = self._runtime("plain")
+        self.assertIsNone(runtime.worker_command)
+        result = skillctl._execute(runtime, {"value": 5})
+        self.assertEqual((result["status"], result["output"]), ("success", {"value": 5, "doubled": 10}))
+        self.assertEqual(result["report"]["mode"], "oneshot")
+        self.assertNotIn("worker", result["report"])
+
+    def test_worker_is_reused_across_requests(self) -> None:
+        pool = skillctl._WorkerPool(self._runtime("echo"))
+        self.addCleanup(pool.close)
+        self.assertEqual(pool.call({"value": 1}, 5000), {"value": 1, "doubled": 2})
+        worker = pool.idle.queue[0]
+        with self.assertRaisesRegex(skillctl.SkillctlError, "Skill worker error: cannot handle 2"):
+            pool.call({"value": 2, "mode": "fail"}, 5000)
+        self.assertEqual(pool.call({"value": 3}, 5000), {"value": 3, "doubled": 6})
+        self.assertIs(pool.idle.queue[0], worker)
+        self.assertEqual((pool.spawned, worker.next_id), (1, 3))
+
+    def test_timed_out_worker_is_killed_and_respawned(self) -> None:
+        pool = skillctl._WorkerPool(self._runtime("echo"))
+        self.addCleanup(pool.close)
+        pool.call({"value": 1}, 5000)
+        first = pool.idle.queue[0]
+        with self.assertRaisesRegex(skillctl.SkillctlError, "timed out after 200ms"):
+            pool.call({"value": 2, "mode": "sleep"}, 200)
+        self.assertIsNotNone(first.proc.poll())
+        self.assertEqual((pool.spawned, pool.idle.qsize()), (0, 0))
+
+        self.assertEqual(pool.call({"value": 3}, 5000), {"value": 3, "doubled": 6})
+        second = pool.idle.queue[0]
+        self.assertIsNot(second, first)
+        with self.assertRaisesRegex(skillctl.SkillctlError, "exited with code 3"):
+            pool.call({"value": 4, "mode": "crash"}, 5000)
+        self.assertEqual(pool.spawned, 0)
+        self.assertEqual(pool.call({"value": 5}, 5000), {"value": 5, "doubled": 10})
+        self.assertIsNot(pool.idle.queue[0], second)
+
+    def test_serve_reports_timeouts_and_recovers(self) -> None:
+        result, responses = self._serve(
+            [
+                {"id": 1, "skill": "test.echo", "input": {"value": 1, "mode": "sleep"}},
+                {"id": 2, "skill": "test.echo", "input": {"value": 2}},
+            ],
+            "--timeout-ms",
+            "300",
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(responses[0]["error"], "Skill worker timed out after 300ms")
+        self.assertEqual(responses[1]["output"], {"value": 2, "doubled": 4})
+        runs = reports(result.stderr, "skill_run_report")
+        self.assertEqual([r["worker"]["requests"] for r in runs], [1, 2])
+
+
+@unittest.skipIf(skillctl.jsonschema is None, "jsonschema not installed")
+class SkillctlBatchTests(SkillRepoTestCase):
+    def _batch(self, items: list, *args: str) -> tuple:
+        lines = [item if isinstance(item, str) else json.dumps(item) for item in items]
+        batch = self.repo / "batch.jsonl"
+        batch.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        result = self._skillctl("run", "skills/echo", "--batch", str(batch), *args)
+        [report] = reports(result.stderr, "skill_batch_report")
+        return result, [json.loads(line) for line in result.stdout.splitlines()], report
+
+    @staticmethod
+    def _without_timings(results: list) -> list:
+        return [{key: value for key, value in item.items() if key != "durationMs"} for item in results]
+
+    def test_results_keep_input_order_with_parallel_jobs(self) -> None:
+        # Earlier items sleep longer, so they finish last.
+        items = [{"value": i, "delayMs": (8 - i) * 40} for i in range(8)]
+        result, results, report = self._batch(items, "--jobs", "4")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual([item["index"] for item in results], list(range(8)))
+        self.assertEqual([item["output"]["value"] for item in results], list(range(8)))
+        self.assertEqual((report["mode"], report["jobs"], report["total"]), ("worker", 4, 8))
+
+    def test_failing_items_get_their_own_error_lines(self) -> None:
+        items = [{"value": 0}, {"value": 1, "mode": "fail"}, "{not json", {"value": "x"}, {"value": 4}]
+        result, results, report = self._batch(items, "--jobs", "2")
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual([item["status"] for item in results], ["success", "error", "error", "error", "success"])
+        self.assertEqual(results[1]["error"], "Skill worker error: cannot handle 1")
+        self.assertTrue(results[2]["error"].startswith("Input is not valid UTF-8 JSON"))
+        self.assertIn("'x' is not of type 'integer'", results[3]["error"])
+        self.assertEqual(results[4]["output"], {"value": 4, "doubled": 8})
+        self.assertEqual(
+            {key: report[key] for key in ("total", "succeeded", "failed", "jobs", "mode")},
+            {"total": 5, "succeeded": 2, "failed": 3, "jobs": 2, "mode": "worker"},
+        )
+        self.assertEqual(report["skill"], {"id": "test.echo", "version": "0.1.0", "path": "skills/echo"})
+        self.assertIn("startupMs", report)
+
+    def test_no_workers_matches_worker_mode(self) -> None:
+        items = [{"value": i, "delayMs": (i % 3) * 20} for i in range(6)]
+        warm, warm_results, warm_report = self._batch(items, "--jobs", "3")
+        cold, cold_results, cold_report = self._batch(items, "--jobs", "3", "--no-workers")
+        self.assertEqual((warm.returncode, cold.returncode), (0, 0), cold.stderr)
+        self.assertEqual(self._without_timings(cold_results), self._without_timings(warm_results))
+        self.assertEqual((warm_report["mode"], cold_report["mode"]), ("worker", "oneshot"))
+        self.assertNotIn("startupMs", cold_report)
+        self.assertEqual((cold_report["total"], cold_report["succeeded"]), (6, 6))
+
+    def test_stdin_results_stream_before_eof(self) -> None:
+        proc = subprocess.Popen(
+            [sys.executable, str(SCRIPTS_DIR / "skillctl.py"), "--repo-root", str(self.repo), "run", "skills/echo", "--batch", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self.addCleanup(proc.stderr.close)
+        self.addCleanup(proc.stdout.close)
+        received: list = []
+        try:
+            for value in range(3):
+                proc.stdin.write(json.dumps({"value": value}) + "\n")
+                proc.stdin.flush()
+                reader = threading.Thread(target=lambda: received.append(json.loads(proc.stdout.readline())))
+                reader.start()
+                reader.join(20)
+                self.assertFalse(reader.is_alive(), "result was not written before end of input")
+        finally:
+            proc.stdin.close()
+            proc.wait(60)
+        self.assertEqual([(item["index"], item["output"]["doubled"]) for item in received], [(0, 0), (1, 2), (2, 4)])
+        self.assertEqual(proc.returncode, 0)
+
+    def test_batch_from_stdin_to_output_file(self) -> None:
+        out = self.repo / "results.jsonl"
+        stdin = "\n".join(json.dumps({"value": i}) for i in range(3)) + "\n\n"
+        result = self._skillctl("run", "skills/plain", "--batch", "-", "--output", str(out), stdin=stdin)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "")
+        results = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([item["output"]["doubled"] for item in results], [0, 2, 4])
+        [report] = reports(result.stderr, "skill_batch_report")
+        self.assertEqual((report["mode"], report["total"]), ("oneshot", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
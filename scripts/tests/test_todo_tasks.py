@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from scripts import todo_tasks
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+TODO = """# Todo (CERES template)
+
+## Current Focus
+- [ ] Execute prompt: prompts/prompt-a.md ship it
+- [x] From prompt prompts/prompt-b.md
+  Outcome: reviewed
+- [ ] Execute prompt:
+- [x] Task C (completed locally; pending push hash)
+"""
+
+
+class TodoTasksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        todo_tasks.clear_cache()
+
+    def tearDown(self) -> None:
+        todo_tasks.clear_cache()
+        self.tmp.cleanup()
+
+    def _prompt(self, name: str, classification: str, age: float = 60.0) -> Path:
+        path = self.root / "prompts" / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"# Prompt\n\nClassification: {classification}\n", encoding="utf-8")
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_task_table(self) -> None:
+        table = todo_tasks.parse_tasks(TODO)
+        self.assertEqual([task.line for task in table.tasks], [4, 5, 7, 8])
+        self.assertTrue(table.has_unchecked())
+        self.assertEqual([task.summary for task in table.checked()][1], "Task C (completed locally; pending push hash)")
+        refs = [(task.line, ref.marker, ref.path, ref.outcome) for task, ref in table.prompt_refs()]
+        self.assertEqual(
+            refs,
+            [
+                (4, "Execute prompt", "prompts/prompt-a.md", True),
+                (5, "From prompt", "prompts/prompt-b.md", True),
+                (7, "Execute prompt", None, False),
+            ],
+        )
+        self.assertEqual(table.long_lines(50), [8])
+
+    def test_tables_are_cached_by_content(self) -> None:
+        self.assertIs(todo_tasks.parse_tasks(TODO), todo_tasks.parse_tasks(str(TODO)))
+        todo = self.root / "todo.md"
+        todo.write_text(TODO, encoding="utf-8")
+        table = todo_tasks.load_tasks(todo)
+        self.assertIs(table, todo_tasks.parse_tasks(TODO))
+        self.assertIsNone(todo_tasks.load_tasks(self.root / "missing.md"))
+
+        stat = todo.stat()
+        todo.write_text(TODO.replace("- [ ] Execute prompt:\n", ""), encoding="utf-8")
+        os.utime(todo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(len(todo_tasks.load_tasks(todo).tasks), 3)
+
+    def test_classifier_rereads_only_changed_prompts(self) -> None:
+        atomic = self._prompt("prompt-a.md", "atomic")
+        self._prompt("prompt-b.md", "Decomposable")
+        cache = self.root / ".cache" / "lifecycle" / "prompt-classifications.json"
+
+        classifier = todo_tasks.PromptClassifier(cache)
+        self.assertEqual(classifier.classify(atomic), (True, "atomic"))
+        self.assertEqual(classifier.classify(self.root / "prompts" / "prompt-b.md"), (True, "decomposable"))
+        self.assertEqual(classifier.classify(self.root / "prompts" / "missing.md"), (False, None))
+        classifier.save()
+        self.assertEqual(len(json.loads(cache.read_text(encoding="utf-8"))["prompts"]), 2)
+
+        reloaded = todo_tasks.PromptClassifier(cache)
+        reloaded.classify(atomic)
+        self.assertEqual(reloaded.reads, 0)
+        self._prompt("prompt-a.md", "unknown", age=30.0)
+        self.assertEqual(reloaded.classify(atomic), (True, None))
+        self.assertEqual(reloaded.reads, 1)
+
+    def test_recent_prompts_are_not_persisted(self) -> None:
+        fresh = self._prompt("prompt-a.md", "atomic", age=0.0)
+        cache = self.root / "classifications.json"
+        classifier = todo_tasks.PromptClassifier(cache)
+        classifier.classify(fresh)
+        classifier.save()
+        self.assertEqual(json.loads(cache.read_text(encoding="utf-8"))["prompts"], {})
+
+    def test_component_copy_matches(self) -> None:
+        hub = (REPO_ROOT / "scripts" / "todo_tasks.py").read_text(encoding="utf-8")
+        copy = REPO_ROOT / "governance-orchestrator" / "scripts" / "todo_tasks.py"
+        self.assertEqual(copy.read_text(encoding="utf-8"), hub)
+
+
+if __name__ == "__main__":
+    unittest.main()
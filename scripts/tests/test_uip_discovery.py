@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "governance-orchestrator" / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+import uip_discovery  # noqa: E402
+
+
+class UipDiscoveryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.manifest = self.root / ".cache" / "uip-discovery.json"
+        self._write("ui-artifacts/a.intent.json", {"id": "a"})
+        self._write("ui-artifacts/notes.json", {"ignored": True})
+        self._write("ui-contracts/examples/clicked.json", {"type": "action.clicked"})
+        self._write("deep/b.event.json", {"type": "form.submitted"})
+        self._write("node_modules/pkg/c.intent.json", {"id": "c"})
+        self._write("runs/2026-01-01/d.event.json", {"id": "d"})
+        (self.root / "flows").mkdir()
+        (self.root / "flows" / "submit.sync.yaml").write_text("trigger:\n  source: ui_event\n", encoding="utf-8")
+        (self.root / "node_modules" / "x.sync.yaml").write_text("a: 1\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _write(self, rel: str, payload: object) -> Path:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+    def _discovery(self) -> "uip_discovery.Discovery":
+        return uip_discovery.Discovery(self.root, manifest_path=self.manifest)
+
+    def test_single_walk_prunes_excluded_dirs(self) -> None:
+        discovery = self._discovery()
+        found = {Path(a["path"]).relative_to(self.root).as_posix(): a["type"] for a in discovery.artifacts()}
+        self.assertEqual(
+            found,
+            {
+                "deep/b.event.json": "event",
+                "ui-artifacts/a.intent.json": "intent",
+                "ui-contracts/examples/clicked.json": "event",
+            },
+        )
+        self.assertEqual(discovery.sync_manifests(), [self.root / "flows" / "submit.sync.yaml"])
+        [(path, manifest, error)] = discovery.load_syncs()
+        self.assertIsNone(error)
+        self.assertEqual(manifest, {"trigger": {"source": "ui_event"}})
+
+    def test_invalid_json_raises_structural_violation(self) -> None:
+        (self.root / "deep" / "b.event.json").write_text("{", encoding="utf-8")
+        with self.assertRaises(uip_discovery.DiscoveryError) as ctx:
+            self._discovery().artifacts()
+        self.assertIn("UIP-STRUCTURAL-VIOLATION | file: deep/b.event.json | rule: valid-json", str(ctx.exception))
+
+    def test_manifest_reuses_parses_until_file_changes(self) -> None:
+        self._discovery().artifacts()
+        self.assertTrue(self.manifest.exists())
+
+        # Same size and mtime: the persisted parse is trusted without re-reading.
+        path = self.root / "deep" / "b.event.json"
+        stat = path.stat()
+        path.write_text(json.dumps({"type": "form.XXXXXXXXX"}), encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self._discovery().payload(path), {"type": "form.submitted"})
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        discovery = self._discovery()
+        discovery.artifacts()
+        self.assertEqual(discovery.payload(path), {"type": "form.XXXXXXXXX"})
+
+    def test_manifest_drops_deleted_files(self) -> None:
+        self._discovery().artifacts()
+        (self.root / "ui-artifacts" / "a.intent.json").unlink()
+        self._discovery().artifacts()
+        files = json.loads(self.manifest.read_text(encoding="utf-8"))["files"]
+        self.assertNotIn("ui-artifacts/a.intent.json", files)
+
+    def test_changed_paths_are_classified_without_walking(self) -> None:
+        discovery = self._discovery()
+        changed = [
+            self.root / "deep" / "b.event.json",
+            self.root / "node_modules" / "pkg" / "c.intent.json",
+            self.root / "ui-contracts" / "examples" / "clicked.json",
+            self.root / "deep" / "deleted.intent.json",
+            self.root / "README.md",
+        ]
+        found = [Path(a["path"]).name for a in discovery.artifacts(changed)]
+        self.assertEqual(found, ["b.event.json", "clicked.json"])
+        self.assertIsNone(discovery._kinds)
+        self.assertEqual(discovery.classify(self.root / "flows" / "submit.sync.yaml"), (None, True))
+
+    def test_schema_or_validator_changes_force_full_run(self) -> None:
+        partial = uip_discovery.ChangeSet([self.root / "deep" / "b.event.json"], self.root)
+        self.assertFalse(partial.full)
+        self.assertIn(self.root / "deep" / "b.event.json", partial)
+        for rel in ("schemas/design-intent.schema.json", "skills/ui-intent-emit/impl/run.py", "scripts/check-uip-shadow.py"):
+            changes = uip_discovery.ChangeSet([self.root / "deep" / "b.event.json", self.root / rel], self.root)
+            self.assertEqual(changes.full_reason, f"{rel} changed")
+
+    def test_component_copies_match(self) -> None:
+        hub = (SCRIPTS_DIR / "uip_discovery.py").read_text(encoding="utf-8")
+        copy = REPO_ROOT / "ui-pattern-registry" / "scripts" / "uip_discovery.py"
+        self.assertEqual(copy.read_text(encoding="utf-8"), hub)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import importlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import workspace_snapshot
+from scripts.workspace_snapshot import ArtifactError, WorkspaceSnapshot
+
+auto_governance = importlib.import_module("scripts.auto-governance")
+status = importlib.import_module("scripts.status")
+state_digest = importlib.import_module("scripts.generate-state-digest")
+
+ELICITATION = """---
+spec_id: spec-1
+ready_for_planning: true
+blocking_unknowns: []
+---
+# Elicitation
+"""
+
+
+class WorkspaceSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.workspace = self.root / ".ceres" / "workspace"
+        (self.workspace / "specs" / "elicitation").mkdir(parents=True)
+        self._write("objective-contract.json", json.dumps({"spec_id": "spec-1", "status": "committed", "goal": "g"}))
+        self._write("gap-ledger.json", json.dumps({"gaps": [{"gap_id": "G1", "blocking": True, "status": "open"}]}))
+        self._write("specs/elicitation/spec.md", ELICITATION)
+        self._write("todo.md", "# Todo\n\n## Current Focus\n- [ ] Task A\n\n## Backlog\n- [ ] Later\n")
+        self._write("memory.md", "# Memory\n\n## Decisions\n- Use JSON\n")
+        workspace_snapshot.clear_shared()
+
+    def tearDown(self) -> None:
+        workspace_snapshot.clear_shared()
+        self.tmp.cleanup()
+
+    def _write(self, rel: str, text: str) -> Path:
+        path = self.workspace / rel
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def _touch_later(self, path: Path) -> None:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_typed_accessors(self) -> None:
+        snapshot = WorkspaceSnapshot(self.workspace, self.root)
+        self.assertEqual(snapshot.objective_status(), "committed")
+        self.assertEqual([gap["gap_id"] for gap in snapshot.blocking_gaps()], ["G1"])
+        self.assertTrue(snapshot.elicitation_ready())
+        self.assertEqual(snapshot.current_focus(), ["- [ ] Task A"])
+        self.assertEqual(snapshot.memory_section("Decisions"), ["- Use JSON"])
+        self.assertIsNone(snapshot.mode_settings())
+
+        self._write("gap-ledger.json", "{not json")
+        with self.assertRaises(ArtifactError):
+            snapshot.gap_ledger()
+        self.assertEqual(snapshot.summary()["blocking_gaps"], "unreadable")
+
+    def test_artifacts_are_parsed_once_until_they_change(self) -> None:
+        snapshot = WorkspaceSnapshot(self.workspace, self.root)
+        first = snapshot.objective()
+        snapshot.summary()
+        loads = snapshot.loads
+        snapshot.summary()
+        self.assertIs(snapshot.objective(), first)
+        self.assertEqual(snapshot.loads, loads)
+
+        path = self._write("objective-contract.json", json.dumps({"status": "draft"}))
+        self._touch_later(path)
+        self.assertEqual(snapshot.objective_status(), "draft")
+        self.assertEqual(snapshot.loads, loads + 1)
+
+    def test_consumers_share_one_snapshot(self) -> None:
+        issues = auto_governance.detect_issues(self.workspace)
+        self.assertEqual(issues, ["blocking_gap_unresolved"])
+        snapshot = workspace_snapshot.shared(self.workspace, auto_governance.ROOT)
+        loads = snapshot.loads
+
+        digest = state_digest.generate(self.workspace)
+        self.assertIn("Gaps: 1 open, 1 blocking", digest)
+        self.assertIn("## Current Focus\n- [ ] Task A", digest)
+        self.assertIn("## Key Decisions\n- Use JSON", digest)
+        self.assertIs(workspace_snapshot.shared(self.workspace, state_digest.ROOT), snapshot)
+        # The digest reuses the parsed objective and ledger; only todo.md, memory.md and
+        # the four source hashes are new reads.
+        self.assertEqual(snapshot.loads - loads, 6)
+        self.assertEqual(auto_governance.detect_issues(self.workspace), issues)
+        before = snapshot.loads
+        state_digest.generate(self.workspace)
+        self.assertEqual(snapshot.loads, before)
+
+    def test_json_artifacts_do_not_fall_back_to_yaml(self) -> None:
+        self._write("objective-contract.json", "status: committed\n")
+        self._write("gap-ledger.json", "gaps: []\n")
+        self.assertEqual(
+            auto_governance.detect_issues(self.workspace),
+            ["gap_ledger_parse_error", "objective_contract_parse_error"],
+        )
+
+    def test_status_reads_the_workspace_of_its_root(self) -> None:
+        (self.workspace / "todo.md").write_bytes(b"# Todo\n\n## Current Focus\n- [ ] caf\xe9\n")
+        self.assertEqual(WorkspaceSnapshot(self.workspace, self.root).summary()["current_focus"], "unreadable")
+        with mock.patch.dict(os.environ):
+            os.environ.pop("CERES_WORKSPACE", None)
+            lines = status.workspace_lines(self.root)
+        self.assertEqual(
+            lines,
+            [
+                f"Workspace: {self.workspace}",
+                "  objective: committed | gaps: 1 open, 1 blocking | elicitation: ready",
+            ],
+        )
+
+    def test_front_matter_errors(self) -> None:
+        for text, message in (("no front matter\n", "missing front matter"), ("---\na: 1\n", "not terminated")):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ArtifactError, message):
+                    workspace_snapshot.parse_front_matter(text)
+        self._write("specs/elicitation/spec.md", "no front matter\n")
+        snapshot = WorkspaceSnapshot(self.workspace, self.root)
+        self.assertEqual(snapshot.elicitation(), {})
+        self.assertFalse(snapshot.elicitation_ready())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts import yaml_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+EDGE_DOCUMENTS = [
+    "a: |\n  line1\n  line2\n\nb: 1\n",
+    "a: |-\n  x\n\n\nb: >\n  one\n  two\n\n  three\n    more\n  four\n",
+    "- - a\n  - b\n- c\n",
+    "- name: x\n  run: |\n    echo hi # kept\n- name: y\n",
+    "k: 'it''s' # comment\nq: \"a\\tb\"\nu: http://x.y/z#frag\nv: [a, 'b c', {d: 1, e: [2, 3]}]\nw: {}\n",
+    "on: [push]\nyes: no\nn: -0x1F\np: 017\nf: 1_000.5\ng: .inf\nh: 1e5\nj: 2024-01-01\n",
+    "key:\n- a\n- b\nother:\n",
+    "a:\n  b:\n    - c: 1\n      d: 2\n    - e\n",
+    "'quoted key': 1\n\"dq\": ~\n",
+    "a: -1\nb: -x\nc: ?x\nd: :x\ne: =x\nf: [a, -1, -x]\n",
+]
+INDICATOR_SCALARS = ["a: - b\n", "a: =\n", "a: -\n", "a: ? x\n", "a: ,x\n", "a: ]\n", "a: |x\n", "- =\n", "[- b]\n", "[?x]\n"]
+
+
+class YamlLoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        yaml_loader.clear_cache()
+
+    def tearDown(self) -> None:
+        yaml_loader.clear_cache()
+        self.tmp.cleanup()
+
+    @unittest.skipIf("libyaml" not in yaml_loader.pyyaml_loaders(), "libyaml not installed")
+    def test_subset_parser_matches_libyaml(self) -> None:
+        libyaml = yaml_loader.pyyaml_loaders()["libyaml"]
+        configs = [REPO_ROOT / "ceres.policy.yaml", REPO_ROOT / "ceres.workflow.yaml"]
+        configs += sorted(REPO_ROOT.glob("*/skills/*/skill.yaml"))
+        configs += sorted(REPO_ROOT.glob("*/skills/reasoning/*.yaml"))
+        configs += sorted(REPO_ROOT.glob("*/synchronizations/**/*.yaml"))
+        texts = [path.read_text(encoding="utf-8") for path in configs if path.is_file()] + EDGE_DOCUMENTS
+        for text in texts:
+            with self.subTest(text=text[:40]):
+                expected = yaml_loader._pyyaml_parse(text, libyaml)
+                self.assertEqual(yaml_loader.parse_subset(text), expected)
+
+    @unittest.skipIf(not yaml_loader.pyyaml_loaders(), "PyYAML not installed")
+    def test_documents_outside_subset_fall_back_to_pyyaml(self) -> None:
+        self.assertEqual(yaml_loader.parse("base: &b {x: 1}\nderived: *b\n"), {"base": {"x": 1}, "derived": {"x": 1}})
+
+    def test_subset_rejects_unsupported_syntax(self) -> None:
+        for text in ("a: &anchor 1\n", "a: b: c\n", "a: x\n  b: y\n", "a: [1, 2\n", "---\na: 1\n---\nb: 2\n"):
+            with self.subTest(text=text):
+                with self.assertRaises(yaml_loader.YamlError):
+                    yaml_loader.parse_subset(text)
+
+    def test_indicator_scalars_are_left_to_libyaml(self) -> None:
+        libyaml = yaml_loader.pyyaml_loaders().get("libyaml")
+        for text in INDICATOR_SCALARS:
+            with self.subTest(text=text):
+                with self.assertRaises(yaml_loader.YamlError):
+                    yaml_loader.parse_subset(text)
+                if libyaml is None:
+                    continue
+                try:
+                    expected = yaml_loader._pyyaml_parse(text, libyaml)
+                except yaml_loader.YamlError:
+                    with self.assertRaises(yaml_loader.YamlError):
+                        yaml_loader.parse(text)
+                else:
+                    self.assertEqual(yaml_loader.parse(text), expected)
+
+    def test_load_yaml_caches_until_file_changes(self) -> None:
+        path = self.root / "config.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        first = yaml_loader.load_yaml(path)
+        self.assertIs(yaml_loader.load_yaml(path), first)
+
+        stat = path.stat()
+        path.write_text("value: 2\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(yaml_loader.load_yaml(path), {"value": 2})
+
+        path.write_text("# only a comment\n", encoding="utf-8")
+        with self.assertRaises(yaml_loader.YamlError):
+            yaml_loader.load_yaml(path)
+
+    def test_load_yaml_or_json_falls_back_and_labels_errors(self) -> None:
+        path = self.root / "objective.json"
+        path.write_text(json.dumps({"goal": "g", "nested": {"a": [1, 2]}}, indent=2), encoding="utf-8")
+        self.assertEqual(yaml_loader.load_yaml_or_json(path, "Objective"), {"goal": "g", "nested": {"a": [1, 2]}})
+
+        path.write_text("[1, 2]", encoding="utf-8")
+        with self.assertRaisesRegex(SystemExit, "Objective must be an object"):
+            yaml_loader.load_yaml_or_json(path, "Objective")
+        self.assertEqual(yaml_loader.load_yaml_or_json(path, "Objective", expect_object=False), [1, 2])
+
+        broken = self.root / "broken.yaml"
+        broken.write_text("a: [1\n", encoding="utf-8")
+        with self.assertRaisesRegex(SystemExit, "Failed to parse Broken"):
+            yaml_loader.load_yaml_or_json(broken, "Broken")
+
+    def test_component_copies_match(self) -> None:
+        hub = (REPO_ROOT / "scripts" / "yaml_loader.py").read_text(encoding="utf-8")
+        for component in ("governance-orchestrator", "readme-spec-engine", "ui-constitution", "ui-pattern-registry"):
+            copy = REPO_ROOT / component / "scripts" / "yaml_loader.py"
+            self.assertEqual(copy.read_text(encoding="utf-8"), hub)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Structured task table for todo.md, shared by the lifecycle gate and housekeeping.
+
+enforce-lifecycle.py and housekeeping.py both walk todo.md line by line looking for
+task checkboxes, `Execute prompt:` / `From prompt` references and their outcomes.
+`parse_tasks` does that walk once and memoises the resulting TaskTable by content
+hash; `load_tasks` adds a (mtime_ns, size, inode) memo so an unchanged todo.md is
+not even re-read. PromptClassifier caches each prompt file's `Classification:`
+line by the same file signature, optionally persisted under `.cache/`, so the gate
+only re-reads prompts that changed.
+
+Stdlib only: governance-orchestrator/scripts/todo_tasks.py is an identical copy.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+EXECUTE_PROMPT_PATTERN = re.compile(r"Execute prompt:\s*([^\s]+)")
+FROM_PROMPT_PATTERN = re.compile(r"From prompt\s+([^\s:]+)(?:\s*:\s*(.+))?")
+CLASSIFICATIONS = frozenset({"atomic", "decomposable"})
+
+CACHE_VERSION = 1
+# Prompt files modified this recently are not persisted: a same-timestamp rewrite
+# would otherwise be indistinguishable from the cached version.
+RACY_WINDOW_NS = 2_000_000_000
+_MAX_TABLES = 8
+
+
+@dataclass(frozen=True)
+class PromptRef:
+    """One prompt reference on a task line; `path` is None when the marker has no path."""
+
+    marker: str
+    path: Optional[str]
+    outcome: bool
+
+
+@dataclass(frozen=True)
+class Task:
+    """A `- [...]` line of todo.md."""
+
+    line: int
+    text: str
+    prompt_refs: Tuple[PromptRef, ...]
+
+    @property
+    def checked(self) -> bool:
+        return self.text.startswith("- [x] ")
+
+    @property
+    def unchecked(self) -> bool:
+        return self.text.startswith("- [ ]")
+
+    @property
+    def summary(self) -> str:
+        """Text after the checkbox of a checked task."""
+        return self.text[len("- [x] ") :] if self.checked else ""
+
+
+@dataclass(frozen=True)
+class TaskTable:
+    digest: str
+    lines: Tuple[str, ...]
+    tasks: Tuple[Task, ...]
+
+    def checked(self) -> List[Task]:
+        return [task for task in self.tasks if task.checked]
+
+    def has_unchecked(self) -> bool:
+        return any(task.unchecked for task in self.tasks)
+
+    def prompt_refs(self) -> List[Tuple[Task, PromptRef]]:
+        return [(task, ref) for task in self.tasks for ref in task.prompt_refs]
+
+    def long_lines(self, limit: int) -> List[int]:
+        return [idx for idx, line in enumerate(self.lines, start=1) if len(line) > limit]
+
+
+def _outcome_on_next_line(lines: List[str], index: int) -> bool:
+    if index + 1 >= len(lines):
+        return False
+    next_line = lines[index + 1].strip()
+    if not next_line.lower().startswith("outcome:"):
+        return False
+    return bool(next_line.split(":", 1)[1].strip())
+
+
+def _prompt_refs(stripped: str, lines: List[str], index: int) -> Tuple[PromptRef, ...]:
+    refs: List[PromptRef] = []
+    if "Execute prompt:" in stripped:
+        match = EXECUTE_PROMPT_PATTERN.search(stripped)
+        if match is None:
+            refs.append(PromptRef("Execute prompt", None, False))
+        else:
+            tail = stripped[match.end() :].strip()
+            refs.append(PromptRef("Execute prompt", match.group(1), bool(tail) or _outcome_on_next_line(lines, index)))
+    if "From prompt" in stripped:
+        match = FROM_PROMPT_PATTERN.search(stripped)
+        if match is None:
+            refs.append(PromptRef("From prompt", None, False))
+        else:
+            inline = bool(match.group(2) and match.group(2).strip())
+            refs.append(PromptRef("From prompt", match.group(1), inline or _outcome_on_next_line(lines, index)))
+    return tuple(refs)
+
+
+def _build_table(text: str, digest: str) -> TaskTable:
+    lines = text.splitlines()
+    tasks = []
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("- ["):
+            tasks.append(Task(index + 1, stripped, _prompt_refs(stripped, lines, index)))
+    return TaskTable(digest, tuple(lines), tuple(tasks))
+
+
+_TABLES: Dict[str, TaskTable] = {}
+_FILES: Dict[str, Tuple[Tuple[int, int, int], TaskTable]] = {}
+_LOCK = threading.Lock()
+
+
+def parse_tasks(text: str) -> TaskTable:
+    """The task table for `text`, reused while the same content is parsed again."""
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    with _LOCK:
+        table = _TABLES.get(digest)
+    if table is None:
+        table = _build_table(text, digest)
+        with _LOCK:
+            if len(_TABLES) >= _MAX_TABLES:
+                _TABLES.pop(next(iter(_TABLES)))
+            _TABLES[digest] = table
+    return table
+
+
+def load_tasks(path: Path) -> Optional[TaskTable]:
+    """The task table for the file at `path`, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = str(Path(path).resolve())
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _LOCK:
+        entry = _FILES.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    table = parse_tasks(text)
+    with _LOCK:
+        _FILES[key] = (signature, table)
+    return table
+
+
+def read_prompt_classification(path: Path) -> Optional[str]:
+    """`atomic` or `decomposable` from the first `Classification:` line, else None."""
+    classification = None
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.startswith("Classification:"):
+                classification = line.split(":", 1)[1].strip().lower()
+                break
+    return classification if classification in CLASSIFICATIONS else None
+
+
+class PromptClassifier:
+    """Prompt classifications keyed by file signature, optionally persisted as JSON."""
+
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        self.cache_path = cache_path
+        self.reads = 0
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+        if cache_path is not None:
+            try:
+                data = json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                entries = data.get("prompts")
+                if isinstance(entries, dict):
+                    self._entries = entries
+
+    def classify(self, path: Path) -> Tuple[bool, Optional[str]]:
+        """(exists, classification) for the prompt file at `path`."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False, None
+        key = str(path)
+        signature = [st.st_mtime_ns, st.st_size, st.st_ino]
+        entry = self._entries.get(key)
+        if isinstance(entry, list) and len(entry) == 2 and entry[0] == signature:
+            return True, entry[1]
+        self.reads += 1
+        classification = read_prompt_classification(path)
+        self._entries[key] = [signature, classification]
+        self._dirty = True
+        return True, classification
+
+    def save(self) -> None:
+        if self.cache_path is None or not self._dirty:
+            return
+        cutoff = time.time_ns() - RACY_WINDOW_NS
+        entries = {key: entry for key, entry in self._entries.items() if entry[0][0] < cutoff}
+        payload = json.dumps({"version": CACHE_VERSION, "prompts": entries}, sort_keys=True)
+        tmp = self.cache_path.with_name(self.cache_path.name + f".{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+_CLASSIFIERS: Dict[str, PromptClassifier] = {}
+
+
+def shared_classifier(cache_path: Optional[Path] = None) -> PromptClassifier:
+    """One classifier per cache file per process, so repeated gates reuse its memo."""
+    key = str(cache_path)
+    with _LOCK:
+        classifier = _CLASSIFIERS.get(key)
+        if classifier is None:
+            classifier = _CLASSIFIERS[key] = PromptClassifier(cache_path)
+    return classifier
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _TABLES.clear()
+        _FILES.clear()
+        _CLASSIFIERS.clear()
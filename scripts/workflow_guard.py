@@ -10,31 +10,10 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
 
-
-def load_yaml_or_json(path: Path, label: str) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    data = None
-    try:
-        import yaml  # type: ignore
-    except Exception:
-        yaml = None
-
-    if yaml is not None:
-        try:
-            data = yaml.safe_load(text)
-        except Exception:
-            data = None
-
-    if data is None:
-        try:
-            data = json.loads(text)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse {label}: {exc}")
-
-    if not isinstance(data, dict):
-        raise SystemExit(f"{label} must be an object.")
-    return data
+from scripts.yaml_loader import load_yaml_or_json
 
 
 def resolve_path(raw: str) -> Path:
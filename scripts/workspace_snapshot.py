@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Workspace artifacts parsed once per process and shared by the session scripts.
+
+auto-governance, generate-state-digest, doctor, preflight and resolve-mode-settings
+all read the same half-dozen files (Objective Contract, Gap Ledger, Spec Elicitation
+front matter, todo.md, memory.md, modes_settings_profiles.json). A WorkspaceSnapshot
+loads each artifact lazily on first access and memoises the parsed value by
+(mtime_ns, size, inode), so a file is re-read only after it changes. `shared()`
+returns one snapshot per workspace, so scripts running in the same process (the
+preflight in-process gate, a session daemon) parse each artifact once.
+
+Returned documents are shared between callers: treat them as read-only and copy
+before mutating.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from scripts import yaml_loader
+
+OBJECTIVE = "objective-contract.json"
+GAP_LEDGER = "gap-ledger.json"
+ELICITATION = "specs/elicitation"
+TODO = "todo.md"
+TODO_INBOX = "todo-inbox.md"
+COMPLETED = "completed.md"
+MEMORY = "memory.md"
+MODE_SETTINGS = "modes_settings_profiles.json"
+
+FRONT_MATTER_KEY_RE = re.compile(r"^[A-Za-z0-9_\-]+\s*:")
+
+
+class ArtifactError(ValueError):
+    """An artifact exists but cannot be parsed into the expected shape."""
+
+
+def project_root() -> Path:
+    """The project root: ROOT, or the directory holding `.ceres/` when CERES runs from core."""
+    env_home = os.environ.get("CERES_HOME")
+    if env_home:
+        try:
+            env_path = Path(env_home).resolve()
+            if env_path.name == ".ceres":
+                return env_path.parent
+        except Exception:
+            pass
+    if ROOT.name == "core" and ROOT.parent.name == ".ceres":
+        return ROOT.parent.parent
+    if ".ceres" in ROOT.parts:
+        try:
+            idx = ROOT.parts.index(".ceres")
+            return Path(*ROOT.parts[:idx])
+        except Exception:
+            pass
+    return ROOT
+
+
+def resolve_workspace(root: Path = ROOT) -> Path:
+    env = os.environ.get("CERES_WORKSPACE")
+    if env:
+        return Path(env)
+    candidate = root / ".ceres" / "workspace"
+    if candidate.is_dir():
+        return candidate
+    return root
+
+
+def parse_front_matter(text: str) -> Dict[str, Any]:
+    """Leading `---` front matter as flat scalars, booleans and `- item` lists."""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        raise ArtifactError("missing front matter (expected leading ---)")
+
+    front_matter_lines = []
+    end_index = None
+    for i in range(1, len(lines)):
+        if lines[i].strip() == "---":
+            end_index = i
+            break
+        front_matter_lines.append(lines[i])
+
+    if end_index is None:
+        raise ArtifactError("front matter not terminated (missing ---)")
+
+    data: Dict[str, Any] = {}
+    current_key: Optional[str] = None
+    for raw_line in front_matter_lines:
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if FRONT_MATTER_KEY_RE.match(line):
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            current_key = None
+            if value == "":
+                data[key] = []
+                current_key = key
+            elif value in {"[]", "[ ]"}:
+                data[key] = []
+            elif value.lower() in {"true", "false"}:
+                data[key] = value.lower() == "true"
+            else:
+                data[key] = value.strip("\"'")
+        elif line.startswith("-") and current_key:
+            item = line.lstrip("-").strip()
+            if item:
+                items = data.setdefault(current_key, [])
+                if isinstance(items, list):
+                    items.append(item)
+    return data
+
+
+def extract_section(text: str, heading: str) -> List[str]:
+    """Non-empty lines under a level 1-3 Markdown heading, up to the next heading."""
+    lines: List[str] = []
+    in_section = False
+    for line in text.splitlines():
+        if re.match(rf"^#{{1,3}}\s+{re.escape(heading)}", line, re.IGNORECASE):
+            in_section = True
+            continue
+        if in_section:
+            if re.match(r"^#{1,3}\s+", line):
+                break
+            stripped = line.strip()
+            if stripped and stripped != "-":
+                lines.append(stripped)
+    return lines
+
+
+def _parse_document(text: str) -> Any:
+    """JSON, falling back to YAML; a document neither can read raises the JSON error."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        try:
+            data = yaml_loader.parse(text)
+        except yaml_loader.YamlError:
+            data = None
+        if data is None:
+            raise ArtifactError(str(exc)) from exc
+        return data
+
+
+def _parse_json(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ArtifactError(str(exc)) from exc
+
+
+def _is_blocking(gap: Any) -> bool:
+    return isinstance(gap, dict) and gap.get("blocking") is True and gap.get("status") != "resolved"
+
+
+class WorkspaceSnapshot:
+    """Lazy, memoised view of one workspace's artifacts (plus the hub mode settings).
+
+    Path-taking readers (`text`, `document`, `json`, `front_matter`, `digest`) accept
+    any file, so callers with explicit paths share the same memo. They return None for
+    a missing file and raise ArtifactError when a file cannot be parsed.
+    """
+
+    def __init__(self, workspace: Path, root: Path = ROOT) -> None:
+        self.workspace = Path(workspace)
+        self.root = Path(root)
+        self.objective_path = self.workspace / OBJECTIVE
+        self.gap_ledger_path = self.workspace / GAP_LEDGER
+        self.elicitation_dir = self.workspace / ELICITATION
+        self.todo_path = self.workspace / TODO
+        self.inbox_path = self.workspace / TODO_INBOX
+        self.completed_path = self.workspace / COMPLETED
+        self.memory_path = self.workspace / MEMORY
+        self.mode_settings_path = self.root / MODE_SETTINGS
+        self._memo: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], Any, Optional[ArtifactError]]] = {}
+        self.loads = 0
+
+    def _load(self, path: Path, kind: str, parse: Callable[[bytes], Any]) -> Any:
+        path = Path(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        key = (str(path), kind)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        entry = self._memo.get(key)
+        if entry is None or entry[0] != signature:
+            try:
+                raw = path.read_bytes()
+            except FileNotFoundError:
+                return None
+            self.loads += 1
+            try:
+                entry = (signature, parse(raw), None)
+            except ArtifactError as exc:
+                entry = (signature, None, exc)
+            except (UnicodeDecodeError, ValueError) as exc:
+                entry = (signature, None, ArtifactError(str(exc)))
+            self._memo[key] = entry
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
+
+    # -- generic readers ---------------------------------------------------
+
+    def text(self, path: Path) -> Optional[str]:
+        return self._load(path, "text", lambda raw: raw.decode("utf-8"))
+
+    def document(self, path: Path) -> Any:
+        """JSON or YAML document at `path`."""
+        return self._load(path, "document", lambda raw: _parse_document(raw.decode("utf-8")))
+
+    def json(self, path: Path) -> Any:
+        """Strict JSON document at `path`."""
+        return self._load(path, "json", lambda raw: _parse_json(raw.decode("utf-8")))
+
+    def front_matter(self, path: Path) -> Optional[Dict[str, Any]]:
+        return self._load(path, "front_matter", lambda raw: parse_front_matter(raw.decode("utf-8")))
+
+    def digest(self, path: Path) -> str:
+        """Short MD5 of the file (as recorded in STATE.md), or "missing"."""
+        value = self._load(path, "md5", lambda raw: hashlib.md5(raw).hexdigest()[:12])
+        return "missing" if value is None else value
+
+    def _object(self, path: Path, label: str) -> Optional[Dict[str, Any]]:
+        # The .json artifacts are strict JSON here; only preflight reads them via document().
+        data = self.json(path)
+        if data is not None and not isinstance(data, dict):
+            raise ArtifactError(f"{label} must be an object")
+        return data
+
+    # -- typed accessors ---------------------------------------------------
+
+    def objective(self) -> Optional[Dict[str, Any]]:
+        return self._object(self.objective_path, "Objective Contract")
+
+    def objective_status(self) -> Optional[str]:
+        return (self.objective() or {}).get("status")
+
+    def gap_ledger(self) -> Optional[Dict[str, Any]]:
+        return self._object(self.gap_ledger_path, "Gap Ledger")
+
+    def gaps(self) -> List[Any]:
+        gaps = (self.gap_ledger() or {}).get("gaps", [])
+        return gaps if isinstance(gaps, list) else []
+
+    def open_gaps(self) -> List[Dict[str, Any]]:
+        return [gap for gap in self.gaps() if isinstance(gap, dict) and gap.get("status") != "resolved"]
+
+    def blocking_gaps(self) -> List[Dict[str, Any]]:
+        return [gap for gap in self.gaps() if _is_blocking(gap)]
+
+    def elicitation_files(self) -> List[Path]:
+        if not self.elicitation_dir.is_dir():
+            return []
+        return sorted(p for p in self.elicitation_dir.glob("*.md") if p.is_file())
+
+    def elicitation(self) -> Optional[Dict[str, Any]]:
+        """Front matter of the first Spec Elicitation Record ({} when it has none)."""
+        files = self.elicitation_files()
+        if not files:
+            return None
+        try:
+            return self.front_matter(files[0]) or {}
+        except ArtifactError:
+            return {}
+
+    def elicitation_ready(self) -> bool:
+        data = self.elicitation() or {}
+        blocking = data.get("blocking_unknowns")
+        return data.get("ready_for_planning") is True and not (isinstance(blocking, list) and blocking)
+
+    def todo_text(self) -> str:
+        return self.text(self.todo_path) or ""
+
+    def memory_text(self) -> str:
+        return self.text(self.memory_path) or ""
+
+    def current_focus(self) -> List[str]:
+        return extract_section(self.todo_text(), "Current Focus")
+
+    def memory_section(self, heading: str) -> List[str]:
+        return extract_section(self.memory_text(), heading)
+
+    def last_completed(self) -> Optional[str]:
+        entries = [
+            stripped[6:]
+            for stripped in (line.strip() for line in (self.text(self.completed_path) or "").splitlines())
+            if stripped.startswith("- [x] ") and "YYYY-MM-DD" not in stripped
+        ]
+        return entries[-1] if entries else None
+
+    def mode_settings(self) -> Optional[Dict[str, Any]]:
+        return self.json(self.mode_settings_path)
+
+    def summary(self) -> Dict[str, Any]:
+        """Headline state for status reports; unreadable artifacts show as "unreadable"."""
+
+        def guarded(accessor: Callable[[], Any]) -> Any:
+            try:
+                return accessor()
+            except ArtifactError:
+                return "unreadable"
+
+        return {
+            "objective_status": guarded(self.objective_status),
+            "open_gaps": guarded(lambda: len(self.open_gaps())),
+            "blocking_gaps": guarded(lambda: len(self.blocking_gaps())),
+            "elicitation_ready": self.elicitation_ready(),
+            "current_focus": guarded(self.current_focus),
+        }
+
+
+_SHARED: Dict[Tuple[str, str], WorkspaceSnapshot] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared(workspace: Optional[Path] = None, root: Path = ROOT) -> WorkspaceSnapshot:
+    """The process-wide snapshot for `workspace` (default: resolve_workspace(root))."""
+    workspace = Path(workspace) if workspace is not None else resolve_workspace(root)
+    key = (str(workspace.resolve()), str(Path(root).resolve()))
+    with _SHARED_LOCK:
+        snapshot = _SHARED.get(key)
+        if snapshot is None:
+            snapshot = _SHARED[key] = WorkspaceSnapshot(workspace, root)
+    return snapshot
+
+
+def clear_shared() -> None:
+    with _SHARED_LOCK:
+        _SHARED.clear()
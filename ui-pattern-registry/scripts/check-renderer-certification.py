@@ -1,17 +1,20 @@
 #!/usr/bin/env python3
+import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Union
-import importlib.util
+from typing import Any, Optional, Union
 
-from uip_yaml import YamlError, load_yaml
+from schema_registry import SchemaError, default_registry
+from uip_discovery import add_change_arguments, changes_from_args
+from yaml_loader import YamlError, load_yaml
 
 ROOT = Path(__file__).resolve().parent.parent
 MANIFEST_PATH = ROOT / "ui-contracts/renderers.yaml"
 
 REQUIRED_EVENT_FIELDS = {"intentId", "uiSessionId", "idempotencyKey", "schemaVersion"}
 NONDETERMINISTIC_TOKENS = ("Math.random", "Date.now", "new Date(", "crypto.randomUUID")
+RENDERER_PATH_KEYS = ("entrypoint", "adapter", "intentFixture", "invalidIntentFixture", "eventFixture")
 
 
 def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str) -> None:
@@ -31,16 +34,16 @@ def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str)
 
 def load_intent_validator():
     module_path = ROOT / "skills/ui-intent-emit/impl/run.py"
-    spec = importlib.util.spec_from_file_location("ui_intent_run", module_path)
-    if spec is None or spec.loader is None:
+    try:
+        # Imported once per process and content hash, shared by every checker.
+        module = default_registry().python_validator(module_path, "ui_intent_run")
+    except (OSError, SchemaError):
         fail(
             "UIP-STRUCTURAL-VIOLATION",
             module_path,
             "renderer.intent.validator",
             "Ensure the UI intent validator is present and importable.",
         )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
     if not hasattr(module, "validate_intent"):
         fail(
             "UIP-STRUCTURAL-VIOLATION",
@@ -174,10 +177,29 @@ def ensure_validation_call(path: Path, text: str) -> None:
         )
 
 
-def main() -> None:
+def renderer_paths(renderer: Any) -> list[Path]:
+    if not isinstance(renderer, dict):
+        return []
+    return [
+        ROOT / renderer[key]
+        for key in RENDERER_PATH_KEYS
+        if isinstance(renderer.get(key), str) and renderer[key].strip()
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Certify UIP renderers against their manifest and fixtures.")
+    add_change_arguments(parser)
+    args = parser.parse_args(argv)
+    changes = changes_from_args(args)
+
+    renderers = load_manifest()
+    if changes is not None and not changes.full:
+        renderers = [r for r in renderers if any(path in changes for path in renderer_paths(r))]
+        if not renderers:
+            return
     intent_module = load_intent_validator()
     validate_intent_fn = getattr(intent_module, "validate_intent")
-    renderers = load_manifest()
 
     for renderer in renderers:
         if not isinstance(renderer, dict):
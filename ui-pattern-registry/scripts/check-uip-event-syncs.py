@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
-import json
-import subprocess
+import argparse
 import sys
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
-from uip_yaml import YamlError, load_yaml
+from uip_discovery import ChangeSet, DiscoveryError, add_change_arguments, changes_from_args, discovery_for
 
 ROOT = Path(__file__).resolve().parent.parent
-DISCOVERY_SCRIPT = ROOT / "scripts/discover-uip-artifacts.py"
 
 UI_EVENT_TYPES = {
     "form.submitted",
@@ -35,42 +33,19 @@ def fail(category: str, file_path: Union[Path, str], rule: str, suggestion: str)
 
 
 def run_event_discovery() -> dict[str, Path]:
-    result = subprocess.run(
-        [sys.executable, str(DISCOVERY_SCRIPT)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout).strip()
-        if message:
-            print(message, file=sys.stderr)
-        raise SystemExit(result.returncode)
+    discovery = discovery_for()
+    try:
+        artifacts = discovery.artifacts()
+    except DiscoveryError as exc:
+        print(exc, file=sys.stderr)
+        raise SystemExit(1)
 
     event_types: dict[str, Path] = {}
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        try:
-            artifact = json.loads(line)
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                DISCOVERY_SCRIPT,
-                "discovery.output",
-                "Ensure discovery emits JSON lines with path/type.",
-            )
-        if artifact.get("type") != "event":
+    for artifact in artifacts:
+        if artifact["type"] != "event":
             continue
         path = Path(artifact["path"])
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            fail(
-                "UIP-STRUCTURAL-VIOLATION",
-                path,
-                "valid-json",
-                "Fix JSON syntax so the event artifact can be parsed.",
-            )
+        payload = discovery.payload(path)
         event_type = payload.get("type")
         if not isinstance(event_type, str) or not event_type.strip():
             fail(
@@ -84,18 +59,7 @@ def run_event_discovery() -> dict[str, Path]:
 
 
 def discover_sync_manifests() -> list[Path]:
-    paths: set[Path] = set()
-    paths.update(ROOT.rglob("*.sync.yaml"))
-    for folder in [
-        ROOT / "synchronizations",
-        ROOT / "synchronizations" / "templates",
-        ROOT / "synchronizations" / "examples",
-    ]:
-        if not folder.exists():
-            continue
-        paths.update(folder.glob("*.yaml"))
-        paths.update(folder.glob("*.yml"))
-    return sorted(paths)
+    return discovery_for().sync_manifests()
 
 
 def ensure_mapping(
@@ -256,7 +220,34 @@ def validate_sync_manifest(path: Path, data: Any) -> set[str]:
     return event_types
 
 
-def main() -> None:
+def trigger_matches(data: Any) -> set[str]:
+    """Event types a manifest's trigger.match lists, without validating the manifest."""
+    trigger = data.get("trigger") if isinstance(data, dict) else None
+    match = trigger.get("match") if isinstance(trigger, dict) else None
+    values = [match] if isinstance(match, str) else match if isinstance(match, list) else []
+    return {value for value in values if isinstance(value, str)}
+
+
+def changed_event_types(changes: ChangeSet) -> set[str]:
+    discovery = discovery_for()
+    event_types: set[str] = set()
+    for artifact in discovery.artifacts(changes.paths):
+        if artifact["type"] != "event":
+            continue
+        payload = discovery.payload(Path(artifact["path"]))
+        event_type = payload.get("type") if isinstance(payload, dict) else None
+        if isinstance(event_type, str) and event_type.strip():
+            event_types.add(event_type)
+    return event_types
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check that every UIEvent type has a valid synchronization.")
+    add_change_arguments(parser)
+    args = parser.parse_args(argv)
+    changes = changes_from_args(args)
+    incremental = changes is not None and not changes.full
+
     event_types = run_event_discovery()
     sync_paths = discover_sync_manifests()
     if not sync_paths:
@@ -270,20 +261,32 @@ def main() -> None:
             )
         return
 
+    # Incrementally, validate changed manifests plus those routing a changed event
+    # type. Coverage is re-checked for every event type only if a manifest changed
+    # (an edit or deletion can drop a route); otherwise just for the changed types.
+    touched_types: set[str] = set()
+    syncs_changed = True
+    if incremental:
+        touched_types = changed_event_types(changes)
+        syncs_changed = any(discovery_for().classify(path)[1] for path in changes.paths)
+
     sync_event_types: set[str] = set()
-    for path in sync_paths:
-        try:
-            manifest = load_yaml(path)
-        except YamlError as exc:
+    for path, manifest, error in discovery_for().load_syncs():
+        if incremental and path not in changes and not (trigger_matches(manifest) & touched_types):
+            sync_event_types.update(trigger_matches(manifest))
+            continue
+        if error is not None:
             fail(
                 "UIP-SCHEMA-VIOLATION",
                 path,
                 "sync.yaml",
-                f"Fix YAML syntax: {exc}",
+                f"Fix YAML syntax: {error}",
             )
         sync_event_types.update(validate_sync_manifest(path, manifest))
 
     for event_type, path in event_types.items():
+        if not syncs_changed and event_type not in touched_types:
+            continue
         if event_type not in sync_event_types:
             fail(
                 "UIP-BOUNDARY-VIOLATION",
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Indexed store over the date-partitioned run records in `runs/YYYY-MM-DD/<run_id>.jsonl`.
+
+The run files stay the source of truth. A derived SQLite index (`.cache/runs/index.sqlite`
+next to `runs/`) keeps one row per run file with the fields queries filter and aggregate
+on, stamped with the file's (mtime_ns, size, inode) signature: a refresh only re-reads
+files whose signature changed, and only in the day partitions the query covers.
+create-run-record.py and append-run-outcome.py update the row of the file they write.
+The index is a cache: deleting it is always safe and it is rebuilt on the next query.
+
+Identical copies live in each component's scripts/ directory; keep them in sync.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+INDEX_VERSION = 1
+FILTER_FIELDS = ("run_id", "concept_id", "skill_id", "spec_id", "outcome", "execution_profile")
+GROUP_FIELDS = ("skill_id", "concept_id", "spec_id", "outcome", "execution_profile")
+# Later records in a run file (appended outcomes) override these; timestamp keeps the first.
+STRING_FIELDS = ("run_id", "concept_id", "skill_id", "spec_id", "outcome", "execution_profile")
+DAY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# Files modified this recently are re-read on the next refresh: a same-timestamp,
+# same-size rewrite would otherwise be indistinguishable from the indexed version.
+RACY_WINDOW_NS = 2_000_000_000
+
+COLUMNS = (
+    "path",
+    "day",
+    "run_id",
+    "timestamp",
+    "concept_id",
+    "skill_id",
+    "spec_id",
+    "outcome",
+    "fix_loop_count",
+    "execution_profile",
+    "records",
+    "mtime_ns",
+    "size",
+    "inode",
+)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    path TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    timestamp TEXT,
+    concept_id TEXT,
+    skill_id TEXT,
+    spec_id TEXT,
+    outcome TEXT,
+    fix_loop_count INTEGER,
+    execution_profile TEXT,
+    records INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    inode INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_day ON runs (day);
+CREATE INDEX IF NOT EXISTS runs_skill ON runs (skill_id, day);
+CREATE INDEX IF NOT EXISTS runs_concept ON runs (concept_id, day);
+"""
+QUERY_COLUMNS = COLUMNS[1:11]
+
+
+def summarize(text: str) -> Tuple[Dict[str, Any], int]:
+    """Run fields folded over the JSONL records of one run file, and the record count."""
+    run: Dict[str, Any] = {}
+    records = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        records += 1
+        stamp = record.get("timestamp")
+        if "timestamp" not in run and isinstance(stamp, str) and stamp:
+            run["timestamp"] = stamp
+        for field in STRING_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str) and value:
+                run[field] = value
+        count = record.get("fix_loop_count")
+        if isinstance(count, int) and not isinstance(count, bool):
+            run["fix_loop_count"] = count
+    return run, records
+
+
+def _writable(path: Path) -> bool:
+    if path.exists():
+        return os.access(path, os.W_OK)
+    return os.access(path.parent, os.W_OK)
+
+
+class RunStore:
+    def __init__(self, runs_dir: Path, index_path: Optional[Path] = None) -> None:
+        self.runs_dir = Path(runs_dir)
+        if index_path is None:
+            index_path = self.runs_dir.parent / ".cache" / "runs" / "index.sqlite"
+        self.index_path = Path(index_path)
+        self.reads = 0
+        self._db: Optional[sqlite3.Connection] = None
+
+    # -- persistence -----------------------------------------------------
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        db = sqlite3.connect(target, timeout=10)
+        try:
+            if db.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                # Take the write lock first so concurrent stores build the schema once.
+                db.execute("BEGIN IMMEDIATE")
+                with db:
+                    if db.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                        db.execute("DROP TABLE IF EXISTS runs")
+                        for statement in SCHEMA.split(";"):
+                            if statement.strip():
+                                db.execute(statement)
+                        db.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is not None:
+            return self._db
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            if not _writable(self.index_path):
+                raise OSError(f"index not writable: {self.index_path}")
+            try:
+                self._db = self._open(str(self.index_path))
+            except sqlite3.OperationalError:
+                # Locked or busy, not damaged: another writer owns the index right now.
+                raise
+            except sqlite3.DatabaseError:
+                # "file is not a database" or a malformed image: the cache is rebuilt.
+                self.index_path.unlink()
+                self._db = self._open(str(self.index_path))
+        except (OSError, sqlite3.Error):
+            # Read-only checkouts (and locked indexes) still answer queries from an in-memory index.
+            self._db = self._open(":memory:")
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _apply(self, rows: Sequence[Tuple[Any, ...]], removed: Sequence[str]) -> None:
+        db = self._connect()
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with db:
+            db.executemany(f"INSERT OR REPLACE INTO runs ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows)
+            db.executemany("DELETE FROM runs WHERE path = ?", [(path,) for path in removed])
+
+    # -- indexing --------------------------------------------------------
+
+    def _row(self, path: Path, day: str, st: os.stat_result) -> Optional[Tuple[Any, ...]]:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        self.reads += 1
+        run, records = summarize(text)
+        mtime_ns = st.st_mtime_ns if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS else -1
+        return (
+            f"{day}/{path.name}",
+            day,
+            run.get("run_id") or path.stem,
+            run.get("timestamp"),
+            run.get("concept_id"),
+            run.get("skill_id"),
+            run.get("spec_id"),
+            run.get("outcome"),
+            run.get("fix_loop_count"),
+            run.get("execution_profile"),
+            records,
+            mtime_ns,
+            st.st_size,
+            st.st_ino,
+        )
+
+    def _days(self, first: Optional[str], last: Optional[str]) -> List[os.DirEntry]:
+        try:
+            entries = list(os.scandir(self.runs_dir))
+        except OSError:
+            return []
+        days = []
+        for entry in entries:
+            if not DAY_PATTERN.match(entry.name) or not entry.is_dir():
+                continue
+            if (first is not None and entry.name < first) or (last is not None and entry.name > last):
+                continue
+            days.append(entry)
+        return days
+
+    def refresh(self, since: Optional[str] = None, until: Optional[str] = None) -> None:
+        """Bring the index up to date for the day partitions overlapping [since, until]."""
+        first = since[:10] if since else None
+        last = until[:10] if until else None
+        db = self._connect()
+        clauses, params = [], []
+        if first is not None:
+            clauses.append("day >= ?")
+            params.append(first)
+        if last is not None:
+            clauses.append("day <= ?")
+            params.append(last)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        known = {
+            path: (mtime_ns, size, inode)
+            for path, mtime_ns, size, inode in db.execute(f"SELECT path, mtime_ns, size, inode FROM runs{where}", params)
+        }
+        rows = []
+        for day in self._days(first, last):
+            try:
+                entries = list(os.scandir(day.path))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                key = f"{day.name}/{entry.name}"
+                if known.pop(key, None) == (st.st_mtime_ns, st.st_size, st.st_ino):
+                    continue
+                row = self._row(Path(entry.path), day.name, st)
+                if row is not None:
+                    rows.append(row)
+        if rows or known:
+            self._apply(rows, list(known))
+
+    def index_file(self, path: Path) -> None:
+        """Re-index one run file right after it was written."""
+        path = Path(path)
+        row = self._row(path, path.parent.name, path.stat())
+        if row is not None:
+            self._apply([row], [])
+
+    def reindex(self) -> int:
+        """Drop every row and rebuild from the run files; returns the number of runs."""
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM runs")
+        self.refresh()
+        return db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    # -- queries ---------------------------------------------------------
+
+    @staticmethod
+    def _where(since: Optional[str], until: Optional[str], filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        unknown = set(filters) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unindexed query fields: {sorted(unknown)}")
+        clauses, params = [], []
+        for field, value in filters.items():
+            if value is not None:
+                clauses.append(f"{field} = ?")
+                params.append(value)
+        if since:
+            clauses.append("day >= ? AND timestamp >= ?")
+            params.extend([since[:10], since])
+        if until:
+            # Inclusive at the precision given: --until 2025-01-31 keeps that whole day.
+            clauses.append("day <= ? AND substr(timestamp, 1, ?) <= ?")
+            params.extend([until[:10], len(until), until])
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def _select(self, sql: str, since: Optional[str], until: Optional[str], filters: Dict[str, Any]) -> List[tuple]:
+        where, params = self._where(since, until, filters)
+        self.refresh(since, until)
+        return self._connect().execute(sql.format(where=where), params).fetchall()
+
+    def query(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Indexed run summaries ordered by timestamp."""
+        sql = f"SELECT {', '.join(QUERY_COLUMNS)} FROM runs{{where}} ORDER BY timestamp, path"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = self._select(sql, since, until, filters)
+        return [dict(zip(QUERY_COLUMNS, row)) for row in rows]
+
+    def fix_loops(
+        self,
+        by: str = "skill_id",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Fix-loop count distribution per `by` value."""
+        if by not in GROUP_FIELDS:
+            raise ValueError(f"Cannot group by {by!r}")
+        sql = (
+            f"SELECT {by}, fix_loop_count, COUNT(*) FROM runs{{where}} "
+            f"GROUP BY 1, 2 ORDER BY 1, 2"
+        )
+        groups: Dict[Optional[str], Dict[str, Any]] = {}
+        for key, count, runs in self._select(sql, since, until, filters):
+            if count is None:
+                continue
+            group = groups.setdefault(key, {by: key, "runs": 0, "total": 0, "max": 0, "histogram": {}})
+            group["runs"] += runs
+            group["total"] += count * runs
+            group["max"] = max(group["max"], count)
+            group["histogram"][str(count)] = runs
+        results = []
+        for group in groups.values():
+            total = group.pop("total")
+            group["mean"] = round(total / group["runs"], 2)
+            results.append(group)
+        return results
+
+    def failure_rate(
+        self,
+        by: str = "concept_id",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Failed share of decided (pass/fail) runs per `by` value."""
+        if by not in GROUP_FIELDS:
+            raise ValueError(f"Cannot group by {by!r}")
+        sql = (
+            f"SELECT {by}, COUNT(*), SUM(outcome = 'fail'), SUM(outcome = 'pass') "
+            f"FROM runs{{where}} GROUP BY 1 ORDER BY 1"
+        )
+        results = []
+        for key, runs, failed, passed in self._select(sql, since, until, filters):
+            decided = (failed or 0) + (passed or 0)
+            results.append(
+                {
+                    by: key,
+                    "runs": runs,
+                    "failed": failed or 0,
+                    "passed": passed or 0,
+                    "failure_rate": round((failed or 0) / decided, 4) if decided else None,
+                }
+            )
+        return results
+
+
+def index_run(path: Path) -> None:
+    """Update the index for a run file that was just written; errors leave it to the next refresh."""
+    path = Path(path)
+    store = RunStore(path.parent.parent)
+    try:
+        store.index_file(path)
+    except (OSError, sqlite3.Error):
+        pass
+    finally:
+        store.close()
+
+
+def _label(value: Optional[str]) -> str:
+    return value if value is not None else "-"
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query the run-record index")
+    parser.add_argument("--runs", type=Path, default=Path("runs"), help="Run records directory (default: runs)")
+    parser.add_argument("--index", type=Path, help="Index file (default: .cache/runs/index.sqlite beside --runs)")
+
+    filters = argparse.ArgumentParser(add_help=False)
+    for field in FILTER_FIELDS:
+        filters.add_argument(f"--{field.replace('_', '-')}", dest=field)
+    filters.add_argument("--since", help="Inclusive date or ISO timestamp lower bound")
+    filters.add_argument("--until", help="Inclusive date or ISO timestamp upper bound")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    q = sub.add_parser("query", parents=[filters], help="Print matching run summaries as JSONL")
+    q.add_argument("--limit", type=int)
+    f = sub.add_parser("fix-loops", parents=[filters], help="Fix-loop count distribution per group")
+    f.add_argument("--by", choices=GROUP_FIELDS, default="skill_id")
+    r = sub.add_parser("failure-rate", parents=[filters], help="Failure rate per group")
+    r.add_argument("--by", choices=GROUP_FIELDS, default="concept_id")
+    for aggregate in (f, r):
+        aggregate.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    sub.add_parser("reindex", help="Drop and rebuild the index")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    store = RunStore(args.runs, args.index)
+    try:
+        if args.command == "reindex":
+            print(f"Indexed {store.reindex()} run(s) from {args.runs}")
+            return 0
+        filters = {field: getattr(args, field) for field in FILTER_FIELDS}
+        if args.command == "query":
+            for run in store.query(since=args.since, until=args.until, limit=args.limit, **filters):
+                print(json.dumps(run))
+            return 0
+        if args.command == "fix-loops":
+            groups = store.fix_loops(by=args.by, since=args.since, until=args.until, **filters)
+            lines = [
+                f"{_label(group[args.by])}\truns={group['runs']}\tmean={group['mean']:.2f}\tmax={group['max']}\t"
+                + " ".join(f"{count}:{runs}" for count, runs in group["histogram"].items())
+                for group in groups
+            ]
+        else:
+            groups = store.failure_rate(by=args.by, since=args.since, until=args.until, **filters)
+            lines = [
+                f"{_label(group[args.by])}\truns={group['runs']}\tfailed={group['failed']}\t"
+                + ("rate=-" if group["failure_rate"] is None else f"rate={group['failure_rate']:.1%}")
+                for group in groups
+            ]
+        if args.json:
+            print(json.dumps(groups, indent=2))
+        else:
+            print("\n".join(lines) if lines else "No matching runs")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
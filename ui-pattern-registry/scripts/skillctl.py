@@ -7,10 +7,13 @@ import json
 import os
 import re
 import shutil
+import queue
 import subprocess
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -20,6 +23,9 @@ try:
 except Exception:  # pragma: no cover
     jsonschema = None  # type: ignore
 
+from schema_registry import SchemaError, default_registry
+from yaml_loader import YamlError, load_yaml
+
 
 class SkillctlError(Exception):
     pass
@@ -77,128 +83,11 @@ def _iter_skill_dirs(skills_dir: Path) -> list[Path]:
     return out
 
 
-def _strip_yaml_comment(line: str) -> str:
-    in_single = False
-    in_double = False
-    out = []
-    for ch in line:
-        if ch == "'" and not in_double:
-            in_single = not in_single
-        elif ch == '"' and not in_single:
-            in_double = not in_double
-        if ch == "#" and not in_single and not in_double:
-            break
-        out.append(ch)
-    return "".join(out)
-
-
-def _parse_scalar(text: str) -> Any:
-    lowered = text.lower()
-    if lowered in {"null", "~"}:
-        return None
-    if lowered == "true":
-        return True
-    if lowered == "false":
-        return False
-    if text in {"[]", "{}"}:
-        return [] if text == "[]" else {}
-    if text.startswith("[") or text.startswith("{"):
-        try:
-            return json.loads(text)
-        except Exception as e:
-            raise SkillctlError(f"Unsupported flow value (must be JSON): {text}") from e
-    if text.startswith('"') and text.endswith('"'):
-        try:
-            return json.loads(text)
-        except Exception as e:
-            raise SkillctlError(f"Invalid quoted string: {text}") from e
-    if text.startswith("'") and text.endswith("'") and len(text) >= 2:
-        return text[1:-1].replace("''", "'")
-    if text.isdigit() or (text.startswith("-") and text[1:].isdigit()):
-        try:
-            return int(text, 10)
-        except Exception:
-            pass
-    return text
-
-
-def _preprocess_yaml(text: str) -> list[tuple[int, str]]:
-    out: list[tuple[int, str]] = []
-    for raw in text.splitlines():
-        if "\t" in raw:
-            raise SkillctlError("Tabs are not allowed in skill.yaml (use spaces).")
-        line = _strip_yaml_comment(raw).rstrip()
-        if not line.strip():
-            continue
-        indent = len(line) - len(line.lstrip(" "))
-        out.append((indent, line.lstrip(" ")))
-    return out
-
-
-def _parse_block(lines: list[tuple[int, str]], index: int, indent: int) -> tuple[Any, int]:
-    if index >= len(lines):
-        return {}, index
-    current_indent, current_text = lines[index]
-    if current_indent != indent:
-        raise SkillctlError(f"Unexpected indentation at line: {current_text}")
-
-    if current_text.startswith("- "):
-        items: list[Any] = []
-        i = index
-        while i < len(lines):
-            i_indent, i_text = lines[i]
-            if i_indent != indent or not i_text.startswith("- "):
-                break
-            rest = i_text[2:].strip()
-            i += 1
-            if rest == "":
-                if i >= len(lines) or lines[i][0] <= indent:
-                    items.append(None)
-                else:
-                    child_indent = lines[i][0]
-                    child, i = _parse_block(lines, i, child_indent)
-                    items.append(child)
-            else:
-                items.append(_parse_scalar(rest))
-        return items, i
-
-    mapping: dict[str, Any] = {}
-    i = index
-    while i < len(lines):
-        i_indent, i_text = lines[i]
-        if i_indent != indent or i_text.startswith("- "):
-            break
-        if ":" not in i_text:
-            raise SkillctlError(f"Invalid mapping entry (missing ':'): {i_text}")
-        key, rest = i_text.split(":", 1)
-        key = key.strip()
-        if not key:
-            raise SkillctlError(f"Empty key in mapping entry: {i_text}")
-        rest = rest.lstrip()
-        i += 1
-        if rest == "":
-            if i >= len(lines) or lines[i][0] <= indent:
-                mapping[key] = {}
-            else:
-                child_indent = lines[i][0]
-                child, i = _parse_block(lines, i, child_indent)
-                mapping[key] = child
-        else:
-            mapping[key] = _parse_scalar(rest)
-    return mapping, i
-
-
 def _load_yaml(path: Path) -> dict[str, Any]:
-    raw = path.read_text(encoding="utf-8")
-    lines = _preprocess_yaml(raw)
-    if not lines:
-        raise SkillctlError(f"Empty YAML file: {path}")
-    top_indent = lines[0][0]
-    if top_indent != 0:
-        raise SkillctlError(f"Top-level YAML must start at indent 0: {path}")
-    parsed, next_index = _parse_block(lines, 0, 0)
-    if next_index != len(lines):
-        raise SkillctlError(f"Trailing content could not be parsed in: {path}")
+    try:
+        parsed = load_yaml(path)
+    except YamlError as e:
+        raise SkillctlError(str(e)) from e
     if not isinstance(parsed, dict):
         raise SkillctlError(f"Expected YAML mapping at {path}")
     return parsed  # type: ignore[return-value]
@@ -212,14 +101,19 @@ def _load_json(path: Path) -> Any:
         raise SkillctlError(f"Invalid JSON at {path}: {e}") from e
 
 
-def _load_contract_schema(skills_dir: Path) -> dict[str, Any]:
+def _contract_validator(skills_dir: Path) -> Any:
     schema_path = skills_dir / "_schema" / "skill.schema.json"
     if not schema_path.exists():
         raise SkillctlError(f"Contract schema missing: {schema_path}")
-    schema = _load_json(schema_path)
-    if not isinstance(schema, dict):
-        raise SkillctlError(f"Invalid contract schema (expected JSON object): {schema_path}")
-    return schema  # type: ignore[return-value]
+    _require_deps()
+    registry = default_registry()
+    try:
+        schema = registry.schema(schema_path)
+        if not isinstance(schema, dict):
+            raise SkillctlError(f"Invalid contract schema (expected JSON object): {schema_path}")
+        return registry.validator(schema_path)
+    except SchemaError as e:
+        raise SkillctlError(str(e)) from e
 
 
 def _json_pointer(err: Any) -> str:
@@ -234,10 +128,7 @@ def _json_pointer(err: Any) -> str:
     return "/" + "/".join(parts)
 
 
-def _validate_manifest(manifest: dict[str, Any], schema: dict[str, Any]) -> None:
-    _require_deps()
-    validator_cls = jsonschema.validators.validator_for(schema)
-    validator = validator_cls(schema)
+def _validate_manifest(manifest: dict[str, Any], validator: Any) -> None:
     errors = sorted(validator.iter_errors(manifest), key=lambda e: (list(e.path), e.message))
     if errors:
         lines = ["Manifest validation failed:"]
@@ -324,15 +215,15 @@ def cmd_describe(repo_root: Path, args: argparse.Namespace) -> int:
 
 def _validate_skill_dir(repo_root: Path, skill_dir: Path, args: argparse.Namespace) -> None:
     skills_dir = _skills_root(repo_root)
-    contract_schema = _load_contract_schema(skills_dir)
+    contract_validator = _contract_validator(skills_dir)
     manifest_path = skill_dir / "skill.yaml"
     manifest = _load_yaml(manifest_path)
-    _validate_manifest(manifest, contract_schema)
+    _validate_manifest(manifest, contract_validator)
 
     input_schema_rel = manifest["io"]["inputSchema"]
     output_schema_rel = manifest["io"]["outputSchema"]
-    _load_json(_safe_join(skill_dir, input_schema_rel))
-    _load_json(_safe_join(skill_dir, output_schema_rel))
+    _load_io_schema(_safe_join(skill_dir, input_schema_rel))
+    _load_io_schema(_safe_join(skill_dir, output_schema_rel))
 
 
 def cmd_validate(repo_root: Path, args: argparse.Namespace) -> int:
@@ -359,92 +250,419 @@ def cmd_validate(repo_root: Path, args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
-    skill_dir = _resolve_skill_dir(repo_root, args.target, allow_template=args.allow_template)
-    skills_dir = _skills_root(repo_root)
-    contract_schema = _load_contract_schema(skills_dir)
-    manifest = _load_yaml(skill_dir / "skill.yaml")
-    _validate_manifest(manifest, contract_schema)
-    skill_ref = _skill_ref_from_manifest(skill_dir, manifest)
-
-    input_schema = _load_json(_safe_join(skill_dir, manifest["io"]["inputSchema"]))
-    output_schema = _load_json(_safe_join(skill_dir, manifest["io"]["outputSchema"]))
-
-    raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
+def _load_io_schema(path: Path) -> Any:
+    # Parsed once per content hash; later runs and `serve` reuse the registry entry.
     try:
-        input_obj = json.loads(raw_input.decode("utf-8"))
+        return default_registry().schema(path)
+    except SchemaError as e:
+        raise SkillctlError(str(e)) from e
+
+
+def _validate_instance(validator: Any, instance: Any) -> None:
+    # Same error jsonschema.validate raises, without re-checking and re-compiling the schema.
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+class _SkillRuntime:
+    """A resolved skill: manifest, compiled I/O validators and execution settings.
+
+    Built once per skill per skillctl process; `serve` reuses it for every request.
+    """
+
+    def __init__(self, repo_root: Path, target: str, allow_template: bool) -> None:
+        started = time.monotonic()
+        self.skill_dir = _resolve_skill_dir(repo_root, target, allow_template=allow_template)
+        contract_validator = _contract_validator(_skills_root(repo_root))
+        self.manifest = _load_yaml(self.skill_dir / "skill.yaml")
+        _validate_manifest(self.manifest, contract_validator)
+        self.ref = _skill_ref_from_manifest(self.skill_dir, self.manifest)
+        self.report_path = str(self.skill_dir.relative_to(repo_root))
+
+        io = self.manifest["io"]
+        self.input_validator = self._compile(_safe_join(self.skill_dir, io["inputSchema"]))
+        self.output_validator = self._compile(_safe_join(self.skill_dir, io["outputSchema"]))
+
+        runtime = self.manifest["runtime"]
+        self.command = runtime["command"]
+        self.worker_command = (runtime.get("worker") or {}).get("command")
+        self.timeout_ms = int(runtime.get("timeoutMs", 60000))
+        self.cwd = _safe_join(self.skill_dir, runtime.get("cwd", "."))
+        self.load_ms = (time.monotonic() - started) * 1000
+
+    @staticmethod
+    def _compile(schema_path: Path) -> Any:
+        _require_deps()
+        _load_io_schema(schema_path)
+        return default_registry().validator(schema_path)
+
+    def skill_json(self) -> dict[str, Any]:
+        return {"id": self.ref.id, "version": self.ref.version, "path": self.report_path}
+
+
+class _Worker:
+    """One warm skill process speaking the line-delimited JSON worker protocol.
+
+    Requests are `{"id": n, "input": {...}}` lines on stdin; the skill answers each with
+    `{"id": n, "output": {...}}` or `{"id": n, "error": "..."}` on stdout. Worker stderr
+    is passed through to ours.
+    """
+
+    def __init__(self, runtime: _SkillRuntime) -> None:
+        self.proc = subprocess.Popen(
+            runtime.worker_command,
+            cwd=str(runtime.cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={**os.environ},
+        )
+        self.lines: queue.Queue[bytes] = queue.Queue()
+        self.next_id = 0
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self) -> None:
+        assert self.proc.stdout is not None
+        for line in self.proc.stdout:
+            self.lines.put(line)
+        self.lines.put(b"")
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, input_obj: Any, timeout_s: float) -> Any:
+        assert self.proc.stdin is not None
+        self.next_id += 1
+        try:
+            self.proc.stdin.write(json.dumps({"id": self.next_id, "input": input_obj}).encode("utf-8") + b"\n")
+            self.proc.stdin.flush()
+            line = self.lines.get(timeout=timeout_s)
+        except queue.Empty:
+            self.close(kill=True)
+            raise SkillctlError(f"Skill worker timed out after {int(timeout_s * 1000)}ms")
+        except OSError as e:
+            self.close(kill=True)
+            raise SkillctlError(f"Skill worker exited with code {self.proc.poll()}") from e
+        if not line:
+            self.close(kill=True)
+            raise SkillctlError(f"Skill worker exited with code {self.proc.poll()}")
+        try:
+            response = json.loads(line.decode("utf-8"))
+        except Exception as e:
+            self.close(kill=True)
+            raise SkillctlError(f"Skill worker response is not valid JSON: {e}") from e
+        if not isinstance(response, dict) or response.get("id") != self.next_id:
+            self.close(kill=True)
+            raise SkillctlError("Skill worker response does not match the request id")
+        if "error" in response:
+            raise SkillctlError(f"Skill worker error: {response['error']}")
+        return response.get("output")
+
+    def close(self, kill: bool = False) -> None:
+        if self.proc.poll() is None and kill:
+            self.proc.kill()
+            self.proc.wait()
+        elif self.proc.poll() is None:
+            try:
+                assert self.proc.stdin is not None
+                self.proc.stdin.close()
+                self.proc.wait(timeout=1)
+            except Exception:
+                self.proc.kill()
+                self.proc.wait()
+
+
+class _WorkerPool:
+    """Up to `size` warm workers for one skill, spawned on demand and reused."""
+
+    def __init__(self, runtime: _SkillRuntime, size: int = 1) -> None:
+        self.runtime = runtime
+        self.size = max(1, size)
+        self.idle: queue.Queue[_Worker] = queue.Queue()
+        self.spawned = 0
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.busy_ms = 0.0
+        self.startup_ms = runtime.load_ms
+
+    def _acquire(self) -> _Worker:
+        with self.lock:
+            spawn = self.idle.empty() and self.spawned < self.size
+            if spawn:
+                self.spawned += 1
+        if not spawn:
+            return self.idle.get()
+        started = time.monotonic()
+        try:
+            worker = _Worker(self.runtime)
+        except Exception:
+            with self.lock:
+                self.spawned -= 1
+            raise
+        with self.lock:
+            self.startup_ms += (time.monotonic() - started) * 1000
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        if worker.alive():
+            self.idle.put(worker)
+            return
+        with self.lock:
+            self.spawned -= 1
+
+    def call(self, input_obj: Any, timeout_ms: int) -> Any:
+        worker = self._acquire()
+        try:
+            return worker.request(input_obj, timeout_ms / 1000.0)
+        finally:
+            self._release(worker)
+
+    def record(self, duration_ms: float) -> dict[str, Any]:
+        """Account one request; returns the amortised timing block for skill_run_report."""
+        with self.lock:
+            self.requests += 1
+            self.busy_ms += duration_ms
+            return {
+                "requests": self.requests,
+                "startupMs": int(self.startup_ms),
+                "amortizedMs": int((self.startup_ms + self.busy_ms) / self.requests),
+            }
+
+    def close(self) -> None:
+        while not self.idle.empty():
+            self.idle.get().close()
+
+
+class _OneshotFailure(SkillctlError):
+    def __init__(self, message: str, stderr: bytes, exit_code: int) -> None:
+        super().__init__(message)
+        self.stderr = stderr
+        self.exit_code = exit_code
+
+
+def _run_oneshot(runtime: _SkillRuntime, input_obj: Any, timeout_ms: int) -> tuple[Any, bytes, int]:
+    proc = subprocess.run(
+        runtime.command,
+        cwd=str(runtime.cwd),
+        input=_canonical_json(input_obj).encode("utf-8"),
+        capture_output=True,
+        timeout=timeout_ms / 1000.0,
+        env={**os.environ},
+    )
+    if proc.returncode != 0:
+        raise _OneshotFailure(f"Skill exited with code {proc.returncode}", proc.stderr, proc.returncode)
+    try:
+        output_obj = json.loads(proc.stdout.decode("utf-8"))
     except Exception as e:
-        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+        raise _OneshotFailure(f"Skill stdout is not valid JSON: {e}", proc.stderr, proc.returncode) from e
+    return output_obj, proc.stderr, proc.returncode
 
-    _require_deps()
-    jsonschema.validate(instance=input_obj, schema=input_schema)
 
-    runtime = manifest["runtime"]
-    command = runtime["command"]
-    timeout_ms = int(args.timeout_ms) if args.timeout_ms is not None else int(runtime.get("timeoutMs", 60000))
-    runtime_cwd_rel = runtime.get("cwd", ".")
-    cwd = _safe_join(skill_dir, runtime_cwd_rel)
+def _execute(
+    runtime: _SkillRuntime,
+    input_obj: Any,
+    timeout_ms: int | None = None,
+    pool: _WorkerPool | None = None,
+) -> dict[str, Any]:
+    """Validate input, run the skill (warm worker when `pool` is given) and validate output.
 
+    Returns status/output/error/exitCode/durationMs plus the `report` to emit on stderr.
+    """
+    timeout = timeout_ms if timeout_ms is not None else runtime.timeout_ms
     started = time.monotonic()
-    proc = None
-    stdout = b""
-    stderr = b""
-    exit_code: int | None = None
-    status = "error"
-    error_message: str | None = None
-
+    result: dict[str, Any] = {"status": "error", "output": None, "error": None, "exitCode": None, "stderr": b""}
     try:
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            input=_canonical_json(input_obj).encode("utf-8"),
-            capture_output=True,
-            timeout=timeout_ms / 1000.0,
-            env={**os.environ},
-        )
-        stdout = proc.stdout
-        stderr = proc.stderr
-        exit_code = proc.returncode
-        if proc.returncode != 0:
-            raise SkillctlError(f"Skill exited with code {proc.returncode}")
-
+        _validate_instance(runtime.input_validator, input_obj)
+        if pool is not None:
+            output_obj = pool.call(input_obj, timeout)
+        else:
+            output_obj, result["stderr"], result["exitCode"] = _run_oneshot(runtime, input_obj, timeout)
+        _validate_instance(runtime.output_validator, output_obj)
+        result["output"] = output_obj
+        result["status"] = "success"
+    except _OneshotFailure as e:
+        result["stderr"], result["exitCode"], result["error"] = e.stderr, e.exit_code, str(e)
+    except Exception as e:
+        result["error"] = str(e)
+    duration = (time.monotonic() - started) * 1000
+    result["durationMs"] = int(duration)
+
+    report: dict[str, Any] = {
+        "event": "skill_run_report",
+        "skill": runtime.skill_json(),
+        "status": result["status"],
+        "durationMs": result["durationMs"],
+        "exitCode": result["exitCode"],
+        "mode": "worker" if pool is not None else "oneshot",
+    }
+    if pool is not None:
+        report["worker"] = pool.record(duration)
+    if result["error"]:
+        report["error"] = result["error"]
+    result["report"] = report
+    return result
+
+
+def _emit_stderr(stderr: bytes) -> None:
+    if stderr:
+        sys.stderr.buffer.write(stderr)
+        if not stderr.endswith(b"\n"):
+            sys.stderr.buffer.write(b"\n")
+    sys.stderr.flush()
+
+
+def _run_batch(runtime: _SkillRuntime, args: argparse.Namespace) -> int:
+    """Run every JSONL input line; results are written as JSONL in input order."""
+    jobs = max(1, args.jobs)
+    pool = _WorkerPool(runtime, jobs) if runtime.worker_command and not args.no_workers else None
+    source = sys.stdin.buffer if args.batch == "-" else Path(args.batch).open("rb")
+    out = Path(args.output).open("w", encoding="utf-8") if args.output else sys.stdout
+
+    def run_line(raw: bytes) -> dict[str, Any]:
         try:
-            output_obj = json.loads(stdout.decode("utf-8"))
+            input_obj = json.loads(raw.decode("utf-8"))
         except Exception as e:
-            raise SkillctlError(f"Skill stdout is not valid JSON: {e}") from e
+            return {"status": "error", "error": f"Input is not valid UTF-8 JSON: {e}", "durationMs": 0, "stderr": b""}
+        return _execute(runtime, input_obj, args.timeout_ms, pool)
+
+    def write_result(result: dict[str, Any]) -> None:
+        index = counts["success"] + counts["error"]
+        counts[result["status"]] += 1
+        item: dict[str, Any] = {"index": index, "status": result["status"], "durationMs": result["durationMs"]}
+        if result["status"] == "success":
+            item["output"] = result["output"]
+        else:
+            item["error"] = result["error"]
+        _emit_stderr(result["stderr"])
+        out.write(_canonical_json(item))
+        out.flush()
 
-        jsonschema.validate(instance=output_obj, schema=output_schema)
-        status = "success"
-        normalized = _canonical_json(output_obj).encode("utf-8")
+    started = time.monotonic()
+    counts = {"success": 0, "error": 0}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # At most 2*jobs lines in flight: input is read as it arrives, and a writer thread
+            # emits each result as soon as every earlier line has finished.
+            window: queue.Queue[Future | None] = queue.Queue(maxsize=2 * jobs - 1)
+            failures: list[BaseException] = []
+
+            def drain() -> None:
+                while (future := window.get()) is not None:
+                    if failures:
+                        continue  # keep consuming so the reader never blocks on a dead writer
+                    try:
+                        write_result(future.result())
+                    except BaseException as e:
+                        failures.append(e)
+
+            writer = threading.Thread(target=drain, daemon=True)
+            writer.start()
+            try:
+                for raw in source:
+                    if failures:
+                        break
+                    if raw.strip():
+                        window.put(executor.submit(run_line, raw))
+            finally:
+                window.put(None)
+                writer.join()
+            if failures:
+                raise failures[0]
+    finally:
+        if pool is not None:
+            pool.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+
+    duration_ms = (time.monotonic() - started) * 1000
+    total = counts["success"] + counts["error"]
+    report = {
+        "event": "skill_batch_report",
+        "skill": runtime.skill_json(),
+        "mode": "worker" if pool is not None else "oneshot",
+        "jobs": jobs,
+        "total": total,
+        "succeeded": counts["success"],
+        "failed": counts["error"],
+        "durationMs": int(duration_ms),
+        "amortizedMs": int((runtime.load_ms + duration_ms) / total) if total else 0,
+    }
+    if pool is not None:
+        report["startupMs"] = int(pool.startup_ms)
+    sys.stderr.write(_canonical_json(report))
+    return 0 if counts["error"] == 0 else 1
+
+
+def cmd_run(repo_root: Path, args: argparse.Namespace) -> int:
+    runtime = _SkillRuntime(repo_root, args.target, args.allow_template)
+    if args.batch:
+        return _run_batch(runtime, args)
+
+    raw_input = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
+    try:
+        input_obj = json.loads(raw_input.decode("utf-8"))
+    except Exception as e:
+        raise SkillctlError(f"Input is not valid UTF-8 JSON: {e}") from e
+
+    result = _execute(runtime, input_obj, args.timeout_ms)
+    if result["status"] == "success":
+        normalized = _canonical_json(result["output"]).encode("utf-8")
         if args.output:
             Path(args.output).write_bytes(normalized)
         else:
             sys.stdout.buffer.write(normalized)
-    except Exception as e:
-        error_message = str(e)
+    _emit_stderr(result["stderr"])
+    sys.stderr.write(_canonical_json(result["report"]))
+    return 0 if result["status"] == "success" else 1
+
+
+def cmd_serve(repo_root: Path, args: argparse.Namespace) -> int:
+    """Answer line-delimited JSON requests on stdin until EOF, keeping skills warm.
+
+    Each request is `{"id": ..., "skill": "<id or path>", "input": {...}}`; each response
+    line carries the same id with status, durationMs and output or error. Skills that
+    declare `runtime.worker` run in a warm worker; others fall back to one-shot runs.
+    """
+    runtimes: dict[str, _SkillRuntime] = {}
+    pools: dict[str, _WorkerPool] = {}
+    exit_code = 0
+    try:
+        for raw in sys.stdin.buffer:
+            if not raw.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(raw.decode("utf-8"))
+                if not isinstance(request, dict) or not isinstance(request.get("skill"), str):
+                    raise SkillctlError("Request must be a JSON object with a string 'skill'")
+                request_id = request.get("id")
+                target = request["skill"]
+                if target not in runtimes:
+                    runtimes[target] = _SkillRuntime(repo_root, target, args.allow_template)
+                    if runtimes[target].worker_command and not args.no_workers:
+                        pools[target] = _WorkerPool(runtimes[target], args.pool_size)
+                result = _execute(runtimes[target], request.get("input"), args.timeout_ms, pools.get(target))
+            except Exception as e:
+                result = {"status": "error", "error": str(e), "output": None, "durationMs": 0, "stderr": b""}
+            response = {"id": request_id, "status": result["status"], "durationMs": result["durationMs"]}
+            if result["status"] == "success":
+                response["output"] = result["output"]
+            else:
+                response["error"] = result["error"]
+                exit_code = 1
+            _emit_stderr(result["stderr"])
+            if "report" in result:
+                sys.stderr.write(_canonical_json(result["report"]))
+            sys.stdout.write(_canonical_json(response))
+            sys.stdout.flush()
     finally:
-        duration_ms = int((time.monotonic() - started) * 1000)
-        if stderr:
-            sys.stderr.buffer.write(stderr)
-            if not stderr.endswith(b"\n"):
-                sys.stderr.buffer.write(b"\n")
-
-        report = {
-            "event": "skill_run_report",
-            "skill": {
-                "id": skill_ref.id,
-                "version": skill_ref.version,
-                "path": str(skill_ref.path.relative_to(repo_root)),
-            },
-            "status": status,
-            "durationMs": duration_ms,
-            "exitCode": exit_code,
-        }
-        if error_message:
-            report["error"] = error_message
-        sys.stderr.write(_canonical_json(report))
-
-    return 0 if status == "success" else 1
+        for pool in pools.values():
+            pool.close()
+    return exit_code
 
 
 def _yaml_quote(value: str) -> str:
@@ -640,12 +858,23 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_run = subparsers.add_parser("run")
     p_run.add_argument("target")
-    p_run.add_argument("--input", help="Path to JSON input file (default: stdin).")
+    run_source = p_run.add_mutually_exclusive_group()
+    run_source.add_argument("--input", help="Path to JSON input file (default: stdin).")
+    run_source.add_argument("--batch", metavar="FILE", help="Run every line of a JSONL file ('-' for stdin); results are JSONL in input order.")
     p_run.add_argument("--output", help="Write output JSON to a file (default: stdout).")
+    p_run.add_argument("--jobs", type=int, default=1, help="Batch items to run in parallel (--batch only).")
+    p_run.add_argument("--no-workers", action="store_true", help="Use one-shot execution even if the skill declares runtime.worker.")
     p_run.add_argument("--timeout-ms", type=int, default=None)
     p_run.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
     p_run.set_defaults(func=cmd_run)
 
+    p_serve = subparsers.add_parser("serve", help="Run skills for line-delimited JSON requests on stdin.")
+    p_serve.add_argument("--pool-size", type=int, default=1, help="Warm workers per worker-capable skill.")
+    p_serve.add_argument("--no-workers", action="store_true", help="Always use one-shot execution.")
+    p_serve.add_argument("--timeout-ms", type=int, default=None)
+    p_serve.add_argument("--allow-template", action="store_true", help="Allow targeting skills under skills/_*.")
+    p_serve.set_defaults(func=cmd_serve)
+
     p_scaffold = subparsers.add_parser("scaffold")
     p_scaffold.add_argument("skill_id", help="New skill id (example: fs.hash_tree).")
     p_scaffold.add_argument("slug", help="New skill slug under skills/ (example: fs-hash-tree).")